@@ -0,0 +1,246 @@
+"""
+Benchmarks reproducibles del camino crítico de calificación.
+
+Mide Evaluation.get_weighted_grade, Student.get_total_weight,
+GradeCalculator.calculate_final_grade, get_calculation_details y
+calculate_cohort (calculate_final_grade y calculate_cohort también en punto
+fijo) sobre cohortes sintéticas generadas con semilla fija.
+Los resultados se emiten en JSON y pueden compararse con una línea base:
+el proceso termina con código 1 si algún caso es más lento que la base en
+más del umbral indicado.
+
+Uso:
+    python -m benchmarks.bench_grading --sizes 1,1000,1000000 --out actual.json
+    python -m benchmarks.bench_grading --baseline base.json --threshold 0.2
+"""
+
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+from typing import Callable, Dict, List, Optional
+
+from src.models.student import Student
+from src.models.evaluation import Evaluation
+from src.policies.attendance_policy import AttendancePolicy
+from src.policies.extra_points_policy import ExtraPointsPolicy
+from src.calculator.grade_calculator import GradeCalculator
+
+
+DEFAULT_SIZES = (1, 100, 10_000)
+DEFAULT_SEED = 20240601
+DEFAULT_THRESHOLD = 0.20
+# Operaciones mínimas por medición, para que los tamaños chicos sean medibles
+MIN_OPERATIONS = 20_000
+
+
+def generate_cohort(size: int, seed: int = DEFAULT_SEED,
+                    max_evaluations: int = Student.MAX_EVALUATIONS) -> List[Student]:
+    """
+    Genera una cohorte sintética reproducible.
+
+    Args:
+        size: Número de estudiantes
+        seed: Semilla del generador (mismos datos en cada ejecución)
+        max_evaluations: Máximo de evaluaciones por estudiante
+
+    Returns:
+        List[Student]: Estudiantes con evaluaciones y asistencia aleatorias
+    """
+    rng = random.Random(seed)
+    students = []
+    for index in range(size):
+        student = Student(f"ST{index:07d}", max_evaluations)
+        count = rng.randint(1, max_evaluations)
+        for _ in range(count):
+            student.add_evaluation(
+                Evaluation(round(rng.uniform(0, 20), 2), round(100 / count, 2))
+            )
+        student.has_reached_minimum_classes = rng.random() < 0.85
+        students.append(student)
+    return students
+
+
+def _measure(function: Callable[[], int], repeats: int) -> Dict[str, float]:
+    # Mejor de `repeats` mediciones; function devuelve las operaciones realizadas
+    best = None
+    operations = 0
+    for _ in range(repeats):
+        start = time.perf_counter()
+        operations = function()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return {
+        'total_seconds': best,
+        'operations': operations,
+        'ns_per_op': best * 1e9 / max(operations, 1),
+    }
+
+
+def _benchmarks(students: List[Student], calculator: GradeCalculator,
+                fixed_calculator: GradeCalculator) -> Dict[str, Callable]:
+    evaluations = [evaluation for student in students for evaluation in student.evaluations]
+    passes = max(1, MIN_OPERATIONS // max(len(students), 1))
+    evaluation_passes = max(1, MIN_OPERATIONS // max(len(evaluations), 1))
+
+    def weighted_grade() -> int:
+        for _ in range(evaluation_passes):
+            for evaluation in evaluations:
+                evaluation.get_weighted_grade()
+        return evaluation_passes * len(evaluations)
+
+    def total_weight() -> int:
+        for _ in range(passes):
+            for student in students:
+                student.get_total_weight()
+        return passes * len(students)
+
+    def final_grade() -> int:
+        for _ in range(passes):
+            for student in students:
+                calculator.calculate_final_grade(student, 0)
+        return passes * len(students)
+
+    def fixed_point_final_grade() -> int:
+        for _ in range(passes):
+            for student in students:
+                fixed_calculator.calculate_final_grade(student, 0)
+        return passes * len(students)
+
+    def calculation_details() -> int:
+        for _ in range(passes):
+            for student in students:
+                calculator.get_calculation_details(student, 0)
+        return passes * len(students)
+
+    grades = [evaluation.grade for evaluation in evaluations]
+    weights = [evaluation.weight for evaluation in evaluations]
+    counts = [len(student.evaluations) for student in students]
+    attendance = [student.has_reached_minimum_classes for student in students]
+
+    def cohort() -> int:
+        for _ in range(passes):
+            calculator.calculate_cohort(grades, weights, counts, attendance, 0)
+        return passes * len(students)
+
+    def fixed_point_cohort() -> int:
+        for _ in range(passes):
+            fixed_calculator.calculate_cohort(grades, weights, counts, attendance, 0)
+        return passes * len(students)
+
+    return {
+        'evaluation.get_weighted_grade': weighted_grade,
+        'student.get_total_weight': total_weight,
+        'calculator.calculate_final_grade': final_grade,
+        'calculator.calculate_final_grade.fixed_point': fixed_point_final_grade,
+        'calculator.get_calculation_details': calculation_details,
+        'calculator.calculate_cohort': cohort,
+        'calculator.calculate_cohort.fixed_point': fixed_point_cohort,
+    }
+
+
+def run_benchmarks(sizes=DEFAULT_SIZES, seed: int = DEFAULT_SEED,
+                   repeats: int = 3) -> Dict:
+    """
+    Ejecuta todos los benchmarks para cada tamaño de cohorte.
+
+    Returns:
+        Dict: Metadatos del entorno y una lista de resultados por caso
+    """
+    calculator = GradeCalculator(AttendancePolicy(), ExtraPointsPolicy([True]))
+    fixed_calculator = GradeCalculator(AttendancePolicy(), ExtraPointsPolicy([True]),
+                                       fixed_point=True)
+    results = []
+    for size in sizes:
+        students = generate_cohort(size, seed)
+        for name, function in _benchmarks(students, calculator, fixed_calculator).items():
+            results.append({'benchmark': name, 'size': size, **_measure(function, repeats)})
+    return {
+        'meta': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'seed': seed,
+            'repeats': repeats,
+        },
+        'results': results,
+    }
+
+
+def compare_with_baseline(current: Dict, baseline: Dict,
+                          threshold: float = DEFAULT_THRESHOLD) -> List[Dict]:
+    """
+    Compara resultados con una línea base.
+
+    Args:
+        current: Resultados de run_benchmarks
+        baseline: Resultados guardados previamente
+        threshold: Aumento relativo tolerado de ns_per_op (0.2 = 20 %)
+
+    Returns:
+        List[Dict]: Casos con regresión (benchmark, size, baseline, current, ratio)
+    """
+    reference = {(result['benchmark'], result['size']): result['ns_per_op']
+                 for result in baseline.get('results', [])}
+    regressions = []
+    for result in current['results']:
+        key = (result['benchmark'], result['size'])
+        if key not in reference or reference[key] <= 0:
+            continue
+        ratio = result['ns_per_op'] / reference[key]
+        if ratio > 1 + threshold:
+            regressions.append({
+                'benchmark': key[0],
+                'size': key[1],
+                'baseline_ns_per_op': reference[key],
+                'current_ns_per_op': result['ns_per_op'],
+                'ratio': ratio,
+            })
+    return regressions
+
+
+def _parse_sizes(value: str) -> List[int]:
+    return [int(size.replace('_', '')) for size in value.split(',') if size.strip()]
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Punto de entrada de línea de comandos.
+
+    Returns:
+        int: 0 si no hay regresiones, 1 en caso contrario
+    """
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.bench_grading",
+                                     description="Benchmarks de CS-GradeCalculator")
+    parser.add_argument("--sizes", type=_parse_sizes, default=list(DEFAULT_SIZES),
+                        help="Tamaños de cohorte separados por comas (ej. 1,1000,1000000)")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--out", help="Archivo JSON donde guardar los resultados")
+    parser.add_argument("--baseline", help="Archivo JSON de línea base a comparar")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="Regresión tolerada relativa a la base (por defecto 0.20)")
+    args = parser.parse_args(argv)
+
+    current = run_benchmarks(args.sizes, args.seed, args.repeats)
+    for result in current['results']:
+        print(f"{result['benchmark']:<38} n={result['size']:<9} "
+              f"{result['ns_per_op']:>12.1f} ns/op")
+    if args.out:
+        with open(args.out, 'w', encoding='utf-8') as stream:
+            json.dump(current, stream, indent=2)
+
+    if not args.baseline:
+        return 0
+    with open(args.baseline, encoding='utf-8') as stream:
+        baseline = json.load(stream)
+    regressions = compare_with_baseline(current, baseline, args.threshold)
+    for regression in regressions:
+        print(f"REGRESIÓN {regression['benchmark']} n={regression['size']}: "
+              f"{regression['ratio']:.2f}x la línea base")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,192 @@
+"""
+Benchmark de las reglas de selección (descartar las peores / contar las N
+mejores) y del costo de aumentar Student.MAX_EVALUATIONS.
+
+Para cada máximo de evaluaciones se generan cohortes sintéticas (semilla
+fija) y se mide:
+
+- calculator.calculate_final_grade y calculator.calculate_cohort sin reglas
+  de selección: costo base de permitir más evaluaciones por estudiante.
+- pipeline.drop_lowest y pipeline.drop_lowest.cohort: calificación con
+  DropLowest y BestOf (ruta escalar compilada y kernel NumPy).
+- selection.drop_lowest frente a selection.sort y selection.drop_mask frente
+  a selection.argsort: la selección parcial (min/heapq y np.partition)
+  contra el ordenamiento completo.
+
+Los resultados usan el mismo formato JSON que bench_grading, por lo que se
+pueden comparar con una línea base de la misma forma.
+
+Uso:
+    python -m benchmarks.bench_selection --max-evaluations 10,50,200 --size 10000
+"""
+
+import argparse
+import json
+import sys
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+
+from benchmarks.bench_grading import (DEFAULT_SEED, DEFAULT_THRESHOLD, _measure,
+                                      compare_with_baseline, generate_cohort)
+from src.calculator.cohort import pad_evaluations
+from src.calculator.grade_calculator import GradeCalculator
+from src.calculator.pipeline import PolicyPipeline, drop_lowest, drop_mask
+from src.models.student import Student
+from src.policies.attendance_policy import AttendancePolicy
+from src.policies.extra_points_policy import ExtraPointsPolicy
+
+
+DEFAULT_MAX_EVALUATIONS = (Student.MAX_EVALUATIONS, 50, 200)
+DEFAULT_SIZE = 2000
+# Evaluaciones descartadas y mejores contadas en los casos con selección
+DROP_LOWEST = 1
+BEST_OF_FRACTION = 0.8
+
+
+def _benchmarks(students: List[Student], max_evaluations: int) -> Dict[str, Callable]:
+    attendance_policy = AttendancePolicy()
+    extra_points_policy = ExtraPointsPolicy([True])
+    calculator = GradeCalculator(attendance_policy, extra_points_policy)
+    best_of = max(1, int(max_evaluations * BEST_OF_FRACTION))
+    selecting = GradeCalculator(attendance_policy, extra_points_policy,
+                                pipeline=PolicyPipeline.default(
+                                    attendance_policy, extra_points_policy,
+                                    DROP_LOWEST, best_of))
+
+    grades = [evaluation.grade for student in students for evaluation in student.evaluations]
+    weights = [evaluation.weight for student in students for evaluation in student.evaluations]
+    counts = [len(student.evaluations) for student in students]
+    attendance = [student.has_reached_minimum_classes for student in students]
+    grade_matrix, _, count_vector = pad_evaluations(grades, weights, counts)
+    to_drop = np.maximum(np.minimum(np.maximum(DROP_LOWEST, count_vector - best_of),
+                                    count_vector - 1), 0)
+    to_drop_list = to_drop.tolist()
+
+    def final_grade() -> int:
+        for student in students:
+            calculator.calculate_final_grade(student, 0)
+        return len(students)
+
+    def cohort() -> int:
+        calculator.calculate_cohort(grades, weights, counts, attendance, 0)
+        return len(students)
+
+    def selecting_final_grade() -> int:
+        for student in students:
+            selecting.calculate_final_grade(student, 0)
+        return len(students)
+
+    def selecting_cohort() -> int:
+        selecting.calculate_cohort(grades, weights, counts, attendance, 0)
+        return len(students)
+
+    def heap_selection() -> int:
+        for student, count in zip(students, to_drop_list):
+            drop_lowest(student.evaluations, count)
+        return len(students)
+
+    def sort_selection() -> int:
+        # Referencia: ordenar todas las evaluaciones para descartar las primeras
+        for student, count in zip(students, to_drop_list):
+            evaluations = student.evaluations
+            dropped = set(sorted(range(len(evaluations)),
+                                 key=lambda index: evaluations[index].grade)[:count])
+            [evaluation for index, evaluation in enumerate(evaluations)
+             if index not in dropped]
+        return len(students)
+
+    def partition_selection() -> int:
+        drop_mask(grade_matrix, count_vector, to_drop)
+        return len(students)
+
+    def argsort_selection() -> int:
+        # Referencia: ordenar cada fila completa y marcar las primeras to_drop
+        valid = np.arange(grade_matrix.shape[1]) < count_vector[:, None]
+        order = np.argsort(np.where(valid, grade_matrix, np.inf), axis=1, kind='stable')
+        ranks = np.empty_like(order)
+        np.put_along_axis(ranks, order, np.arange(order.shape[1])[None, :], axis=1)
+        ranks < to_drop[:, None]
+        return len(students)
+
+    return {
+        'calculator.calculate_final_grade': final_grade,
+        'calculator.calculate_cohort': cohort,
+        'pipeline.drop_lowest': selecting_final_grade,
+        'pipeline.drop_lowest.cohort': selecting_cohort,
+        'selection.drop_lowest': heap_selection,
+        'selection.sort': sort_selection,
+        'selection.drop_mask': partition_selection,
+        'selection.argsort': argsort_selection,
+    }
+
+
+def run_selection_benchmarks(max_evaluations=DEFAULT_MAX_EVALUATIONS,
+                             size: int = DEFAULT_SIZE, seed: int = DEFAULT_SEED,
+                             repeats: int = 3) -> Dict:
+    """
+    Ejecuta los benchmarks de selección para cada máximo de evaluaciones.
+
+    Returns:
+        Dict: Metadatos y resultados; el nombre de cada caso incluye el máximo
+        de evaluaciones (ej. 'selection.drop_mask[m=50]')
+    """
+    results = []
+    for maximum in max_evaluations:
+        students = generate_cohort(size, seed, maximum)
+        for name, function in _benchmarks(students, maximum).items():
+            results.append({'benchmark': f"{name}[m={maximum}]", 'size': size,
+                            'max_evaluations': maximum, **_measure(function, repeats)})
+    return {
+        'meta': {'seed': seed, 'repeats': repeats, 'drop_lowest': DROP_LOWEST,
+                 'best_of_fraction': BEST_OF_FRACTION},
+        'results': results,
+    }
+
+
+def _parse_list(value: str) -> List[int]:
+    return [int(item.replace('_', '')) for item in value.split(',') if item.strip()]
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Punto de entrada de línea de comandos.
+
+    Returns:
+        int: 0 si no hay regresiones, 1 en caso contrario
+    """
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.bench_selection",
+                                     description="Benchmark de reglas de selección")
+    parser.add_argument("--max-evaluations", type=_parse_list,
+                        default=list(DEFAULT_MAX_EVALUATIONS),
+                        help="Máximos de evaluaciones separados por comas (ej. 10,50,200)")
+    parser.add_argument("--size", type=int, default=DEFAULT_SIZE,
+                        help="Estudiantes por cohorte")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--out", help="Archivo JSON donde guardar los resultados")
+    parser.add_argument("--baseline", help="Archivo JSON de línea base a comparar")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    args = parser.parse_args(argv)
+
+    current = run_selection_benchmarks(args.max_evaluations, args.size, args.seed,
+                                       args.repeats)
+    for result in current['results']:
+        print(f"{result['benchmark']:<46} n={result['size']:<7} "
+              f"{result['ns_per_op']:>12.1f} ns/estudiante")
+    if args.out:
+        with open(args.out, 'w', encoding='utf-8') as stream:
+            json.dump(current, stream, indent=2)
+
+    if not args.baseline:
+        return 0
+    with open(args.baseline, encoding='utf-8') as stream:
+        baseline = json.load(stream)
+    regressions = compare_with_baseline(current, baseline, args.threshold)
+    for regression in regressions:
+        print(f"REGRESIÓN {regression['benchmark']}: {regression['ratio']:.2f}x la línea base")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
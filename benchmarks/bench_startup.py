@@ -0,0 +1,129 @@
+"""
+Benchmark del tiempo de arranque en frío de la línea de comandos.
+
+Ejecuta ``python -m src.main --grade ...`` (modo rápido, un estudiante por
+invocación) en procesos nuevos y lo compara con un intérprete vacío
+(``python -c pass``): la diferencia es el costo propio del programa. También
+verifica que el modo rápido no importe módulos pesados (typing, re,
+argparse, json ni NumPy).
+
+El proceso termina con código 1 si el sobrecosto mediano supera el objetivo
+o si se importa algún módulo prohibido.
+
+Uso:
+    python -m benchmarks.bench_startup --repeats 30 --target-ms 25
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List, Optional, Sequence
+
+# Raíz del repositorio (donde se resuelve el paquete src)
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+GRADE_ARGS = ('-m', 'src.main', '--grade', '15:30', '18:40', '16:30',
+              '--attendance', 's', '--year', '1', '--extra-points', 'n,s')
+BASELINE_ARGS = ('-c', 'pass')
+FORBIDDEN_MODULES = ('typing', 're', 'argparse', 'json', 'numpy')
+# Sobrecosto mediano tolerado sobre el intérprete vacío, en milisegundos
+DEFAULT_TARGET_MS = 25.0
+
+
+def measure_startup(args: Sequence[str], repeats: int) -> List[float]:
+    """
+    Mide el tiempo total (en segundos) de ``python <args>`` en procesos nuevos.
+
+    Raises:
+        RuntimeError: Si el proceso termina con error
+    """
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        completed = subprocess.run([sys.executable, *args], cwd=REPO_ROOT,
+                                   stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+        timings.append(time.perf_counter() - start)
+        if completed.returncode != 0:
+            raise RuntimeError(completed.stderr.decode('utf-8', 'replace'))
+    return timings
+
+
+def imported_modules(args: Sequence[str]) -> List[str]:
+    """
+    Obtiene los módulos que importa ``python <args>`` (según -X importtime).
+    """
+    completed = subprocess.run([sys.executable, '-X', 'importtime', *args], cwd=REPO_ROOT,
+                               stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, check=True)
+    modules = []
+    for line in completed.stderr.decode('utf-8', 'replace').splitlines():
+        if line.startswith('import time:') and '|' in line:
+            name = line.rsplit('|', 1)[1].strip()
+            if name != 'imported package':
+                modules.append(name)
+    return modules
+
+
+def run_startup_benchmark(repeats: int = 20) -> Dict:
+    """
+    Ejecuta el benchmark de arranque.
+
+    Returns:
+        Dict: Medianas en ms del intérprete vacío y del modo rápido, el
+        sobrecosto, los módulos importados y los módulos prohibidos cargados
+    """
+    # Una ejecución previa compila los .pyc para medir solo arranques en caliente de disco
+    measure_startup(GRADE_ARGS, 1)
+    baseline = statistics.median(measure_startup(BASELINE_ARGS, repeats)) * 1000
+    grade = statistics.median(measure_startup(GRADE_ARGS, repeats)) * 1000
+    modules = imported_modules(GRADE_ARGS)
+    top_level = {module.split('.')[0] for module in modules}
+    return {
+        'python': sys.version.split()[0],
+        'repeats': repeats,
+        'interpreter_ms': baseline,
+        'grade_ms': grade,
+        'overhead_ms': grade - baseline,
+        'modules': len(modules),
+        'forbidden_modules': [module for module in FORBIDDEN_MODULES if module in top_level],
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Punto de entrada de línea de comandos.
+
+    Returns:
+        int: 0 si se cumple el objetivo, 1 en caso contrario
+    """
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.bench_startup",
+                                     description="Arranque en frío de CS-GradeCalculator")
+    parser.add_argument("--repeats", type=int, default=20)
+    parser.add_argument("--target-ms", type=float, default=DEFAULT_TARGET_MS,
+                        help="Sobrecosto mediano máximo sobre el intérprete vacío")
+    parser.add_argument("--out", help="Archivo JSON donde guardar los resultados")
+    args = parser.parse_args(argv)
+
+    result = run_startup_benchmark(args.repeats)
+    print(f"Intérprete vacío: {result['interpreter_ms']:.1f} ms")
+    print(f"Modo rápido:      {result['grade_ms']:.1f} ms "
+          f"(+{result['overhead_ms']:.1f} ms, {result['modules']} módulos)")
+    if args.out:
+        with open(args.out, 'w', encoding='utf-8') as stream:
+            json.dump(result, stream, indent=2)
+
+    failed = False
+    if result['forbidden_modules']:
+        print(f"Módulos prohibidos importados: {', '.join(result['forbidden_modules'])}")
+        failed = True
+    if result['overhead_ms'] > args.target_ms:
+        print(f"Sobrecosto sobre el objetivo de {args.target_ms:.1f} ms")
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
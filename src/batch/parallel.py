@@ -0,0 +1,197 @@
+"""
+Módulo de calificación paralela en varios procesos.
+
+La población de estudiantes se divide en bloques (chunks) que se reparten
+entre los procesos de un ProcessPoolExecutor. Las políticas se envían una
+sola vez a cada proceso al iniciarlo y los resultados se devuelven en el
+mismo orden de entrada, por lo que la salida es reproducible byte a byte.
+"""
+
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from itertools import islice
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+from src.batch.runner import grade_record
+from src.calculator.aggregates import SectionAggregate
+from src.calculator.grade_calculator import GradeCalculator
+from src.policies.attendance_policy import AttendancePolicy
+from src.policies.extra_points_policy import ExtraPointsPolicy
+
+
+# Calculadora de cada proceso de trabajo, creada una vez por init_worker
+_worker_calculator: Optional[GradeCalculator] = None
+_worker_max_evaluations: Optional[int] = None
+_worker_tenants = None
+
+
+def init_worker(attendance_policy: AttendancePolicy,
+                extra_points_policy: ExtraPointsPolicy,
+                pipeline=None, max_evaluations: Optional[int] = None,
+                fixed_point: bool = False, tenants=None) -> None:
+    """
+    Inicializador del pool: crea la calculadora del proceso una sola vez
+    (el pipeline, si lo hay, se compila en cada proceso).
+    """
+    global _worker_calculator, _worker_max_evaluations, _worker_tenants
+    _worker_calculator = GradeCalculator(attendance_policy, extra_points_policy,
+                                         pipeline=pipeline, fixed_point=fixed_point)
+    _worker_max_evaluations = max_evaluations
+    _worker_tenants = tenants
+
+
+def grade_record_chunk(records: List) -> List[Tuple[bool, str]]:
+    """
+    Califica en el proceso actual un bloque de (línea, fila, registro).
+    """
+    return [grade_record(_worker_calculator, line_number, raw, record,
+                         max_evaluations=_worker_max_evaluations, tenants=_worker_tenants)
+            for line_number, raw, record in records]
+
+
+def grade_record_chunk_aggregated(aggregate: SectionAggregate,
+                                  records: List) -> Tuple[List[Tuple[bool, str]],
+                                                          SectionAggregate]:
+    """
+    Califica un bloque de registros y calcula su agregado parcial.
+
+    Args:
+        aggregate: Agregado vacío (configuración) a llenar en este proceso
+        records: Bloque de (línea, fila, registro)
+    """
+    results = [grade_record(_worker_calculator, line_number, raw, record, aggregate,
+                            _worker_max_evaluations, _worker_tenants)
+               for line_number, raw, record in records]
+    return results, aggregate
+
+
+def grade_student_chunk(students: List) -> List:
+    """
+    Califica en el proceso actual un bloque de (estudiante, año académico).
+    """
+    results = []
+    for student, academic_year in students:
+        try:
+            results.append(_worker_calculator.get_calculation_details(student, academic_year))
+        except ValueError as error:
+            results.append(error)
+    return results
+
+
+def iter_chunks(items: Iterable, chunk_size: int) -> Iterator[List]:
+    """
+    Divide un iterable en listas de hasta chunk_size elementos.
+    """
+    iterator = iter(items)
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+class ParallelGrader:
+    """
+    Calificador paralelo basado en un pool de procesos.
+
+    Se usa como context manager para liberar los procesos al terminar.
+    """
+
+    def __init__(self, attendance_policy: AttendancePolicy,
+                 extra_points_policy: ExtraPointsPolicy,
+                 workers: Optional[int] = None, chunk_size: int = 1000,
+                 pipeline=None, max_evaluations: Optional[int] = None,
+                 fixed_point: bool = False, tenants=None):
+        """
+        Inicializa el pool de procesos.
+
+        Args:
+            attendance_policy: Política de asistencia a aplicar
+            extra_points_policy: Política de puntos extra a aplicar
+            workers: Número de procesos (por defecto, número de CPUs)
+            chunk_size: Elementos enviados a cada proceso por tarea
+            pipeline: PolicyPipeline de las calculadoras de cada proceso
+            max_evaluations: Máximo de evaluaciones por estudiante al leer
+                             registros (None = Student.MAX_EVALUATIONS)
+            fixed_point: Calcula en punto fijo (centésimas) en cada proceso
+            tenants: TenantPolicies para calificar registros según su tenant
+                     (se envía una vez a cada proceso)
+
+        Raises:
+            ValueError: Si workers o chunk_size no son positivos
+        """
+        workers = workers or os.cpu_count() or 1
+        if workers < 1:
+            raise ValueError("El número de procesos debe ser positivo")
+        if chunk_size < 1:
+            raise ValueError("El tamaño de bloque debe ser positivo")
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self._executor = ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=init_worker,
+            initargs=(attendance_policy, extra_points_policy, pipeline, max_evaluations,
+                      fixed_point, tenants)
+        )
+
+    def _ordered_chunks(self, function, items: Iterable) -> Iterator:
+        # Como máximo 2 bloques en vuelo por proceso: memoria acotada y
+        # resultados entregados en el orden de entrada.
+        pending = deque()
+        for chunk in iter_chunks(items, self.chunk_size):
+            pending.append(self._executor.submit(function, chunk))
+            if len(pending) >= 2 * self.workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+    def _ordered_map(self, function, items: Iterable) -> Iterator:
+        for results in self._ordered_chunks(function, items):
+            yield from results
+
+    def grade_records(self, records: Iterable,
+                      aggregate: Optional[SectionAggregate] = None) -> Iterator[Tuple[bool, str]]:
+        """
+        Califica registros de iter_records en paralelo.
+
+        Args:
+            records: Registros de iter_records
+            aggregate: Estadísticas de sección; cada proceso calcula el
+                       agregado parcial de su bloque y aquí se combinan
+
+        Yields:
+            Tuple[bool, str]: Resultado de grade_record, en orden de entrada
+        """
+        if aggregate is None:
+            return self._ordered_map(grade_record_chunk, records)
+        return self._aggregated(records, aggregate)
+
+    def _aggregated(self, records: Iterable, aggregate: SectionAggregate) -> Iterator:
+        function = partial(grade_record_chunk_aggregated, aggregate.new_partial())
+        for results, partial_aggregate in self._ordered_chunks(function, records):
+            aggregate.merge(partial_aggregate)
+            yield from results
+
+    def grade_students(self, students: Iterable[Tuple]) -> Iterator:
+        """
+        Califica pares (estudiante, año académico) en paralelo.
+
+        Yields:
+            Detalle de get_calculation_details de cada estudiante, en orden de
+            entrada, o el ValueError producido al calificarlo
+        """
+        return self._ordered_map(grade_student_chunk, students)
+
+    def close(self) -> None:
+        """
+        Detiene los procesos del pool.
+        """
+        self._executor.shutdown()
+
+    def __enter__(self) -> 'ParallelGrader':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
@@ -0,0 +1,189 @@
+"""
+Módulo de lectura incremental de estudiantes desde archivos CSV o JSONL.
+
+Formatos soportados (una fila por estudiante):
+
+- JSONL: ``{"student_id": "ST001", "has_reached_minimum_classes": true,
+  "academic_year": 0, "evaluations": [{"grade": 15, "weight": 30}, ...]}``
+- CSV: cabecera con ``student_id``, ``has_reached_minimum_classes``,
+  ``academic_year`` y pares de columnas ``grade_1``, ``weight_1``, ...,
+  ``grade_N``, ``weight_N``. Las celdas vacías se ignoran.
+
+``academic_year`` es el índice (0-based) del año en la política de puntos
+extra y es opcional (0 por defecto).
+
+Los archivos se leen en UTF-8 con ``errors='surrogateescape'`` (ver
+INPUT_ERRORS): una fila con bytes inválidos se entrega como error de esa
+fila, y va a los rechazos, en lugar de interrumpir la lectura.
+"""
+
+import csv
+import json
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from src.batch.values import parse_academic_year, parse_bool
+from src.models.student import Student
+from src.models.evaluation import Evaluation
+
+
+# Manejo de errores de decodificación con que se abren los archivos de entrada
+INPUT_ERRORS = 'surrogateescape'
+
+FORMAT_BY_EXTENSION = {
+    '.csv': 'csv',
+    '.jsonl': 'jsonl',
+    '.ndjson': 'jsonl',
+    '.json': 'jsonl',
+}
+
+
+def detect_format(path: str) -> str:
+    """
+    Determina el formato de un archivo a partir de su extensión.
+
+    Raises:
+        ValueError: Si la extensión no corresponde a un formato soportado
+    """
+    for extension, file_format in FORMAT_BY_EXTENSION.items():
+        if path.lower().endswith(extension):
+            return file_format
+    raise ValueError(f"Formato de archivo no soportado: {path}")
+
+
+def build_student(record: Dict, max_evaluations: Optional[int] = None) -> Tuple[Student, int]:
+    """
+    Construye un estudiante a partir de un registro ya decodificado.
+
+    Args:
+        record: Registro con student_id, evaluations, asistencia y año
+        max_evaluations: Máximo de evaluaciones (None = Student.MAX_EVALUATIONS)
+
+    Returns:
+        Tuple[Student, int]: Estudiante y año académico (0-based)
+
+    Raises:
+        ValueError: Si el registro es inválido (mismas validaciones que
+                    Evaluation y Student.add_evaluation)
+    """
+    if not isinstance(record, dict):
+        raise ValueError("El registro debe ser un objeto")
+    student_id = str(record.get('student_id') or '').strip()
+    if not student_id:
+        raise ValueError("El registro no tiene student_id")
+
+    student = Student(student_id, max_evaluations)
+    evaluations = record.get('evaluations') or []
+    if not isinstance(evaluations, list):
+        raise ValueError("evaluations debe ser una lista")
+    for evaluation in evaluations:
+        try:
+            if isinstance(evaluation, dict):
+                grade, weight = evaluation['grade'], evaluation['weight']
+            else:
+                grade, weight = evaluation
+            grade, weight = float(grade), float(weight)
+        except (KeyError, TypeError):
+            raise ValueError(f"Evaluación inválida: {evaluation!r}") from None
+        student.add_evaluation(Evaluation(grade, weight))
+
+    student.has_reached_minimum_classes = parse_bool(
+        record.get('has_reached_minimum_classes', False)
+    )
+    return student, parse_academic_year(record.get('academic_year'))
+
+
+def csv_row_to_record(header: List[str], row: List[str]) -> Dict:
+    """
+    Convierte una fila CSV en un registro con la estructura del formato JSONL.
+
+    Raises:
+        ValueError: Si la fila no tiene el número de columnas de la cabecera
+    """
+    if len(row) != len(header):
+        raise ValueError(
+            f"La fila tiene {len(row)} columnas y la cabecera {len(header)}"
+        )
+    fields = dict(zip(header, row))
+    evaluations = []
+    position = 1
+    while f'grade_{position}' in fields:
+        grade = fields[f'grade_{position}'].strip()
+        weight = fields.get(f'weight_{position}', '').strip()
+        if grade or weight:
+            evaluations.append((grade, weight))
+        position += 1
+    record = {
+        'student_id': fields.get('student_id'),
+        'has_reached_minimum_classes': fields.get('has_reached_minimum_classes', ''),
+        'academic_year': fields.get('academic_year', '').strip(),
+        'evaluations': evaluations,
+    }
+    if 'tenant' in fields:
+        record['tenant'] = fields['tenant'].strip()
+    return record
+
+
+def _is_invalid_utf8(text: str) -> bool:
+    # Con surrogateescape cada byte inválido queda como un sustituto (U+DC80-U+DCFF)
+    if text.isascii():
+        return False
+    try:
+        text.encode('utf-8')
+    except UnicodeEncodeError:
+        return True
+    return False
+
+
+def _replace_invalid_utf8(text: str) -> str:
+    return text.encode('utf-8', INPUT_ERRORS).decode('utf-8', 'replace')
+
+
+def _invalid_utf8_error() -> ValueError:
+    return ValueError("La fila contiene bytes que no son UTF-8 válido")
+
+
+def iter_records(stream, file_format: str) -> Iterator[Tuple[int, object, object]]:
+    """
+    Recorre un archivo fila por fila sin cargarlo completo en memoria.
+
+    Args:
+        stream: Archivo de texto abierto en UTF-8 con errors=INPUT_ERRORS
+                (con newline='' para CSV)
+        file_format: 'csv' o 'jsonl'
+
+    Yields:
+        Tuple[int, object, object]: Número de línea, fila original y un
+        registro decodificado o la excepción ValueError producida al
+        decodificarlo. En una fila que no es UTF-8 válido, los bytes
+        inválidos de la fila original se reemplazan por U+FFFD.
+    """
+    if file_format == 'csv':
+        reader = csv.reader(stream)
+        header = [column.strip() for column in next(reader, [])]
+        for row in reader:
+            if not any(cell.strip() for cell in row):
+                continue
+            if any(_is_invalid_utf8(cell) for cell in row):
+                yield (reader.line_num, [_replace_invalid_utf8(cell) for cell in row],
+                       _invalid_utf8_error())
+                continue
+            try:
+                record = csv_row_to_record(header, row)
+            except ValueError as error:
+                record = error
+            yield reader.line_num, row, record
+    elif file_format == 'jsonl':
+        for line_number, line in enumerate(stream, 1):
+            line = line.strip()
+            if not line:
+                continue
+            if _is_invalid_utf8(line):
+                yield line_number, _replace_invalid_utf8(line), _invalid_utf8_error()
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError as error:
+                record = error
+            yield line_number, line, record
+    else:
+        raise ValueError(f"Formato de archivo no soportado: {file_format}")
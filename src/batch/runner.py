@@ -0,0 +1,193 @@
+"""
+Módulo de calificación masiva en streaming (modo batch).
+
+Lee estudiantes fila por fila desde CSV o JSONL, calcula su nota final con
+GradeCalculator y escribe cada resultado en JSONL en cuanto está disponible,
+de modo que la memoria usada no depende del tamaño del archivo. Las filas
+inválidas se registran en un archivo de rechazos en lugar de detener el proceso.
+"""
+
+import json
+from typing import Dict, Optional, Tuple
+
+from src.batch.readers import INPUT_ERRORS, build_student, detect_format, iter_records
+from src.batch.writers import export_records, open_result_writer
+from src.calculator.aggregates import SectionAggregate
+from src.calculator.grade_calculator import GradeCalculator
+
+
+def default_rejects_path(output_path: str) -> str:
+    """
+    Obtiene la ruta por defecto del archivo de rechazos.
+
+    Args:
+        output_path: Ruta del archivo de resultados
+
+    Returns:
+        str: Ruta del archivo de rechazos junto al de resultados
+    """
+    base = output_path[:-len('.jsonl')] if output_path.endswith('.jsonl') else output_path
+    return f"{base}.rejects.jsonl"
+
+
+def grade_record(calculator: GradeCalculator, line_number: int, raw,
+                 record, aggregate: Optional[SectionAggregate] = None,
+                 max_evaluations: Optional[int] = None, tenants=None) -> Tuple[bool, str]:
+    """
+    Califica un registro y lo serializa como línea JSONL.
+
+    Args:
+        calculator: Calculadora configurada con las políticas a aplicar
+        line_number: Número de línea del registro en el archivo de entrada
+        raw: Fila original (se copia en el rechazo si el registro es inválido)
+        record: Registro decodificado o ValueError producido al decodificarlo
+        aggregate: Estadísticas de sección donde se registra el resultado
+        max_evaluations: Máximo de evaluaciones por estudiante
+                         (None = Student.MAX_EVALUATIONS)
+        tenants: TenantPolicies; si se indica, el registro se califica con
+                 la calculadora de su campo 'tenant' (en lugar de calculator)
+                 y el resultado incluye ese campo
+
+    Returns:
+        Tuple[bool, str]: (True, resultado) si se calificó o (False, rechazo)
+    """
+    try:
+        if isinstance(record, ValueError):
+            raise record
+        student, academic_year = build_student(record, max_evaluations)
+        if tenants is None:
+            details = calculator.get_calculation_details(student, academic_year)
+        else:
+            tenant = record.get('tenant')
+            details = {'tenant': tenant, **tenants.calculator(tenant).get_calculation_details(
+                student, academic_year)}
+    except ValueError as error:
+        if aggregate is not None:
+            aggregate.add_rejected()
+        return False, json.dumps(
+            {'line': line_number, 'error': str(error), 'row': raw},
+            ensure_ascii=False
+        ) + '\n'
+    if aggregate is not None:
+        aggregate.add(details['final_grade'])
+    return True, json.dumps(details, ensure_ascii=False) + '\n'
+
+
+def write_results(results, output, rejects) -> Dict[str, int]:
+    """
+    Escribe resultados y rechazos a medida que llegan.
+
+    Args:
+        results: Iterable de (aceptado, línea JSONL) de grade_record
+        output: Archivo de texto de resultados
+        rejects: Archivo de texto de rechazos
+
+    Returns:
+        Dict[str, int]: Cantidad de filas 'processed' y 'rejected'
+    """
+    summary = {'processed': 0, 'rejected': 0}
+    for accepted, line in results:
+        if accepted:
+            output.write(line)
+            summary['processed'] += 1
+        else:
+            rejects.write(line)
+            summary['rejected'] += 1
+    return summary
+
+
+def grade_stream(calculator: GradeCalculator, records, output, rejects,
+                 aggregate: Optional[SectionAggregate] = None,
+                 max_evaluations: Optional[int] = None, tenants=None) -> Dict[str, int]:
+    """
+    Califica una secuencia de registros escribiendo resultados y rechazos.
+
+    Args:
+        calculator: Calculadora configurada con las políticas a aplicar
+        records: Iterable de (línea, fila original, registro) de iter_records
+        output: Archivo de texto donde se escribe un resultado JSON por línea
+        rejects: Archivo de texto donde se escribe un rechazo JSON por línea
+        aggregate: Estadísticas de sección a actualizar con cada resultado
+        max_evaluations: Máximo de evaluaciones por estudiante
+        tenants: TenantPolicies para calificar cada registro según su tenant
+
+    Returns:
+        Dict[str, int]: Cantidad de filas 'processed' y 'rejected'
+    """
+    results = (grade_record(calculator, line_number, raw, record, aggregate, max_evaluations,
+                            tenants)
+               for line_number, raw, record in records)
+    return write_results(results, output, rejects)
+
+
+def run_batch(input_path: str, output_path: str, calculator: GradeCalculator,
+              rejects_path: Optional[str] = None,
+              file_format: Optional[str] = None, workers: int = 1,
+              chunk_size: int = 1000,
+              aggregate: Optional[SectionAggregate] = None,
+              max_evaluations: Optional[int] = None,
+              output_format: str = 'jsonl', tenants=None) -> Dict[str, int]:
+    """
+    Ejecuta la calificación masiva de un archivo completo.
+
+    Sin paralelismo, los resultados se escriben con los escritores por
+    bloques de src.batch.writers (el JSONL es idéntico al de grade_stream).
+
+    Args:
+        input_path: Archivo CSV o JSONL con un estudiante por fila
+        output_path: Archivo JSONL de resultados, o ruta base de las tablas
+                     columnares
+        calculator: Calculadora configurada con las políticas a aplicar
+        rejects_path: Archivo JSONL de filas rechazadas (por defecto junto a
+                      output_path)
+        file_format: 'csv' o 'jsonl' (por defecto según la extensión)
+        workers: Número de procesos de calificación (1 = sin paralelismo)
+        chunk_size: Filas enviadas a cada proceso por tarea
+        aggregate: Estadísticas de sección a calcular mientras se califica
+                   (con varios procesos, cada uno calcula un agregado parcial
+                   por bloque y se combinan aquí)
+        max_evaluations: Máximo de evaluaciones por estudiante
+                         (None = Student.MAX_EVALUATIONS)
+        output_format: 'jsonl', o 'csv'/'arrow' para tablas columnares de
+                       estudiantes y evaluaciones (solo con workers=1)
+        tenants: TenantPolicies para calificar en una sola pasada registros
+                 de varios tenants (campo o columna 'tenant'); solo con
+                 salida JSONL y la calculadora estándar
+
+    Returns:
+        Dict[str, int]: Cantidad de filas 'processed' y 'rejected'
+
+    Raises:
+        ValueError: Si el formato del archivo o de salida no es soportado
+    """
+    file_format = file_format or detect_format(input_path)
+    rejects_path = rejects_path or default_rejects_path(output_path)
+    if output_format != 'jsonl' and workers > 1:
+        raise ValueError("La salida columnar se escribe sin paralelismo (workers=1)")
+    if tenants is not None:
+        if output_format != 'jsonl':
+            raise ValueError("La calificación por tenant solo admite salida JSONL")
+        if calculator.pipeline is not None or calculator.fixed_point:
+            raise ValueError("La calificación por tenant usa la calculadora estándar")
+
+    with open(input_path, 'r', encoding='utf-8', errors=INPUT_ERRORS, newline='') as source, \
+            open(rejects_path, 'w', encoding='utf-8') as rejects:
+        records = iter_records(source, file_format)
+        if workers <= 1 and tenants is not None:
+            with open(output_path, 'w', encoding='utf-8') as output:
+                return grade_stream(calculator, records, output, rejects, aggregate,
+                                    max_evaluations, tenants)
+        if workers <= 1:
+            with open_result_writer(calculator, output_path, output_format) as writer:
+                return export_records(writer, records, rejects, aggregate, max_evaluations)
+
+        from src.batch.parallel import ParallelGrader
+
+        with open(output_path, 'w', encoding='utf-8') as output, \
+                ParallelGrader(calculator.attendance_policy, calculator.extra_points_policy,
+                               workers=workers, chunk_size=chunk_size,
+                               pipeline=calculator.pipeline,
+                               max_evaluations=max_evaluations,
+                               fixed_point=calculator.fixed_point,
+                               tenants=tenants) as grader:
+            return write_results(grader.grade_records(records, aggregate), output, rejects)
@@ -0,0 +1,50 @@
+"""
+Módulo de interpretación de valores de texto comunes a todas las entradas.
+
+Es independiente de los lectores de archivos para que la línea de comandos
+pueda usarlo sin importar csv ni json.
+"""
+
+TRUE_VALUES = ('s', 'si', 'sí', 'y', 'yes', 'true', '1')
+FALSE_VALUES = ('n', 'no', 'false', '0', '')
+
+
+def parse_bool(value) -> bool:
+    """
+    Interpreta un valor de asistencia (s/n, true/false, 1/0).
+
+    Raises:
+        ValueError: Si el valor no es reconocido
+    """
+    if isinstance(value, bool):
+        return value
+    text = str(value).strip().lower()
+    if text in TRUE_VALUES:
+        return True
+    if text in FALSE_VALUES:
+        return False
+    raise ValueError(f"Valor de asistencia inválido: {value!r}")
+
+
+def parse_academic_year(value) -> int:
+    """
+    Interpreta el año académico (índice 0-based) de un registro. Un valor
+    ausente o vacío equivale a 0.
+
+    Raises:
+        ValueError: Si el valor no es un entero no negativo (se rechazan
+                    booleanos, listas, objetos y números con parte decimal)
+    """
+    if value is None or value == '':
+        return 0
+    year = None
+    if isinstance(value, float) and value.is_integer():
+        year = int(value)
+    elif isinstance(value, (int, str)) and not isinstance(value, bool):
+        try:
+            year = int(value)
+        except ValueError:
+            pass
+    if year is None or year < 0:
+        raise ValueError(f"Año académico inválido: {value!r}")
+    return year
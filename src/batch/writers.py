@@ -0,0 +1,422 @@
+"""
+Módulo de escritura de resultados de calificación por bloques.
+
+Los escritores reciben estudiantes ya construidos, calculan su nota con la
+calculadora dada y escriben el resultado sin pasar por el diccionario de
+get_calculation_details:
+
+- JsonlResultWriter: una línea JSON por estudiante, idéntica byte a byte a
+  ``json.dumps(get_calculation_details(...), ensure_ascii=False)``, armada
+  directamente como texto.
+- Escritores columnares: una tabla de estudiantes (STUDENT_COLUMNS) y una
+  tabla plana de evaluaciones (EVALUATION_COLUMNS) unidas por student_id,
+  en Arrow IPC (requiere la dependencia opcional pyarrow) o en CSV. Como en
+  get_calculation_details, si el pipeline descarta evaluaciones la columna
+  dropped las marca y number_of_evaluations y total_weight cuentan solo las
+  conservadas.
+
+Todos acumulan a lo sumo chunk_size estudiantes antes de escribir, por lo
+que la memoria usada no depende del tamaño de la cohorte.
+"""
+
+import csv
+import json
+from abc import ABC, abstractmethod
+from typing import Dict, Iterable, Optional
+
+from src.batch.readers import build_student
+from src.calculator.aggregates import SectionAggregate
+from src.calculator.details import kept_total_weight
+from src.calculator.grade_calculator import GradeCalculator
+
+
+STUDENT_COLUMNS = ('student_id', 'academic_year', 'number_of_evaluations', 'total_weight',
+                   'has_reached_minimum_classes', 'extra_points_policy_active',
+                   'weighted_average', 'attendance_penalty', 'extra_points', 'final_grade')
+EVALUATION_COLUMNS = ('student_id', 'position', 'grade', 'weight', 'weighted_grade', 'dropped')
+OUTPUT_FORMATS = ('jsonl', 'csv', 'arrow')
+DEFAULT_CHUNK_SIZE = 10_000
+
+_encode_string = json.encoder.encode_basestring
+# Plantillas de JsonlResultWriter: %r de int y float finitos es el mismo texto
+# que produce json.dumps
+_EVALUATION_TEMPLATE = '{"grade": %r, "weight": %r, "weighted_grade": %r}'
+_LINE_TEMPLATE = (
+    '{"student_id": %s, "number_of_evaluations": %d, "evaluations": [%s], '
+    '"total_weight": %r, "has_reached_minimum_classes": %s, '
+    '"extra_points_policy_active": %s, "weighted_average": %r, '
+    '"attendance_penalty": %r, "extra_points": %r, "final_grade": %r}\n'
+)
+
+
+def arrow_available() -> bool:
+    """
+    Indica si la dependencia opcional pyarrow está instalada.
+    """
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def _json_value(value) -> str:
+    # Mismo texto que json.dumps para identificadores y booleanos
+    if value is True:
+        return 'true'
+    if value is False:
+        return 'false'
+    if type(value) is str:
+        return _encode_string(value)
+    return json.dumps(value, ensure_ascii=False)
+
+
+class ResultWriter(ABC):
+    """
+    Base de los escritores: calcula cada resultado y escribe por bloques.
+
+    Se usa como context manager; close() escribe el último bloque.
+    """
+
+    def __init__(self, calculator: GradeCalculator, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        """
+        Inicializa el escritor.
+
+        Args:
+            calculator: Calculadora configurada con las políticas a aplicar
+            chunk_size: Estudiantes acumulados antes de escribir un bloque
+
+        Raises:
+            ValueError: Si chunk_size no es positivo
+        """
+        if chunk_size < 1:
+            raise ValueError("El tamaño de bloque debe ser positivo")
+        self.calculator = calculator
+        self.chunk_size = chunk_size
+        self.rows = 0
+        self._pending = 0
+
+    def write(self, student, academic_year: int = 0) -> dict:
+        """
+        Califica un estudiante y agrega su resultado al bloque actual.
+
+        Returns:
+            Dict: Resultado de calculate_final_grade
+
+        Raises:
+            ValueError: Si el estudiante no cumple las precondiciones del
+                        cálculo (no se escribe nada)
+        """
+        calculation = self.calculator.calculate_final_grade(student, academic_year)
+        self._append(student, academic_year, calculation)
+        self.rows += 1
+        self._pending += 1
+        if self._pending >= self.chunk_size:
+            self.flush()
+        return calculation
+
+    @abstractmethod
+    def _append(self, student, academic_year: int, calculation: dict) -> None:
+        """
+        Agrega el resultado de un estudiante al bloque actual.
+        """
+
+    @abstractmethod
+    def _write_chunk(self) -> None:
+        """
+        Escribe el bloque actual en la salida.
+        """
+
+    def flush(self) -> None:
+        """
+        Escribe el bloque pendiente.
+        """
+        if self._pending:
+            self._write_chunk()
+            self._pending = 0
+
+    def close(self) -> None:
+        """
+        Escribe el último bloque y libera los archivos propios del escritor.
+        """
+        self.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+
+class JsonlResultWriter(ResultWriter):
+    """
+    Escritor JSONL en streaming, sin diccionarios intermedios.
+    """
+
+    def __init__(self, calculator: GradeCalculator, stream,
+                 chunk_size: int = DEFAULT_CHUNK_SIZE, close_stream: bool = False):
+        """
+        Args:
+            calculator: Calculadora configurada con las políticas a aplicar
+            stream: Archivo de texto donde se escribe
+            chunk_size: Líneas acumuladas antes de cada escritura
+            close_stream: Si close() también cierra stream
+        """
+        super().__init__(calculator, chunk_size)
+        self.stream = stream
+        self.close_stream = close_stream
+        self._lines = []
+        self._selects = calculator.selects_evaluations
+
+    def _append(self, student, academic_year: int, calculation: dict) -> None:
+        calculator = self.calculator
+        weighted_average = calculation['weighted_average']
+        if self._selects or weighted_average - weighted_average != 0.0:
+            # Alguna nota es NaN o infinita (json.dumps las escribe como
+            # NaN/Infinity, no como repr) o el pipeline descarta evaluaciones
+            # (cada una lleva 'dropped'): se usa el camino general
+            details = calculator.get_calculation_details(student, academic_year)
+            self._lines.append(json.dumps(details, ensure_ascii=False) + '\n')
+            return
+        weighted_grade = calculator.weighted_grade
+        evaluations = student.evaluations
+        self._lines.append(_LINE_TEMPLATE % (
+            _json_value(student.student_id),
+            len(evaluations),
+            ', '.join([_EVALUATION_TEMPLATE % (evaluation.grade, evaluation.weight,
+                                               weighted_grade(evaluation))
+                       for evaluation in evaluations]),
+            round(student.get_total_weight(), 2),
+            _json_value(student.has_reached_minimum_classes),
+            _json_value(calculator.extra_points_policy.is_extra_points_active(academic_year)),
+            weighted_average,
+            calculation['attendance_penalty'],
+            calculation['extra_points'],
+            calculation['final_grade'],
+        ))
+
+    def _write_chunk(self) -> None:
+        self.stream.write(''.join(self._lines))
+        self._lines.clear()
+
+    def close(self) -> None:
+        try:
+            super().close()
+        finally:
+            if self.close_stream:
+                self.stream.close()
+
+
+class ColumnarResultWriter(ResultWriter):
+    """
+    Base de los escritores columnares: acumula las columnas de las tablas de
+    estudiantes y de evaluaciones del bloque actual.
+    """
+
+    def __init__(self, calculator: GradeCalculator, base_path: str,
+                 chunk_size: int = DEFAULT_CHUNK_SIZE):
+        """
+        Args:
+            calculator: Calculadora configurada con las políticas a aplicar
+            base_path: Ruta base; las tablas se escriben en
+                       ``<base>.students.<ext>`` y ``<base>.evaluations.<ext>``
+            chunk_size: Estudiantes por bloque
+        """
+        super().__init__(calculator, chunk_size)
+        self.students_path = f"{base_path}.students.{self.EXTENSION}"
+        self.evaluations_path = f"{base_path}.evaluations.{self.EXTENSION}"
+        self._students = {column: [] for column in STUDENT_COLUMNS}
+        self._evaluations = {column: [] for column in EVALUATION_COLUMNS}
+        self._selects = calculator.selects_evaluations
+
+    def _append(self, student, academic_year: int, calculation: dict) -> None:
+        student_id = student.student_id
+        weighted_grade = self.calculator.weighted_grade
+        evaluations = self._evaluations
+        student_evaluations = student.evaluations
+        dropped = self.calculator.dropped_evaluations(student) if self._selects else ()
+        for position, evaluation in enumerate(student_evaluations):
+            evaluations['student_id'].append(student_id)
+            evaluations['position'].append(position)
+            evaluations['grade'].append(float(evaluation.grade))
+            evaluations['weight'].append(float(evaluation.weight))
+            evaluations['weighted_grade'].append(weighted_grade(evaluation))
+            evaluations['dropped'].append(position in dropped)
+
+        if dropped:
+            total_weight = kept_total_weight(student_evaluations, dropped)
+        else:
+            total_weight = student.get_total_weight()
+        students = self._students
+        students['student_id'].append(student_id)
+        students['academic_year'].append(academic_year)
+        students['number_of_evaluations'].append(len(student_evaluations) - len(dropped))
+        students['total_weight'].append(float(round(total_weight, 2)))
+        students['has_reached_minimum_classes'].append(
+            bool(student.has_reached_minimum_classes))
+        students['extra_points_policy_active'].append(
+            bool(self.calculator.extra_points_policy.is_extra_points_active(academic_year)))
+        for field in ('weighted_average', 'attendance_penalty', 'extra_points', 'final_grade'):
+            students[field].append(calculation[field])
+
+    def _clear(self) -> None:
+        for column in self._students.values():
+            column.clear()
+        for column in self._evaluations.values():
+            column.clear()
+
+
+class CsvResultWriter(ColumnarResultWriter):
+    """
+    Escritor columnar en CSV (sin dependencias externas).
+
+    Los valores booleanos se escriben como true/false.
+    """
+
+    EXTENSION = 'csv'
+
+    def __init__(self, calculator: GradeCalculator, base_path: str,
+                 chunk_size: int = DEFAULT_CHUNK_SIZE):
+        super().__init__(calculator, base_path, chunk_size)
+        self._files = [open(self.students_path, 'w', encoding='utf-8', newline=''),
+                       open(self.evaluations_path, 'w', encoding='utf-8', newline='')]
+        self._student_writer = csv.writer(self._files[0])
+        self._evaluation_writer = csv.writer(self._files[1])
+        self._student_writer.writerow(STUDENT_COLUMNS)
+        self._evaluation_writer.writerow(EVALUATION_COLUMNS)
+
+    def _write_chunk(self) -> None:
+        students = self._students
+        for field in ('has_reached_minimum_classes', 'extra_points_policy_active'):
+            students[field] = ['true' if value else 'false' for value in students[field]]
+        evaluations = self._evaluations
+        evaluations['dropped'] = ['true' if value else 'false'
+                                  for value in evaluations['dropped']]
+        self._student_writer.writerows(zip(*(students[column] for column in STUDENT_COLUMNS)))
+        self._evaluation_writer.writerows(
+            zip(*(evaluations[column] for column in EVALUATION_COLUMNS)))
+        self._clear()
+
+    def close(self) -> None:
+        try:
+            super().close()
+        finally:
+            for stream in self._files:
+                stream.close()
+
+
+class ArrowResultWriter(ColumnarResultWriter):
+    """
+    Escritor columnar en Arrow IPC (formato de archivo), un record batch por
+    bloque. Requiere la dependencia opcional pyarrow.
+    """
+
+    EXTENSION = 'arrow'
+
+    def __init__(self, calculator: GradeCalculator, base_path: str,
+                 chunk_size: int = DEFAULT_CHUNK_SIZE):
+        """
+        Raises:
+            ValueError: Si pyarrow no está instalado
+        """
+        try:
+            import pyarrow
+            import pyarrow.ipc
+        except ImportError:
+            raise ValueError("La salida Arrow requiere el paquete opcional pyarrow") from None
+        super().__init__(calculator, base_path, chunk_size)
+        self._pyarrow = pyarrow
+        self._student_schema = pyarrow.schema([
+            ('student_id', pyarrow.string()), ('academic_year', pyarrow.int64()),
+            ('number_of_evaluations', pyarrow.int64()), ('total_weight', pyarrow.float64()),
+            ('has_reached_minimum_classes', pyarrow.bool_()),
+            ('extra_points_policy_active', pyarrow.bool_()),
+            ('weighted_average', pyarrow.float64()), ('attendance_penalty', pyarrow.float64()),
+            ('extra_points', pyarrow.float64()), ('final_grade', pyarrow.float64()),
+        ])
+        self._evaluation_schema = pyarrow.schema([
+            ('student_id', pyarrow.string()), ('position', pyarrow.int64()),
+            ('grade', pyarrow.float64()), ('weight', pyarrow.float64()),
+            ('weighted_grade', pyarrow.float64()), ('dropped', pyarrow.bool_()),
+        ])
+        self._student_writer = pyarrow.ipc.new_file(self.students_path, self._student_schema)
+        self._evaluation_writer = pyarrow.ipc.new_file(self.evaluations_path,
+                                                       self._evaluation_schema)
+
+    def _write_chunk(self) -> None:
+        record_batch = self._pyarrow.RecordBatch.from_pydict
+        self._student_writer.write_batch(record_batch(self._students,
+                                                      schema=self._student_schema))
+        self._evaluation_writer.write_batch(record_batch(self._evaluations,
+                                                         schema=self._evaluation_schema))
+        self._clear()
+
+    def close(self) -> None:
+        try:
+            super().close()
+        finally:
+            self._student_writer.close()
+            self._evaluation_writer.close()
+
+
+def open_result_writer(calculator: GradeCalculator, path: str, output_format: str = 'jsonl',
+                       chunk_size: int = DEFAULT_CHUNK_SIZE) -> ResultWriter:
+    """
+    Crea el escritor de resultados para un formato.
+
+    Args:
+        calculator: Calculadora configurada con las políticas a aplicar
+        path: Archivo JSONL de salida, o ruta base de las tablas columnares
+        output_format: 'jsonl', 'csv' o 'arrow'
+        chunk_size: Estudiantes por bloque
+
+    Returns:
+        ResultWriter: Escritor abierto (cierra sus archivos al cerrarse)
+
+    Raises:
+        ValueError: Si el formato no es soportado o falta pyarrow para 'arrow'
+    """
+    if output_format == 'jsonl':
+        return JsonlResultWriter(calculator, open(path, 'w', encoding='utf-8'), chunk_size,
+                                 close_stream=True)
+    if output_format == 'csv':
+        return CsvResultWriter(calculator, path, chunk_size)
+    if output_format == 'arrow':
+        return ArrowResultWriter(calculator, path, chunk_size)
+    raise ValueError(f"Formato de salida no soportado: {output_format}")
+
+
+def export_records(writer: ResultWriter, records: Iterable, rejects,
+                   aggregate: Optional[SectionAggregate] = None,
+                   max_evaluations: Optional[int] = None) -> Dict[str, int]:
+    """
+    Califica registros de iter_records con un escritor de resultados.
+
+    Args:
+        writer: Escritor de resultados abierto
+        records: Iterable de (línea, fila original, registro) de iter_records
+        rejects: Archivo de texto donde se escribe un rechazo JSON por línea
+        aggregate: Estadísticas de sección a actualizar con cada resultado
+        max_evaluations: Máximo de evaluaciones por estudiante
+
+    Returns:
+        Dict[str, int]: Cantidad de filas 'processed' y 'rejected'
+    """
+    summary = {'processed': 0, 'rejected': 0}
+    for line_number, raw, record in records:
+        try:
+            if isinstance(record, ValueError):
+                raise record
+            student, academic_year = build_student(record, max_evaluations)
+            calculation = writer.write(student, academic_year)
+        except ValueError as error:
+            if aggregate is not None:
+                aggregate.add_rejected()
+            rejects.write(json.dumps({'line': line_number, 'error': str(error), 'row': raw},
+                                     ensure_ascii=False) + '\n')
+            summary['rejected'] += 1
+            continue
+        if aggregate is not None:
+            aggregate.add(calculation['final_grade'])
+        summary['processed'] += 1
+    return summary
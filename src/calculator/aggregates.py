@@ -0,0 +1,236 @@
+"""
+Módulo de estadísticas de sección calculadas en una sola pasada.
+
+SectionAggregate acumula las notas finales a medida que GradeCalculator las
+produce, sin guardarlas: media y varianza con el algoritmo de Welford,
+mínimo, máximo, tasa de aprobación, histograma por punto de nota y un sketch
+de cuantiles (mediana y percentiles). Todos los acumuladores se pueden
+combinar, de modo que cada proceso de un pool calcula un agregado parcial y
+el proceso principal los une con merge().
+"""
+
+import bisect
+import math
+from typing import Dict, Iterable, Optional
+
+
+# Nota mínima aprobatoria por defecto (escala vigesimal)
+PASSING_GRADE = 11.0
+
+# Límites superiores de las barras del histograma: [0, 1), [1, 2), ... [20, +Inf)
+HISTOGRAM_BOUNDS = tuple(float(point) for point in range(1, 21))
+
+# Percentiles reportados por defecto
+PERCENTILES = (0.10, 0.25, 0.50, 0.75, 0.90)
+
+
+class QuantileSketch:
+    """
+    Sketch de cuantiles combinable basado en conteos por valor redondeado.
+
+    Cada nota se cuenta en la cubeta de su valor redondeado a ``decimals``
+    decimales, por lo que el error de cualquier cuantil es como máximo media
+    unidad de ese decimal. Las notas finales ya están redondeadas a 2
+    decimales (RF04), así que con el valor por defecto el sketch es exacto y
+    su tamaño no depende del número de estudiantes (a lo sumo una cubeta por
+    nota posible).
+    """
+
+    __slots__ = ('decimals', 'counts', 'count')
+
+    def __init__(self, decimals: int = 2):
+        self.decimals = decimals
+        self.counts: Dict[int, int] = {}
+        self.count = 0
+
+    def add(self, value: float) -> None:
+        """
+        Registra un valor.
+
+        Raises:
+            ValueError: Si el valor es NaN o infinito
+        """
+        if not math.isfinite(value):
+            raise ValueError(f"El sketch solo admite valores finitos: {value}")
+        key = round(value * 10 ** self.decimals)
+        self.counts[key] = self.counts.get(key, 0) + 1
+        self.count += 1
+
+    def merge(self, other: 'QuantileSketch') -> None:
+        """
+        Suma los conteos de otro sketch con la misma resolución.
+
+        Raises:
+            ValueError: Si los sketches tienen distinta resolución
+        """
+        if other.decimals != self.decimals:
+            raise ValueError("No se pueden combinar sketches con distinta resolución")
+        for key, count in other.counts.items():
+            self.counts[key] = self.counts.get(key, 0) + count
+        self.count += other.count
+
+    def quantiles(self, fractions: Iterable[float]) -> Dict[float, Optional[float]]:
+        """
+        Calcula varios cuantiles por rango más cercano en un solo recorrido.
+
+        Args:
+            fractions: Cuantiles entre 0 y 1
+
+        Returns:
+            Dict: Valor de cada cuantil (None si el sketch está vacío)
+        """
+        fractions = list(fractions)
+        if not self.count:
+            return {fraction: None for fraction in fractions}
+        # round() evita que 0.9 * 10 = 9.000000000000002 suba al siguiente rango
+        ranks = sorted((max(math.ceil(round(fraction * self.count, 9)), 1), fraction)
+                       for fraction in fractions)
+        result = {}
+        seen = 0
+        position = 0
+        for key in sorted(self.counts):
+            seen += self.counts[key]
+            while position < len(ranks) and ranks[position][0] <= seen:
+                result[ranks[position][1]] = key / 10 ** self.decimals
+                position += 1
+        for _, fraction in ranks[position:]:
+            result[fraction] = max(self.counts) / 10 ** self.decimals
+        return result
+
+    def quantile(self, fraction: float) -> Optional[float]:
+        """
+        Calcula un cuantil por rango más cercano.
+        """
+        return self.quantiles([fraction])[fraction]
+
+
+class SectionAggregate:
+    """
+    Estadísticas en línea de las notas finales de una sección.
+
+    Attributes:
+        count (int): Notas registradas
+        rejected (int): Estudiantes que no se pudieron calificar
+        non_finite (int): Notas NaN o infinitas (por ejemplo, de una nota
+                          'inf' en la entrada), que no entran en ninguna
+                          estadística
+        passed (int): Notas mayores o iguales a passing_grade
+    """
+
+    __slots__ = ('passing_grade', 'count', 'rejected', 'non_finite', 'passed', 'mean', 'm2',
+                 'minimum', 'maximum', 'histogram', 'sketch')
+
+    def __init__(self, passing_grade: float = PASSING_GRADE, sketch_decimals: int = 2):
+        """
+        Inicializa un agregado vacío.
+
+        Args:
+            passing_grade: Nota mínima aprobatoria
+            sketch_decimals: Resolución del sketch de cuantiles
+        """
+        self.passing_grade = passing_grade
+        self.count = 0
+        self.rejected = 0
+        self.non_finite = 0
+        self.passed = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.minimum: Optional[float] = None
+        self.maximum: Optional[float] = None
+        self.histogram = [0] * (len(HISTOGRAM_BOUNDS) + 1)
+        self.sketch = QuantileSketch(sketch_decimals)
+
+    def new_partial(self) -> 'SectionAggregate':
+        """
+        Crea un agregado vacío con la misma configuración (para cada proceso).
+        """
+        return SectionAggregate(self.passing_grade, self.sketch.decimals)
+
+    def add(self, final_grade: float) -> None:
+        """
+        Registra la nota final de un estudiante. Las notas NaN o infinitas
+        solo se cuentan en non_finite.
+        """
+        if not math.isfinite(final_grade):
+            self.non_finite += 1
+            return
+        self.count += 1
+        delta = final_grade - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (final_grade - self.mean)
+        if self.minimum is None or final_grade < self.minimum:
+            self.minimum = final_grade
+        if self.maximum is None or final_grade > self.maximum:
+            self.maximum = final_grade
+        if final_grade >= self.passing_grade:
+            self.passed += 1
+        self.histogram[bisect.bisect_right(HISTOGRAM_BOUNDS, final_grade)] += 1
+        self.sketch.add(final_grade)
+
+    def add_rejected(self) -> None:
+        """
+        Registra un estudiante que no se pudo calificar.
+        """
+        self.rejected += 1
+
+    def merge(self, other: 'SectionAggregate') -> None:
+        """
+        Combina otro agregado parcial (fórmula paralela de Chan et al.).
+
+        Raises:
+            ValueError: Si los agregados tienen distinta configuración
+        """
+        if other.passing_grade != self.passing_grade:
+            raise ValueError("No se pueden combinar agregados con distinta nota aprobatoria")
+        self.sketch.merge(other.sketch)
+        self.rejected += other.rejected
+        self.non_finite += other.non_finite
+        if not other.count:
+            return
+        total = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / total
+        self.m2 += other.m2 + delta * delta * self.count * other.count / total
+        self.count = total
+        self.passed += other.passed
+        self.minimum = other.minimum if self.minimum is None else min(self.minimum,
+                                                                      other.minimum)
+        self.maximum = other.maximum if self.maximum is None else max(self.maximum,
+                                                                      other.maximum)
+        for index, count in enumerate(other.histogram):
+            self.histogram[index] += count
+
+    def result(self, percentiles: Iterable[float] = PERCENTILES) -> Dict:
+        """
+        Obtiene las estadísticas de la sección.
+
+        Args:
+            percentiles: Percentiles a reportar (entre 0 y 1)
+
+        Returns:
+            Dict: count, rejected, non_finite, mean, variance, std_dev
+            (poblacionales), min, max, median, percentiles, pass_rate e
+            histogram. Los valores que requieren notas son None si no se
+            registró ninguna.
+        """
+        fractions = list(percentiles)
+        quantiles = self.sketch.quantiles(fractions + [0.5])
+        variance = self.m2 / self.count if self.count else None
+        lowers = (0.0,) + HISTOGRAM_BOUNDS
+        uppers = HISTOGRAM_BOUNDS + (None,)
+        return {
+            'count': self.count,
+            'rejected': self.rejected,
+            'non_finite': self.non_finite,
+            'mean': self.mean if self.count else None,
+            'variance': variance,
+            'std_dev': math.sqrt(variance) if variance is not None else None,
+            'min': self.minimum,
+            'max': self.maximum,
+            'median': quantiles[0.5],
+            'percentiles': {f"p{round(fraction * 100):g}": quantiles[fraction]
+                            for fraction in fractions},
+            'pass_rate': self.passed / self.count if self.count else None,
+            'histogram': [{'lower': lower, 'upper': upper, 'count': count}
+                          for lower, upper, count in zip(lowers, uppers, self.histogram)],
+        }
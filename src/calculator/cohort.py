@@ -0,0 +1,222 @@
+"""
+Módulo de cálculo vectorizado de notas finales para cohortes completas.
+
+Los datos se reciben en formato columnar: las notas y pesos de todas las
+evaluaciones se concatenan en dos arreglos planos y ``evaluation_counts``
+indica cuántas evaluaciones pertenecen a cada estudiante (en orden).
+"""
+
+import numpy as np
+
+
+# Campos devueltos por el cálculo, en el mismo orden que calculate_final_grade
+RESULT_FIELDS = ('weighted_average', 'attendance_penalty', 'extra_points', 'final_grade')
+
+
+def round_2(values: np.ndarray) -> np.ndarray:
+    """
+    Redondea a 2 decimales con el mismo resultado que ``round(x, 2)`` de Python.
+
+    ``np.round`` escala por 100 y redondea, lo que puede diferir de ``round``
+    cuando el valor escalado queda muy cerca de .5. Esos casos (muy pocos) se
+    recalculan con ``round`` para garantizar resultados idénticos bit a bit.
+
+    Args:
+        values: Arreglo de valores float64
+
+    Returns:
+        np.ndarray: Valores redondeados
+    """
+    values = np.asarray(values, dtype=np.float64)
+    rounded = np.round(values, 2)
+    scaled = values * 100
+    distance = np.abs(scaled - np.floor(scaled) - 0.5)
+    ambiguous = np.flatnonzero(distance <= 1e-6 * np.maximum(1.0, np.abs(scaled)))
+    for index in ambiguous.tolist():
+        rounded[index] = round(float(values[index]), 2)
+    return rounded
+
+
+def pad_evaluations(grades, weights, evaluation_counts):
+    """
+    Reorganiza las columnas planas en matrices (estudiantes x evaluaciones).
+
+    Las posiciones sobrantes se rellenan con 0.0, que no altera las sumas.
+
+    Args:
+        grades: Notas de todas las evaluaciones, concatenadas por estudiante
+        weights: Pesos de todas las evaluaciones, concatenados por estudiante
+        evaluation_counts: Número de evaluaciones de cada estudiante
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray]: Matriz de notas, matriz de
+        pesos y vector de cantidades
+
+    Raises:
+        ValueError: Si las longitudes de las columnas no son consistentes
+    """
+    grades = np.asarray(grades, dtype=np.float64)
+    weights = np.asarray(weights, dtype=np.float64)
+    counts = np.asarray(evaluation_counts, dtype=np.int64)
+
+    if grades.ndim != 1 or weights.ndim != 1 or counts.ndim != 1:
+        raise ValueError("Las columnas deben ser unidimensionales")
+    if grades.shape != weights.shape:
+        raise ValueError("Las columnas de notas y pesos deben tener la misma longitud")
+    if np.any(counts < 0):
+        raise ValueError("El número de evaluaciones no puede ser negativo")
+    if int(counts.sum()) != grades.size:
+        raise ValueError(
+            "La suma de evaluation_counts debe coincidir con el número de evaluaciones"
+        )
+
+    n_students = counts.size
+    width = int(counts.max()) if n_students else 0
+    starts = np.zeros(n_students, dtype=np.int64)
+    if n_students > 1:
+        np.cumsum(counts[:-1], out=starts[1:])
+
+    rows = np.repeat(np.arange(n_students, dtype=np.int64), counts)
+    columns = np.arange(grades.size, dtype=np.int64) - np.repeat(starts, counts)
+
+    grade_matrix = np.zeros((n_students, width), dtype=np.float64)
+    weight_matrix = np.zeros((n_students, width), dtype=np.float64)
+    grade_matrix[rows, columns] = grades
+    weight_matrix[rows, columns] = weights
+    return grade_matrix, weight_matrix, counts
+
+
+def weighted_averages(grade_matrix: np.ndarray, weight_matrix: np.ndarray,
+                      counts: np.ndarray) -> np.ndarray:
+    """
+    Calcula el promedio ponderado (sin redondear) de cada estudiante.
+
+    Las sumas se acumulan columna por columna, de izquierda a derecha, para
+    reproducir exactamente el orden de suma de la ruta escalar (RNF03).
+
+    Raises:
+        ValueError: Si algún estudiante no tiene evaluaciones, alguna nota o
+                    peso es inválido, o el peso total es cero
+    """
+    invalid = np.flatnonzero(counts == 0)
+    if invalid.size:
+        raise ValueError(
+            f"El estudiante debe tener al menos una evaluación (fila {int(invalid[0])})"
+        )
+    if np.any(grade_matrix < 0):
+        raise ValueError("La nota no puede ser negativa")
+    if np.any((weight_matrix < 0) | (weight_matrix > 100)):
+        raise ValueError("El peso debe estar entre 0 y 100")
+
+    n_students, width = grade_matrix.shape
+    weighted_sum = np.zeros(n_students, dtype=np.float64)
+    total_weight = np.zeros(n_students, dtype=np.float64)
+    for column in range(width):
+        weight_column = weight_matrix[:, column]
+        weighted_sum += grade_matrix[:, column] * (weight_column / 100)
+        total_weight += weight_column
+
+    invalid = np.flatnonzero(total_weight == 0)
+    if invalid.size:
+        raise ValueError(
+            "El peso total de las evaluaciones no puede ser cero "
+            f"(fila {int(invalid[0])})"
+        )
+    return weighted_sum / (total_weight / 100)
+
+
+def policy_vectors(attendance_policy, extra_points_policy, has_reached_minimum_classes,
+                   academic_years):
+    """
+    Evalúa las políticas una sola vez por valor distinto y las difunde a la cohorte.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Penalización y puntos extra por estudiante
+    """
+    attendance = np.asarray(has_reached_minimum_classes, dtype=bool)
+    years = np.asarray(academic_years, dtype=np.int64)
+
+    penalty = np.where(
+        attendance,
+        float(attendance_policy.calculate_penalty(True)),
+        float(attendance_policy.calculate_penalty(False))
+    )
+
+    unique_years, inverse = np.unique(years, return_inverse=True)
+    extra_by_year = np.array(
+        [float(extra_points_policy.get_extra_points_for_year(int(year)))
+         for year in unique_years.tolist()],
+        dtype=np.float64
+    )
+    extra_points = extra_by_year[inverse.reshape(-1)]
+    return penalty, extra_points
+
+
+def final_grades(weighted_average: np.ndarray, attendance_penalty: np.ndarray,
+                 extra_points: np.ndarray) -> np.ndarray:
+    """
+    Aplica RF04 a vectores por estudiante: promedio ponderado - penalización
+    + puntos extra, sin bajar de 0 y sin redondear.
+
+    Es la versión vectorizada de GradeCalculator._calculate_final_grade, con
+    las mismas operaciones en el mismo orden (RNF03). Los cálculos de
+    cohortes solo difieren en cómo obtienen la penalización y los puntos
+    extra de cada estudiante.
+    """
+    final_grade = weighted_average - attendance_penalty + extra_points
+    return np.where(final_grade > 0.0, final_grade, 0.0)
+
+
+def grade_vectors(weighted_average: np.ndarray, attendance_penalty: np.ndarray,
+                  extra_points: np.ndarray) -> dict:
+    """
+    Calcula la nota final (final_grades) y redondea los cuatro campos.
+
+    Returns:
+        Dict[str, np.ndarray]: Mismas claves que calculate_final_grade, con un
+        valor por estudiante
+    """
+    return {
+        'weighted_average': round_2(weighted_average),
+        'attendance_penalty': round_2(attendance_penalty),
+        'extra_points': round_2(extra_points),
+        'final_grade': round_2(final_grades(weighted_average, attendance_penalty,
+                                            extra_points))
+    }
+
+
+def calculate_cohort(attendance_policy, extra_points_policy, grades, weights,
+                     evaluation_counts, has_reached_minimum_classes,
+                     academic_years=0):
+    """
+    Calcula las notas finales de toda una cohorte en una pasada vectorizada.
+
+    Args:
+        attendance_policy: Política de asistencia a aplicar
+        extra_points_policy: Política de puntos extra a aplicar
+        grades: Notas de todas las evaluaciones, concatenadas por estudiante
+        weights: Pesos de todas las evaluaciones, concatenados por estudiante
+        evaluation_counts: Número de evaluaciones de cada estudiante
+        has_reached_minimum_classes: Asistencia mínima de cada estudiante
+        academic_years: Año académico de cada estudiante (o uno común a todos)
+
+    Returns:
+        Dict[str, np.ndarray]: Mismas claves que calculate_final_grade, con un
+        valor por estudiante
+
+    Raises:
+        ValueError: Si las columnas son inconsistentes o algún estudiante no
+                    cumple las precondiciones del cálculo
+    """
+    grade_matrix, weight_matrix, counts = pad_evaluations(grades, weights, evaluation_counts)
+    n_students = counts.size
+
+    attendance = np.broadcast_to(np.asarray(has_reached_minimum_classes, dtype=bool),
+                                 (n_students,))
+    years = np.broadcast_to(np.asarray(academic_years, dtype=np.int64), (n_students,))
+
+    weighted_average = weighted_averages(grade_matrix, weight_matrix, counts)
+    attendance_penalty, extra_points = policy_vectors(
+        attendance_policy, extra_points_policy, attendance, years
+    )
+    return grade_vectors(weighted_average, attendance_penalty, extra_points)
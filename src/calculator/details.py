@@ -0,0 +1,227 @@
+"""
+Módulo con el resultado diferido de GradeCalculator.get_calculation_details.
+
+El detalle por evaluación (RF05) es una lista con un diccionario por
+evaluación, y la mayoría de los consumidores solo leen la nota final.
+CalculationDetails es un dict que guarda los totales del cálculo al crearse
+y arma la lista 'evaluations' solo la primera vez que se accede a ella (o a
+cualquier operación que recorra el contenido: iteración, items, ==, repr,
+json.dumps, pickle o modificaciones). Una vez armado se comporta como el
+dict de siempre, con las claves en el mismo orden.
+
+Cuando el cálculo descarta evaluaciones (DropLowest o BestOf), todas siguen
+en la lista, cada una con 'dropped', y number_of_evaluations y total_weight
+corresponden a las conservadas: el peso con que se renormalizó el promedio.
+"""
+
+from __future__ import annotations
+
+from src.models.evaluation import Evaluation
+
+
+_EVALUATIONS = 'evaluations'
+
+
+def kept_total_weight(evaluations, dropped) -> float:
+    """
+    Obtiene el peso de las evaluaciones conservadas, sumado en el mismo orden
+    que el pipeline compilado (el peso con que se renormaliza el promedio).
+    """
+    total_weight = 0
+    for position, evaluation in enumerate(evaluations):
+        if position not in dropped:
+            total_weight += evaluation.weight
+    return total_weight
+
+
+class _EvaluationValues:
+    # Copia de nota y peso con la interfaz que usa GradeCalculator.weighted_grade
+    __slots__ = ('grade', 'weight')
+
+    get_weighted_grade = Evaluation.get_weighted_grade
+
+
+class CalculationDetails(dict):
+    """
+    Detalle del cálculo de un estudiante con la lista de evaluaciones diferida.
+
+    Las notas y pesos se copian al crearse, por lo que el detalle no cambia
+    si luego se modifica el estudiante y sigue siendo válido cuando las
+    evaluaciones son vistas sobre memoria ya liberada (EvaluationView).
+    """
+
+    __slots__ = ('_grades', '_weights', '_weighted_grade', '_dropped')
+
+    def __init__(self, student, calculation: dict, extra_points_policy_active: bool,
+                 weighted_grade, dropped=None):
+        """
+        Guarda los totales del cálculo.
+
+        Args:
+            student: Estudiante calculado
+            calculation: Resultado de calculate_final_grade para el estudiante
+            extra_points_policy_active: Si la política de puntos extra aplica
+            weighted_grade: Función que obtiene la nota ponderada de una
+                            evaluación (GradeCalculator.weighted_grade)
+            dropped: Posiciones de las evaluaciones descartadas, o None si el
+                     cálculo no descarta evaluaciones
+        """
+        evaluations = student.evaluations
+        if dropped is None:
+            number_of_evaluations = len(evaluations)
+            total_weight = student.get_total_weight()
+        else:
+            number_of_evaluations = len(evaluations) - len(dropped)
+            total_weight = kept_total_weight(evaluations, dropped)
+        dict.__init__(self, student_id=student.student_id,
+                      number_of_evaluations=number_of_evaluations,
+                      total_weight=round(total_weight, 2),
+                      has_reached_minimum_classes=student.has_reached_minimum_classes,
+                      extra_points_policy_active=extra_points_policy_active)
+        dict.update(self, calculation)
+        self._grades = tuple([evaluation.grade for evaluation in evaluations])
+        self._weights = tuple([evaluation.weight for evaluation in evaluations])
+        self._weighted_grade = weighted_grade
+        self._dropped = dropped
+
+    @property
+    def is_materialized(self) -> bool:
+        """
+        Indica si la lista de evaluaciones ya se armó.
+        """
+        return self._grades is None
+
+    def _materialize(self) -> None:
+        # Inserta 'evaluations' en su posición (tercera clave) para que el
+        # orden coincida con el del dict armado de una vez
+        grades = self._grades
+        if grades is None:
+            return
+        weights = self._weights
+        self._grades = self._weights = None
+        weighted_grade = self._weighted_grade
+        values = _EvaluationValues()
+        evaluations = []
+        for grade, weight in zip(grades, weights):
+            values.grade = grade
+            values.weight = weight
+            evaluations.append({
+                'grade': grade,
+                'weight': weight,
+                'weighted_grade': weighted_grade(values)
+            })
+        dropped = self._dropped
+        if dropped is not None:
+            for position, evaluation in enumerate(evaluations):
+                evaluation['dropped'] = position in dropped
+        items = list(dict.items(self))
+        dict.clear(self)
+        dict.update(self, items[:2])
+        dict.__setitem__(self, _EVALUATIONS, evaluations)
+        dict.update(self, items[2:])
+
+    def __missing__(self, key):
+        # dict.__getitem__ solo llega aquí con claves ausentes, de modo que
+        # leer los totales no paga ningún costo adicional
+        if key == _EVALUATIONS and self._grades is not None:
+            self._materialize()
+            return dict.__getitem__(self, key)
+        raise KeyError(key)
+
+    def get(self, key, default=None):
+        if key == _EVALUATIONS:
+            self._materialize()
+        return dict.get(self, key, default)
+
+    def __contains__(self, key) -> bool:
+        if key == _EVALUATIONS and self._grades is not None:
+            return True
+        return dict.__contains__(self, key)
+
+    def __len__(self) -> int:
+        return dict.__len__(self) + (self._grades is not None)
+
+    def __iter__(self):
+        self._materialize()
+        return dict.__iter__(self)
+
+    def __reversed__(self):
+        self._materialize()
+        return dict.__reversed__(self)
+
+    def keys(self):
+        self._materialize()
+        return dict.keys(self)
+
+    def values(self):
+        self._materialize()
+        return dict.values(self)
+
+    def items(self):
+        self._materialize()
+        return dict.items(self)
+
+    def copy(self) -> dict:
+        self._materialize()
+        return dict(dict.items(self))
+
+    def __eq__(self, other):
+        self._materialize()
+        if isinstance(other, CalculationDetails):
+            other._materialize()
+        return dict.__eq__(self, other)
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    __hash__ = None
+
+    def __or__(self, other):
+        self._materialize()
+        return dict.__or__(dict(dict.items(self)), other)
+
+    def __ror__(self, other):
+        self._materialize()
+        return dict.__ror__(dict(dict.items(self)), other)
+
+    def __setitem__(self, key, value):
+        self._materialize()
+        dict.__setitem__(self, key, value)
+
+    def __delitem__(self, key):
+        self._materialize()
+        dict.__delitem__(self, key)
+
+    def __ior__(self, other):
+        self._materialize()
+        return dict.__ior__(self, other)
+
+    def update(self, *args, **kwargs):
+        self._materialize()
+        dict.update(self, *args, **kwargs)
+
+    def setdefault(self, key, default=None):
+        self._materialize()
+        return dict.setdefault(self, key, default)
+
+    def pop(self, key, *default):
+        self._materialize()
+        return dict.pop(self, key, *default)
+
+    def popitem(self):
+        self._materialize()
+        return dict.popitem(self)
+
+    def clear(self) -> None:
+        self._grades = self._weights = None
+        dict.clear(self)
+
+    def __repr__(self) -> str:
+        self._materialize()
+        return dict.__repr__(self)
+
+    def __reduce__(self):
+        # Se serializa como el dict completo (procesos de trabajo, copy)
+        self._materialize()
+        return (dict, (dict(dict.items(self)),))
@@ -0,0 +1,218 @@
+"""
+Módulo de cálculo de notas en punto fijo (centésimas) con aritmética entera.
+
+Las notas, los pesos y los valores de las políticas se convierten a enteros
+en centésimas (15.07 -> 1507, peso 33.5 -> 3350) y el promedio ponderado se
+calcula como una sola división entera exacta::
+
+    promedio = suma(nota_i * peso_i) / suma(peso_i)
+
+Regla de redondeo: el resultado se redondea a centésimas hacia arriba en la
+mitad exacta (ROUND_HALF_UP; los valores nunca son negativos), una única
+vez, sobre el cociente exacto. Por ejemplo, notas 10.25 y 10.26 con igual
+peso promedian exactamente 10.255 -> 10.26, mientras que con floats y
+``round(x, 2)`` el resultado es 10.25 porque 10.255 queda representado en
+binario como 10.25499999... La penalización y los puntos extra ya son
+centésimas exactas, por lo que se suman al promedio redondeado sin volver a
+redondear (equivale a redondear la nota final exacta).
+
+Las entradas deben ser representables en centésimas: un valor se acepta si
+es el float más cercano a un número con 2 decimales (15.07, que en binario
+es 15.0699999..., se lee como 1507), y un valor como 15.125 se rechaza con
+ValueError en lugar de redondearse en silencio.
+
+Las funciones vectorizadas usan enteros int64 con el mismo resultado bit a
+bit que las escalares.
+"""
+
+from __future__ import annotations
+
+import math
+
+from src.models.student import Student
+
+# Unidades por punto: los valores se guardan en centésimas
+SCALE = 100
+
+
+def to_hundredths(value: float) -> int:
+    """
+    Convierte un valor a centésimas enteras.
+
+    Args:
+        value: Nota, peso o valor de política
+
+    Returns:
+        int: Valor en centésimas
+
+    Raises:
+        ValueError: Si el valor no es representable en centésimas (incluye
+                    NaN e infinitos)
+    """
+    if not math.isfinite(value):
+        raise ValueError(f"El valor {value!r} no se puede representar en centésimas")
+    hundredths = round(value * SCALE)
+    if hundredths / SCALE != value:
+        raise ValueError(f"El valor {value!r} no se puede representar en centésimas")
+    return hundredths
+
+
+def divide_half_up(numerator: int, denominator: int) -> int:
+    """
+    Divide enteros no negativos redondeando la mitad exacta hacia arriba.
+    """
+    return (2 * numerator + denominator) // (2 * denominator)
+
+
+def weighted_grade(evaluation) -> float:
+    """
+    Calcula la nota ponderada (nota * peso / 100) de una evaluación,
+    redondeada a centésimas con la misma regla que el promedio.
+
+    Raises:
+        ValueError: Si la nota o el peso no son representables en centésimas
+    """
+    # nota y peso en centésimas: el producto queda en diezmilésimas de centésima
+    product = to_hundredths(evaluation.grade) * to_hundredths(evaluation.weight)
+    return divide_half_up(product, SCALE * SCALE) / SCALE
+
+
+def calculate_final_grade(student: Student, academic_year: int, attendance_policy,
+                          extra_points_policy) -> dict[str, float]:
+    """
+    Calcula la nota final (RF04) en punto fijo.
+
+    Args:
+        student: Estudiante con sus evaluaciones
+        academic_year: Año académico para consultar la política de puntos extra
+        attendance_policy: Política de asistencia a aplicar
+        extra_points_policy: Política de puntos extra a aplicar
+
+    Returns:
+        Dict con las mismas claves que GradeCalculator.calculate_final_grade;
+        cada valor es una cantidad exacta de centésimas
+
+    Raises:
+        ValueError: Si el estudiante no tiene evaluaciones, el peso total es
+                    cero o algún valor no es representable en centésimas
+    """
+    evaluations = student.evaluations
+    if not evaluations:
+        raise ValueError("El estudiante debe tener al menos una evaluación")
+
+    weighted_sum = 0
+    total_weight = 0
+    for evaluation in evaluations:
+        # to_hundredths en línea: es el ciclo crítico del modo de punto fijo
+        try:
+            grade = round(evaluation.grade * SCALE)
+            weight = round(evaluation.weight * SCALE)
+        except (OverflowError, ValueError):
+            # NaN o infinito: to_hundredths lanza el ValueError documentado
+            grade = weight = None
+        if (grade is None or grade / SCALE != evaluation.grade
+                or weight / SCALE != evaluation.weight):
+            to_hundredths(evaluation.grade)
+            to_hundredths(evaluation.weight)
+        weighted_sum += grade * weight
+        total_weight += weight
+    if total_weight == 0:
+        raise ValueError("El peso total de las evaluaciones no puede ser cero")
+
+    weighted_average = divide_half_up(weighted_sum, total_weight)
+    attendance_penalty = to_hundredths(
+        attendance_policy.calculate_penalty(student.has_reached_minimum_classes)
+    )
+    extra_points = to_hundredths(extra_points_policy.get_extra_points_for_year(academic_year))
+    final_grade = max(0, weighted_average - attendance_penalty + extra_points)
+
+    return {
+        'weighted_average': weighted_average / SCALE,
+        'attendance_penalty': attendance_penalty / SCALE,
+        'extra_points': extra_points / SCALE,
+        'final_grade': final_grade / SCALE
+    }
+
+
+def to_hundredths_array(values):
+    """
+    Versión vectorizada de to_hundredths.
+
+    Returns:
+        np.ndarray: Valores en centésimas (int64)
+
+    Raises:
+        ValueError: Si algún valor no es representable en centésimas (incluye
+                    NaN e infinitos)
+    """
+    import numpy as np
+
+    values = np.asarray(values, dtype=np.float64)
+    hundredths = np.rint(values * SCALE)
+    invalid = np.flatnonzero(~np.isfinite(values) | (hundredths / SCALE != values))
+    if invalid.size:
+        value = float(values.flat[int(invalid[0])])
+        raise ValueError(f"El valor {value!r} no se puede representar en centésimas")
+    return hundredths.astype(np.int64)
+
+
+def calculate_cohort(attendance_policy, extra_points_policy, grades, weights,
+                     evaluation_counts, has_reached_minimum_classes, academic_years=0):
+    """
+    Calcula en punto fijo las notas finales de toda una cohorte.
+
+    Recibe las columnas con la misma convención que
+    src.calculator.cohort.calculate_cohort y devuelve los mismos valores que
+    calculate_final_grade de este módulo, estudiante por estudiante.
+
+    Returns:
+        Dict[str, np.ndarray]: Mismas claves que calculate_final_grade
+
+    Raises:
+        ValueError: Si las columnas son inconsistentes, algún estudiante no
+                    cumple las precondiciones del cálculo o algún valor no es
+                    representable en centésimas
+    """
+    import numpy as np
+    from src.calculator.cohort import pad_evaluations, policy_vectors
+
+    grade_matrix, weight_matrix, counts = pad_evaluations(grades, weights, evaluation_counts)
+    n_students = counts.size
+    invalid = np.flatnonzero(counts == 0)
+    if invalid.size:
+        raise ValueError(
+            f"El estudiante debe tener al menos una evaluación (fila {int(invalid[0])})"
+        )
+    if np.any(grade_matrix < 0):
+        raise ValueError("La nota no puede ser negativa")
+    if np.any((weight_matrix < 0) | (weight_matrix > 100)):
+        raise ValueError("El peso debe estar entre 0 y 100")
+
+    grade_hundredths = to_hundredths_array(grade_matrix)
+    weight_hundredths = to_hundredths_array(weight_matrix)
+    # Sumas enteras: exactas en cualquier orden
+    weighted_sum = (grade_hundredths * weight_hundredths).sum(axis=1)
+    total_weight = weight_hundredths.sum(axis=1)
+    invalid = np.flatnonzero(total_weight == 0)
+    if invalid.size:
+        raise ValueError(
+            "El peso total de las evaluaciones no puede ser cero "
+            f"(fila {int(invalid[0])})"
+        )
+
+    attendance = np.broadcast_to(np.asarray(has_reached_minimum_classes, dtype=bool),
+                                 (n_students,))
+    years = np.broadcast_to(np.asarray(academic_years, dtype=np.int64), (n_students,))
+    penalty, extra = policy_vectors(attendance_policy, extra_points_policy, attendance, years)
+
+    weighted_average = (2 * weighted_sum + total_weight) // (2 * total_weight)
+    attendance_penalty = to_hundredths_array(penalty)
+    extra_points = to_hundredths_array(extra)
+    final_grade = np.maximum(weighted_average - attendance_penalty + extra_points, 0)
+
+    return {
+        'weighted_average': weighted_average / SCALE,
+        'attendance_penalty': attendance_penalty / SCALE,
+        'extra_points': extra_points / SCALE,
+        'final_grade': final_grade / SCALE
+    }
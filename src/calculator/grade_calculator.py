@@ -2,10 +2,20 @@
 Módulo principal para el cálculo de la nota final del estudiante.
 """
 
-from typing import Dict
+from __future__ import annotations
+
+import time
+from collections import OrderedDict, namedtuple
+from src.calculator import fixed_point as fixed
+from src.calculator.details import CalculationDetails
+from src.calculator.metrics import MetricsRegistry, classify_validation_error
 from src.models.student import Student
 from src.policies.attendance_policy import AttendancePolicy
 from src.policies.extra_points_policy import ExtraPointsPolicy
+from src.policies.policy_config import PolicyConfig
+
+
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'maxsize', 'currsize'])
 
 
 class GradeCalculator:
@@ -16,22 +26,131 @@ class GradeCalculator:
     - Promedio ponderado de evaluaciones
     - Penalización por inasistencias
     - Puntos extra según política
+    
+    Opcionalmente mantiene una caché LRU de get_calculation_details indexada
+    por el contenido del estudiante. Los valores de los que dependen las
+    políticas (su policy_key) se comparan en cada consulta y, si cambiaron,
+    la caché se vacía, de modo que ningún cambio en las evaluaciones, la
+    asistencia o las políticas devuelve un resultado obsoleto.
+    
+    Con un MetricsRegistry registra llamadas, latencia y errores de
+    validación; sin él, el único costo es una comparación por llamada.
+    
+    Con fixed_point=True calcula en centésimas enteras con redondeo exacto
+    hacia arriba en la mitad (ver src.calculator.fixed_point).
+    
+    Si ambas políticas son el mismo tipo inmutable PolicyConfig, sus valores
+    se precalculan al crear la calculadora en lugar de consultarse por
+    estudiante.
     """
     
     def __init__(self, attendance_policy: AttendancePolicy, 
-                 extra_points_policy: ExtraPointsPolicy):
+                 extra_points_policy: ExtraPointsPolicy,
+                 cache_size: int = 0,
+                 metrics: MetricsRegistry | None = None,
+                 pipeline=None,
+                 fixed_point: bool = False):
         """
         Inicializa el calculador de notas.
         
         Args:
             attendance_policy: Política de asistencia a aplicar
             extra_points_policy: Política de puntos extra a aplicar
+            cache_size: Máximo de resultados en caché (0 = sin caché)
+            metrics: Registro de métricas (None = sin instrumentación)
+            pipeline: PolicyPipeline que reemplaza los pasos fijos de RF04
+                      (None = penalización de asistencia y puntos extra de
+                      las políticas dadas)
+            fixed_point: Calcula en punto fijo (centésimas) con aritmética
+                         entera exacta en lugar de floats
+            
+        Raises:
+            ValueError: Si cache_size es negativo o se combinan pipeline y
+                        fixed_point
         """
+        if cache_size < 0:
+            raise ValueError("El tamaño de la caché no puede ser negativo")
         self.attendance_policy = attendance_policy
         self.extra_points_policy = extra_points_policy
+        self.cache_size = cache_size
+        self._cache: OrderedDict | None = OrderedDict() if cache_size else None
+        self._cache_policy_key = None
+        self._cache_hits = 0
+        self._cache_misses = 0
+        self.metrics = metrics
+        if fixed_point and pipeline is not None:
+            raise ValueError("El modo de punto fijo no admite un pipeline de políticas")
+        self.pipeline = pipeline
+        self.fixed_point = fixed_point
+        if fixed_point:
+            self.weighted_grade = fixed.weighted_grade
+        self._prepare_policies()
+    
+    def _prepare_policies(self) -> None:
+        # Elige la implementación del cálculo según las políticas actuales
+        self._pipeline_kernel = None
+        # Solo los tramos de asistencia leen attendance_rate del estudiante
+        self._keys_attendance_rate = (self.pipeline is not None
+                                      and self.pipeline.uses_attendance_rate)
+        if self.pipeline is not None:
+            # La función compilada reemplaza al método en esta instancia, de
+            # modo que la ruta sin pipeline no paga ninguna comprobación extra.
+            # Se guardan los valores de las políticas con que se compiló para
+            # volver a compilar si cambian (ver _check_pipeline).
+            self._pipeline_key = self.pipeline.policy_key()
+            self._fused = self.pipeline.compile()
+            self._calculate_final_grade = self._calculate_final_grade_pipeline
+        elif self.fixed_point:
+            self._calculate_final_grade = self._calculate_final_grade_fixed_point
+        elif (isinstance(self.attendance_policy, PolicyConfig)
+              and isinstance(self.extra_points_policy, PolicyConfig)):
+            # Configuraciones inmutables: la penalización y los puntos extra se
+            # congelan en tuplas indexadas por asistencia y por año
+            self._penalties = self.attendance_policy.frozen_penalties()
+            self._extra_points = self.extra_points_policy.frozen_extra_points()
+            self._calculate_final_grade = self._calculate_final_grade_frozen
+        else:
+            self.__dict__.pop('_calculate_final_grade', None)
+    
+    def refresh_policies(self) -> None:
+        """
+        Vuelve a preparar las políticas después de reemplazarlas.
+        
+        Los valores congelados de PolicyConfig se toman de las políticas al
+        crear la calculadora; este método los vuelve a preparar y vacía la
+        caché de resultados. Los cambios en el lugar de las políticas de un
+        pipeline (por ejemplo all_years_teachers) se detectan solos.
+        """
+        self._prepare_policies()
+        self.cache_clear()
+    
+    def _check_pipeline(self) -> None:
+        # Las políticas del pipeline se pueden modificar en el lugar: si sus
+        # valores cambiaron desde la compilación se vuelve a compilar, y los
+        # resultados en caché calculados con la versión anterior se descartan
+        if self.pipeline.policy_key() != self._pipeline_key:
+            self._prepare_policies()
+            if self._cache is not None:
+                self._cache.clear()
+    
+    def _calculate_final_grade_pipeline(self, student: Student,
+                                        academic_year: int) -> dict[str, float]:
+        self._check_pipeline()
+        return self._fused(student, academic_year)
+    
+    def _observe(self, method: str, function, student: Student, academic_year: int):
+        # Ejecuta function midiendo su duración y clasificando los ValueError
+        start = time.perf_counter()
+        try:
+            return function(student, academic_year)
+        except ValueError as error:
+            self.metrics.record_validation_failure(classify_validation_error(error))
+            raise
+        finally:
+            self.metrics.observe_call(method, time.perf_counter() - start)
     
     def calculate_final_grade(self, student: Student, 
-                            academic_year: int = 0) -> Dict[str, float]:
+                            academic_year: int = 0) -> dict[str, float]:
         """
         Calcula la nota final del estudiante (RF04).
         
@@ -52,6 +171,30 @@ class GradeCalculator:
         Raises:
             ValueError: Si el estudiante no tiene evaluaciones o pesos inválidos
         """
+        if self.metrics is None:
+            return self._calculate_final_grade(student, academic_year)
+        return self._observe('calculate_final_grade', self._calculate_final_grade,
+                             student, academic_year)
+    
+    def _calculate_final_grade_fixed_point(self, student: Student,
+                                           academic_year: int) -> dict[str, float]:
+        return fixed.calculate_final_grade(student, academic_year, self.attendance_policy,
+                                           self.extra_points_policy)
+    
+    @staticmethod
+    def weighted_grade(evaluation) -> float:
+        """
+        Obtiene la nota ponderada de una evaluación tal como aparece en el
+        detalle del cálculo (RF05): redondeada a 2 decimales, o en punto fijo
+        si la calculadora usa fixed_point.
+        """
+        return round(evaluation.get_weighted_grade(), 2)
+    
+    def _calculate_final_grade(self, student: Student, academic_year: int,
+                               attendance_penalty: float | None = None,
+                               extra_points: float | None = None) -> dict[str, float]:
+        # Única implementación escalar de RF04: las políticas congeladas solo
+        # pasan sus valores precalculados (ver _calculate_final_grade_frozen)
         if not student.evaluations:
             raise ValueError("El estudiante debe tener al menos una evaluación")
         
@@ -60,16 +203,18 @@ class GradeCalculator:
             raise ValueError("El peso total de las evaluaciones no puede ser cero")
         
         # Calcular promedio ponderado
-        weighted_sum = sum(eval.get_weighted_grade() for eval in student.evaluations)
+        weighted_sum = student.get_weighted_sum()
         weighted_average = weighted_sum / (total_weight / 100)
         
         # Aplicar penalización por asistencia
-        attendance_penalty = self.attendance_policy.calculate_penalty(
-            student.has_reached_minimum_classes
-        )
+        if attendance_penalty is None:
+            attendance_penalty = self.attendance_policy.calculate_penalty(
+                student.has_reached_minimum_classes
+            )
         
         # Obtener puntos extra según política
-        extra_points = self.extra_points_policy.get_extra_points_for_year(academic_year)
+        if extra_points is None:
+            extra_points = self.extra_points_policy.get_extra_points_for_year(academic_year)
         
         # Calcular nota final
         final_grade = weighted_average - attendance_penalty + extra_points
@@ -84,8 +229,18 @@ class GradeCalculator:
             'final_grade': round(final_grade, 2)
         }
     
+    def _calculate_final_grade_frozen(self, student: Student,
+                                      academic_year: int) -> dict[str, float]:
+        extra_points = (self._extra_points[academic_year]
+                        if 0 <= academic_year < len(self._extra_points) else 0.0)
+        # La instancia reemplaza _calculate_final_grade por este método
+        return type(self)._calculate_final_grade(
+            self, student, academic_year,
+            self._penalties[1 if student.has_reached_minimum_classes else 0], extra_points
+        )
+    
     def get_calculation_details(self, student: Student, 
-                               academic_year: int = 0) -> Dict:
+                               academic_year: int = 0) -> dict:
         """
         Obtiene el detalle completo del cálculo (RF05).
         
@@ -94,26 +249,183 @@ class GradeCalculator:
             academic_year: Año académico para consultar política
             
         Returns:
-            Dict con todos los detalles del cálculo
+            Dict con todos los detalles del cálculo. La lista 'evaluations'
+            se arma recién cuando se accede a ella (ver CalculationDetails).
+            Si el pipeline descarta evaluaciones (DropLowest o BestOf), cada
+            evaluación lleva 'dropped' y number_of_evaluations y total_weight
+            cuentan solo las conservadas.
+            Con la caché activa, el mismo Dict se comparte entre llamadas y
+            no debe modificarse.
         """
-        calculation = self.calculate_final_grade(student, academic_year)
+        if self.metrics is None:
+            return self._get_calculation_details(student, academic_year)
+        return self._observe('get_calculation_details', self._get_calculation_details,
+                             student, academic_year)
+    
+    def _get_calculation_details(self, student: Student, academic_year: int) -> dict:
+        if self._cache is None:
+            return self._build_calculation_details(student, academic_year)
         
-        return {
-            'student_id': student.student_id,
-            'number_of_evaluations': len(student.evaluations),
-            'evaluations': [
-                {
-                    'grade': eval.grade,
-                    'weight': eval.weight,
-                    'weighted_grade': round(eval.get_weighted_grade(), 2)
-                }
-                for eval in student.evaluations
-            ],
-            'total_weight': round(student.get_total_weight(), 2),
-            'has_reached_minimum_classes': student.has_reached_minimum_classes,
-            'extra_points_policy_active': self.extra_points_policy.is_extra_points_active(
-                academic_year
-            ),
-            **calculation
-        }
+        policy_key = self._policy_key()
+        if policy_key != self._cache_policy_key:
+            self._cache.clear()
+            self._cache_policy_key = policy_key
+        key = self._cache_key(student, academic_year)
+        details = self._cache.get(key)
+        if details is not None:
+            self._cache.move_to_end(key)
+            self._cache_hits += 1
+            return details
+        
+        self._cache_misses += 1
+        details = self._build_calculation_details(student, academic_year)
+        self._cache[key] = details
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return details
+    
+    @property
+    def selects_evaluations(self) -> bool:
+        """
+        Indica si el pipeline de la calculadora descarta evaluaciones
+        (DropLowest o BestOf).
+        """
+        return self.pipeline is not None and self.pipeline.selects_evaluations
+    
+    def dropped_evaluations(self, student: Student) -> set[int] | None:
+        """
+        Obtiene las posiciones de las evaluaciones que el cálculo descarta.
+        
+        Returns:
+            set[int] | None: Posiciones descartadas, o None si la calculadora
+            no descarta evaluaciones
+        """
+        if not self.selects_evaluations:
+            return None
+        return self.pipeline.dropped_positions(student.evaluations)
+    
+    def _build_calculation_details(self, student: Student, academic_year: int) -> dict:
+        calculation = self._calculate_final_grade(student, academic_year)
+        
+        return CalculationDetails(
+            student, calculation,
+            self.extra_points_policy.is_extra_points_active(academic_year),
+            self.weighted_grade, self.dropped_evaluations(student)
+        )
+    
+    def _policy_key(self) -> tuple:
+        # Valores que declaran las políticas (no su identidad): si la lista de
+        # años o las constantes cambian, la clave cambia
+        key = (self.attendance_policy.policy_key(), self.extra_points_policy.policy_key())
+        if self.pipeline is not None:
+            key += (self.pipeline.policy_key(),)
+        return key
+    
+    def _cache_key(self, student: Student, academic_year: int) -> tuple:
+        # Solo el contenido del estudiante: los valores de las políticas se
+        # comparan una vez por consulta (ver _policy_key)
+        key = (
+            student.student_id,
+            tuple((eval.grade, eval.weight) for eval in student.evaluations),
+            student.has_reached_minimum_classes,
+            academic_year,
+        )
+        if self._keys_attendance_rate:
+            key += (getattr(student, 'attendance_rate', None),)
+        return key
+    
+    def cache_info(self) -> CacheInfo:
+        """
+        Obtiene las estadísticas de la caché de resultados.
+        
+        Returns:
+            CacheInfo: Aciertos, fallos, tamaño máximo y tamaño actual
+        """
+        return CacheInfo(self._cache_hits, self._cache_misses, self.cache_size,
+                         len(self._cache) if self._cache is not None else 0)
+    
+    def cache_clear(self) -> None:
+        """
+        Vacía la caché de resultados y reinicia sus estadísticas.
+        """
+        if self._cache is not None:
+            self._cache.clear()
+        self._cache_hits = 0
+        self._cache_misses = 0
+    
+    def calculate_cohort(self, grades, weights, evaluation_counts,
+                         has_reached_minimum_classes, academic_years=0,
+                         attendance_rates=None) -> dict:
+        """
+        Calcula la nota final de una cohorte completa en una pasada vectorizada.
+        
+        Las evaluaciones se reciben en columnas planas: ``grades`` y ``weights``
+        concatenan las evaluaciones de todos los estudiantes (en orden) y
+        ``evaluation_counts`` indica cuántas corresponden a cada uno. Los
+        resultados son idénticos bit a bit a los de calculate_final_grade (RNF03).
+        
+        Args:
+            grades: Notas de todas las evaluaciones
+            weights: Pesos de todas las evaluaciones
+            evaluation_counts: Número de evaluaciones por estudiante
+            has_reached_minimum_classes: Asistencia mínima por estudiante
+            academic_years: Año académico por estudiante (o uno común a todos)
+            attendance_rates: Porcentaje de asistencia por estudiante (solo
+                              lo usan pipelines con AttendanceTiers)
+            
+        Returns:
+            Dict con las mismas claves que calculate_final_grade, cada una con
+            un arreglo NumPy de un valor por estudiante
+            
+        Raises:
+            ValueError: Si las columnas son inconsistentes o algún estudiante
+                        no tiene evaluaciones o pesos válidos
+        """
+        if self.fixed_point:
+            return fixed.calculate_cohort(
+                self.attendance_policy, self.extra_points_policy, grades, weights,
+                evaluation_counts, has_reached_minimum_classes, academic_years
+            )
+        if self.pipeline is not None:
+            self._check_pipeline()
+            if self._pipeline_kernel is None:
+                self._pipeline_kernel = self.pipeline.compile_vectorized()
+            return self._pipeline_kernel(grades, weights, evaluation_counts,
+                                         has_reached_minimum_classes, academic_years,
+                                         attendance_rates)
+        
+        from src.calculator.cohort import calculate_cohort
+        
+        return calculate_cohort(
+            self.attendance_policy, self.extra_points_policy, grades, weights,
+            evaluation_counts, has_reached_minimum_classes, academic_years
+        )
+    
+    def validate_cohort(self, grades, weights, evaluation_counts):
+        """
+        Valida una cohorte completa en una pasada vectorizada, sin lanzar un
+        ValueError por cada valor inválido.
+        
+        Recibe las columnas en el mismo formato que calculate_cohort. Si la
+        calculadora tiene métricas, cada error se suma a los errores de
+        validación por motivo.
+        
+        Args:
+            grades: Notas de todas las evaluaciones
+            weights: Pesos de todas las evaluaciones
+            evaluation_counts: Número de evaluaciones por estudiante
+            
+        Returns:
+            ValidationReport: Errores encontrados, con fila y evaluación
+            
+        Raises:
+            ValueError: Si las longitudes de las columnas no son consistentes
+        """
+        from src.calculator.validation import validate_columns
+        
+        report = validate_columns(grades, weights, evaluation_counts)
+        if self.metrics is not None:
+            for issue in report:
+                self.metrics.record_validation_failure(issue.reason)
+        return report
 
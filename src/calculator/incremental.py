@@ -0,0 +1,214 @@
+"""
+Módulo de recalificación incremental a partir de un registro de cambios.
+
+IncrementalGrader mantiene la nota final de cada estudiante de una sección y,
+ante una secuencia de eventos (evaluación agregada, nota editada, asistencia
+modificada o año de ExtraPointsPolicy activado/desactivado), recalcula solo
+los estudiantes afectados y emite las diferencias (deltas).
+
+Los estudiantes de cada año académico se indexan al registrarlos, de modo que
+cambiar la política de un año recalifica únicamente a ese año sin recorrer
+toda la sección.
+"""
+
+import math
+from collections import namedtuple
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from src.calculator.grade_calculator import GradeCalculator
+from src.models.evaluation import Evaluation
+from src.models.student import Student
+from src.policies.extra_points_policy import ExtraPointsPolicy
+from src.policies.policy_config import PolicyConfig
+
+
+# Eventos del registro de cambios
+EvaluationAdded = namedtuple('EvaluationAdded', ['student_id', 'grade', 'weight'])
+GradeEdited = namedtuple('GradeEdited', ['student_id', 'index', 'grade', 'weight'],
+                         defaults=(None, None))
+AttendanceChanged = namedtuple('AttendanceChanged',
+                               ['student_id', 'has_reached_minimum_classes'])
+ExtraPointsYearToggled = namedtuple('ExtraPointsYearToggled', ['academic_year', 'active'])
+
+# Cambio en la nota final de un estudiante. Las notas son None cuando el
+# estudiante no se puede calificar; error contiene entonces el motivo.
+GradeDelta = namedtuple('GradeDelta', ['student_id', 'previous', 'current', 'error'])
+
+
+def _same_grade(previous: Optional[float], current: Optional[float]) -> bool:
+    # NaN != NaN: una nota que sigue siendo NaN no es un cambio
+    if previous == current:
+        return True
+    return (isinstance(previous, float) and isinstance(current, float)
+            and math.isnan(previous) and math.isnan(current))
+
+
+class IncrementalGrader:
+    """
+    Motor de recalificación incremental de una sección.
+
+    Al procesar ExtraPointsYearToggled la calculadora recibe una política de
+    puntos extra nueva con los años actualizados (ExtraPointsPolicy o
+    PolicyConfig, según la original); la lista de años del llamador no se
+    modifica. Las reglas ExtraPoints del pipeline que usaban la política
+    anterior se reemplazan en un pipeline nuevo y la calculadora se vuelve a
+    preparar con refresh_policies.
+    """
+
+    def __init__(self, calculator: GradeCalculator,
+                 students: Iterable[Tuple[Student, int]] = ()):
+        """
+        Inicializa el motor y califica la sección completa una vez.
+
+        Args:
+            calculator: Calculadora con las políticas de la sección
+            students: Pares (estudiante, año académico)
+
+        Raises:
+            ValueError: Si un student_id está repetido o la calculadora
+                        combina un pipeline con PolicyConfig (sus reglas
+                        conservarían la configuración anterior)
+        """
+        if (calculator.pipeline is not None
+                and isinstance(calculator.extra_points_policy, PolicyConfig)):
+            raise ValueError("La recalificación incremental no admite un pipeline con "
+                             "PolicyConfig")
+        self.calculator = calculator
+        self._students: Dict[str, Tuple[Student, int]] = {}
+        self._students_by_year: Dict[int, Set[str]] = {}
+        self._grades: Dict[str, Optional[float]] = {}
+        self._errors: Dict[str, str] = {}
+        self._dirty: Set[str] = set()
+        for student, academic_year in students:
+            self.add_student(student, academic_year)
+        self._flush()
+
+    def add_student(self, student: Student, academic_year: int) -> None:
+        """
+        Registra un estudiante; se califica al aplicar el siguiente lote de eventos.
+
+        Raises:
+            ValueError: Si el student_id ya está registrado
+        """
+        if student.student_id in self._students:
+            raise ValueError(f"El estudiante {student.student_id} ya está registrado")
+        self._students[student.student_id] = (student, academic_year)
+        self._students_by_year.setdefault(academic_year, set()).add(student.student_id)
+        self._grades[student.student_id] = None
+        self._dirty.add(student.student_id)
+
+    def final_grade(self, student_id: str) -> Optional[float]:
+        """
+        Nota final vigente del estudiante (None si no se puede calificar).
+        """
+        self._student(student_id)
+        return self._grades[student_id]
+
+    def students_in_year(self, academic_year: int) -> Set[str]:
+        """
+        Identificadores de los estudiantes de un año académico.
+        """
+        return set(self._students_by_year.get(academic_year, ()))
+
+    def apply(self, events: Iterable) -> List[GradeDelta]:
+        """
+        Aplica eventos en orden y recalifica solo a los estudiantes afectados.
+
+        Cada estudiante se recalifica una sola vez por llamada aunque tenga
+        varios eventos. Si un evento es inválido se lanza el error; los
+        eventos anteriores quedan aplicados y sus deltas se emiten en la
+        siguiente llamada.
+
+        Args:
+            events: Eventos del registro de cambios
+
+        Returns:
+            List[GradeDelta]: Cambios de nota final, en orden de student_id
+
+        Raises:
+            ValueError: Si un evento es inválido o el estudiante no existe
+        """
+        for event in events:
+            self._dirty.update(self._apply_event(event))
+        return self._flush()
+
+    def _student(self, student_id: str) -> Tuple[Student, int]:
+        entry = self._students.get(student_id)
+        if entry is None:
+            raise ValueError(f"Estudiante desconocido: {student_id}")
+        return entry
+
+    def _apply_event(self, event) -> Iterable[str]:
+        if isinstance(event, EvaluationAdded):
+            student, _ = self._student(event.student_id)
+            student.add_evaluation(Evaluation(event.grade, event.weight))
+            return (event.student_id,)
+        if isinstance(event, GradeEdited):
+            student, _ = self._student(event.student_id)
+            try:
+                student.update_evaluation(event.index, event.grade, event.weight)
+            except IndexError:
+                raise ValueError(f"El estudiante {event.student_id} no tiene "
+                                 f"la evaluación {event.index}") from None
+            return (event.student_id,)
+        if isinstance(event, AttendanceChanged):
+            student, _ = self._student(event.student_id)
+            student.has_reached_minimum_classes = event.has_reached_minimum_classes
+            return (event.student_id,)
+        if isinstance(event, ExtraPointsYearToggled):
+            return self._toggle_year(event.academic_year, event.active)
+        raise ValueError(f"Evento desconocido: {event!r}")
+
+    def _toggle_year(self, academic_year: int, active: bool) -> Iterable[str]:
+        if academic_year < 0:
+            raise ValueError("El año académico no puede ser negativo")
+        policy = self.calculator.extra_points_policy
+        years = list(policy.all_years_teachers)
+        if academic_year >= len(years):
+            years.extend([False] * (academic_year + 1 - len(years)))
+        if years[academic_year] == active:
+            return ()
+        years[academic_year] = active
+        if isinstance(policy, PolicyConfig):
+            replacement = PolicyConfig(years, policy.penalty_no_attendance,
+                                       policy.extra_points_amount)
+        else:
+            replacement = ExtraPointsPolicy(years)
+        self._install_policy(policy, replacement)
+        return self._students_by_year.get(academic_year, ())
+
+    def _install_policy(self, policy, replacement) -> None:
+        calculator = self.calculator
+        if calculator.attendance_policy is policy:
+            calculator.attendance_policy = replacement
+        calculator.extra_points_policy = replacement
+        if calculator.pipeline is not None:
+            from src.calculator.pipeline import ExtraPoints, PolicyPipeline
+
+            calculator.pipeline = PolicyPipeline([
+                ExtraPoints(replacement)
+                if isinstance(rule, ExtraPoints) and rule.policy is policy else rule
+                for rule in calculator.pipeline.rules
+            ])
+        # El pipeline compilado y la configuración congelada tienen una copia
+        # de la lista de años
+        calculator.refresh_policies()
+
+    def _flush(self) -> List[GradeDelta]:
+        deltas = []
+        for student_id in sorted(self._dirty):
+            student, academic_year = self._students[student_id]
+            previous = self._grades[student_id]
+            previous_error = self._errors.pop(student_id, None)
+            try:
+                current = self.calculator.calculate_final_grade(
+                    student, academic_year)['final_grade']
+                error = None
+            except ValueError as exception:
+                current = None
+                error = self._errors[student_id] = str(exception)
+            self._grades[student_id] = current
+            if not _same_grade(previous, current) or error != previous_error:
+                deltas.append(GradeDelta(student_id, previous, current, error))
+        self._dirty.clear()
+        return deltas
@@ -0,0 +1,179 @@
+"""
+Módulo de métricas de ejecución de GradeCalculator.
+
+MetricsRegistry registra el número de llamadas y un histograma de latencia
+por método, además de los errores de validación (ValueError) agrupados por
+motivo. Las métricas se exportan en el formato de texto de Prometheus.
+"""
+
+from __future__ import annotations
+
+import bisect
+from collections.abc import Iterable
+
+
+# Límites superiores (en segundos) de los buckets del histograma de latencia
+DEFAULT_LATENCY_BUCKETS = (
+    0.000001, 0.0000025, 0.000005, 0.00001, 0.000025, 0.00005,
+    0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.1, 1.0
+)
+
+# Fragmento del mensaje de cada ValueError del sistema y su motivo
+VALIDATION_REASONS = (
+    ("al menos una evaluación", "no_evaluations"),
+    ("peso total", "zero_total_weight"),
+    ("nota no puede ser negativa", "negative_grade"),
+    ("peso debe estar entre", "weight_out_of_range"),
+    ("No se pueden agregar más de", "too_many_evaluations"),
+)
+
+
+def classify_validation_error(error: ValueError) -> str:
+    """
+    Obtiene el motivo de un error de validación a partir de su mensaje.
+
+    Returns:
+        str: Motivo (ej. 'zero_total_weight') u 'other' si no se reconoce
+    """
+    message = str(error)
+    for fragment, reason in VALIDATION_REASONS:
+        if fragment in message:
+            return reason
+    return "other"
+
+
+class Histogram:
+    """
+    Histograma acumulativo con buckets fijos (estilo Prometheus).
+    """
+
+    __slots__ = ('bounds', 'counts', 'total', 'count')
+
+    def __init__(self, bounds: Iterable[float] = DEFAULT_LATENCY_BUCKETS):
+        self.bounds = tuple(sorted(bounds))
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        """
+        Registra una observación.
+        """
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.total += value
+        self.count += 1
+
+    def cumulative(self) -> Iterable[tuple[str, int]]:
+        """
+        Obtiene los pares (le, cantidad acumulada), terminando en '+Inf'.
+        """
+        running = 0
+        for bound, count in zip(self.bounds, self.counts):
+            running += count
+            yield repr(bound), running
+        yield "+Inf", running + self.counts[-1]
+
+
+class MetricsRegistry:
+    """
+    Registro de métricas de llamadas, latencia y errores de validación.
+
+    Es seguro usarlo desde varios hilos.
+    """
+
+    PREFIX = "gradecalculator"
+
+    def __init__(self, latency_buckets: Iterable[float] = DEFAULT_LATENCY_BUCKETS):
+        # threading se importa aquí: GradeCalculator importa este módulo y
+        # el modo rápido de la línea de comandos no usa métricas
+        import threading
+
+        self._latency_buckets = tuple(latency_buckets)
+        self._lock = threading.Lock()
+        self.calls: dict[str, int] = {}
+        self.latency: dict[str, Histogram] = {}
+        self.validation_failures: dict[str, int] = {}
+
+    def observe_call(self, method: str, seconds: float) -> None:
+        """
+        Registra una llamada a un método y su duración.
+        """
+        with self._lock:
+            self.calls[method] = self.calls.get(method, 0) + 1
+            histogram = self.latency.get(method)
+            if histogram is None:
+                histogram = self.latency[method] = Histogram(self._latency_buckets)
+            histogram.observe(seconds)
+
+    def record_validation_failure(self, reason: str) -> None:
+        """
+        Registra un error de validación con su motivo.
+        """
+        with self._lock:
+            self.validation_failures[reason] = self.validation_failures.get(reason, 0) + 1
+
+    def render_prometheus(self) -> str:
+        """
+        Exporta las métricas en el formato de texto de Prometheus.
+
+        Returns:
+            str: Texto listo para servir en un endpoint /metrics
+        """
+        prefix = self.PREFIX
+        lines = [
+            f"# HELP {prefix}_calls_total Llamadas a GradeCalculator por método.",
+            f"# TYPE {prefix}_calls_total counter",
+        ]
+        with self._lock:
+            for method, count in sorted(self.calls.items()):
+                lines.append(f'{prefix}_calls_total{{method="{method}"}} {count}')
+
+            lines += [
+                f"# HELP {prefix}_call_duration_seconds Latencia de GradeCalculator por método.",
+                f"# TYPE {prefix}_call_duration_seconds histogram",
+            ]
+            for method, histogram in sorted(self.latency.items()):
+                for bound, count in histogram.cumulative():
+                    lines.append(f'{prefix}_call_duration_seconds_bucket'
+                                 f'{{method="{method}",le="{bound}"}} {count}')
+                lines.append(f'{prefix}_call_duration_seconds_sum{{method="{method}"}} '
+                             f'{histogram.total!r}')
+                lines.append(f'{prefix}_call_duration_seconds_count{{method="{method}"}} '
+                             f'{histogram.count}')
+
+            lines += [
+                f"# HELP {prefix}_validation_failures_total Errores de validación por motivo.",
+                f"# TYPE {prefix}_validation_failures_total counter",
+            ]
+            for reason, count in sorted(self.validation_failures.items()):
+                lines.append(f'{prefix}_validation_failures_total{{reason="{reason}"}} {count}')
+        return "\n".join(lines) + "\n"
+
+
+def parse_prometheus_text(text: str) -> dict[tuple[str, tuple[tuple[str, str], ...]], float]:
+    """
+    Lee texto en formato Prometheus como lo haría un scraper.
+
+    Returns:
+        Dict: Valor de cada muestra indexado por (nombre, etiquetas ordenadas)
+
+    Raises:
+        ValueError: Si alguna línea no es una muestra válida
+    """
+    # re se importa aquí para no cargarlo al importar GradeCalculator
+    import re
+
+    sample_line = re.compile(r'^([a-zA-Z_:][a-zA-Z0-9_:]*)(?:\{(.*)\})?\s+(\S+)$')
+    label = re.compile(r'([a-zA-Z_][a-zA-Z0-9_]*)="((?:[^"\\]|\\.)*)"')
+    samples = {}
+    for line in text.splitlines():
+        line = line.strip()
+        if not line or line.startswith('#'):
+            continue
+        match = sample_line.match(line)
+        if match is None:
+            raise ValueError(f"Línea de métricas inválida: {line}")
+        name, labels, value = match.groups()
+        label_pairs = tuple(sorted(label.findall(labels or '')))
+        samples[(name, label_pairs)] = float(value)
+    return samples
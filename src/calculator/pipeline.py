@@ -0,0 +1,492 @@
+"""
+Módulo de pipeline de políticas compilado.
+
+Un PolicyPipeline describe de forma declarativa las reglas que se aplican al
+promedio ponderado (descartar las peores evaluaciones o contar solo las N
+mejores, penalizaciones de asistencia, puntos extra y topes). Al compilarlo se genera una única función de Python
+con los valores de las políticas ya resueltos como constantes, por lo que
+agregar reglas no agrega llamadas a métodos por estudiante; compile_vectorized
+produce el kernel NumPy equivalente para cohortes completas.
+
+El orden de cálculo es siempre el de GradeCalculator (RF04)::
+
+    promedio ponderado (sin las evaluaciones descartadas; el peso de las
+                        restantes se renormaliza a su suma)
+    - suma de penalizaciones + suma de puntos extra
+    -> no negativa -> topes -> redondeo a 2 decimales
+
+Con las reglas por defecto (AttendancePenalty y ExtraPoints) los resultados
+son idénticos bit a bit a calculate_final_grade y calculate_cohort (RNF03).
+Las constantes se leen de las políticas al compilar: si una política cambia
+(por ejemplo all_years_teachers), hay que volver a compilar. policy_key
+permite detectarlo; GradeCalculator lo comprueba antes de cada cálculo y
+vuelve a compilar solo.
+"""
+
+import heapq
+from typing import Callable, Dict, List, Optional, Sequence, Set, Tuple
+
+from src.policies.attendance_policy import AttendancePolicy
+from src.policies.extra_points_policy import ExtraPointsPolicy
+
+
+STAGE_EVALUATIONS = 0
+STAGE_PENALTY = 1
+STAGE_BONUS = 2
+STAGE_FINAL = 3
+
+
+class DropLowest:
+    """
+    Descarta las ``count`` evaluaciones de menor nota (a igual nota, la
+    primera registrada). Siempre se conserva al menos una evaluación y el
+    promedio se calcula sobre el peso de las evaluaciones restantes.
+    """
+
+    STAGE = STAGE_EVALUATIONS
+    __slots__ = ('count',)
+
+    def __init__(self, count: int = 1):
+        if count < 1:
+            raise ValueError("La cantidad de evaluaciones a descartar debe ser positiva")
+        self.count = count
+
+
+class BestOf:
+    """
+    Cuenta solo las ``count`` evaluaciones de mayor nota (las demás se
+    descartan como en DropLowest). Combinada con DropLowest se descarta la
+    mayor de las dos cantidades.
+    """
+
+    STAGE = STAGE_EVALUATIONS
+    __slots__ = ('count',)
+
+    def __init__(self, count: int):
+        if count < 1:
+            raise ValueError("La cantidad de evaluaciones a contar debe ser positiva")
+        self.count = count
+
+
+class AttendancePenalty:
+    """
+    Penalización de asistencia mínima según AttendancePolicy.
+    """
+
+    STAGE = STAGE_PENALTY
+    __slots__ = ('policy',)
+
+    def __init__(self, policy: AttendancePolicy = None):
+        self.policy = policy if policy is not None else AttendancePolicy()
+
+
+class AttendanceTiers:
+    """
+    Penalización graduada según el porcentaje de asistencia del estudiante
+    (Student.attendance_rate, de 0 a 100).
+
+    ``tiers`` son pares (porcentaje mínimo, penalización): se aplica el
+    primer tramo, de mayor a menor porcentaje, cuyo mínimo se alcanza; por
+    debajo de todos los tramos se aplica la penalización del último.
+    """
+
+    STAGE = STAGE_PENALTY
+    __slots__ = ('tiers',)
+
+    def __init__(self, tiers: Sequence[Tuple[float, float]]):
+        if not tiers:
+            raise ValueError("Se requiere al menos un tramo de asistencia")
+        self.tiers = tuple(sorted(((float(minimum), float(penalty))
+                                   for minimum, penalty in tiers), reverse=True))
+
+
+class ExtraPoints:
+    """
+    Puntos extra por año académico según ExtraPointsPolicy.
+    """
+
+    STAGE = STAGE_BONUS
+    __slots__ = ('policy',)
+
+    def __init__(self, policy: ExtraPointsPolicy):
+        self.policy = policy
+
+
+class Cap:
+    """
+    Tope de la nota final (se aplica después de asegurar que no sea negativa).
+    """
+
+    STAGE = STAGE_FINAL
+    __slots__ = ('maximum',)
+
+    def __init__(self, maximum: float = 20.0):
+        self.maximum = float(maximum)
+
+
+# drop_lowest usa heapq.nsmallest cuando n supera count * HEAP_SELECTION_RATIO
+HEAP_SELECTION_RATIO = 64
+
+RULE_TYPES = (DropLowest, BestOf, AttendancePenalty, AttendanceTiers, ExtraPoints, Cap)
+
+
+def evaluations_to_drop(n_evaluations: int, drops: int = 0,
+                        best_of: Optional[int] = None) -> int:
+    """
+    Obtiene cuántas evaluaciones se descartan de un total de n_evaluations.
+
+    Args:
+        n_evaluations: Evaluaciones del estudiante
+        drops: Evaluaciones de menor nota a descartar
+        best_of: Evaluaciones de mayor nota a contar (None = todas)
+
+    Returns:
+        int: Cantidad a descartar (siempre se conserva al menos una)
+    """
+    if best_of is not None:
+        drops = max(drops, n_evaluations - best_of)
+    return max(0, min(drops, n_evaluations - 1))
+
+
+def drop_lowest(evaluations: list, count: int) -> list:
+    """
+    Obtiene las evaluaciones que se conservan al descartar las ``count`` de
+    menor nota (a igual nota, la primera registrada), en su orden original.
+
+    La selección es parcial cuando conviene: min para una sola evaluación y
+    heapq.nsmallest (O(n log count)) cuando count es chico frente a n; en
+    bloques pequeños ordenar es más rápido en CPython (ver
+    benchmarks.bench_selection).
+    """
+    dropped = dropped_positions(evaluations, count)
+    if not dropped:
+        return evaluations
+    return [evaluation for index, evaluation in enumerate(evaluations)
+            if index not in dropped]
+
+
+def dropped_positions(evaluations: Sequence, count: int) -> Set[int]:
+    """
+    Obtiene las posiciones de las ``count`` evaluaciones de menor nota que
+    descarta drop_lowest (vacío si no se descarta ninguna).
+    """
+    count = min(count, len(evaluations) - 1)
+    if count <= 0:
+        return set()
+    grades = [evaluation.grade for evaluation in evaluations]
+    indices = range(len(grades))
+    if count == 1:
+        return {min(indices, key=grades.__getitem__)}
+    if count * HEAP_SELECTION_RATIO < len(grades):
+        return set(heapq.nsmallest(count, indices, key=grades.__getitem__))
+    return set(sorted(indices, key=grades.__getitem__)[:count])
+
+
+def drop_mask(grade_matrix, counts, to_drop):
+    """
+    Marca las evaluaciones descartadas de una cohorte en formato matricial.
+
+    Por fila se descartan las ``to_drop`` notas menores entre las primeras
+    ``counts`` columnas, con el mismo desempate que drop_lowest. La k-ésima
+    nota menor se obtiene con np.partition (selección parcial, sin ordenar
+    la fila) y los empates en ese umbral se resuelven por posición.
+
+    Args:
+        grade_matrix: Matriz de notas (estudiantes x evaluaciones)
+        counts: Evaluaciones válidas por fila
+        to_drop: Evaluaciones a descartar por fila
+
+    Returns:
+        np.ndarray: Máscara booleana de las evaluaciones descartadas
+    """
+    import numpy as np
+
+    n_students, width = grade_matrix.shape
+    mask = np.zeros((n_students, width), dtype=bool)
+    valid = np.arange(width) < counts[:, None]
+    # Una partición por cantidad distinta (a lo sumo width - 1 grupos)
+    for count in np.unique(to_drop[to_drop > 0]).tolist():
+        rows = np.flatnonzero(to_drop == count)
+        grades = np.where(valid[rows], grade_matrix[rows], np.inf)
+        if count == 1:
+            # argmin devuelve la primera posición de la menor nota
+            mask[rows, np.argmin(grades, axis=1)] = True
+            continue
+        threshold = np.partition(grades, count - 1, axis=1)[:, count - 1:count]
+        below = grades < threshold
+        ties = grades == threshold
+        needed = count - below.sum(axis=1, keepdims=True)
+        mask[rows] = below | (ties & (np.cumsum(ties, axis=1) <= needed))
+    return mask
+
+
+def _extra_points_table(policy: ExtraPointsPolicy) -> Tuple[float, ...]:
+    return tuple(float(policy.get_extra_points_for_year(year))
+                 for year in range(len(policy.all_years_teachers)))
+
+
+class PolicyPipeline:
+    """
+    Composición declarativa de reglas de cálculo de la nota final.
+    """
+
+    def __init__(self, rules: Sequence):
+        """
+        Inicializa el pipeline.
+
+        Args:
+            rules: Reglas (DropLowest, AttendancePenalty, AttendanceTiers,
+                   ExtraPoints, Cap); dentro de cada etapa se respeta el orden
+
+        Raises:
+            ValueError: Si alguna regla no es soportada
+        """
+        for rule in rules:
+            if not isinstance(rule, RULE_TYPES):
+                raise ValueError(f"Regla no soportada: {rule!r}")
+        self.rules = sorted(rules, key=lambda rule: rule.STAGE)
+
+    @classmethod
+    def default(cls, attendance_policy: AttendancePolicy,
+                extra_points_policy: ExtraPointsPolicy, drop_lowest: int = 0,
+                best_of: Optional[int] = None) -> 'PolicyPipeline':
+        """
+        Pipeline equivalente a GradeCalculator con las políticas dadas.
+
+        Args:
+            attendance_policy: Política de asistencia a aplicar
+            extra_points_policy: Política de puntos extra a aplicar
+            drop_lowest: Evaluaciones de menor nota a descartar (0 = ninguna)
+            best_of: Evaluaciones de mayor nota a contar (None = todas)
+        """
+        rules = [AttendancePenalty(attendance_policy), ExtraPoints(extra_points_policy)]
+        if drop_lowest:
+            rules.append(DropLowest(drop_lowest))
+        if best_of is not None:
+            rules.append(BestOf(best_of))
+        return cls(rules)
+
+    def policy_key(self) -> Tuple:
+        """
+        Obtiene los valores que compile toma de las políticas de las reglas.
+
+        Si cambia respecto del obtenido al compilar, la función compilada y
+        el kernel vectorizado quedaron desactualizados.
+        """
+        return tuple([rule.policy.policy_key() for rule in self.rules
+                      if isinstance(rule, (AttendancePenalty, ExtraPoints))])
+
+    @property
+    def uses_attendance_rate(self) -> bool:
+        """
+        Indica si el pipeline lee el porcentaje de asistencia (AttendanceTiers).
+        """
+        return bool(self._rules(AttendanceTiers))
+
+    @property
+    def selects_evaluations(self) -> bool:
+        """
+        Indica si el pipeline descarta evaluaciones (DropLowest o BestOf).
+        """
+        drops, best_of = self._selection()
+        return bool(drops) or best_of is not None
+
+    def dropped_positions(self, evaluations: Sequence) -> Set[int]:
+        """
+        Obtiene las posiciones de las evaluaciones que el pipeline descarta,
+        con la misma selección que la función compilada.
+
+        Returns:
+            Set[int]: Posiciones descartadas (vacío sin DropLowest ni BestOf)
+        """
+        drops, best_of = self._selection()
+        return dropped_positions(evaluations,
+                                 evaluations_to_drop(len(evaluations), drops, best_of))
+
+    def _rules(self, rule_type) -> List:
+        return [rule for rule in self.rules if isinstance(rule, rule_type)]
+
+    def _selection(self) -> Tuple[int, Optional[int]]:
+        # (evaluaciones a descartar, mejores a contar) de las reglas de la etapa
+        drops = sum(rule.count for rule in self._rules(DropLowest))
+        best = [rule.count for rule in self._rules(BestOf)]
+        return drops, (min(best) if best else None)
+
+    def source(self) -> Tuple[str, Dict]:
+        """
+        Genera el código de la función fusionada.
+
+        Returns:
+            Tuple[str, Dict]: Código fuente y constantes que referencia
+        """
+        constants: Dict = {'drop_lowest': drop_lowest,
+                           'evaluations_to_drop': evaluations_to_drop}
+        lines = [
+            "def fused(student, academic_year):",
+            "    evaluations = student.evaluations",
+            "    if not evaluations:",
+            "        raise ValueError('El estudiante debe tener al menos una evaluación')",
+        ]
+        drops, best_of = self._selection()
+        if drops or best_of is not None:
+            lines += [
+                "    total_weight = 0",
+                "    weighted_sum = 0",
+                "    dropped = evaluations_to_drop(len(evaluations), "
+                f"{drops}, {best_of})",
+                "    for evaluation in drop_lowest(evaluations, dropped):",
+                "        total_weight += evaluation.weight",
+                "        weighted_sum += evaluation.grade * (evaluation.weight / 100)",
+            ]
+        else:
+            lines += [
+                "    total_weight = student.get_total_weight()",
+                "    weighted_sum = student.get_weighted_sum()",
+            ]
+        lines += [
+            "    if total_weight == 0:",
+            "        raise ValueError('El peso total de las evaluaciones no puede ser cero')",
+            "    weighted_average = weighted_sum / (total_weight / 100)",
+        ]
+
+        penalties = []
+        for index, rule in enumerate(self._rules((AttendancePenalty, AttendanceTiers))):
+            name = f"penalty_{index}"
+            penalties.append(name)
+            if isinstance(rule, AttendancePenalty):
+                constants[f"{name}_met"] = rule.policy.calculate_penalty(True)
+                constants[f"{name}_missed"] = rule.policy.calculate_penalty(False)
+                lines.append(f"    {name} = {name}_met if student.has_reached_minimum_classes "
+                             f"else {name}_missed")
+                continue
+            lines += [
+                "    attendance_rate = getattr(student, 'attendance_rate', None)",
+                "    if attendance_rate is None:",
+                "        raise ValueError('La regla de tramos requiere attendance_rate')",
+            ]
+            for position, (minimum, penalty) in enumerate(rule.tiers):
+                keyword = "if" if position == 0 else "elif"
+                constants[f"{name}_min_{position}"] = minimum
+                constants[f"{name}_value_{position}"] = penalty
+                lines += [f"    {keyword} attendance_rate >= {name}_min_{position}:",
+                          f"        {name} = {name}_value_{position}"]
+            lines += ["    else:", f"        {name} = {name}_value_{len(rule.tiers) - 1}"]
+
+        bonuses = []
+        for index, rule in enumerate(self._rules(ExtraPoints)):
+            name = f"bonus_{index}"
+            bonuses.append(name)
+            constants[f"{name}_table"] = _extra_points_table(rule.policy)
+            lines.append(f"    {name} = {name}_table[academic_year] if 0 <= academic_year "
+                         f"< {len(constants[f'{name}_table'])} else 0.0")
+
+        lines += [
+            f"    attendance_penalty = {' + '.join(penalties) or '0.0'}",
+            f"    extra_points = {' + '.join(bonuses) or '0.0'}",
+            "    final_grade = weighted_average - attendance_penalty + extra_points",
+            "    final_grade = max(0.0, final_grade)",
+        ]
+        for index, rule in enumerate(self._rules(Cap)):
+            constants[f"cap_{index}"] = rule.maximum
+            lines.append(f"    final_grade = min(final_grade, cap_{index})")
+        lines += [
+            "    return {",
+            "        'weighted_average': round(weighted_average, 2),",
+            "        'attendance_penalty': round(attendance_penalty, 2),",
+            "        'extra_points': round(extra_points, 2),",
+            "        'final_grade': round(final_grade, 2)",
+            "    }",
+        ]
+        return "\n".join(lines) + "\n", constants
+
+    def compile(self) -> Callable:
+        """
+        Compila el pipeline en una sola función.
+
+        Returns:
+            Callable: fused(student, academic_year) -> Dict con las mismas
+            claves que GradeCalculator.calculate_final_grade
+        """
+        code, namespace = self.source()
+        exec(compile(code, "<policy-pipeline>", "exec"), namespace)
+        return namespace['fused']
+
+    def compile_vectorized(self) -> Callable:
+        """
+        Compila el pipeline en un kernel NumPy para cohortes completas.
+
+        Returns:
+            Callable: kernel(grades, weights, evaluation_counts,
+            has_reached_minimum_classes, academic_years=0, attendance_rates=None)
+            con la convención columnar de calculate_cohort
+        """
+        import numpy as np
+        from src.calculator.cohort import (final_grades, pad_evaluations, round_2,
+                                           weighted_averages)
+
+        drops, best_of = self._selection()
+        # (tramos, None) o (None, (penalización si cumple, si no cumple))
+        penalty_rules = [
+            (None, (float(rule.policy.calculate_penalty(True)),
+                    float(rule.policy.calculate_penalty(False))))
+            if isinstance(rule, AttendancePenalty) else (rule.tiers, None)
+            for rule in self._rules((AttendancePenalty, AttendanceTiers))
+        ]
+        bonus_tables = [np.array(_extra_points_table(rule.policy) + (0.0,), dtype=np.float64)
+                        for rule in self._rules(ExtraPoints)]
+        caps = [rule.maximum for rule in self._rules(Cap)]
+
+        def kernel(grades, weights, evaluation_counts, has_reached_minimum_classes,
+                   academic_years=0, attendance_rates=None):
+            grade_matrix, weight_matrix, counts = pad_evaluations(grades, weights,
+                                                                  evaluation_counts)
+            n_students, width = grade_matrix.shape
+            if (drops or best_of is not None) and width > 1:
+                # Las evaluaciones descartadas quedan con peso 0 (suman 0.0),
+                # de modo que el promedio se renormaliza con el peso restante
+                to_drop = np.minimum(drops, counts - 1)
+                if best_of is not None:
+                    to_drop = np.minimum(np.maximum(to_drop, counts - best_of), counts - 1)
+                to_drop = np.maximum(to_drop, 0)
+                weight_matrix = np.where(drop_mask(grade_matrix, counts, to_drop),
+                                         0.0, weight_matrix)
+            weighted_average = weighted_averages(grade_matrix, weight_matrix, counts)
+
+            attendance = np.broadcast_to(np.asarray(has_reached_minimum_classes, dtype=bool),
+                                         (n_students,))
+            attendance_penalty = None
+            for tiers, binary in penalty_rules:
+                if binary is not None:
+                    penalty = np.where(attendance, binary[0], binary[1])
+                else:
+                    if attendance_rates is None:
+                        raise ValueError("La regla de tramos requiere attendance_rate")
+                    rates = np.broadcast_to(np.asarray(attendance_rates, dtype=np.float64),
+                                            (n_students,))
+                    penalty = np.select([rates >= minimum for minimum, _ in tiers],
+                                        [value for _, value in tiers], tiers[-1][1])
+                attendance_penalty = (penalty if attendance_penalty is None
+                                      else attendance_penalty + penalty)
+            if attendance_penalty is None:
+                attendance_penalty = np.zeros(n_students)
+
+            years = np.broadcast_to(np.asarray(academic_years, dtype=np.int64), (n_students,))
+            extra_points = None
+            for table in bonus_tables:
+                in_range = (years >= 0) & (years < table.size - 1)
+                bonus = table[np.where(in_range, years, table.size - 1)]
+                extra_points = bonus if extra_points is None else extra_points + bonus
+            if extra_points is None:
+                extra_points = np.zeros(n_students)
+
+            final_grade = final_grades(weighted_average, attendance_penalty, extra_points)
+            for maximum in caps:
+                final_grade = np.minimum(final_grade, maximum)
+            return {
+                'weighted_average': round_2(weighted_average),
+                'attendance_penalty': round_2(attendance_penalty),
+                'extra_points': round_2(extra_points),
+                'final_grade': round_2(final_grade),
+            }
+
+        return kernel
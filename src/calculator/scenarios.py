@@ -0,0 +1,182 @@
+"""
+Módulo de simulación de cambios de política sobre una cohorte (what-if).
+
+El promedio ponderado de cada estudiante no depende de las políticas, por lo
+que ScenarioEngine lo calcula una sola vez. Cada escenario solo cambia la
+penalización por inasistencia (AttendancePolicy.PENALTY_NO_ATTENDANCE) y la
+cantidad de puntos extra (ExtraPointsPolicy.EXTRA_POINTS_AMOUNT), de modo que
+la nota final de todos los escenarios se obtiene como una difusión (broadcast)
+de esos valores sobre los promedios de la cohorte, por bloques de escenarios
+para acotar la memoria.
+
+Las notas de cada escenario se calculan con las mismas operaciones que
+GradeCalculator (RNF03): el escenario con los valores actuales reproduce
+exactamente las notas finales de calculate_cohort.
+"""
+
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+
+from src.calculator.aggregates import HISTOGRAM_BOUNDS, PASSING_GRADE
+from src.calculator.cohort import final_grades, pad_evaluations, round_2, weighted_averages
+from src.policies.attendance_policy import AttendancePolicy
+from src.policies.extra_points_policy import ExtraPointsPolicy
+
+
+# Elementos (escenarios x estudiantes) evaluados por bloque: ~32 MB por matriz
+BLOCK_ELEMENTS = 4_000_000
+
+
+class Scenario:
+    """
+    Variante de las políticas a simular.
+
+    Attributes:
+        name (str): Nombre del escenario
+        penalty_no_attendance (float): Penalización por no cumplir asistencia
+        extra_points_amount (float): Puntos extra cuando la política está activa
+    """
+
+    __slots__ = ('name', 'penalty_no_attendance', 'extra_points_amount')
+
+    def __init__(self, name: str,
+                 penalty_no_attendance: float = AttendancePolicy.PENALTY_NO_ATTENDANCE,
+                 extra_points_amount: float = ExtraPointsPolicy.EXTRA_POINTS_AMOUNT):
+        """
+        Raises:
+            ValueError: Si la penalización o los puntos extra son negativos
+        """
+        if penalty_no_attendance < 0:
+            raise ValueError("La penalización no puede ser negativa")
+        if extra_points_amount < 0:
+            raise ValueError("Los puntos extra no pueden ser negativos")
+        self.name = name
+        self.penalty_no_attendance = float(penalty_no_attendance)
+        self.extra_points_amount = float(extra_points_amount)
+
+    @classmethod
+    def grid(cls, penalties: Iterable[float], extra_amounts: Iterable[float]) -> List['Scenario']:
+        """
+        Crea un escenario por cada combinación de penalización y puntos extra.
+
+        Returns:
+            List[Scenario]: Escenarios nombrados 'penalty=P,extra=E'
+        """
+        extra_amounts = list(extra_amounts)
+        return [cls(f"penalty={penalty:g},extra={amount:g}", penalty, amount)
+                for penalty in penalties for amount in extra_amounts]
+
+    def __repr__(self) -> str:
+        return (f"Scenario({self.name!r}, penalty_no_attendance={self.penalty_no_attendance}, "
+                f"extra_points_amount={self.extra_points_amount})")
+
+
+class ScenarioEngine:
+    """
+    Evalúa escenarios de política sobre una cohorte en formato columnar.
+    """
+
+    def __init__(self, extra_points_policy: ExtraPointsPolicy, grades, weights,
+                 evaluation_counts, has_reached_minimum_classes, academic_years=0):
+        """
+        Calcula los promedios ponderados de la cohorte (una sola vez).
+
+        Recibe las columnas con la misma convención que
+        GradeCalculator.calculate_cohort (``**table.columns()`` de un
+        StudentTable); extra_points_policy define en qué años se otorgan
+        puntos extra.
+
+        Raises:
+            ValueError: Si la cohorte está vacía, las columnas son
+                        inconsistentes o algún estudiante no cumple las
+                        precondiciones del cálculo
+        """
+        grade_matrix, weight_matrix, counts = pad_evaluations(grades, weights,
+                                                              evaluation_counts)
+        n_students = counts.size
+        if n_students == 0:
+            raise ValueError("La cohorte debe tener al menos un estudiante")
+        self.weighted_average = weighted_averages(grade_matrix, weight_matrix, counts)
+        self.attendance = np.broadcast_to(np.asarray(has_reached_minimum_classes, dtype=bool),
+                                          (n_students,)).copy()
+        years = np.broadcast_to(np.asarray(academic_years, dtype=np.int64), (n_students,))
+        unique_years, inverse = np.unique(years, return_inverse=True)
+        active = np.array([bool(extra_points_policy.is_extra_points_active(int(year)))
+                           for year in unique_years.tolist()], dtype=bool)
+        self.extra_points_active = active[inverse.reshape(-1)]
+
+    def __len__(self) -> int:
+        return self.weighted_average.size
+
+    def _final_grades(self, penalties: np.ndarray, extra_amounts: np.ndarray) -> np.ndarray:
+        attendance_penalty = np.where(self.attendance, 0.0, penalties[:, None])
+        extra_points = np.where(self.extra_points_active, extra_amounts[:, None], 0.0)
+        final_grade = final_grades(self.weighted_average, attendance_penalty, extra_points)
+        return round_2(final_grade.ravel()).reshape(final_grade.shape)
+
+    def final_grades(self, scenario: Scenario) -> np.ndarray:
+        """
+        Calcula la nota final de cada estudiante en un escenario.
+
+        Returns:
+            np.ndarray: Notas finales redondeadas, una por estudiante
+        """
+        return self._final_grades(np.array([scenario.penalty_no_attendance]),
+                                  np.array([scenario.extra_points_amount]))[0]
+
+    def run(self, scenarios: Iterable[Scenario], passing_grade: float = PASSING_GRADE,
+            block_elements: Optional[int] = None) -> Dict:
+        """
+        Evalúa todos los escenarios sobre la cohorte.
+
+        Args:
+            scenarios: Escenarios a simular
+            passing_grade: Nota mínima aprobatoria
+            block_elements: Máximo de notas (escenarios x estudiantes) en
+                            memoria a la vez (por defecto BLOCK_ELEMENTS)
+
+        Returns:
+            Dict con:
+                - 'scenarios': Nombres de los escenarios, en orden
+                - 'pass_rate': Tasa de aprobación por escenario
+                - 'mean': Nota final promedio por escenario
+                - 'histogram': Matriz (escenarios x barras) con la cantidad
+                  de estudiantes por barra de HISTOGRAM_BOUNDS, igual que
+                  SectionAggregate
+                - 'histogram_bounds': Límites superiores de las barras
+
+        Raises:
+            ValueError: Si no hay escenarios
+        """
+        scenarios = list(scenarios)
+        if not scenarios:
+            raise ValueError("Debe indicar al menos un escenario")
+        penalties = np.array([scenario.penalty_no_attendance for scenario in scenarios])
+        extra_amounts = np.array([scenario.extra_points_amount for scenario in scenarios])
+
+        n_students = len(self)
+        n_bins = len(HISTOGRAM_BOUNDS) + 1
+        block = max(1, (block_elements or BLOCK_ELEMENTS) // n_students)
+        passed = np.empty(len(scenarios), dtype=np.int64)
+        mean = np.empty(len(scenarios), dtype=np.float64)
+        histogram = np.empty((len(scenarios), n_bins), dtype=np.int64)
+        for start in range(0, len(scenarios), block):
+            stop = min(start + block, len(scenarios))
+            final_grade = self._final_grades(penalties[start:stop], extra_amounts[start:stop])
+            passed[start:stop] = np.count_nonzero(final_grade >= passing_grade, axis=1)
+            mean[start:stop] = final_grade.mean(axis=1)
+            # HISTOGRAM_BOUNDS son los puntos 1..20: la barra de una nota no
+            # negativa (bisect_right) es su parte entera, con tope en la última
+            bins = np.minimum(final_grade.astype(np.int64), n_bins - 1)
+            bins += np.arange(stop - start)[:, None] * n_bins
+            histogram[start:stop] = np.bincount(bins.ravel(), minlength=(stop - start) * n_bins
+                                                ).reshape(stop - start, n_bins)
+
+        return {
+            'scenarios': [scenario.name for scenario in scenarios],
+            'pass_rate': passed / n_students,
+            'mean': mean,
+            'histogram': histogram,
+            'histogram_bounds': HISTOGRAM_BOUNDS,
+        }
@@ -0,0 +1,164 @@
+"""
+Módulo de calificación multi-tenant (varias facultades en una misma pasada).
+
+TenantPolicies congela la PolicyConfig de cada tenant en una fila de dos
+tablas precalculadas: penalización (tenant x asistencia) y puntos extra
+(tenant x año). Cada estudiante se califica con los parámetros de su tenant
+buscados por índice, ya sea uno por uno (una GradeCalculator congelada por
+tenant) o para una cohorte completa en una pasada vectorizada.
+
+Archivo de configuración (JSON), un objeto por tenant::
+
+    {"ingenieria": {"all_years_teachers": [true, false],
+                    "penalty_no_attendance": 1.5,
+                    "extra_points_amount": 0.5}}
+"""
+
+import json
+from typing import Dict, Iterable, List
+
+import numpy as np
+
+from src.calculator.cohort import grade_vectors, pad_evaluations, weighted_averages
+from src.calculator.grade_calculator import GradeCalculator
+from src.policies.policy_config import PolicyConfig
+
+
+class TenantPolicies:
+    """
+    Políticas por tenant indexadas por código de fila.
+
+    Attributes:
+        tenants (List[str]): Nombres de los tenants, en orden de fila
+        configs (List[PolicyConfig]): Configuración de cada tenant
+        penalties (np.ndarray): Penalización (tenants x 2), columna 0 sin
+                                asistencia y 1 con asistencia
+        extra_points (np.ndarray): Puntos extra (tenants x años)
+    """
+
+    def __init__(self, configs: Dict[str, PolicyConfig]):
+        """
+        Congela las configuraciones de los tenants.
+
+        Raises:
+            ValueError: Si no hay tenants o alguna configuración no es PolicyConfig
+        """
+        if not configs:
+            raise ValueError("Debe configurar al menos un tenant")
+        for config in configs.values():
+            if not isinstance(config, PolicyConfig):
+                raise ValueError("La configuración de cada tenant debe ser un PolicyConfig")
+        self.tenants: List[str] = list(configs.keys())
+        self.configs: List[PolicyConfig] = list(configs.values())
+        self._codes = {tenant: code for code, tenant in enumerate(self.tenants)}
+        self._calculators = [GradeCalculator(config, config) for config in self.configs]
+
+        n_years = max(len(config.all_years_teachers) for config in self.configs)
+        self.penalties = np.array([config.frozen_penalties() for config in self.configs],
+                                  dtype=np.float64)
+        self.extra_points = np.zeros((len(self.configs), n_years), dtype=np.float64)
+        for code, config in enumerate(self.configs):
+            frozen = config.frozen_extra_points()
+            self.extra_points[code, :len(frozen)] = frozen
+
+    def __len__(self) -> int:
+        return len(self.tenants)
+
+    def tenant_code(self, tenant: str) -> int:
+        """
+        Obtiene el índice de fila de un tenant.
+
+        Raises:
+            ValueError: Si el tenant no está configurado
+        """
+        try:
+            return self._codes[tenant]
+        except (KeyError, TypeError):
+            raise ValueError(f"Tenant desconocido: {tenant}") from None
+
+    def tenant_codes(self, tenants: Iterable[str]) -> np.ndarray:
+        """
+        Convierte nombres de tenants en índices de fila para calculate_cohort.
+
+        Raises:
+            ValueError: Si algún tenant no está configurado
+        """
+        return np.fromiter((self.tenant_code(tenant) for tenant in tenants), dtype=np.int64)
+
+    def calculator(self, tenant: str) -> GradeCalculator:
+        """
+        Obtiene la calculadora (con políticas congeladas) de un tenant.
+
+        Raises:
+            ValueError: Si el tenant no está configurado
+        """
+        return self._calculators[self.tenant_code(tenant)]
+
+    def calculate_cohort(self, tenant_codes, grades, weights, evaluation_counts,
+                         has_reached_minimum_classes, academic_years=0) -> Dict[str, np.ndarray]:
+        """
+        Calcula la nota final de una cohorte con estudiantes de varios tenants.
+
+        Recibe las columnas con la misma convención que
+        GradeCalculator.calculate_cohort, más el código de tenant de cada
+        estudiante (ver tenant_codes). Los resultados son idénticos bit a bit
+        a los de la calculadora de cada tenant (RNF03).
+
+        Returns:
+            Dict[str, np.ndarray]: Mismas claves que calculate_final_grade
+
+        Raises:
+            ValueError: Si las columnas son inconsistentes, algún código de
+                        tenant es inválido o algún estudiante no cumple las
+                        precondiciones del cálculo
+        """
+        grade_matrix, weight_matrix, counts = pad_evaluations(grades, weights, evaluation_counts)
+        n_students = counts.size
+        codes = np.broadcast_to(np.asarray(tenant_codes, dtype=np.int64), (n_students,))
+        if np.any((codes < 0) | (codes >= len(self.tenants))):
+            raise ValueError("Código de tenant inválido")
+        attendance = np.broadcast_to(np.asarray(has_reached_minimum_classes, dtype=bool),
+                                     (n_students,))
+        years = np.broadcast_to(np.asarray(academic_years, dtype=np.int64), (n_students,))
+
+        weighted_average = weighted_averages(grade_matrix, weight_matrix, counts)
+        attendance_penalty = self.penalties[codes, attendance.astype(np.int64)]
+        valid = (years >= 0) & (years < self.extra_points.shape[1])
+        extra_points = np.zeros(n_students, dtype=np.float64)
+        extra_points[valid] = self.extra_points[codes[valid], years[valid]]
+        return grade_vectors(weighted_average, attendance_penalty, extra_points)
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'TenantPolicies':
+        """
+        Crea las políticas a partir del contenido del archivo de configuración.
+
+        Raises:
+            ValueError: Si la configuración de algún tenant es inválida
+        """
+        if not isinstance(data, dict):
+            raise ValueError("La configuración de tenants debe ser un objeto")
+        configs = {}
+        for tenant, values in data.items():
+            if not isinstance(values, dict):
+                raise ValueError(f"Configuración inválida del tenant {tenant}")
+            try:
+                configs[tenant] = PolicyConfig(**values)
+            except TypeError:
+                raise ValueError(f"Configuración inválida del tenant {tenant}") from None
+        return cls(configs)
+
+
+def load_tenant_policies(path: str) -> TenantPolicies:
+    """
+    Carga las políticas por tenant desde un archivo JSON.
+
+    Raises:
+        ValueError: Si el archivo no es JSON válido o la configuración es inválida
+    """
+    with open(path, encoding='utf-8') as stream:
+        try:
+            data = json.load(stream)
+        except json.JSONDecodeError as error:
+            raise ValueError(f"Archivo de tenants inválido: {error}") from None
+    return TenantPolicies.from_dict(data)
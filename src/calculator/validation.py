@@ -0,0 +1,171 @@
+"""
+Módulo de validación masiva de cohortes en formato columnar.
+
+Aplica en una sola pasada vectorizada las mismas reglas que Evaluation,
+Student y GradeCalculator verifican objeto por objeto, pero en lugar de
+lanzar un ValueError en el primer valor inválido devuelve un reporte con
+todos los errores y la fila (estudiante) y evaluación donde ocurren.
+
+Los motivos coinciden con los de ``classify_validation_error`` para que el
+reporte se pueda sumar a las métricas de validación.
+"""
+
+from collections import namedtuple
+from typing import Dict, Iterator, List
+
+import numpy as np
+
+from src.models.student import Student
+
+
+# Error individual: fila del estudiante, posición de la evaluación dentro del
+# estudiante (None si el error es del estudiante), motivo y mensaje
+ValidationIssue = namedtuple('ValidationIssue', ['row', 'evaluation', 'reason', 'message'])
+
+
+class ValidationReport:
+    """
+    Reporte estructurado de una validación masiva.
+
+    Attributes:
+        n_students (int): Estudiantes validados
+        issues (List[ValidationIssue]): Errores ordenados por fila y evaluación
+    """
+
+    def __init__(self, n_students: int, issues: List[ValidationIssue],
+                 counts: np.ndarray):
+        self.n_students = n_students
+        self.issues = issues
+        self._counts = counts
+
+    @property
+    def is_valid(self) -> bool:
+        """
+        Indica si ningún estudiante tiene errores.
+        """
+        return not self.issues
+
+    @property
+    def invalid_rows(self) -> List[int]:
+        """
+        Filas con al menos un error, en orden ascendente.
+        """
+        return sorted({issue.row for issue in self.issues})
+
+    def valid_mask(self) -> np.ndarray:
+        """
+        Máscara booleana por estudiante (True si no tiene errores).
+        """
+        mask = np.ones(self.n_students, dtype=bool)
+        mask[self.invalid_rows] = False
+        return mask
+
+    def evaluation_mask(self) -> np.ndarray:
+        """
+        Máscara booleana por evaluación, para filtrar las columnas planas.
+        """
+        return np.repeat(self.valid_mask(), self._counts)
+
+    def counts_by_reason(self) -> Dict[str, int]:
+        """
+        Número de errores por motivo.
+        """
+        counts: Dict[str, int] = {}
+        for issue in self.issues:
+            counts[issue.reason] = counts.get(issue.reason, 0) + 1
+        return counts
+
+    def to_dict(self) -> Dict:
+        """
+        Representación serializable (JSON) del reporte.
+        """
+        return {
+            'n_students': self.n_students,
+            'n_invalid_students': len(self.invalid_rows),
+            'counts_by_reason': self.counts_by_reason(),
+            'issues': [issue._asdict() for issue in self.issues],
+        }
+
+    def __len__(self) -> int:
+        return len(self.issues)
+
+    def __iter__(self) -> Iterator[ValidationIssue]:
+        return iter(self.issues)
+
+
+def validate_columns(grades, weights, evaluation_counts,
+                     max_evaluations: int = Student.MAX_EVALUATIONS) -> ValidationReport:
+    """
+    Valida una cohorte completa sin lanzar excepciones por cada valor.
+
+    Reglas (las mismas de la ruta por objetos):
+        - La nota no puede ser negativa (Evaluation)
+        - El peso debe estar entre 0 y 100 (Evaluation)
+        - Como máximo max_evaluations evaluaciones por estudiante (RNF01)
+        - Al menos una evaluación por estudiante (GradeCalculator)
+        - El peso total no puede ser cero (GradeCalculator)
+
+    Args:
+        grades: Notas de todas las evaluaciones, concatenadas por estudiante
+        weights: Pesos de todas las evaluaciones, concatenados por estudiante
+        evaluation_counts: Número de evaluaciones de cada estudiante
+        max_evaluations: Límite de evaluaciones por estudiante
+
+    Returns:
+        ValidationReport: Errores encontrados, con su fila y evaluación
+
+    Raises:
+        ValueError: Si las columnas no tienen longitudes consistentes (no se
+                    puede atribuir ningún valor a un estudiante)
+    """
+    grades = np.asarray(grades, dtype=np.float64)
+    weights = np.asarray(weights, dtype=np.float64)
+    counts = np.asarray(evaluation_counts, dtype=np.int64)
+
+    if grades.ndim != 1 or weights.ndim != 1 or counts.ndim != 1:
+        raise ValueError("Las columnas deben ser unidimensionales")
+    if grades.shape != weights.shape:
+        raise ValueError("Las columnas de notas y pesos deben tener la misma longitud")
+    if np.any(counts < 0):
+        raise ValueError("El número de evaluaciones no puede ser negativo")
+    if int(counts.sum()) != grades.size:
+        raise ValueError(
+            "La suma de evaluation_counts debe coincidir con el número de evaluaciones"
+        )
+
+    n_students = counts.size
+    ends = np.cumsum(counts)
+    starts = ends - counts
+    rows = np.repeat(np.arange(n_students, dtype=np.int64), counts)
+
+    # (fila, evaluación, orden del motivo) para ordenar el reporte de forma estable
+    found = []
+
+    def add_evaluation_issues(mask, order, reason, message):
+        positions = np.flatnonzero(mask)
+        issue_rows = rows[positions]
+        for row, evaluation in zip(issue_rows.tolist(),
+                                   (positions - starts[issue_rows]).tolist()):
+            found.append((row, evaluation, order, ValidationIssue(row, evaluation,
+                                                                  reason, message)))
+
+    def add_student_issues(mask, order, reason, message):
+        for row in np.flatnonzero(mask).tolist():
+            found.append((row, -1, order, ValidationIssue(row, None, reason, message)))
+
+    add_student_issues(counts == 0, 0, 'no_evaluations',
+                       "El estudiante debe tener al menos una evaluación")
+    add_student_issues(counts > max_evaluations, 1, 'too_many_evaluations',
+                       f"No se pueden agregar más de {max_evaluations} evaluaciones")
+    add_evaluation_issues(grades < 0, 2, 'negative_grade', "La nota no puede ser negativa")
+    add_evaluation_issues((weights < 0) | (weights > 100), 3, 'weight_out_of_range',
+                          "El peso debe estar entre 0 y 100")
+
+    # Con pesos no negativos la suma es cero si y solo si todos son cero, así
+    # que basta contar los pesos distintos de cero (exacto, sin redondeo).
+    nonzero_weights = np.bincount(rows, weights=(weights != 0), minlength=n_students)
+    add_student_issues((counts > 0) & (nonzero_weights == 0), 4, 'zero_total_weight',
+                       "El peso total de las evaluaciones no puede ser cero")
+
+    found.sort(key=lambda entry: entry[:3])
+    return ValidationReport(n_students, [entry[3] for entry in found], counts)
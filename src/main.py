@@ -3,8 +3,17 @@ Aplicación principal para el cálculo de notas finales.
 Sistema: CS-GradeCalculator
 Actor: Docente UTEC
 Caso de Uso: CU001 - Calcular nota final del estudiante
+
+Uso:
+    python -m src.main                  (modo interactivo CU001)
+    python -m src.main --grade 15:30 18:70 --attendance s --year 1 --extra-points n,s
+    echo '{"student_id": "ST001", "evaluations": [[15, 30]]}' | python -m src.main --grade -
+    python -m src.main --batch notas.csv --out resultados.jsonl --extra-points s,n
+    python -m src.main --batch notas.csv --out resultados.jsonl --stats
 """
 
+import sys
+
 from src.models.student import Student
 from src.models.evaluation import Evaluation
 from src.policies.attendance_policy import AttendancePolicy
@@ -12,9 +21,9 @@ from src.policies.extra_points_policy import ExtraPointsPolicy
 from src.calculator.grade_calculator import GradeCalculator
 
 
-def main():
+def run_interactive():
     """
-    Función principal que ejecuta el caso de uso CU001.
+    Ejecuta el caso de uso CU001 solicitando los datos por consola.
     """
     print("=" * 60)
     print("Sistema: CS-GradeCalculator")
@@ -154,6 +163,348 @@ def main():
         print(f"Error en el cálculo: {e}")
 
 
+# Modo rápido: un estudiante por invocación, sin input() ni argparse
+GRADE_FLAG = "--grade"
+GRADE_USAGE = (
+    "uso: python -m src.main --grade NOTA:PESO [NOTA:PESO ...] [--id CÓDIGO] "
+    "[--attendance s|n] [--year AÑO] [--extra-points S,N,...] [--details]\n"
+    "     python -m src.main --grade - [--extra-points S,N,...] [--details]  "
+    "(registro JSON por stdin)\n"
+    "AÑO es el índice 0-based del año académico (0 = primer año; el modo "
+    "interactivo lo pide 1-based)"
+)
+
+
+def _parse_policy_years(value: str) -> list:
+    from src.batch.values import parse_bool
+    
+    if not value.strip():
+        return []
+    return [parse_bool(item) for item in value.split(',')]
+
+
+def parse_extra_points(value: str) -> list:
+    """
+    Interpreta la política de puntos extra como lista separada por comas (s/n).
+    
+    Args:
+        value: Texto como "s,n,s" (un valor por año académico)
+        
+    Returns:
+        list: Lista de booleanos por año académico
+    """
+    import argparse
+    
+    try:
+        return _parse_policy_years(value)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
+
+
+def parse_grade_args(argv: list) -> dict:
+    """
+    Interpreta los argumentos del modo rápido sin importar argparse.
+    
+    Args:
+        argv: Argumentos de línea de comandos, incluido --grade
+        
+    Returns:
+        dict: Opciones con evaluations (lista de textos NOTA:PESO o None si
+              el registro se lee por stdin), student_id, attendance, year,
+              extra_points y details
+        
+    Raises:
+        ValueError: Si los argumentos no siguen GRADE_USAGE
+    """
+    options = {'evaluations': [], 'student_id': 'CLI', 'attendance': 'n',
+               'year': '0', 'extra_points': '', 'details': False}
+    valued = {'--id': 'student_id', '--attendance': 'attendance', '--year': 'year',
+              '--extra-points': 'extra_points'}
+    position = 0
+    while position < len(argv):
+        argument = argv[position]
+        if argument == GRADE_FLAG:
+            position += 1
+            while position < len(argv) and not argv[position].startswith('--'):
+                options['evaluations'].append(argv[position])
+                position += 1
+            continue
+        if argument == '--details':
+            options['details'] = True
+        elif argument in valued:
+            if position + 1 >= len(argv):
+                raise ValueError(f"{argument} requiere un valor")
+            position += 1
+            options[valued[argument]] = argv[position]
+        else:
+            raise ValueError(f"Argumento no reconocido: {argument}")
+        position += 1
+    
+    if options['evaluations'] == ['-']:
+        options['evaluations'] = None
+    elif not options['evaluations']:
+        raise ValueError(f"{GRADE_FLAG} requiere al menos una evaluación NOTA:PESO o '-'")
+    return options
+
+
+def build_grade_student(options: dict, stdin=None) -> tuple:
+    """
+    Construye el estudiante del modo rápido a partir de las opciones.
+    
+    Args:
+        options: Resultado de parse_grade_args
+        stdin: Archivo de donde leer el registro JSON (por defecto sys.stdin)
+        
+    Returns:
+        tuple: Estudiante y año académico (0-based)
+        
+    Raises:
+        ValueError: Si alguna evaluación, la asistencia o el año son inválidos
+    """
+    from src.batch.values import parse_academic_year, parse_bool
+    
+    if options['evaluations'] is None:
+        import json
+        from src.batch.readers import build_student
+        
+        try:
+            record = json.loads((stdin or sys.stdin).read())
+        except json.JSONDecodeError as e:
+            raise ValueError(f"JSON inválido en stdin: {e.msg}") from None
+        return build_student(record)
+    
+    student = Student(options['student_id'])
+    for text in options['evaluations']:
+        grade, separator, weight = text.partition(':')
+        try:
+            if not separator:
+                raise ValueError
+            grade, weight = float(grade), float(weight)
+        except ValueError:
+            raise ValueError(f"Evaluación inválida (se espera NOTA:PESO): {text}") from None
+        student.add_evaluation(Evaluation(grade, weight))
+    student.has_reached_minimum_classes = parse_bool(options['attendance'])
+    return student, parse_academic_year(options['year'])
+
+
+def run_grade(argv: list, stdin=None, stdout=None, stderr=None,
+              calculator_for=None) -> int:
+    """
+    Modo rápido: calcula la nota final de un estudiante y termina.
+    
+    Solo importa los modelos, las políticas y GradeCalculator (sin argparse,
+    typing, re ni NumPy), para minimizar el tiempo de arranque cuando un
+    planificador invoca el programa una vez por estudiante. Imprime la nota
+    final, o el detalle del cálculo en JSON con --details (RF05).
+    
+    Args:
+        argv: Argumentos de línea de comandos, incluido --grade
+        stdin: Entrada del registro JSON (por defecto sys.stdin)
+        stdout: Salida del resultado (por defecto sys.stdout)
+        stderr: Salida de los errores (por defecto sys.stderr)
+        calculator_for: Función que recibe la lista de años de la política de
+                        puntos extra y devuelve la calculadora a usar (por
+                        defecto, una nueva en cada llamada)
+        
+    Returns:
+        int: 0 si se calculó la nota, 1 si los datos son inválidos y 2 si
+             los argumentos no son válidos
+    """
+    stdout = stdout or sys.stdout
+    stderr = stderr or sys.stderr
+    try:
+        options = parse_grade_args(argv)
+        extra_points = _parse_policy_years(options['extra_points'])
+    except ValueError as e:
+        print(f"{GRADE_USAGE}\nerror: {e}", file=stderr)
+        return 2
+    
+    if calculator_for is None:
+        calculator = GradeCalculator(AttendancePolicy(), ExtraPointsPolicy(extra_points))
+    else:
+        calculator = calculator_for(extra_points)
+    try:
+        student, academic_year = build_grade_student(options, stdin)
+        if options['details']:
+            import json
+            
+            details = calculator.get_calculation_details(student, academic_year)
+            print(json.dumps(details, ensure_ascii=False), file=stdout)
+        else:
+            print(calculator.calculate_final_grade(student, academic_year)['final_grade'],
+                  file=stdout)
+    except ValueError as e:
+        print(f"error: {e}", file=stderr)
+        return 1
+    return 0
+
+
+def print_statistics(statistics: dict) -> None:
+    """
+    Muestra las estadísticas de la sección calculadas en modo batch.
+    
+    Args:
+        statistics: Resultado de SectionAggregate.result()
+    """
+    if statistics['non_finite']:
+        print(f"Notas no finitas excluidas de las estadísticas: {statistics['non_finite']}")
+    if not statistics['count']:
+        print("Sin notas para calcular estadísticas")
+        return
+    print(f"Media: {statistics['mean']:.2f}  Desviación estándar: {statistics['std_dev']:.2f}")
+    print(f"Mediana: {statistics['median']}  Mínimo: {statistics['min']}  "
+          f"Máximo: {statistics['max']}")
+    print("Percentiles: " + ", ".join(f"{name}={value}" for name, value
+                                      in statistics['percentiles'].items()))
+    print(f"Tasa de aprobación: {statistics['pass_rate']:.1%}")
+    for bar in statistics['histogram']:
+        if bar['count']:
+            upper = f"{bar['upper']:g}" if bar['upper'] is not None else '+Inf'
+            print(f"  [{bar['lower']:g}, {upper}): {bar['count']}")
+
+
+def build_parser():
+    """
+    Construye el parser de argumentos de línea de comandos.
+    
+    Returns:
+        argparse.ArgumentParser: Parser del modo interactivo y batch
+    """
+    import argparse
+    
+    parser = argparse.ArgumentParser(
+        prog="python -m src.main",
+        description="CS-GradeCalculator - Cálculo de nota final del estudiante"
+    )
+    parser.add_argument("--batch", metavar="ENTRADA",
+                        help="Archivo CSV o JSONL a calificar sin interacción")
+    parser.add_argument("--out", metavar="SALIDA",
+                        help="Archivo JSONL de resultados, o ruta base de las tablas "
+                             "columnares (requerido con --batch)")
+    parser.add_argument("--rejects", metavar="RECHAZOS",
+                        help="Archivo JSONL de filas rechazadas")
+    parser.add_argument("--format", choices=["csv", "jsonl"],
+                        help="Formato de entrada (por defecto según la extensión)")
+    parser.add_argument("--extra-points", type=parse_extra_points, default=[],
+                        metavar="S,N,...",
+                        help="Política de puntos extra por año académico (s/n)")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Procesos de calificación en modo batch (por defecto 1)")
+    parser.add_argument("--chunk-size", type=int, default=1000,
+                        help="Filas por tarea enviada a cada proceso (por defecto 1000)")
+    parser.add_argument("--stats", action="store_true",
+                        help="Muestra las estadísticas de la sección al terminar")
+    parser.add_argument("--drop-lowest", type=int, default=0, metavar="N",
+                        help="Descarta las N evaluaciones de menor nota")
+    parser.add_argument("--best-of", type=int, metavar="N",
+                        help="Cuenta solo las N evaluaciones de mayor nota")
+    parser.add_argument("--max-evaluations", type=int, metavar="N",
+                        help=f"Máximo de evaluaciones por estudiante "
+                             f"(por defecto {Student.MAX_EVALUATIONS})")
+    parser.add_argument("--fixed-point", action="store_true",
+                        help="Calcula en centésimas exactas (redondeo hacia arriba en la mitad)")
+    parser.add_argument("--tenants", metavar="CONFIG",
+                        help="Archivo JSON con las políticas de cada tenant; cada fila "
+                             "se califica según su campo tenant")
+    parser.add_argument("--out-format", choices=["jsonl", "csv", "arrow"], default="jsonl",
+                        help="Formato de resultados: JSONL o tablas columnares de "
+                             "estudiantes y evaluaciones (por defecto jsonl)")
+    parser.add_argument("--profile", choices=["sample", "cprofile"],
+                        help="Perfila la ejecución: muestreo de pilas (salida colapsada "
+                             "para flamegraph) o cProfile (volcado pstats)")
+    parser.add_argument("--profile-out", metavar="BASE", default="profile",
+                        help="Ruta base de los archivos del perfil (por defecto profile)")
+    parser.add_argument("--profile-interval", type=float, default=1.0, metavar="MS",
+                        help="Milisegundos entre muestras con --profile sample "
+                             "(por defecto 1; más alto, menos sobrecosto)")
+    parser.add_argument("--profile-top", type=int, default=20, metavar="N",
+                        help="Funciones más costosas listadas en el resumen (por defecto 20)")
+    return parser
+
+
+def run_command(parser, args):
+    """
+    Ejecuta el modo interactivo o el modo batch según los argumentos.
+    
+    Args:
+        parser: Parser de build_parser (para reportar errores de uso)
+        args: Argumentos ya procesados
+    """
+    if args.batch is None:
+        run_interactive()
+        return
+    if not args.out:
+        parser.error("--out es requerido con --batch")
+    
+    from src.batch.runner import run_batch
+    
+    if args.max_evaluations is not None and args.max_evaluations < 1:
+        parser.error("--max-evaluations debe ser positivo")
+    attendance_policy = AttendancePolicy()
+    extra_points_policy = ExtraPointsPolicy(args.extra_points)
+    pipeline = None
+    try:
+        if args.drop_lowest or args.best_of is not None:
+            from src.calculator.pipeline import PolicyPipeline
+            pipeline = PolicyPipeline.default(attendance_policy, extra_points_policy,
+                                              args.drop_lowest, args.best_of)
+        calculator = GradeCalculator(attendance_policy, extra_points_policy,
+                                     pipeline=pipeline, fixed_point=args.fixed_point)
+    except ValueError as e:
+        parser.error(str(e))
+    tenants = None
+    if args.tenants:
+        from src.calculator.tenants import load_tenant_policies
+        try:
+            tenants = load_tenant_policies(args.tenants)
+        except (OSError, ValueError) as e:
+            parser.error(str(e))
+    aggregate = None
+    if args.stats:
+        from src.calculator.aggregates import SectionAggregate
+        aggregate = SectionAggregate()
+    try:
+        summary = run_batch(args.batch, args.out, calculator,
+                            rejects_path=args.rejects, file_format=args.format,
+                            workers=args.workers, chunk_size=args.chunk_size,
+                            aggregate=aggregate, max_evaluations=args.max_evaluations,
+                            output_format=args.out_format, tenants=tenants)
+    except ValueError as e:
+        parser.error(str(e))
+    print(f"Procesados: {summary['processed']}, rechazados: {summary['rejected']}")
+    if aggregate is not None:
+        print_statistics(aggregate.result())
+
+
+def main(argv=None):
+    """
+    Función principal: ejecuta CU001 de forma interactiva, en modo rápido
+    (--grade) o en modo batch. Con --profile la ejecución interactiva o
+    batch se perfila (ver src.profiling).
+    
+    Args:
+        argv: Argumentos de línea de comandos (por defecto sys.argv)
+        
+    Returns:
+        int: Código de salida del modo rápido (None en los demás modos)
+    """
+    if argv is None:
+        argv = sys.argv[1:]
+    if GRADE_FLAG in argv:
+        return run_grade(argv)
+    
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    
+    if args.profile:
+        if args.profile_interval <= 0:
+            parser.error("--profile-interval debe ser positivo")
+        from src.profiling import profile_run
+        return profile_run(lambda: run_command(parser, args), args.profile,
+                           args.profile_out, args.profile_interval / 1000, args.profile_top)
+    return run_command(parser, args)
+
+
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
 
@@ -10,8 +10,15 @@ class Evaluation:
     Attributes:
         grade (float): Nota obtenida en la evaluación (0-20 típicamente)
         weight (float): Porcentaje de peso sobre la nota final (0-100)
+    
+    Las evaluaciones son inmutables: Student guarda los totales de sus
+    evaluaciones, por lo que cambiar la nota o el peso de una evaluación ya
+    registrada dejaría el resultado desactualizado. Para corregirlas se usa
+    Student.update_evaluation.
     """
     
+    __slots__ = ('grade', 'weight')
+    
     def __init__(self, grade: float, weight: float):
         """
         Inicializa una evaluación.
@@ -28,8 +35,18 @@ class Evaluation:
         if weight < 0 or weight > 100:
             raise ValueError("El peso debe estar entre 0 y 100")
         
-        self.grade = grade
-        self.weight = weight
+        _set_grade(self, grade)
+        _set_weight(self, weight)
+    
+    def __setattr__(self, name, value):
+        raise AttributeError(f"Evaluation es inmutable: no se puede asignar '{name}'")
+    
+    def __delattr__(self, name):
+        raise AttributeError(f"Evaluation es inmutable: no se puede eliminar '{name}'")
+    
+    def __reduce__(self):
+        # pickle y copy restauran los slots con setattr: se recrea con __init__
+        return (type(self), (self.grade, self.weight))
     
     def get_weighted_grade(self) -> float:
         """
@@ -43,3 +60,7 @@ class Evaluation:
     def __repr__(self) -> str:
         return f"Evaluation(grade={self.grade}, weight={self.weight}%)"
 
+
+# Los descriptores de los slots asignan sin pasar por __setattr__
+_set_grade = Evaluation.grade.__set__
+_set_weight = Evaluation.weight.__set__
@@ -2,7 +2,10 @@
 Módulo que representa un estudiante con sus evaluaciones.
 """
 
-from typing import List
+from __future__ import annotations
+
+import math
+
 from src.models.evaluation import Evaluation
 
 
@@ -12,22 +15,69 @@ class Student:
     
     Attributes:
         student_id (str): Identificador único del estudiante
-        evaluations (List[Evaluation]): Lista de evaluaciones del estudiante
+        evaluations (Tuple[Evaluation, ...]): Evaluaciones del estudiante
+                                              (solo lectura)
         has_reached_minimum_classes (bool): Indica si cumplió asistencia mínima
+        attendance_rate (float | None): Porcentaje de asistencia (0-100), opcional;
+                                        lo usan reglas como AttendanceTiers
+        max_evaluations (int): Máximo de evaluaciones de este estudiante
+                               (por defecto MAX_EVALUATIONS)
+    
+    El peso total y la suma ponderada se mantienen de forma incremental, por
+    lo que las evaluaciones solo se modifican mediante add_evaluation,
+    update_evaluation y remove_evaluation. evaluations ya no es una lista
+    pública: devuelve una tupla, y append, la asignación por índice o la
+    reasignación de evaluations fallan en lugar de desincronizar los totales.
     """
     
     MAX_EVALUATIONS = 10  # RNF01: Máximo 10 evaluaciones
     
-    def __init__(self, student_id: str):
+    __slots__ = ('student_id', '_evaluations', '_snapshot', 'has_reached_minimum_classes',
+                 'attendance_rate', 'max_evaluations', '_total_weight', '_weighted_sum',
+                 '_weighted_count')
+    
+    def __init__(self, student_id: str, max_evaluations: int | None = None):
         """
         Inicializa un estudiante.
         
         Args:
             student_id: Identificador único del estudiante
+            max_evaluations: Máximo de evaluaciones para cursos con muchas
+                             evaluaciones pequeñas (None = MAX_EVALUATIONS)
+            
+        Raises:
+            ValueError: Si max_evaluations no es positivo
         """
+        if max_evaluations is None:
+            max_evaluations = self.MAX_EVALUATIONS
+        elif max_evaluations < 1:
+            raise ValueError("El máximo de evaluaciones debe ser positivo")
         self.student_id = student_id
-        self.evaluations: List[Evaluation] = []
+        self.max_evaluations = max_evaluations
+        self._evaluations: list[Evaluation] = []
+        # Tupla devuelta por evaluations; se arma de nuevo tras cada cambio
+        self._snapshot: tuple[Evaluation, ...] | None = ()
         self.has_reached_minimum_classes = False
+        self.attendance_rate = None
+        # Mismo valor inicial que sum() para que los totales sean idénticos
+        self._total_weight = 0
+        self._weighted_sum = 0
+        # Evaluaciones con peso distinto de cero
+        self._weighted_count = 0
+    
+    @property
+    def evaluations(self) -> tuple[Evaluation, ...]:
+        """
+        Evaluaciones del estudiante, en orden de registro (solo lectura).
+        
+        La tupla se arma una sola vez después de cada cambio, de modo que
+        agregar evaluaciones no copia las anteriores y leerla varias veces
+        no tiene costo adicional.
+        """
+        snapshot = self._snapshot
+        if snapshot is None:
+            snapshot = self._snapshot = tuple(self._evaluations)
+        return snapshot
     
     def add_evaluation(self, evaluation: Evaluation) -> None:
         """
@@ -39,21 +89,110 @@ class Student:
         Raises:
             ValueError: Si se excede el límite máximo de evaluaciones (RNF01)
         """
-        if len(self.evaluations) >= self.MAX_EVALUATIONS:
+        if len(self._evaluations) >= self.max_evaluations:
             raise ValueError(
-                f"No se pueden agregar más de {self.MAX_EVALUATIONS} evaluaciones"
+                f"No se pueden agregar más de {self.max_evaluations} evaluaciones"
             )
-        self.evaluations.append(evaluation)
+        self._evaluations.append(evaluation)
+        self._snapshot = None
+        self._total_weight += evaluation.weight
+        self._weighted_sum += evaluation.get_weighted_grade()
+        if evaluation.weight:
+            self._weighted_count += 1
+    
+    def update_evaluation(self, index: int, grade: float | None = None,
+                          weight: float | None = None) -> Evaluation:
+        """
+        Reemplaza la nota y/o el peso de una evaluación existente.
+        
+        Los totales se ajustan en O(1) restando la contribución anterior y
+        sumando la nueva (ver _replace_contribution).
+        
+        Args:
+            index: Posición de la evaluación
+            grade: Nueva nota (se conserva la actual si es None)
+            weight: Nuevo peso (se conserva el actual si es None)
+            
+        Returns:
+            Evaluation: La nueva evaluación registrada
+            
+        Raises:
+            ValueError: Si grade o weight son inválidos
+            IndexError: Si no existe una evaluación en esa posición
+        """
+        current = self._evaluations[index]
+        evaluation = Evaluation(
+            current.grade if grade is None else grade,
+            current.weight if weight is None else weight
+        )
+        self._evaluations[index] = evaluation
+        self._snapshot = None
+        self._replace_contribution(current, evaluation)
+        return evaluation
+    
+    def remove_evaluation(self, index: int) -> Evaluation:
+        """
+        Elimina una evaluación del estudiante.
+        
+        Los totales se ajustan en O(1) restando la contribución de la
+        evaluación eliminada (ver _replace_contribution).
+        
+        Args:
+            index: Posición de la evaluación
+            
+        Returns:
+            Evaluation: La evaluación eliminada
+            
+        Raises:
+            IndexError: Si no existe una evaluación en esa posición
+        """
+        evaluation = self._evaluations.pop(index)
+        self._snapshot = None
+        self._replace_contribution(evaluation, None)
+        return evaluation
+    
+    def _replace_contribution(self, removed: Evaluation,
+                              added: Evaluation | None) -> None:
+        # Restar no deshace el redondeo de la suma, así que tras update/remove
+        # los totales pueden diferir en el último bit de sumar desde cero; los
+        # estudiantes armados solo con add_evaluation siguen siendo idénticos
+        # a la ruta vectorizada (RNF03). Se vuelve a sumar únicamente cuando
+        # restar no sirve: si la contribución anterior no es finita (inf - inf
+        # es NaN) o si no quedan evaluaciones con peso, para que el peso total
+        # sea exactamente cero y no el residuo de la resta.
+        removed_weighted = removed.get_weighted_grade()
+        if removed.weight:
+            self._weighted_count -= 1
+        if added is not None and added.weight:
+            self._weighted_count += 1
+        if not self._weighted_count or not math.isfinite(removed_weighted):
+            self._total_weight = sum(eval.weight for eval in self._evaluations)
+            self._weighted_sum = sum(eval.get_weighted_grade() for eval in self._evaluations)
+            return
+        self._total_weight -= removed.weight
+        self._weighted_sum -= removed_weighted
+        if added is not None:
+            self._total_weight += added.weight
+            self._weighted_sum += added.get_weighted_grade()
     
     def get_total_weight(self) -> float:
         """
-        Calcula el peso total de todas las evaluaciones.
+        Obtiene el peso total de todas las evaluaciones en O(1).
         
         Returns:
             float: Suma de todos los pesos
         """
-        return sum(eval.weight for eval in self.evaluations)
+        return self._total_weight
+    
+    def get_weighted_sum(self) -> float:
+        """
+        Obtiene la suma de las notas ponderadas en O(1).
+        
+        Returns:
+            float: Suma de nota * (peso / 100) de todas las evaluaciones
+        """
+        return self._weighted_sum
     
     def __repr__(self) -> str:
-        return f"Student(id={self.student_id}, evaluations={len(self.evaluations)})"
+        return f"Student(id={self.student_id}, evaluations={len(self._evaluations)})"
 
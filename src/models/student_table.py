@@ -0,0 +1,308 @@
+"""
+Módulo con una representación compacta (columnar) de estudiantes y evaluaciones.
+
+Las notas y pesos de todas las evaluaciones se guardan en buffers contiguos
+de float64 en lugar de un objeto Evaluation por evaluación. El acceso
+individual se hace mediante vistas livianas con la misma interfaz que
+Student y Evaluation, por lo que GradeCalculator funciona sin cambios.
+"""
+
+from array import array
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+from src.models.student import Student
+
+
+class EvaluationBlock:
+    """
+    Bloque contiguo de evaluaciones (notas y pesos en columnas float64).
+
+    Attributes:
+        grades: Notas de todas las evaluaciones del bloque
+        weights: Pesos de todas las evaluaciones del bloque
+    """
+
+    __slots__ = ('grades', 'weights')
+
+    def __init__(self, grades=None, weights=None):
+        """
+        Inicializa el bloque, vacío o sobre buffers existentes.
+
+        Args:
+            grades: Secuencia de notas (array('d'), memoryview u otra secuencia)
+            weights: Secuencia de pesos de la misma longitud
+
+        Raises:
+            ValueError: Si las columnas no tienen la misma longitud
+        """
+        self.grades = array('d') if grades is None else grades
+        self.weights = array('d') if weights is None else weights
+        if len(self.grades) != len(self.weights):
+            raise ValueError("Las columnas de notas y pesos deben tener la misma longitud")
+
+    def append(self, grade: float, weight: float) -> None:
+        """
+        Agrega una evaluación con las mismas validaciones que Evaluation.
+
+        Raises:
+            ValueError: Si grade o weight son inválidos
+        """
+        if grade < 0:
+            raise ValueError("La nota no puede ser negativa")
+        if weight < 0 or weight > 100:
+            raise ValueError("El peso debe estar entre 0 y 100")
+        self.grades.append(grade)
+        self.weights.append(weight)
+
+    def view(self, index: int) -> 'EvaluationView':
+        """
+        Obtiene una vista tipo Evaluation sobre la evaluación indicada.
+        """
+        return EvaluationView(self, index)
+
+    def __len__(self) -> int:
+        return len(self.grades)
+
+
+class EvaluationView:
+    """
+    Vista de una evaluación dentro de un EvaluationBlock con la interfaz de Evaluation.
+    """
+
+    __slots__ = ('_block', '_index')
+
+    def __init__(self, block: EvaluationBlock, index: int):
+        self._block = block
+        self._index = index
+
+    @property
+    def grade(self) -> float:
+        return self._block.grades[self._index]
+
+    @property
+    def weight(self) -> float:
+        return self._block.weights[self._index]
+
+    def get_weighted_grade(self) -> float:
+        """
+        Calcula la nota ponderada (nota * peso).
+
+        Returns:
+            float: Nota ponderada
+        """
+        return self._block.grades[self._index] * (self._block.weights[self._index] / 100)
+
+    def __repr__(self) -> str:
+        return f"Evaluation(grade={self.grade}, weight={self.weight}%)"
+
+
+class StudentTable:
+    """
+    Tabla columnar de estudiantes con sus evaluaciones en un EvaluationBlock.
+
+    Las evaluaciones del estudiante i ocupan las posiciones
+    offsets[i]:offsets[i + 1] del bloque.
+
+    Attributes:
+        student_ids: Identificadores de los estudiantes
+        offsets: Posición inicial de las evaluaciones de cada estudiante (n + 1)
+        attendance: Asistencia mínima cumplida por estudiante (0/1)
+        academic_years: Año académico de cada estudiante (0-based)
+        block: Bloque con las notas y pesos de todas las evaluaciones
+        max_evaluations: Máximo de evaluaciones por estudiante en add_student
+    """
+
+    __slots__ = ('student_ids', 'offsets', 'attendance', 'academic_years', 'block',
+                 'max_evaluations')
+
+    def __init__(self, student_ids=None, offsets=None, attendance=None,
+                 academic_years=None, block: Optional[EvaluationBlock] = None,
+                 max_evaluations: Optional[int] = None):
+        """
+        Inicializa la tabla, vacía o sobre columnas existentes.
+
+        Args:
+            max_evaluations: Máximo de evaluaciones por estudiante
+                             (None = Student.MAX_EVALUATIONS)
+
+        Raises:
+            ValueError: Si las longitudes de las columnas no son consistentes
+                        o max_evaluations no es positivo
+        """
+        if max_evaluations is None:
+            max_evaluations = Student.MAX_EVALUATIONS
+        elif max_evaluations < 1:
+            raise ValueError("El máximo de evaluaciones debe ser positivo")
+        self.max_evaluations = max_evaluations
+        self.student_ids = [] if student_ids is None else student_ids
+        self.offsets = array('q', [0]) if offsets is None else offsets
+        self.attendance = bytearray() if attendance is None else attendance
+        self.academic_years = array('q') if academic_years is None else academic_years
+        self.block = EvaluationBlock() if block is None else block
+
+        n_students = len(self.student_ids)
+        if (len(self.offsets) != n_students + 1 or len(self.attendance) != n_students
+                or len(self.academic_years) != n_students):
+            raise ValueError("Las columnas de la tabla no tienen longitudes consistentes")
+        if self.offsets[n_students] != len(self.block):
+            raise ValueError("Los offsets no coinciden con el número de evaluaciones")
+
+    @classmethod
+    def from_students(cls, students: Iterable[Student],
+                      academic_years: Optional[Iterable[int]] = None,
+                      max_evaluations: Optional[int] = None) -> 'StudentTable':
+        """
+        Construye una tabla a partir de objetos Student (o vistas compatibles).
+
+        Args:
+            students: Estudiantes a incluir, en orden
+            academic_years: Año académico de cada estudiante (0 por defecto)
+            max_evaluations: Máximo de evaluaciones por estudiante
+                             (None = Student.MAX_EVALUATIONS)
+        """
+        table = cls(max_evaluations=max_evaluations)
+        years = iter(academic_years) if academic_years is not None else None
+        for student in students:
+            table.add_student(
+                student.student_id,
+                ((evaluation.grade, evaluation.weight) for evaluation in student.evaluations),
+                student.has_reached_minimum_classes,
+                next(years) if years is not None else 0
+            )
+        return table
+
+    def add_student(self, student_id: str, evaluations: Iterable[Tuple[float, float]],
+                    has_reached_minimum_classes: bool = False,
+                    academic_year: int = 0) -> None:
+        """
+        Agrega un estudiante con sus evaluaciones (pares nota, peso).
+
+        La fila se valida completa antes de escribirse, de modo que un error
+        no deja la tabla en un estado parcial.
+
+        Raises:
+            ValueError: Si alguna evaluación es inválida o se excede
+                        max_evaluations (RNF01)
+        """
+        pairs = [(float(grade), float(weight)) for grade, weight in evaluations]
+        if len(pairs) > self.max_evaluations:
+            raise ValueError(
+                f"No se pueden agregar más de {self.max_evaluations} evaluaciones"
+            )
+        for grade, weight in pairs:
+            if grade < 0:
+                raise ValueError("La nota no puede ser negativa")
+            if weight < 0 or weight > 100:
+                raise ValueError("El peso debe estar entre 0 y 100")
+
+        for grade, weight in pairs:
+            self.block.grades.append(grade)
+            self.block.weights.append(weight)
+        self.student_ids.append(student_id)
+        self.offsets.append(len(self.block))
+        self.attendance.append(1 if has_reached_minimum_classes else 0)
+        self.academic_years.append(academic_year)
+
+    def evaluation_counts(self) -> array:
+        """
+        Obtiene el número de evaluaciones de cada estudiante.
+
+        Returns:
+            numpy.ndarray: Cantidades (int64), diferencias consecutivas de offsets
+        """
+        import numpy as np
+
+        return np.diff(np.frombuffer(self.offsets, dtype=np.int64))
+
+    def columns(self) -> dict:
+        """
+        Obtiene las columnas en el formato de GradeCalculator.calculate_cohort.
+
+        Returns:
+            dict: Argumentos para ``calculator.calculate_cohort(**table.columns())``
+        """
+        return {
+            'grades': self.block.grades,
+            'weights': self.block.weights,
+            'evaluation_counts': self.evaluation_counts(),
+            'has_reached_minimum_classes': self.attendance,
+            'academic_years': self.academic_years,
+        }
+
+    def __len__(self) -> int:
+        return len(self.student_ids)
+
+    def __getitem__(self, index: int) -> 'StudentView':
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("Índice de estudiante fuera de rango")
+        return StudentView(self, index)
+
+    def __iter__(self) -> Iterator['StudentView']:
+        for index in range(len(self)):
+            yield StudentView(self, index)
+
+
+class StudentView:
+    """
+    Vista de un estudiante dentro de un StudentTable con la interfaz de Student.
+    """
+
+    __slots__ = ('_table', '_index')
+
+    def __init__(self, table: StudentTable, index: int):
+        self._table = table
+        self._index = index
+
+    @property
+    def student_id(self) -> str:
+        return self._table.student_ids[self._index]
+
+    @property
+    def academic_year(self) -> int:
+        return self._table.academic_years[self._index]
+
+    @property
+    def evaluations(self) -> List[EvaluationView]:
+        block = self._table.block
+        start = self._table.offsets[self._index]
+        end = self._table.offsets[self._index + 1]
+        return [EvaluationView(block, position) for position in range(start, end)]
+
+    @property
+    def has_reached_minimum_classes(self) -> bool:
+        return bool(self._table.attendance[self._index])
+
+    @has_reached_minimum_classes.setter
+    def has_reached_minimum_classes(self, value: bool) -> None:
+        self._table.attendance[self._index] = 1 if value else 0
+
+    def get_total_weight(self) -> float:
+        """
+        Calcula el peso total de todas las evaluaciones.
+
+        Returns:
+            float: Suma de todos los pesos
+        """
+        weights = self._table.block.weights
+        start = self._table.offsets[self._index]
+        end = self._table.offsets[self._index + 1]
+        return sum(weights[position] for position in range(start, end))
+
+    def get_weighted_sum(self) -> float:
+        """
+        Calcula la suma de las notas ponderadas de todas las evaluaciones.
+
+        Returns:
+            float: Suma de nota * (peso / 100)
+        """
+        block = self._table.block
+        grades, weights = block.grades, block.weights
+        start = self._table.offsets[self._index]
+        end = self._table.offsets[self._index + 1]
+        return sum(grades[position] * (weights[position] / 100)
+                   for position in range(start, end))
+
+    def __repr__(self) -> str:
+        return f"Student(id={self.student_id}, evaluations={len(self.evaluations)})"
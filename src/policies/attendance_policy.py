@@ -28,6 +28,17 @@ class AttendancePolicy:
             return 0.0
         return AttendancePolicy.PENALTY_NO_ATTENDANCE
     
+    @staticmethod
+    def policy_key() -> tuple:
+        """
+        Obtiene los valores de los que depende la política, para detectar
+        cambios en quienes los precalculan (pipelines compilados, cachés).
+        
+        Returns:
+            tuple: (PENALTY_NO_ATTENDANCE,)
+        """
+        return (AttendancePolicy.PENALTY_NO_ATTENDANCE,)
+    
     @staticmethod
     def is_attendance_valid(has_reached_minimum_classes: bool) -> bool:
         """
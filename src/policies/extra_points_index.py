@@ -0,0 +1,201 @@
+"""
+Módulo con un índice precompilado de la política de puntos extra.
+
+Cuando se manejan muchos programas y años académicos, las listas
+all_years_teachers de cada programa se compilan una sola vez en una tabla
+densa (programa x año) de bytes. La tabla responde consultas individuales
+sin validar rangos por separado, consultas vectorizadas para arreglos
+completos de años, y se guarda en disco en un formato binario compacto
+(bits empaquetados) para cargarla rápidamente al iniciar.
+"""
+
+import struct
+from typing import Dict, Iterable, List, Sequence
+
+import numpy as np
+
+from src.policies.extra_points_policy import ExtraPointsPolicy
+
+
+# Cabecera: magic, versión, n_programas, n_años, puntos extra
+_MAGIC = b'CSXP'
+_VERSION = 1
+_HEADER = struct.Struct('<4sHIId')
+_NAME_LENGTH = struct.Struct('<H')
+
+
+class ExtraPointsIndex:
+    """
+    Tabla densa de la política de puntos extra indexada por (programa, año).
+
+    Attributes:
+        programs (List[str]): Nombres de los programas, en orden de fila
+        n_years (int): Número de años académicos (columnas) de la tabla
+        extra_points_amount (float): Puntos extra cuando la política está activa
+    """
+
+    def __init__(self, policies: Dict[str, Sequence[bool]],
+                 extra_points_amount: float = ExtraPointsPolicy.EXTRA_POINTS_AMOUNT):
+        """
+        Compila la política de cada programa en la tabla.
+
+        Args:
+            policies: Por programa, su lista all_years_teachers o un ExtraPointsPolicy
+            extra_points_amount: Puntos extra a otorgar cuando la política está activa
+
+        Raises:
+            ValueError: Si alguna política no es una lista de años
+        """
+        rows: List[Sequence[bool]] = []
+        for policy in policies.values():
+            if isinstance(policy, ExtraPointsPolicy):
+                policy = policy.all_years_teachers
+            if not isinstance(policy, (list, tuple)):
+                raise ValueError("all_years_teachers debe ser una lista")
+            rows.append(policy)
+
+        self.programs = list(policies.keys())
+        self.n_years = max((len(row) for row in rows), default=0)
+        self.extra_points_amount = float(extra_points_amount)
+        self._codes = {program: code for code, program in enumerate(self.programs)}
+
+        table = bytearray(len(self.programs) * self.n_years)
+        for code, row in enumerate(rows):
+            offset = code * self.n_years
+            for year, active in enumerate(row):
+                table[offset + year] = 1 if active else 0
+        self._set_table(table)
+
+    def _set_table(self, table: bytearray) -> None:
+        self._table = table
+        # Vista sin copia de la misma memoria para las consultas vectorizadas
+        self._matrix = np.frombuffer(table, dtype=np.uint8).reshape(
+            len(self.programs), self.n_years
+        )
+
+    def program_code(self, program: str) -> int:
+        """
+        Obtiene el índice de fila de un programa.
+
+        Raises:
+            ValueError: Si el programa no está en el índice
+        """
+        try:
+            return self._codes[program]
+        except KeyError:
+            raise ValueError(f"Programa desconocido: {program}") from None
+
+    def program_codes(self, programs: Iterable[str]) -> np.ndarray:
+        """
+        Convierte nombres de programas en índices de fila para lookup_many.
+
+        Raises:
+            ValueError: Si algún programa no está en el índice
+        """
+        return np.fromiter((self.program_code(program) for program in programs),
+                           dtype=np.int64)
+
+    def is_extra_points_active(self, program: str, academic_year: int) -> bool:
+        """
+        Verifica si la política está activa para un programa y año.
+
+        Returns:
+            bool: True si está activa; False si no lo está o el año está fuera de rango
+        """
+        code = self.program_code(program)
+        if academic_year < 0 or academic_year >= self.n_years:
+            return False
+        return self._table[code * self.n_years + academic_year] == 1
+
+    def get_extra_points(self, program: str, academic_year: int) -> float:
+        """
+        Obtiene los puntos extra para un programa y año.
+
+        Returns:
+            float: extra_points_amount si la política está activa, 0 si no
+        """
+        if self.is_extra_points_active(program, academic_year):
+            return self.extra_points_amount
+        return 0.0
+
+    def lookup_many(self, program_codes, academic_years) -> np.ndarray:
+        """
+        Obtiene los puntos extra de arreglos completos de (programa, año).
+
+        Args:
+            program_codes: Índices de fila (ver program_codes) o uno común a todos
+            academic_years: Años académicos (0-based); fuera de rango otorgan 0
+
+        Returns:
+            np.ndarray: Puntos extra por elemento (float64)
+        """
+        codes, years = np.broadcast_arrays(np.asarray(program_codes, dtype=np.int64),
+                                           np.asarray(academic_years, dtype=np.int64))
+        valid = ((years >= 0) & (years < self.n_years)
+                 & (codes >= 0) & (codes < len(self.programs)))
+        active = np.zeros(codes.shape, dtype=bool)
+        active[valid] = self._matrix[codes[valid], years[valid]] == 1
+        return np.where(active, self.extra_points_amount, 0.0)
+
+    def policy_for(self, program: str) -> ExtraPointsPolicy:
+        """
+        Construye el ExtraPointsPolicy de un programa para usarlo con GradeCalculator.
+        """
+        code = self.program_code(program)
+        return ExtraPointsPolicy([bool(active) for active in self._matrix[code].tolist()])
+
+    def save(self, path: str) -> None:
+        """
+        Guarda el índice en disco (cabecera, nombres y bits empaquetados por fila).
+        """
+        with open(path, 'wb') as stream:
+            stream.write(_HEADER.pack(_MAGIC, _VERSION, len(self.programs),
+                                      self.n_years, self.extra_points_amount))
+            for program in self.programs:
+                encoded = program.encode('utf-8')
+                stream.write(_NAME_LENGTH.pack(len(encoded)))
+                stream.write(encoded)
+            stream.write(np.packbits(self._matrix, axis=1).tobytes())
+
+    @classmethod
+    def load(cls, path: str) -> 'ExtraPointsIndex':
+        """
+        Carga un índice guardado con save.
+
+        Raises:
+            ValueError: Si el archivo no tiene el formato esperado o está truncado
+        """
+        with open(path, 'rb') as stream:
+            data = stream.read()
+        if len(data) < _HEADER.size:
+            raise ValueError("Archivo de índice de puntos extra inválido")
+        magic, version, n_programs, n_years, amount = _HEADER.unpack_from(data)
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError("Archivo de índice de puntos extra inválido")
+
+        position = _HEADER.size
+        programs = []
+        for _ in range(n_programs):
+            if position + _NAME_LENGTH.size > len(data):
+                raise ValueError("Archivo de índice de puntos extra truncado")
+            (length,) = _NAME_LENGTH.unpack_from(data, position)
+            position += _NAME_LENGTH.size
+            if position + length > len(data):
+                raise ValueError("Archivo de índice de puntos extra truncado")
+            programs.append(data[position:position + length].decode('utf-8'))
+            position += length
+
+        row_bytes = (n_years + 7) // 8
+        if position + n_programs * row_bytes > len(data):
+            raise ValueError("Archivo de índice de puntos extra truncado")
+        packed = np.frombuffer(data, dtype=np.uint8, count=n_programs * row_bytes,
+                               offset=position).reshape(n_programs, row_bytes)
+        matrix = np.unpackbits(packed, axis=1, count=n_years)
+
+        index = cls.__new__(cls)
+        index.programs = programs
+        index.n_years = n_years
+        index.extra_points_amount = amount
+        index._codes = {program: code for code, program in enumerate(programs)}
+        index._set_table(bytearray(matrix.tobytes()))
+        return index
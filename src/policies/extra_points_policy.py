@@ -2,7 +2,7 @@
 Módulo que maneja la política de puntos extra por año académico.
 """
 
-from typing import List
+from __future__ import annotations
 
 
 class ExtraPointsPolicy:
@@ -16,7 +16,7 @@ class ExtraPointsPolicy:
     
     EXTRA_POINTS_AMOUNT = 1.0  # Puntos extra a otorgar cuando la política está activa
     
-    def __init__(self, all_years_teachers: List[bool]):
+    def __init__(self, all_years_teachers: list[bool]):
         """
         Inicializa la política de puntos extra.
         
@@ -28,6 +28,16 @@ class ExtraPointsPolicy:
             raise ValueError("all_years_teachers debe ser una lista")
         self.all_years_teachers = all_years_teachers
     
+    def policy_key(self) -> tuple:
+        """
+        Obtiene los valores de los que depende la política, para detectar
+        cambios en quienes los precalculan (pipelines compilados, cachés).
+        
+        Returns:
+            tuple: (EXTRA_POINTS_AMOUNT, años de all_years_teachers)
+        """
+        return (ExtraPointsPolicy.EXTRA_POINTS_AMOUNT, tuple(self.all_years_teachers))
+    
     def get_extra_points_for_year(self, academic_year: int) -> float:
         """
         Obtiene los puntos extra para un año académico específico.
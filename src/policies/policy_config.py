@@ -0,0 +1,156 @@
+"""
+Módulo con la configuración inmutable de las políticas de una instancia.
+
+AttendancePolicy y ExtraPointsPolicy leen sus valores de constantes de clase
+(PENALTY_NO_ATTENDANCE y EXTRA_POINTS_AMOUNT), por lo que aplicar reglas
+distintas por facultad obliga a modificar esas constantes o a crear
+subclases. PolicyConfig guarda los tres parámetros por instancia y no se
+puede modificar después de crearse: GradeCalculator puede entonces congelar
+la penalización y los puntos extra en tuplas precalculadas, sin llamar a las
+políticas en cada estudiante.
+"""
+
+from __future__ import annotations
+
+from src.policies.attendance_policy import AttendancePolicy
+from src.policies.extra_points_policy import ExtraPointsPolicy
+
+
+class PolicyConfig:
+    """
+    Configuración inmutable de asistencia y puntos extra.
+
+    Implementa la interfaz de AttendancePolicy y de ExtraPointsPolicy, por lo
+    que la misma instancia se pasa como ambas políticas a GradeCalculator.
+
+    Attributes:
+        all_years_teachers (tuple[bool, ...]): Política de puntos extra por año
+        penalty_no_attendance (float): Penalización por no cumplir asistencia
+        extra_points_amount (float): Puntos extra cuando la política está activa
+    """
+
+    __slots__ = ('all_years_teachers', 'penalty_no_attendance', 'extra_points_amount')
+
+    def __init__(self, all_years_teachers=(),
+                 penalty_no_attendance: float = AttendancePolicy.PENALTY_NO_ATTENDANCE,
+                 extra_points_amount: float = ExtraPointsPolicy.EXTRA_POINTS_AMOUNT):
+        """
+        Inicializa la configuración.
+
+        Args:
+            all_years_teachers: Lista de booleanos por año académico
+            penalty_no_attendance: Penalización por no cumplir asistencia
+            extra_points_amount: Puntos extra cuando la política está activa
+
+        Raises:
+            ValueError: Si los años no son una lista de booleanos o algún
+                        valor es negativo
+        """
+        if not isinstance(all_years_teachers, (list, tuple)):
+            raise ValueError("all_years_teachers debe ser una lista")
+        # Sin bool(): un texto como "false" o "n" se tomaría como True
+        for active in all_years_teachers:
+            if not isinstance(active, bool):
+                raise ValueError("all_years_teachers solo admite booleanos "
+                                 f"(valor recibido: {active!r})")
+        if penalty_no_attendance < 0:
+            raise ValueError("La penalización no puede ser negativa")
+        if extra_points_amount < 0:
+            raise ValueError("Los puntos extra no pueden ser negativos")
+        object.__setattr__(self, 'all_years_teachers',
+                           tuple(all_years_teachers))
+        object.__setattr__(self, 'penalty_no_attendance', float(penalty_no_attendance))
+        object.__setattr__(self, 'extra_points_amount', float(extra_points_amount))
+
+    @classmethod
+    def from_policies(cls, attendance_policy: AttendancePolicy,
+                      extra_points_policy: ExtraPointsPolicy) -> PolicyConfig:
+        """
+        Congela los valores actuales de un par de políticas.
+
+        ExtraPointsPolicy evalúa cada año por su valor de verdad, que es lo
+        que se congela.
+        """
+        return cls([bool(active) for active in extra_points_policy.all_years_teachers],
+                   attendance_policy.calculate_penalty(False),
+                   ExtraPointsPolicy.EXTRA_POINTS_AMOUNT)
+
+    def calculate_penalty(self, has_reached_minimum_classes: bool) -> float:
+        """
+        Calcula la penalización por no cumplir asistencia mínima.
+
+        Returns:
+            float: 0 si cumplió, penalty_no_attendance si no
+        """
+        if has_reached_minimum_classes:
+            return 0.0
+        return self.penalty_no_attendance
+
+    def is_extra_points_active(self, academic_year: int) -> bool:
+        """
+        Verifica si la política de puntos extra está activa para un año.
+        """
+        if academic_year < 0 or academic_year >= len(self.all_years_teachers):
+            return False
+        return self.all_years_teachers[academic_year]
+
+    def get_extra_points_for_year(self, academic_year: int) -> float:
+        """
+        Obtiene los puntos extra para un año académico.
+
+        Returns:
+            float: extra_points_amount si la política está activa, 0 si no
+        """
+        if self.is_extra_points_active(academic_year):
+            return self.extra_points_amount
+        return 0.0
+
+    def policy_key(self) -> tuple:
+        """
+        Obtiene los valores de la configuración (no cambian: es inmutable).
+        """
+        return (self.all_years_teachers, self.penalty_no_attendance, self.extra_points_amount)
+
+    def frozen_penalties(self) -> tuple[float, float]:
+        """
+        Obtiene la penalización indexada por asistencia.
+
+        Returns:
+            tuple[float, float]: (penalización sin asistencia, con asistencia)
+        """
+        return self.calculate_penalty(False), self.calculate_penalty(True)
+
+    def frozen_extra_points(self) -> tuple[float, ...]:
+        """
+        Obtiene los puntos extra indexados por año académico (los años fuera
+        de la tupla no otorgan puntos).
+        """
+        return tuple(self.get_extra_points_for_year(year)
+                     for year in range(len(self.all_years_teachers)))
+
+    def __setattr__(self, name, value):
+        raise AttributeError("PolicyConfig es inmutable")
+
+    def __delattr__(self, name):
+        raise AttributeError("PolicyConfig es inmutable")
+
+    def __reduce__(self):
+        return (PolicyConfig, (self.all_years_teachers, self.penalty_no_attendance,
+                               self.extra_points_amount))
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, PolicyConfig):
+            return NotImplemented
+        return (self.all_years_teachers, self.penalty_no_attendance,
+                self.extra_points_amount) == (other.all_years_teachers,
+                                              other.penalty_no_attendance,
+                                              other.extra_points_amount)
+
+    def __hash__(self) -> int:
+        return hash((self.all_years_teachers, self.penalty_no_attendance,
+                     self.extra_points_amount))
+
+    def __repr__(self) -> str:
+        return (f"PolicyConfig({list(self.all_years_teachers)}, "
+                f"penalty_no_attendance={self.penalty_no_attendance}, "
+                f"extra_points_amount={self.extra_points_amount})")
@@ -0,0 +1,365 @@
+"""
+Módulo de perfilado de las ejecuciones de calificación.
+
+Dos modos:
+
+- 'sample': un hilo toma muestras de la pila del hilo principal cada
+  ``interval`` segundos (sys._current_frames). Escribe la salida en formato
+  de pilas colapsadas (``marco;marco;... muestras``), lista para
+  flamegraph.pl, speedscope o inferno. El costo depende del intervalo: con
+  intervalos más largos hay menos muestras y menos sobrecosto.
+- 'cprofile': instrumenta cada llamada con cProfile (tiempos exactos por
+  función, mayor sobrecosto). Escribe el volcado de pstats, que aceptan
+  snakeviz o flameprof para generar el flamegraph.
+
+En ambos modos el resumen lista las N funciones con más tiempo propio y
+reparte el tiempo entre GradeCalculator y el resto de src/calculator
+('calculator'), la construcción de modelos de src/models ('models'), la
+lectura y escritura de archivos ('io': lectores y escritores de src/batch,
+src/storage y los módulos json, csv, codecs e io) y el resto ('other'). En
+modo 'sample' cada muestra se asigna a la categoría del marco más interno
+que tenga una; en 'cprofile', por el tiempo propio de cada función.
+"""
+
+import cProfile
+import os
+import pstats
+import sys
+import threading
+from collections import Counter
+from typing import Callable, Dict, List, Optional, Tuple
+
+PROFILE_MODES = ('sample', 'cprofile')
+CATEGORIES = ('calculator', 'models', 'io', 'other')
+# Intervalo de muestreo por defecto en segundos
+DEFAULT_INTERVAL = 0.001
+DEFAULT_TOP = 20
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_PROJECT_IO = ('src/batch/readers.py', 'src/batch/writers.py', 'src/storage/')
+_STDLIB_IO = ('json', 'csv', 'codecs', 'io', '_pyio', 'encodings')
+# Carpeta de los módulos de primer nivel de la biblioteca estándar (csv.py)
+_STDLIB_DIR = os.path.dirname(os.path.abspath(os.__file__))
+
+
+def _relative_path(filename: str) -> str:
+    path = os.path.abspath(filename)
+    if path.startswith(_ROOT + os.sep):
+        return os.path.relpath(path, _ROOT).replace(os.sep, '/')
+    # Fuera del proyecto basta con el paquete y el archivo (json/encoder.py)
+    parts = path.replace(os.sep, '/').split('/')
+    return '/'.join(parts[-2:])
+
+
+def categorize(filename: str, function: str = '') -> Optional[str]:
+    """
+    Obtiene la categoría de una función según el archivo donde está definida.
+
+    Args:
+        filename: Archivo de la función ('~' para las funciones de C en cProfile)
+        function: Nombre de la función
+
+    Returns:
+        str | None: 'calculator', 'models' o 'io', o None si no pertenece a
+        ninguna categoría
+    """
+    if filename == '~':
+        return 'io' if any(name in function for name in ('_io.', '_csv', '_json')) else None
+    path = _relative_path(filename)
+    if path.startswith('src/calculator/'):
+        return 'calculator'
+    if path.startswith('src/models/'):
+        return 'models'
+    if path.startswith(_PROJECT_IO):
+        return 'io'
+    if not path.startswith('src/'):
+        directory, name = os.path.split(os.path.abspath(filename))
+        # Un módulo de primer nivel (python3.11/csv.py) se reconoce por su
+        # nombre y el de un paquete (json/encoder.py), por la carpeta
+        module = name if directory == _STDLIB_DIR else path.split('/')[0]
+        module = module[:-3] if module.endswith('.py') else module
+        if module in _STDLIB_IO:
+            return 'io'
+    return None
+
+
+def _label(code) -> str:
+    name = getattr(code, 'co_qualname', code.co_name)
+    # ';' separa marcos en el formato colapsado
+    return f"{_relative_path(code.co_filename)}:{name}".replace(';', ',')
+
+
+class ProfileReport:
+    """
+    Resultado de un perfilado: tiempos por función, por categoría y (en modo
+    'sample') las pilas colapsadas.
+
+    Attributes:
+        mode (str): 'sample' o 'cprofile'
+        unit (str): Unidad de los valores ('muestras' o 's')
+        total (float): Total de muestras o segundos medidos
+        functions (Dict[str, Tuple[float, float]]): Tiempo propio y total
+                                                    por función
+        categories (Dict[str, float]): Tiempo por categoría (CATEGORIES)
+        stacks (Counter | None): Muestras por pila (raíz primero)
+        stats (pstats.Stats | None): Estadísticas de cProfile
+    """
+
+    def __init__(self, mode: str, unit: str, total: float,
+                 functions: Dict[str, Tuple[float, float]], categories: Dict[str, float],
+                 stacks: Optional[Counter] = None, stats: Optional[pstats.Stats] = None):
+        self.mode = mode
+        self.unit = unit
+        self.total = total
+        self.functions = functions
+        self.categories = categories
+        self.stacks = stacks
+        self.stats = stats
+
+    def top(self, n: int = DEFAULT_TOP) -> List[Tuple[str, float, float]]:
+        """
+        Obtiene las n funciones con más tiempo propio.
+
+        Returns:
+            List[Tuple[str, float, float]]: (función, tiempo propio, total)
+        """
+        ranked = sorted(self.functions.items(), key=lambda item: (-item[1][0], item[0]))
+        return [(label, own, cumulative) for label, (own, cumulative) in ranked[:n]]
+
+    def collapsed(self) -> List[str]:
+        """
+        Obtiene las pilas en formato colapsado, una línea por pila.
+
+        Raises:
+            ValueError: Si el perfil no se tomó por muestreo
+        """
+        if self.stacks is None:
+            raise ValueError("Las pilas colapsadas requieren el modo 'sample'")
+        return [f"{';'.join(stack)} {count}" for stack, count in sorted(self.stacks.items())]
+
+    def summary(self, n: int = DEFAULT_TOP) -> str:
+        """
+        Arma el resumen de texto: reparto por categoría y funciones más costosas.
+        """
+        total = self.total or 1
+        value = '{:.0f}' if self.unit == 'muestras' else '{:.4f}'
+        lines = [f"Perfil ({self.mode}): {value.format(self.total)} {self.unit}", "",
+                 "Categoría        %"]
+        for category in CATEGORIES:
+            lines.append(f"{category:<12} {100 * self.categories.get(category, 0) / total:6.1f}")
+        lines += ["", f"{'propio %':>9} {'total %':>8}  función"]
+        for label, own, cumulative in self.top(n):
+            lines.append(f"{100 * own / total:9.1f} {100 * cumulative / total:8.1f}  {label}")
+        return '\n'.join(lines) + '\n'
+
+
+class SamplingProfiler:
+    """
+    Perfilador por muestreo de la pila de un hilo.
+
+    El hilo de muestreo solo corre cuando el hilo medido suelta el GIL, así
+    que entre start() y stop() el intervalo de cambio de hilo del intérprete
+    (sys.setswitchinterval) baja a ``interval`` si es mayor. El ajuste es de
+    todo el proceso: afecta a los demás hilos mientras dura el perfilado y
+    stop() restaura el valor anterior.
+    """
+
+    def __init__(self, interval: float = DEFAULT_INTERVAL):
+        """
+        Args:
+            interval: Segundos entre muestras
+
+        Raises:
+            ValueError: Si el intervalo no es positivo
+        """
+        if interval <= 0:
+            raise ValueError("El intervalo de muestreo debe ser positivo")
+        self.interval = interval
+        self.samples: Counter = Counter()
+        self._thread: Optional[threading.Thread] = None
+        self._stopped = threading.Event()
+        self._switch_interval = sys.getswitchinterval()
+
+    def start(self) -> None:
+        """
+        Comienza a tomar muestras del hilo que llama y baja el intervalo de
+        cambio de hilo del proceso hasta stop().
+        """
+        self._target = threading.get_ident()
+        self._stopped.clear()
+        self._switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(min(self._switch_interval, self.interval))
+        self._thread = threading.Thread(target=self._run, name="sampling-profiler",
+                                        daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        current_frames = sys._current_frames
+        samples = self.samples
+        target = self._target
+        while not self._stopped.wait(self.interval):
+            frame = current_frames().get(target)
+            stack = []
+            while frame is not None:
+                stack.append(frame.f_code)
+                frame = frame.f_back
+            if stack:
+                samples[tuple(stack)] += 1
+
+    def stop(self) -> None:
+        """
+        Deja de tomar muestras.
+        """
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        sys.setswitchinterval(self._switch_interval)
+
+    def report(self) -> ProfileReport:
+        """
+        Resume las muestras tomadas.
+        """
+        labels: Dict = {}
+        codes_category: Dict = {}
+        stacks: Counter = Counter()
+        own: Counter = Counter()
+        cumulative: Counter = Counter()
+        categories: Counter = Counter()
+        for codes, count in self.samples.items():
+            for code in codes:
+                if code not in labels:
+                    labels[code] = _label(code)
+                    codes_category[code] = categorize(code.co_filename, code.co_name)
+            # Las pilas se guardan desde la hoja: se invierten para el formato colapsado
+            names = [labels[code] for code in reversed(codes)]
+            stacks[tuple(names)] += count
+            own[names[-1]] += count
+            for name in set(names):
+                cumulative[name] += count
+            category = next((codes_category[code] for code in codes
+                             if codes_category[code] is not None), 'other')
+            categories[category] += count
+        functions = {name: (own[name], cumulative[name]) for name in cumulative}
+        return ProfileReport('sample', 'muestras', sum(self.samples.values()), functions,
+                             dict(categories), stacks=stacks)
+
+
+class TracingProfiler:
+    """
+    Perfilador determinista basado en cProfile, con la misma interfaz que
+    SamplingProfiler.
+    """
+
+    def __init__(self):
+        self._profile = cProfile.Profile()
+
+    def start(self) -> None:
+        """
+        Comienza a medir las llamadas.
+        """
+        self._profile.enable()
+
+    def stop(self) -> None:
+        """
+        Deja de medir las llamadas.
+        """
+        self._profile.disable()
+
+    def report(self) -> ProfileReport:
+        """
+        Resume las estadísticas de cProfile.
+        """
+        stats = pstats.Stats(self._profile)
+        functions = {}
+        categories: Counter = Counter()
+        total = 0.0
+        for (filename, line, name), (_, _, own, cumulative, callers) in stats.stats.items():
+            if filename == '~':
+                label = name
+            else:
+                label = f"{_relative_path(filename)}:{name}:{line}"
+            functions[label] = (own, cumulative)
+            total += own
+            category = categorize(filename, name)
+            if category is None and filename == '~':
+                # Las funciones de C (round, sum, ...) cuentan para quien las llama
+                for (caller_file, _, caller_name), edge in callers.items():
+                    caller_category = categorize(caller_file, caller_name) or 'other'
+                    categories[caller_category] += edge[2]
+                continue
+            categories[category or 'other'] += own
+        return ProfileReport('cprofile', 's', total, functions, dict(categories), stats=stats)
+
+
+def create_profiler(mode: str = 'sample', interval: float = DEFAULT_INTERVAL):
+    """
+    Crea el perfilador de un modo.
+
+    Raises:
+        ValueError: Si el modo no es soportado o el intervalo no es positivo
+    """
+    if mode == 'sample':
+        return SamplingProfiler(interval)
+    if mode == 'cprofile':
+        return TracingProfiler()
+    raise ValueError(f"Modo de perfilado no soportado: {mode}")
+
+
+def write_profile(report: ProfileReport, output_base: str, top: int = DEFAULT_TOP) -> List[str]:
+    """
+    Escribe el perfil: ``<base>.collapsed`` (modo 'sample') o ``<base>.prof``
+    (modo 'cprofile') y el resumen en ``<base>.summary.txt``.
+
+    Returns:
+        List[str]: Rutas de los archivos escritos
+    """
+    paths = []
+    if report.stacks is not None:
+        path = f"{output_base}.collapsed"
+        with open(path, 'w', encoding='utf-8') as stream:
+            stream.writelines(line + '\n' for line in report.collapsed())
+        paths.append(path)
+    if report.stats is not None:
+        path = f"{output_base}.prof"
+        report.stats.dump_stats(path)
+        paths.append(path)
+    path = f"{output_base}.summary.txt"
+    with open(path, 'w', encoding='utf-8') as stream:
+        stream.write(report.summary(top))
+    paths.append(path)
+    return paths
+
+
+def profile_run(function: Callable, mode: str = 'sample', output_base: str = 'profile',
+                interval: float = DEFAULT_INTERVAL, top: int = DEFAULT_TOP):
+    """
+    Ejecuta function bajo el perfilador, escribe el perfil e imprime el resumen.
+
+    Los procesos de trabajo de un batch con --workers no se perfilan: solo
+    se mide el proceso principal.
+
+    Args:
+        function: Función sin argumentos a perfilar
+        mode: 'sample' o 'cprofile'
+        output_base: Ruta base de los archivos del perfil
+        interval: Segundos entre muestras (modo 'sample')
+        top: Funciones listadas en el resumen
+
+    Returns:
+        El valor devuelto por function
+
+    Raises:
+        ValueError: Si el modo no es soportado o el intervalo no es positivo
+    """
+    profiler = create_profiler(mode, interval)
+    profiler.start()
+    try:
+        result = function()
+    finally:
+        profiler.stop()
+    report = profiler.report()
+    paths = write_profile(report, output_base, top)
+    print(report.summary(top), end='')
+    print(f"Perfil escrito en: {', '.join(paths)}")
+    return result
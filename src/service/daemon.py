@@ -0,0 +1,201 @@
+"""
+Daemon local de calificación sobre un socket de dominio Unix.
+
+Mantiene en memoria las calculadoras ya configuradas (una por política de
+puntos extra) y atiende solicitudes del modo --grade de src.main con el
+protocolo de src.service.protocol, de modo que cada cálculo cuesta un viaje
+de ida y vuelta por el socket en lugar de iniciar un proceso de Python.
+
+Uso:
+    python -m src.service.daemon --socket /tmp/cs-gradecalculator.sock
+    python -m src.service.daemon_client --grade 15:30 18:70 --attendance s
+"""
+
+import argparse
+import asyncio
+import io
+import os
+import signal
+import socket
+import stat
+from collections import OrderedDict
+from typing import List, Optional
+
+from src.calculator.grade_calculator import GradeCalculator
+from src.calculator.metrics import MetricsRegistry
+from src.main import run_grade
+from src.policies.attendance_policy import AttendancePolicy
+from src.policies.extra_points_policy import ExtraPointsPolicy
+from src.service.protocol import (DEFAULT_SOCKET_PATH, LENGTH, SOCKET_ENVIRONMENT_VARIABLE,
+                                  decode_body, encode_frame, frame_size)
+
+
+def _is_socket(path: str) -> bool:
+    # lstat: un enlace simbólico al socket tampoco se elimina
+    try:
+        return stat.S_ISSOCK(os.lstat(path).st_mode)
+    except OSError:
+        return False
+
+
+class GradingDaemon:
+    """
+    Servidor del daemon de calificación.
+
+    Las calculadoras se crean la primera vez que se pide una política de
+    puntos extra y se reutilizan (LRU de hasta max_calculators políticas).
+    """
+
+    def __init__(self, socket_path: str = DEFAULT_SOCKET_PATH, max_calculators: int = 64,
+                 cache_size: int = 0, metrics: Optional[MetricsRegistry] = None):
+        """
+        Inicializa el daemon.
+
+        Args:
+            socket_path: Ruta del socket de dominio Unix
+            max_calculators: Políticas distintas que se mantienen en memoria
+            cache_size: Tamaño de la caché LRU de resultados de cada calculadora
+            metrics: Registro de métricas compartido por las calculadoras
+
+        Raises:
+            ValueError: Si max_calculators no es positivo
+        """
+        if max_calculators < 1:
+            raise ValueError("El número de calculadoras debe ser positivo")
+        self.socket_path = socket_path
+        self.max_calculators = max_calculators
+        self.cache_size = cache_size
+        self.metrics = metrics
+        self._attendance_policy = AttendancePolicy()
+        self._calculators: OrderedDict = OrderedDict()
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    def calculator_for(self, extra_points: List[bool]) -> GradeCalculator:
+        """
+        Obtiene la calculadora configurada para una política de puntos extra.
+        """
+        key = tuple(extra_points)
+        calculator = self._calculators.get(key)
+        if calculator is not None:
+            self._calculators.move_to_end(key)
+            return calculator
+        calculator = GradeCalculator(self._attendance_policy,
+                                     ExtraPointsPolicy(list(extra_points)),
+                                     cache_size=self.cache_size, metrics=self.metrics)
+        self._calculators[key] = calculator
+        if len(self._calculators) > self.max_calculators:
+            self._calculators.popitem(last=False)
+        return calculator
+
+    def handle(self, fields: List[str]) -> List[str]:
+        """
+        Atiende una solicitud ya decodificada.
+
+        Args:
+            fields: [entrada estándar, argumentos de --grade ...]
+
+        Returns:
+            List[str]: [código de salida, salida estándar, salida de errores]
+        """
+        if not fields:
+            return ['2', '', "error: solicitud vacía\n"]
+        stdout, stderr = io.StringIO(), io.StringIO()
+        code = run_grade(fields[1:], stdin=io.StringIO(fields[0]), stdout=stdout,
+                         stderr=stderr, calculator_for=self.calculator_for)
+        return [str(code), stdout.getvalue(), stderr.getvalue()]
+
+    async def start(self) -> None:
+        """
+        Comienza a aceptar conexiones (reemplaza un socket anterior abandonado).
+
+        Raises:
+            ValueError: Si otro daemon ya atiende en socket_path o la ruta
+                        existe y no es un socket (nunca se elimina)
+        """
+        if _is_socket(self.socket_path):
+            probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                probe.connect(self.socket_path)
+            except OSError:
+                os.unlink(self.socket_path)
+            else:
+                raise ValueError(f"Ya hay un daemon atendiendo en {self.socket_path}")
+            finally:
+                probe.close()
+        elif os.path.lexists(self.socket_path):
+            raise ValueError(f"{self.socket_path} existe y no es un socket")
+        self._server = await asyncio.start_unix_server(self._handle_connection,
+                                                       self.socket_path)
+
+    async def close(self) -> None:
+        """
+        Deja de aceptar conexiones y elimina el socket.
+        """
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        if _is_socket(self.socket_path):
+            os.unlink(self.socket_path)
+
+    async def _handle_connection(self, reader: asyncio.StreamReader,
+                                 writer: asyncio.StreamWriter) -> None:
+        # Una conexión puede enviar varias solicitudes seguidas
+        try:
+            while True:
+                try:
+                    prefix = await reader.readexactly(LENGTH.size)
+                except asyncio.IncompleteReadError:
+                    break
+                try:
+                    fields = decode_body(await reader.readexactly(frame_size(prefix)))
+                except ValueError as error:
+                    writer.write(encode_frame(['2', '', f"error: {error}\n"]))
+                    await writer.drain()
+                    break
+                writer.write(encode_frame(self.handle(fields)))
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+
+async def serve(daemon: GradingDaemon) -> None:
+    """
+    Ejecuta el daemon hasta que se interrumpa el proceso (SIGINT o SIGTERM).
+    """
+    stopped = asyncio.Event()
+    asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, stopped.set)
+    await daemon.start()
+    print(f"CS-GradeCalculator escuchando en {daemon.socket_path}")
+    try:
+        await stopped.wait()
+    finally:
+        await daemon.close()
+
+
+def main(argv=None):
+    """
+    Punto de entrada de línea de comandos del daemon.
+    """
+    parser = argparse.ArgumentParser(prog="python -m src.service.daemon",
+                                     description="Daemon local de CS-GradeCalculator")
+    parser.add_argument("--socket", default=os.environ.get(SOCKET_ENVIRONMENT_VARIABLE,
+                                                           DEFAULT_SOCKET_PATH),
+                        help="Ruta del socket de dominio Unix")
+    parser.add_argument("--cache-size", type=int, default=0,
+                        help="Caché de resultados por calculadora (0 = desactivada)")
+    args = parser.parse_args(argv)
+
+    daemon = GradingDaemon(args.socket, cache_size=args.cache_size)
+    try:
+        asyncio.run(serve(daemon))
+    except KeyboardInterrupt:
+        pass
+    except ValueError as e:
+        parser.error(str(e))
+
+
+if __name__ == "__main__":
+    main()
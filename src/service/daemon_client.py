@@ -0,0 +1,92 @@
+"""
+Cliente liviano del daemon de calificación.
+
+Acepta los mismos argumentos que ``python -m src.main --grade`` y los envía
+al daemon por el socket de dominio Unix; imprime la respuesta y termina con
+el mismo código de salida. Solo importa socket y struct. Si el daemon no
+está disponible, calcula la nota en el propio proceso como src.main.
+
+Uso:
+    python -m src.service.daemon_client --grade 15:30 18:70 --attendance s
+    echo '{"student_id": "ST001", "evaluations": [[15, 30]]}' | \\
+        python -m src.service.daemon_client --grade - --socket /tmp/notas.sock
+"""
+
+import os
+import socket
+import sys
+
+from src.service.protocol import (DEFAULT_SOCKET_PATH, LENGTH, SOCKET_ENVIRONMENT_VARIABLE,
+                                  decode_body, encode_frame, frame_size)
+
+
+def _receive_exactly(connection: socket.socket, size: int) -> bytes:
+    chunks = []
+    while size:
+        chunk = connection.recv(size)
+        if not chunk:
+            raise ConnectionError("El daemon cerró la conexión")
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b''.join(chunks)
+
+
+def request(socket_path: str, argv: list, stdin_text: str = '') -> tuple:
+    """
+    Envía una solicitud al daemon y espera la respuesta.
+
+    Args:
+        socket_path: Ruta del socket del daemon
+        argv: Argumentos del modo --grade
+        stdin_text: Registro JSON cuando se usa --grade -
+
+    Returns:
+        tuple: Código de salida, salida estándar y salida de errores
+
+    Raises:
+        OSError: Si no se puede conectar con el daemon
+        ValueError: Si la respuesta está mal formada
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+        connection.connect(socket_path)
+        connection.sendall(encode_frame([stdin_text, *argv]))
+        prefix = _receive_exactly(connection, LENGTH.size)
+        fields = decode_body(_receive_exactly(connection, frame_size(prefix)))
+    if len(fields) != 3:
+        raise ValueError("Respuesta mal formada")
+    code, stdout, stderr = fields
+    return int(code), stdout, stderr
+
+
+def main(argv=None) -> int:
+    """
+    Punto de entrada del cliente.
+
+    Returns:
+        int: Código de salida del modo --grade
+    """
+    argv = list(sys.argv[1:] if argv is None else argv)
+    socket_path = os.environ.get(SOCKET_ENVIRONMENT_VARIABLE, DEFAULT_SOCKET_PATH)
+    if '--socket' in argv:
+        position = argv.index('--socket')
+        if position + 1 >= len(argv):
+            print("error: --socket requiere un valor", file=sys.stderr)
+            return 2
+        socket_path = argv[position + 1]
+        del argv[position:position + 2]
+
+    stdin_text = sys.stdin.read() if '-' in argv else ''
+    try:
+        code, stdout, stderr = request(socket_path, argv, stdin_text)
+    except OSError:
+        import io
+        from src.main import run_grade
+
+        return run_grade(argv, stdin=io.StringIO(stdin_text))
+    sys.stdout.write(stdout)
+    sys.stderr.write(stderr)
+    return code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,300 @@
+"""
+Servicio HTTP asíncrono de calificación (solo biblioteca estándar).
+
+Endpoints:
+    POST /grade        Califica un estudiante (registro con el formato JSONL
+                       del modo batch) y devuelve el detalle del cálculo (RF05)
+    POST /grade/batch  Califica {"students": [registro, ...]} en el pool de
+                       procesos, sin bloquear el event loop
+    GET  /metrics      Métricas de GradeCalculator en formato Prometheus
+    GET  /health       Estado del servicio
+
+Las conexiones son persistentes (HTTP/1.1 keep-alive) y admiten pipelining:
+las solicitudes de una misma conexión se responden en el orden recibido.
+
+Uso:
+    python -m src.service.http_server --port 8080 --extra-points s,n --workers 4
+"""
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Optional, Tuple
+
+from src.batch.parallel import grade_record_chunk, init_worker, iter_chunks
+from src.batch.readers import build_student
+from src.calculator.grade_calculator import GradeCalculator
+from src.calculator.metrics import MetricsRegistry
+from src.policies.attendance_policy import AttendancePolicy
+from src.policies.extra_points_policy import ExtraPointsPolicy
+
+
+MAX_BODY_SIZE = 16 * 1024 * 1024
+MAX_HEADERS = 100
+JSON_TYPE = 'application/json'
+PROMETHEUS_TYPE = 'text/plain; version=0.0.4'
+
+STATUS_REASONS = {
+    200: 'OK',
+    400: 'Bad Request',
+    404: 'Not Found',
+    405: 'Method Not Allowed',
+    413: 'Payload Too Large',
+}
+
+
+class HttpError(Exception):
+    """
+    Error de protocolo que se responde al cliente y cierra la conexión.
+    """
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+async def read_request(reader: asyncio.StreamReader) -> Optional[Tuple[str, str, Dict, bytes]]:
+    """
+    Lee una solicitud HTTP/1.1 completa.
+
+    Returns:
+        Tuple con método, ruta, cabeceras (en minúsculas) y cuerpo, o None si
+        el cliente cerró la conexión
+
+    Raises:
+        HttpError: Si la solicitud está mal formada o excede MAX_BODY_SIZE
+    """
+    request_line = await reader.readline()
+    if not request_line:
+        return None
+    parts = request_line.decode('latin-1').split()
+    if len(parts) != 3 or not parts[2].startswith('HTTP/'):
+        raise HttpError(400, "Línea de solicitud inválida")
+    method, path, _ = parts
+
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b'\r\n', b'\n', b''):
+            break
+        if len(headers) >= MAX_HEADERS:
+            raise HttpError(400, "Demasiadas cabeceras")
+        name, separator, value = line.decode('latin-1').partition(':')
+        if not separator:
+            raise HttpError(400, "Cabecera inválida")
+        headers[name.strip().lower()] = value.strip()
+
+    try:
+        length = int(headers.get('content-length', '0'))
+    except ValueError:
+        raise HttpError(400, "Content-Length inválido") from None
+    if length < 0:
+        raise HttpError(400, "Content-Length inválido")
+    if length > MAX_BODY_SIZE:
+        raise HttpError(413, "El cuerpo de la solicitud es demasiado grande")
+    body = await reader.readexactly(length) if length else b''
+    return method.upper(), path, headers, body
+
+
+def build_response(status: int, content_type: str, body: bytes,
+                   keep_alive: bool = True) -> bytes:
+    """
+    Construye una respuesta HTTP/1.1 completa.
+    """
+    head = (
+        f"HTTP/1.1 {status} {STATUS_REASONS.get(status, 'OK')}\r\n"
+        f"Content-Type: {content_type}\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+    )
+    return head.encode('latin-1') + body
+
+
+def _json_body(payload) -> bytes:
+    return json.dumps(payload, ensure_ascii=False).encode('utf-8')
+
+
+class GradingService:
+    """
+    Servicio HTTP que expone GradeCalculator.
+
+    Las solicitudes individuales se califican directamente en el event loop
+    (microsegundos); los lotes se reparten en bloques entre los procesos del
+    pool, que reciben las políticas una sola vez al iniciar. El pool usa el
+    método 'spawn' para que los procesos no hereden los sockets de las
+    conexiones abiertas (con 'fork' el cliente nunca vería el cierre).
+    """
+
+    def __init__(self, attendance_policy: AttendancePolicy,
+                 extra_points_policy: ExtraPointsPolicy,
+                 workers: Optional[int] = None, chunk_size: int = 500,
+                 metrics: Optional[MetricsRegistry] = None):
+        """
+        Inicializa el servicio.
+
+        Args:
+            attendance_policy: Política de asistencia a aplicar
+            extra_points_policy: Política de puntos extra a aplicar
+            workers: Procesos del pool para lotes (por defecto, número de CPUs)
+            chunk_size: Estudiantes por tarea enviada al pool
+            metrics: Registro de métricas (por defecto, uno nuevo)
+        """
+        self.metrics = metrics if metrics is not None else MetricsRegistry()
+        self.calculator = GradeCalculator(attendance_policy, extra_points_policy,
+                                          metrics=self.metrics)
+        self.chunk_size = chunk_size
+        self._executor = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context('spawn'),
+            initializer=init_worker,
+            initargs=(attendance_policy, extra_points_policy)
+        )
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    async def start(self, host: str = '127.0.0.1', port: int = 8080) -> int:
+        """
+        Comienza a aceptar conexiones.
+
+        Returns:
+            int: Puerto en escucha (útil con port=0)
+        """
+        self._server = await asyncio.start_server(self._handle_connection, host, port)
+        return self._server.sockets[0].getsockname()[1]
+
+    async def close(self) -> None:
+        """
+        Deja de aceptar conexiones y detiene el pool de procesos.
+        """
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        self._executor.shutdown()
+
+    async def _handle_connection(self, reader: asyncio.StreamReader,
+                                 writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                try:
+                    request = await read_request(reader)
+                except HttpError as error:
+                    writer.write(build_response(error.status, JSON_TYPE,
+                                                _json_body({'error': str(error)}), False))
+                    await writer.drain()
+                    break
+                if request is None:
+                    break
+                method, path, headers, body = request
+                keep_alive = headers.get('connection', '').lower() != 'close'
+                status, content_type, payload = await self.dispatch(method, path, body)
+                writer.write(build_response(status, content_type, payload, keep_alive))
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            # ValueError: línea que excede el límite del StreamReader
+            pass
+        finally:
+            writer.close()
+
+    async def dispatch(self, method: str, path: str, body: bytes) -> Tuple[int, str, bytes]:
+        """
+        Atiende una solicitud ya leída.
+
+        Returns:
+            Tuple[int, str, bytes]: Estado, tipo de contenido y cuerpo
+        """
+        routes = {
+            '/grade': ('POST', self._grade),
+            '/grade/batch': ('POST', self._grade_batch),
+            '/metrics': ('GET', self._render_metrics),
+            '/health': ('GET', self._health),
+        }
+        route = routes.get(path.split('?', 1)[0])
+        if route is None:
+            return 404, JSON_TYPE, _json_body({'error': "Ruta no encontrada"})
+        expected_method, handler = route
+        if method != expected_method:
+            return 405, JSON_TYPE, _json_body({'error': "Método no permitido"})
+        try:
+            return await handler(body)
+        except ValueError as error:
+            return 400, JSON_TYPE, _json_body({'error': str(error)})
+
+    async def _grade(self, body: bytes) -> Tuple[int, str, bytes]:
+        student, academic_year = build_student(json.loads(body))
+        details = self.calculator.get_calculation_details(student, academic_year)
+        return 200, JSON_TYPE, _json_body(details)
+
+    async def _grade_batch(self, body: bytes) -> Tuple[int, str, bytes]:
+        payload = json.loads(body)
+        students = payload.get('students') if isinstance(payload, dict) else None
+        if not isinstance(students, list):
+            raise ValueError("El cuerpo debe tener la forma {\"students\": [...]}")
+
+        loop = asyncio.get_running_loop()
+        records = [(index, None, record) for index, record in enumerate(students)]
+        chunks = await asyncio.gather(*(
+            loop.run_in_executor(self._executor, grade_record_chunk, chunk)
+            for chunk in iter_chunks(records, self.chunk_size)
+        ))
+
+        results = []
+        for chunk in chunks:
+            for accepted, line in chunk:
+                if accepted:
+                    results.append(line.rstrip('\n'))
+                else:
+                    reject = json.loads(line)
+                    results.append(json.dumps({'index': reject['line'],
+                                               'error': reject['error']},
+                                              ensure_ascii=False))
+        return 200, JSON_TYPE, ('{"results": [' + ', '.join(results) + ']}').encode('utf-8')
+
+    async def _render_metrics(self, body: bytes) -> Tuple[int, str, bytes]:
+        return 200, PROMETHEUS_TYPE, self.metrics.render_prometheus().encode('utf-8')
+
+    async def _health(self, body: bytes) -> Tuple[int, str, bytes]:
+        return 200, JSON_TYPE, _json_body({'status': 'ok'})
+
+
+async def serve(host: str, port: int, service: GradingService) -> None:
+    """
+    Ejecuta el servicio hasta que se interrumpa el proceso.
+    """
+    bound_port = await service.start(host, port)
+    print(f"CS-GradeCalculator escuchando en http://{host}:{bound_port}")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await service.close()
+
+
+def main(argv=None):
+    """
+    Punto de entrada de línea de comandos del servicio.
+    """
+    from src.main import parse_extra_points
+
+    parser = argparse.ArgumentParser(prog="python -m src.service.http_server",
+                                     description="Servicio HTTP de CS-GradeCalculator")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--extra-points", type=parse_extra_points, default=[],
+                        metavar="S,N,...",
+                        help="Política de puntos extra por año académico (s/n)")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Procesos para lotes (por defecto, número de CPUs)")
+    args = parser.parse_args(argv)
+
+    service = GradingService(AttendancePolicy(), ExtraPointsPolicy(args.extra_points),
+                             workers=args.workers)
+    try:
+        asyncio.run(serve(args.host, args.port, service))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+"""
+Generador de carga local para el servicio HTTP de calificación.
+
+Abre varias conexiones persistentes y envía solicitudes con pipelining
+(varias solicitudes escritas antes de leer las respuestas), midiendo la
+latencia de cada una para reportar throughput, p50 y p99.
+
+Uso:
+    python -m src.service.loadgen --port 8080 --requests 20000 --concurrency 16 --pipeline 8
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import time
+from typing import Dict, List, Sequence
+
+DEFAULT_RECORD = {
+    'student_id': 'LOAD001',
+    'has_reached_minimum_classes': True,
+    'academic_year': 0,
+    'evaluations': [{'grade': 15.0, 'weight': 30.0}, {'grade': 18.0, 'weight': 40.0},
+                    {'grade': 16.0, 'weight': 30.0}],
+}
+
+
+def percentile(sorted_values: Sequence[float], fraction: float) -> float:
+    """
+    Percentil por rango más cercano sobre valores ya ordenados.
+
+    Args:
+        sorted_values: Valores en orden ascendente
+        fraction: Percentil entre 0 y 1 (ej. 0.99)
+    """
+    if not sorted_values:
+        return 0.0
+    # round() evita que 0.99 * 100 = 99.00000000000001 suba al siguiente rango
+    rank = math.ceil(round(fraction * len(sorted_values), 9))
+    return sorted_values[min(max(rank, 1), len(sorted_values)) - 1]
+
+
+def build_request(host: str, path: str, body: bytes) -> bytes:
+    """
+    Construye una solicitud POST HTTP/1.1 con keep-alive.
+    """
+    return (f"POST {path} HTTP/1.1\r\nHost: {host}\r\n"
+            f"Content-Type: application/json\r\nContent-Length: {len(body)}\r\n\r\n"
+            ).encode('latin-1') + body
+
+
+async def read_response(reader: asyncio.StreamReader) -> int:
+    """
+    Lee una respuesta HTTP completa.
+
+    Returns:
+        int: Código de estado
+    """
+    status_line = await reader.readline()
+    if not status_line:
+        raise ConnectionError("El servidor cerró la conexión")
+    status = int(status_line.split()[1])
+    length = 0
+    while True:
+        line = await reader.readline()
+        if line in (b'\r\n', b'\n', b''):
+            break
+        name, _, value = line.decode('latin-1').partition(':')
+        if name.strip().lower() == 'content-length':
+            length = int(value.strip())
+    if length:
+        await reader.readexactly(length)
+    return status
+
+
+async def _client(host: str, port: int, request: bytes, count: int, pipeline: int,
+                  latencies: List[float], statuses: Dict[int, int]) -> None:
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        remaining = count
+        while remaining:
+            window = min(pipeline, remaining)
+            sent_at = time.perf_counter()
+            writer.write(request * window)
+            await writer.drain()
+            for _ in range(window):
+                status = await read_response(reader)
+                latencies.append(time.perf_counter() - sent_at)
+                statuses[status] = statuses.get(status, 0) + 1
+            remaining -= window
+    finally:
+        writer.close()
+
+
+async def run_load(host: str, port: int, requests: int = 1000, concurrency: int = 8,
+                   pipeline: int = 4, path: str = '/grade', record=None) -> Dict:
+    """
+    Ejecuta la carga y resume los resultados.
+
+    Args:
+        host: Host del servicio
+        port: Puerto del servicio
+        requests: Total de solicitudes a enviar
+        concurrency: Conexiones simultáneas
+        pipeline: Solicitudes enviadas por conexión antes de leer respuestas
+        path: Endpoint a invocar
+        record: Cuerpo JSON de cada solicitud (por defecto, un estudiante de ejemplo)
+
+    Returns:
+        Dict: requests, seconds, throughput, p50_ms, p99_ms y conteo por estado
+    """
+    body = json.dumps(DEFAULT_RECORD if record is None else record).encode('utf-8')
+    request = build_request(host, path, body)
+    latencies: List[float] = []
+    statuses: Dict[int, int] = {}
+
+    per_client = [requests // concurrency + (1 if index < requests % concurrency else 0)
+                  for index in range(concurrency)]
+    start = time.perf_counter()
+    await asyncio.gather(*(
+        _client(host, port, request, count, pipeline, latencies, statuses)
+        for count in per_client if count
+    ))
+    seconds = time.perf_counter() - start
+
+    latencies.sort()
+    return {
+        'requests': len(latencies),
+        'seconds': seconds,
+        'throughput': len(latencies) / seconds if seconds else 0.0,
+        'p50_ms': percentile(latencies, 0.50) * 1000,
+        'p99_ms': percentile(latencies, 0.99) * 1000,
+        'statuses': statuses,
+    }
+
+
+def main(argv=None):
+    """
+    Punto de entrada de línea de comandos del generador de carga.
+    """
+    parser = argparse.ArgumentParser(prog="python -m src.service.loadgen",
+                                     description="Generador de carga de CS-GradeCalculator")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--requests", type=int, default=10000)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--pipeline", type=int, default=4)
+    parser.add_argument("--path", default="/grade")
+    args = parser.parse_args(argv)
+
+    summary = asyncio.run(run_load(args.host, args.port, args.requests,
+                                   args.concurrency, args.pipeline, args.path))
+    print(f"Solicitudes: {summary['requests']} en {summary['seconds']:.2f} s "
+          f"({summary['throughput']:.0f} req/s)")
+    print(f"p50: {summary['p50_ms']:.3f} ms  p99: {summary['p99_ms']:.3f} ms")
+    print(f"Estados: {summary['statuses']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Protocolo con prefijo de longitud del daemon de calificación.
+
+Cada mensaje es una trama::
+
+    longitud (u32, big-endian) | cantidad de campos (u32) | campo_1 | ... | campo_N
+
+y cada campo es ``longitud (u32) | texto UTF-8``. Las solicitudes llevan
+[entrada estándar, argumento_1, ..., argumento_N] (los mismos argumentos del
+modo --grade de src.main) y las respuestas [código de salida, salida
+estándar, salida de errores].
+
+El módulo solo usa struct para que el cliente arranque rápido.
+"""
+
+import struct
+
+LENGTH = struct.Struct('!I')
+# Tamaño máximo de una trama (sin el prefijo de longitud)
+MAX_FRAME_SIZE = 16 * 1024 * 1024
+# Ruta del socket si no se indica --socket ni CSGRADE_SOCKET
+DEFAULT_SOCKET_PATH = '/tmp/cs-gradecalculator.sock'
+SOCKET_ENVIRONMENT_VARIABLE = 'CSGRADE_SOCKET'
+
+
+def encode_frame(fields) -> bytes:
+    """
+    Codifica una lista de textos como trama completa (con prefijo de longitud).
+
+    Raises:
+        ValueError: Si la trama excede MAX_FRAME_SIZE
+    """
+    parts = [LENGTH.pack(len(fields))]
+    for field in fields:
+        data = field.encode('utf-8')
+        parts.append(LENGTH.pack(len(data)))
+        parts.append(data)
+    body = b''.join(parts)
+    if len(body) > MAX_FRAME_SIZE:
+        raise ValueError("El mensaje excede el tamaño máximo permitido")
+    return LENGTH.pack(len(body)) + body
+
+
+def decode_body(body: bytes) -> list:
+    """
+    Decodifica el cuerpo de una trama (sin el prefijo de longitud).
+
+    Raises:
+        ValueError: Si el cuerpo está mal formado
+    """
+    try:
+        (count,), position = LENGTH.unpack_from(body), LENGTH.size
+        fields = []
+        for _ in range(count):
+            (size,) = LENGTH.unpack_from(body, position)
+            position += LENGTH.size
+            if position + size > len(body):
+                raise ValueError
+            fields.append(body[position:position + size].decode('utf-8'))
+            position += size
+    except (struct.error, UnicodeDecodeError, ValueError):
+        raise ValueError("Mensaje mal formado") from None
+    if position != len(body):
+        raise ValueError("Mensaje mal formado")
+    return fields
+
+
+def frame_size(prefix: bytes) -> int:
+    """
+    Obtiene el tamaño del cuerpo a partir del prefijo de 4 bytes.
+
+    Raises:
+        ValueError: Si el tamaño excede MAX_FRAME_SIZE
+    """
+    (size,) = LENGTH.unpack(prefix)
+    if size > MAX_FRAME_SIZE:
+        raise ValueError("El mensaje excede el tamaño máximo permitido")
+    return size
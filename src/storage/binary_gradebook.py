@@ -0,0 +1,218 @@
+"""
+Módulo del formato binario columnar de libretas de notas (gradebook).
+
+El archivo guarda un StudentTable completo en columnas contiguas, alineadas
+a 8 bytes, que se cargan mediante mmap sin copiar ni volver a validar los
+datos: las columnas del StudentTable resultante son memoryviews sobre el
+propio archivo, por lo que varios procesos pueden compartir la misma copia
+en la caché de páginas del sistema operativo.
+
+Estructura (little-endian):
+    Cabecera    magic 'CSGB', versión (u32), n_estudiantes (u64),
+                n_evaluaciones (u64), bytes de identificadores (u64)
+    offsets         int64[n + 1]  inicio de las evaluaciones de cada estudiante
+    grades          float64[m]    notas
+    weights         float64[m]    pesos
+    academic_years  int64[n]      año académico (0-based)
+    id_offsets      int64[n + 1]  inicio de cada identificador en el blob
+    attendance      uint8[n]      asistencia mínima (0/1)
+    ids             bytes         identificadores en UTF-8, concatenados
+"""
+
+import mmap
+import struct
+import sys
+from array import array
+from typing import List, Sequence
+
+from src.models.student_table import EvaluationBlock, StudentTable
+
+
+MAGIC = b'CSGB'
+VERSION = 1
+HEADER = struct.Struct('<4sIQQQ')
+ALIGNMENT = 8
+
+
+def _padding(size: int) -> int:
+    return -size % ALIGNMENT
+
+
+def _little_endian(values: array) -> bytes:
+    if sys.byteorder != 'little':
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+class StudentIdColumn(Sequence[str]):
+    """
+    Columna de identificadores que decodifica cada uno solo al accederlo.
+    """
+
+    def __init__(self, blob: memoryview, offsets: Sequence[int]):
+        self._blob = blob
+        self._offsets = offsets
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[position] for position in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("Índice de estudiante fuera de rango")
+        return bytes(self._blob[self._offsets[index]:self._offsets[index + 1]]).decode('utf-8')
+
+
+def write_gradebook(path: str, table: StudentTable) -> None:
+    """
+    Escribe un StudentTable en formato binario.
+
+    Args:
+        path: Archivo de destino
+        table: Tabla a guardar
+    """
+    encoded_ids = [str(student_id).encode('utf-8') for student_id in table.student_ids]
+    id_offsets = array('q', [0])
+    for encoded in encoded_ids:
+        id_offsets.append(id_offsets[-1] + len(encoded))
+
+    sections = [
+        _little_endian(array('q', table.offsets)),
+        _little_endian(array('d', table.block.grades)),
+        _little_endian(array('d', table.block.weights)),
+        _little_endian(array('q', table.academic_years)),
+        _little_endian(id_offsets),
+        bytes(table.attendance),
+    ]
+    with open(path, 'wb') as stream:
+        stream.write(HEADER.pack(MAGIC, VERSION, len(table), len(table.block),
+                                 id_offsets[-1]))
+        for section in sections:
+            stream.write(section)
+            stream.write(b'\0' * _padding(len(section)))
+        for encoded in encoded_ids:
+            stream.write(encoded)
+
+
+class Gradebook:
+    """
+    Libreta de notas binaria abierta mediante mmap.
+
+    Las columnas no se copian al exportarlas: un arreglo NumPy construido
+    sobre ellas (np.frombuffer, np.asarray) apunta al archivo mapeado y debe
+    liberarse antes de close(); para conservar los datos después de cerrar
+    hay que copiarlos (np.array(columna)).
+
+    Attributes:
+        table (StudentTable): Tabla cuyas columnas apuntan al archivo mapeado
+    """
+
+    def __init__(self, path: str):
+        """
+        Abre y mapea el archivo en memoria (solo lectura).
+
+        Raises:
+            ValueError: Si el archivo no tiene el formato esperado
+        """
+        self.path = path
+        with open(path, 'rb') as stream:
+            try:
+                self._mmap = mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                raise ValueError("Archivo de gradebook inválido") from None
+        self._views: List[memoryview] = []
+        try:
+            self.table = self._map_table()
+        except ValueError:
+            self.close()
+            raise
+
+    def _section(self, position: int, size: int, typecode: str) -> memoryview:
+        if position + size > len(self._mmap):
+            raise ValueError("Archivo de gradebook truncado")
+        raw = memoryview(self._mmap)[position:position + size]
+        view = raw.cast(typecode)
+        self._views += [raw, view]
+        return view
+
+    def _map_table(self) -> StudentTable:
+        if len(self._mmap) < HEADER.size:
+            raise ValueError("Archivo de gradebook inválido")
+        magic, version, n_students, n_evaluations, ids_size = HEADER.unpack_from(self._mmap)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("Archivo de gradebook inválido")
+        if sys.byteorder != 'little':
+            raise ValueError("La carga sin copia requiere una plataforma little-endian")
+
+        position = HEADER.size
+        columns = []
+        for count, typecode, item_size in ((n_students + 1, 'q', 8), (n_evaluations, 'd', 8),
+                                           (n_evaluations, 'd', 8), (n_students, 'q', 8),
+                                           (n_students + 1, 'q', 8), (n_students, 'B', 1)):
+            size = count * item_size
+            columns.append(self._section(position, size, typecode))
+            position += size + _padding(size)
+        offsets, grades, weights, academic_years, id_offsets, attendance = columns
+        blob = self._section(position, ids_size, 'B')
+
+        return StudentTable(
+            student_ids=StudentIdColumn(blob, id_offsets),
+            offsets=offsets,
+            attendance=attendance,
+            academic_years=academic_years,
+            block=EvaluationBlock(grades, weights),
+        )
+
+    def close(self) -> None:
+        """
+        Libera el mapeo. Las vistas obtenidas de la tabla dejan de ser válidas.
+
+        Raises:
+            ValueError: Si algún arreglo construido sobre las columnas sigue
+                        vivo. Las vistas que se pudieron liberar quedan
+                        liberadas y el mapeo sigue abierto: close() se puede
+                        volver a llamar después de liberar esos arreglos
+        """
+        exported = []
+        for view in reversed(self._views):
+            try:
+                view.release()
+            except BufferError:
+                exported.append(view)
+        self._views = exported[::-1]
+        # Un arreglo puede retener el buffer de una vista propia o del mmap
+        if not exported:
+            try:
+                self._mmap.close()
+                return
+            except BufferError:
+                pass
+        raise ValueError("No se puede cerrar el gradebook: hay arreglos que todavía "
+                         "usan sus columnas (libérelos o cópielos antes de cerrar)")
+
+    def __enter__(self) -> 'Gradebook':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+
+def load_gradebook(path: str) -> Gradebook:
+    """
+    Abre una libreta de notas binaria sin copiar sus datos.
+
+    Args:
+        path: Archivo escrito con write_gradebook
+
+    Returns:
+        Gradebook: Libreta abierta; su atributo table es compatible con
+        GradeCalculator (vistas Student/Evaluation) y con calculate_cohort
+
+    Raises:
+        ValueError: Si el archivo no tiene el formato esperado
+    """
+    return Gradebook(path)
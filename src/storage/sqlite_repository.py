@@ -0,0 +1,448 @@
+"""
+Módulo de persistencia de estudiantes y evaluaciones en SQLite.
+
+El repositorio usa una base local en modo WAL (lecturas concurrentes con un
+escritor) con dos tablas sin rowid:
+
+    students     student_id (PK), academic_year, has_reached_minimum_classes,
+                 attendance_rate, max_evaluations, number_of_evaluations,
+                 total_weight, weighted_sum
+    evaluations  (student_id, position) (PK), grade, weight
+
+Además de la clave primaria por student_id hay un índice por
+(academic_year, student_id) para consultar secciones por año.
+
+Cada estudiante guarda también la cantidad de evaluaciones, el peso total y
+la suma ponderada. Esas columnas no las escribe el repositorio sino los
+triggers de evaluations, de modo que no pueden desfasarse de las filas de
+evaluaciones aunque se editen fuera del repositorio:
+
+    - al insertar una evaluación se suman su peso y grade * (weight / 100),
+      igual que Student.add_evaluation. save() borra y vuelve a insertar las
+      evaluaciones de cada estudiante en orden de posición partiendo de cero,
+      así que las sumas son las mismas que las de un Student recién cargado.
+    - al modificar o borrar una evaluación se recalculan desde las filas
+      restantes con TOTAL().
+
+Con esas columnas la nota final (RF04) de una sección completa se calcula en
+una sola consulta SQL sobre la tabla students, sin agrupar evaluaciones ni
+construir objetos Student: solo se aplican las mismas operaciones de punto
+flotante que GradeCalculator, por lo que los resultados son idénticos bit a
+bit (RNF03). El redondeo a dos decimales no se hace en SQL, porque ROUND de
+SQLite puede diferir de ``round`` de Python en los casos de mitad exacta:
+grade_section redondea cada fila al leerla y section_statistics redondea en
+Python el resultado de una única consulta de agregación (ver
+_STATISTICS_QUERY).
+"""
+
+import math
+import sqlite3
+from itertools import islice
+from typing import Dict, Iterable, Iterator, Optional, Tuple
+
+from src.calculator.aggregates import PASSING_GRADE
+from src.calculator.grade_calculator import GradeCalculator
+from src.models.evaluation import Evaluation
+from src.models.student import Student
+
+
+# Estudiantes por cada executemany al guardar
+DEFAULT_CHUNK_SIZE = 10_000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS students (
+    student_id TEXT PRIMARY KEY,
+    academic_year INTEGER NOT NULL,
+    has_reached_minimum_classes INTEGER NOT NULL,
+    attendance_rate REAL,
+    max_evaluations INTEGER NOT NULL,
+    number_of_evaluations INTEGER NOT NULL,
+    total_weight REAL NOT NULL,
+    weighted_sum REAL NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS students_academic_year
+    ON students (academic_year, student_id);
+CREATE TABLE IF NOT EXISTS evaluations (
+    student_id TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    grade REAL NOT NULL,
+    weight REAL NOT NULL,
+    PRIMARY KEY (student_id, position)
+) WITHOUT ROWID;
+CREATE TRIGGER IF NOT EXISTS evaluations_insert AFTER INSERT ON evaluations BEGIN
+    UPDATE students SET
+        number_of_evaluations = number_of_evaluations + 1,
+        total_weight = total_weight + NEW.weight,
+        weighted_sum = weighted_sum + NEW.grade * (NEW.weight / 100.0)
+    WHERE student_id = NEW.student_id;
+END;
+CREATE TRIGGER IF NOT EXISTS evaluations_update AFTER UPDATE ON evaluations BEGIN
+    UPDATE students SET
+        number_of_evaluations = (
+            SELECT COUNT(*) FROM evaluations WHERE student_id = students.student_id),
+        total_weight = (
+            SELECT TOTAL(weight) FROM evaluations WHERE student_id = students.student_id),
+        weighted_sum = (
+            SELECT TOTAL(grade * (weight / 100.0)) FROM evaluations
+            WHERE student_id = students.student_id)
+    WHERE student_id IN (OLD.student_id, NEW.student_id);
+END;
+CREATE TRIGGER IF NOT EXISTS evaluations_delete AFTER DELETE ON evaluations BEGIN
+    UPDATE students SET
+        number_of_evaluations = number_of_evaluations - 1,
+        total_weight = (
+            SELECT TOTAL(weight) FROM evaluations WHERE student_id = OLD.student_id),
+        weighted_sum = (
+            SELECT TOTAL(grade * (weight / 100.0)) FROM evaluations
+            WHERE student_id = OLD.student_id)
+    WHERE student_id = OLD.student_id;
+END;
+"""
+
+# Las sumas parten de cero; las completan los triggers al insertar evaluaciones
+_UPSERT_STUDENT = """
+INSERT INTO students VALUES (?, ?, ?, ?, ?, 0, 0.0, 0.0)
+ON CONFLICT (student_id) DO UPDATE SET
+    academic_year = excluded.academic_year,
+    has_reached_minimum_classes = excluded.has_reached_minimum_classes,
+    attendance_rate = excluded.attendance_rate,
+    max_evaluations = excluded.max_evaluations,
+    number_of_evaluations = 0,
+    total_weight = 0.0,
+    weighted_sum = 0.0
+"""
+
+_INSERT_EVALUATION = """
+INSERT INTO evaluations VALUES (?, ?, ?, ?)
+"""
+
+_DELETE_EVALUATIONS = """
+DELETE FROM evaluations WHERE student_id = ?
+"""
+
+_SELECT_STUDENTS = """
+SELECT s.student_id, s.academic_year, s.has_reached_minimum_classes, s.attendance_rate,
+       s.max_evaluations, e.grade, e.weight
+FROM students AS s LEFT JOIN evaluations AS e ON e.student_id = s.student_id
+"""
+
+# Estadísticas de una sección sobre la consulta de _grade_query sin redondear.
+# Lejos de una mitad exacta (a más de 1e-6 centésimas) el entero
+# CAST(final_grade * 100.0 + 0.5 AS INTEGER) es el mismo que elige
+# round(final_grade, 2): el error de la multiplicación es del orden de 1e-14
+# para notas menores que 10^3 y no alcanza a cambiarlo. Como la división por
+# 100.0 da el double más cercano, hundredths / 100.0 es bit a bit el valor de
+# round(). Esas filas forman un único grupo; las que están cerca de una mitad
+# se agrupan por nota y se redondean en Python, una vez por valor distinto.
+# MIN y MAX se redondean al final, ya que round() es monótono.
+_STATISTICS_QUERY = """
+SELECT near_half, COUNT(*), MIN(final_grade), MAX(final_grade),
+       SUM(hundredths), SUM(hundredths / 100.0 >= ?)
+FROM (
+    SELECT final_grade,
+           CAST(final_grade * 100.0 + 0.5 AS INTEGER) AS hundredths,
+           ABS(final_grade * 100.0 - CAST(final_grade * 100.0 AS INTEGER) - 0.5) < 1e-6
+               AS near_half
+    FROM ({query})
+)
+GROUP BY near_half, CASE WHEN near_half THEN final_grade END
+"""
+
+
+class StudentRepository:
+    """
+    Repositorio de estudiantes sobre una base SQLite local.
+
+    Se usa como context manager; close() cierra la conexión.
+    """
+
+    def __init__(self, path: str = ':memory:'):
+        """
+        Abre (o crea) la base de datos.
+
+        Args:
+            path: Archivo de la base de datos (':memory:' para una temporal)
+        """
+        self.path = path
+        self.connection = sqlite3.connect(path)
+        self.connection.execute("PRAGMA journal_mode = WAL")
+        # Con WAL, NORMAL solo sincroniza en los checkpoints y sigue siendo consistente
+        self.connection.execute("PRAGMA synchronous = NORMAL")
+        with self.connection:
+            self.connection.executescript(_SCHEMA)
+
+    def save(self, students: Iterable, academic_year: int = 0,
+             chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+        """
+        Inserta o actualiza estudiantes con sus evaluaciones en una transacción.
+
+        Args:
+            students: Estudiantes (Student o vistas de StudentTable)
+            academic_year: Año académico de los estudiantes que no lo tienen
+                           como atributo
+            chunk_size: Estudiantes por cada executemany
+
+        Returns:
+            int: Cantidad de estudiantes guardados
+
+        Raises:
+            ValueError: Si chunk_size no es positivo o si algún estudiante
+                        tiene notas o pesos no finitos (no se guarda nada)
+        """
+        if chunk_size < 1:
+            raise ValueError("El tamaño de bloque debe ser positivo")
+        students = iter(students)
+        saved = 0
+        with self.connection:
+            while True:
+                chunk = list(islice(students, chunk_size))
+                if not chunk:
+                    break
+                self._save_chunk(chunk, academic_year)
+                saved += len(chunk)
+        return saved
+
+    def _save_chunk(self, chunk: list, academic_year: int) -> None:
+        student_rows = []
+        evaluation_rows = []
+        for student in chunk:
+            student_id = student.student_id
+            evaluations = student.evaluations
+            total_weight = student.get_total_weight()
+            weighted_sum = student.get_weighted_sum()
+            # SQLite guarda NaN como NULL; las sumas son finitas solo si lo son
+            # todas las notas y pesos
+            if not (math.isfinite(total_weight) and math.isfinite(weighted_sum)):
+                raise ValueError("Las notas y los pesos deben ser valores finitos "
+                                 f"(estudiante {student_id})")
+            student_rows.append((
+                student_id,
+                getattr(student, 'academic_year', academic_year),
+                1 if student.has_reached_minimum_classes else 0,
+                getattr(student, 'attendance_rate', None),
+                getattr(student, 'max_evaluations', Student.MAX_EVALUATIONS),
+            ))
+            evaluation_rows += [(student_id, position, evaluation.grade, evaluation.weight)
+                                for position, evaluation in enumerate(evaluations)]
+        # Las evaluaciones se reinsertan en orden para que los triggers sumen
+        # igual que Student.add_evaluation
+        self.connection.executemany(_DELETE_EVALUATIONS, [row[:1] for row in student_rows])
+        self.connection.executemany(_UPSERT_STUDENT, student_rows)
+        self.connection.executemany(_INSERT_EVALUATION, evaluation_rows)
+
+    def delete(self, student_ids: Iterable[str]) -> int:
+        """
+        Elimina estudiantes (y sus evaluaciones).
+
+        Returns:
+            int: Cantidad de estudiantes eliminados
+        """
+        rows = [(student_id,) for student_id in student_ids]
+        with self.connection:
+            self.connection.executemany("DELETE FROM evaluations WHERE student_id = ?", rows)
+            cursor = self.connection.executemany("DELETE FROM students WHERE student_id = ?",
+                                                 rows)
+        return cursor.rowcount
+
+    def count(self, academic_year: Optional[int] = None) -> int:
+        """
+        Cuenta los estudiantes guardados (de un año académico o de todos).
+        """
+        where, params = self._section_filter(academic_year)
+        return self.connection.execute(
+            f"SELECT COUNT(*) FROM students{where}", params).fetchone()[0]
+
+    def get(self, student_id: str) -> Optional[Tuple[Student, int]]:
+        """
+        Carga un estudiante por su identificador.
+
+        Returns:
+            Tuple[Student, int] | None: Estudiante y año académico, o None si
+            no existe
+        """
+        cursor = self.connection.execute(
+            f"{_SELECT_STUDENTS} WHERE s.student_id = ? ORDER BY e.position", (student_id,))
+        return next(self._build_students(cursor), None)
+
+    def iter_students(self, academic_year: Optional[int] = None) -> Iterator[Tuple[Student, int]]:
+        """
+        Recorre los estudiantes en orden de student_id sin cargarlos todos.
+
+        Args:
+            academic_year: Año académico a recorrer (None = todos)
+
+        Yields:
+            Tuple[Student, int]: Estudiante y año académico
+        """
+        where, params = self._section_filter(academic_year, 's.')
+        cursor = self.connection.execute(
+            f"{_SELECT_STUDENTS}{where} ORDER BY s.student_id, e.position", params)
+        return self._build_students(cursor)
+
+    @staticmethod
+    def _build_students(cursor) -> Iterator[Tuple[Student, int]]:
+        student = None
+        academic_year = 0
+        for (student_id, year, attendance, attendance_rate, max_evaluations,
+             grade, weight) in cursor:
+            if student is None or student.student_id != student_id:
+                if student is not None:
+                    yield student, academic_year
+                student = Student(student_id, max_evaluations)
+                student.has_reached_minimum_classes = bool(attendance)
+                student.attendance_rate = attendance_rate
+                academic_year = year
+            if grade is not None:
+                student.add_evaluation(Evaluation(grade, weight))
+        if student is not None:
+            yield student, academic_year
+
+    @staticmethod
+    def _section_filter(academic_year: Optional[int], prefix: str = '') -> Tuple[str, tuple]:
+        if academic_year is None:
+            return '', ()
+        return f" WHERE {prefix}academic_year = ?", (academic_year,)
+
+    def _grade_query(self, calculator: GradeCalculator,
+                     academic_year: Optional[int]) -> Tuple[str, list]:
+        """
+        Arma la consulta que calcula la nota final (RF04) de cada estudiante
+        de la sección, con columnas student_id, weighted_average,
+        attendance_penalty, extra_points y final_grade (sin redondear).
+
+        Raises:
+            ValueError: Si la calculadora usa un pipeline o punto fijo, o si
+                        algún estudiante de la sección no se puede calificar
+        """
+        if calculator.pipeline is not None or calculator.fixed_point:
+            raise ValueError("La calificación en SQL solo admite el cálculo estándar (RF04)")
+        where, filter_params = self._section_filter(academic_year)
+
+        ungradeable = self.connection.execute(
+            f"SELECT student_id, number_of_evaluations FROM students{where}"
+            f"{' AND' if where else ' WHERE'} total_weight = 0 LIMIT 1",
+            filter_params).fetchone()
+        if ungradeable is not None:
+            student_id, number_of_evaluations = ungradeable
+            if number_of_evaluations == 0:
+                raise ValueError("El estudiante debe tener al menos una evaluación "
+                                 f"(estudiante {student_id})")
+            raise ValueError("El peso total de las evaluaciones no puede ser cero "
+                             f"(estudiante {student_id})")
+
+        # Las políticas se evalúan una vez por valor distinto, como en policy_vectors
+        attendance_policy = calculator.attendance_policy
+        extra_points_policy = calculator.extra_points_policy
+        params = [float(attendance_policy.calculate_penalty(True)),
+                  float(attendance_policy.calculate_penalty(False))]
+        years = [row[0] for row in self.connection.execute(
+            f"SELECT DISTINCT academic_year FROM students{where}", filter_params)]
+        extra_cases = ''
+        for year in years:
+            extra_cases += ' WHEN ? THEN ?'
+            params += [year, float(extra_points_policy.get_extra_points_for_year(year))]
+        extra_points = f"CASE academic_year{extra_cases} END" if years else '0.0'
+
+        # Mismas operaciones y en el mismo orden que GradeCalculator (RNF03)
+        query = f"""
+            SELECT student_id, weighted_average, attendance_penalty, extra_points,
+                   CASE WHEN final_grade > 0.0 THEN final_grade ELSE 0.0 END AS final_grade
+            FROM (
+                SELECT student_id, weighted_average, attendance_penalty, extra_points,
+                       weighted_average - attendance_penalty + extra_points AS final_grade
+                FROM (
+                    SELECT student_id,
+                           weighted_sum / (total_weight / 100.0) AS weighted_average,
+                           CASE WHEN has_reached_minimum_classes THEN ? ELSE ? END
+                               AS attendance_penalty,
+                           {extra_points} AS extra_points
+                    FROM students{where}
+                )
+            )
+        """
+        return query, params + list(filter_params)
+
+    def grade_section(self, calculator: GradeCalculator, academic_year: Optional[int] = None
+                      ) -> Iterator[Tuple[str, Dict[str, float]]]:
+        """
+        Calcula la nota final de cada estudiante de una sección en SQL.
+
+        Args:
+            calculator: Calculadora con las políticas a aplicar
+            academic_year: Año académico de la sección (None = todos)
+
+        Yields:
+            Tuple[str, Dict[str, float]]: student_id y el mismo resultado que
+            calculator.calculate_final_grade, en orden de student_id
+
+        Raises:
+            ValueError: Si la calculadora usa un pipeline o punto fijo, o si
+                        algún estudiante de la sección no se puede calificar
+        """
+        query, params = self._grade_query(calculator, academic_year)
+        cursor = self.connection.execute(f"{query} ORDER BY student_id", params)
+        for student_id, weighted_average, attendance_penalty, extra_points, final_grade in cursor:
+            yield student_id, {
+                'weighted_average': round(weighted_average, 2),
+                'attendance_penalty': round(attendance_penalty, 2),
+                'extra_points': round(extra_points, 2),
+                'final_grade': round(final_grade, 2)
+            }
+
+    def section_statistics(self, calculator: GradeCalculator,
+                           academic_year: Optional[int] = None,
+                           passing_grade: float = PASSING_GRADE) -> Dict:
+        """
+        Calcula las estadísticas de las notas finales de una sección con una
+        única consulta de agregación, sin devolver filas por estudiante.
+
+        Args:
+            calculator: Calculadora con las políticas a aplicar
+            academic_year: Año académico de la sección (None = todos)
+            passing_grade: Nota mínima aprobatoria
+
+        Returns:
+            Dict: count, mean, min, max y pass_rate (None si la sección está
+            vacía), con las mismas claves que SectionAggregate.result()
+
+        Raises:
+            ValueError: Si la calculadora usa un pipeline o punto fijo, o si
+                        algún estudiante de la sección no se puede calificar
+        """
+        query, params = self._grade_query(calculator, academic_year)
+        count = passed = hundredths = 0
+        near_half_sum = 0.0
+        minimum = maximum = None
+        for (near_half, group_count, group_minimum, group_maximum, group_hundredths,
+             group_passed) in self.connection.execute(
+                _STATISTICS_QUERY.format(query=query), [passing_grade] + params):
+            count += group_count
+            if near_half:
+                # Un grupo por nota: MIN y MAX son esa misma nota
+                final_grade = round(group_minimum, 2)
+                near_half_sum += final_grade * group_count
+                passed += group_count if final_grade >= passing_grade else 0
+            else:
+                hundredths += group_hundredths
+                passed += group_passed
+            minimum = group_minimum if minimum is None else min(minimum, group_minimum)
+            maximum = group_maximum if maximum is None else max(maximum, group_maximum)
+        return {
+            'count': count,
+            'mean': (hundredths / 100 + near_half_sum) / count if count else None,
+            'min': round(minimum, 2) if count else None,
+            'max': round(maximum, 2) if count else None,
+            'pass_rate': passed / count if count else None,
+        }
+
+    def close(self) -> None:
+        """
+        Cierra la conexión.
+        """
+        self.connection.close()
+
+    def __enter__(self) -> 'StudentRepository':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
@@ -0,0 +1,66 @@
+"""
+Fábricas y utilidades compartidas por los tests.
+"""
+
+import json
+import random
+
+import pytest
+from src.models.evaluation import Evaluation
+from src.models.student import Student
+
+try:
+    import numpy  # noqa: F401
+except ModuleNotFoundError:
+    HAS_NUMPY = False
+else:
+    HAS_NUMPY = True
+
+# Rutas vectorizadas: NumPy es una dependencia opcional (requirements-numpy.txt)
+requires_numpy = pytest.mark.skipif(not HAS_NUMPY, reason="requiere NumPy")
+
+
+def build_student(student_id, evaluations=(), has_reached_minimum_classes=True,
+                  attendance_rate=None):
+    """Crea un estudiante con las evaluaciones (nota, peso) dadas."""
+    student = Student(student_id)
+    for grade, weight in evaluations:
+        student.add_evaluation(Evaluation(grade, weight))
+    student.has_reached_minimum_classes = has_reached_minimum_classes
+    student.attendance_rate = attendance_rate
+    return student
+
+
+def build_random_cohort(seed, n_students):
+    """Genera una cohorte sintética reproducible en formato columnar."""
+    rng = random.Random(seed)
+    grades, weights, counts, attendance, years = [], [], [], [], []
+    for _ in range(n_students):
+        count = rng.randint(1, Student.MAX_EVALUATIONS)
+        counts.append(count)
+        for _ in range(count):
+            grades.append(round(rng.uniform(0, 20), rng.choice([0, 1, 2, 3])))
+            weights.append(round(rng.uniform(0.5, 100), rng.choice([0, 1, 2])))
+        attendance.append(rng.random() < 0.8)
+        years.append(rng.randint(-1, 4))
+    return grades, weights, counts, attendance, years
+
+
+def build_students(grades, weights, counts, attendance):
+    """Reconstruye los estudiantes de una cohorte columnar."""
+    students, position = [], 0
+    for index, count in enumerate(counts):
+        student = Student(f"ST{index}")
+        for offset in range(count):
+            student.add_evaluation(Evaluation(grades[position + offset],
+                                              weights[position + offset]))
+        position += count
+        student.has_reached_minimum_classes = attendance[index]
+        students.append(student)
+    return students
+
+
+def read_jsonl(path):
+    """Lee un archivo JSONL completo."""
+    with open(path, encoding='utf-8') as stream:
+        return [json.loads(line) for line in stream]
@@ -0,0 +1,161 @@
+"""
+Tests unitarios para las estadísticas de sección en una sola pasada.
+"""
+
+import json
+import random
+import statistics
+
+import pytest
+from src.calculator.aggregates import QuantileSketch, SectionAggregate
+from src.main import main
+
+
+def random_grades(count, seed=3):
+    rng = random.Random(seed)
+    return [round(rng.uniform(0, 21), 2) for _ in range(count)]
+
+
+def nearest_rank(values, fraction):
+    ordered = sorted(values)
+    rank = max(-(-round(fraction * len(ordered), 9) // 1), 1)
+    return ordered[int(rank) - 1]
+
+
+class TestQuantileSketch:
+    """Tests para QuantileSketch."""
+
+    def test_shouldMatchExactQuantiles_forRoundedGrades(self):
+        """Test: Con notas de 2 decimales el sketch es exacto."""
+        grades = random_grades(2001)
+        sketch = QuantileSketch()
+        for grade in grades:
+            sketch.add(grade)
+
+        for fraction in (0.01, 0.1, 0.5, 0.9, 0.99, 1.0):
+            assert sketch.quantile(fraction) == nearest_rank(grades, fraction)
+        assert sketch.quantile(0.5) == statistics.median_low(grades)
+
+    def test_shouldBoundError_byResolution(self):
+        """Test: Con menos decimales el error es a lo sumo media unidad."""
+        grades = random_grades(500)
+        sketch = QuantileSketch(decimals=0)
+        for grade in grades:
+            sketch.add(grade)
+
+        assert abs(sketch.quantile(0.5) - nearest_rank(grades, 0.5)) <= 0.5
+
+    def test_shouldRaiseError_whenMergingDifferentResolutions(self):
+        """Test: Solo se combinan sketches con la misma resolución."""
+        with pytest.raises(ValueError, match="distinta resolución"):
+            QuantileSketch(2).merge(QuantileSketch(1))
+
+
+class TestSectionAggregate:
+    """Tests para SectionAggregate."""
+
+    def test_shouldComputeStatistics_inOnePass(self):
+        """Test: Las estadísticas coinciden con el cálculo sobre toda la lista."""
+        grades = random_grades(1000)
+        aggregate = SectionAggregate()
+        for grade in grades:
+            aggregate.add(grade)
+        aggregate.add_rejected()
+
+        result = aggregate.result()
+
+        assert result['count'] == 1000
+        assert result['rejected'] == 1
+        assert result['mean'] == pytest.approx(statistics.fmean(grades))
+        assert result['std_dev'] == pytest.approx(statistics.pstdev(grades))
+        assert (result['min'], result['max']) == (min(grades), max(grades))
+        assert result['median'] == statistics.median_low(grades)
+        assert result['percentiles']['p90'] == nearest_rank(grades, 0.9)
+        assert result['pass_rate'] == sum(grade >= 11.0 for grade in grades) / 1000
+        assert sum(bar['count'] for bar in result['histogram']) == 1000
+        assert result['histogram'][20] == {
+            'lower': 20.0, 'upper': None, 'count': sum(grade >= 20 for grade in grades)}
+
+    def test_shouldMergePartialAggregates_likeSinglePass(self):
+        """Test: Combinar agregados parciales equivale a una sola pasada."""
+        grades = random_grades(900)
+        whole = SectionAggregate()
+        for grade in grades:
+            whole.add(grade)
+
+        merged = SectionAggregate()
+        for start in range(0, 900, 250):
+            partial = merged.new_partial()
+            for grade in grades[start:start + 250]:
+                partial.add(grade)
+            merged.merge(partial)
+        merged.merge(merged.new_partial())
+
+        expected, actual = whole.result(), merged.result()
+        assert actual['mean'] == pytest.approx(expected['mean'])
+        assert actual['variance'] == pytest.approx(expected['variance'])
+        for key in ('count', 'min', 'max', 'median', 'percentiles', 'pass_rate', 'histogram'):
+            assert actual[key] == expected[key]
+
+    def test_shouldReturnNone_whenEmpty(self):
+        """Test: Un agregado vacío no tiene media ni percentiles."""
+        result = SectionAggregate().result()
+
+        assert result['count'] == 0
+        assert result['mean'] is None
+        assert result['median'] is None
+        assert result['pass_rate'] is None
+
+    def test_shouldExcludeNonFiniteGrades_fromStatistics(self):
+        """Test: Las notas NaN o infinitas se cuentan aparte y no alteran las estadísticas."""
+        aggregate = SectionAggregate()
+        partial = aggregate.new_partial()
+        for grade in (12.0, float('inf'), 14.0):
+            aggregate.add(grade)
+        partial.add(float('nan'))
+        aggregate.merge(partial)
+
+        result = aggregate.result()
+
+        assert (result['count'], result['non_finite']) == (2, 2)
+        assert (result['mean'], result['max'], result['median']) == (13.0, 14.0, 12.0)
+        assert sum(bar['count'] for bar in result['histogram']) == 2
+        with pytest.raises(ValueError, match="finitos"):
+            QuantileSketch().add(float('inf'))
+
+
+class TestBatchStatistics:
+    """Tests para las estadísticas calculadas durante el modo batch."""
+
+    def test_shouldPrintStatistics_fromCommandLine(self, tmp_path, capsys):
+        """Test: --stats muestra las estadísticas de la sección."""
+        source = tmp_path / "notas.jsonl"
+        source.write_text("".join(
+            json.dumps({'student_id': f"ST{grade}", 'has_reached_minimum_classes': True,
+                        'evaluations': [[grade, 100]]}) + "\n"
+            for grade in (8, 12, 16)), encoding='utf-8')
+
+        main(["--batch", str(source), "--out", str(tmp_path / "out.jsonl"), "--stats"])
+
+        out = capsys.readouterr().out
+        assert "Mediana: 12" in out
+        assert "Tasa de aprobación: 66.7%" in out
+
+    @pytest.mark.parametrize("workers", ["1", "2"])
+    def test_shouldNotAbort_whenSomeGradeIsInfinite(self, tmp_path, capsys, workers):
+        """Test: Una nota 'inf' en el CSV no aborta el batch con --stats."""
+        source = tmp_path / "notas.csv"
+        source.write_text(
+            "student_id,has_reached_minimum_classes,grade_1,weight_1\n"
+            "ST001,s,inf,100\n"
+            "ST002,s,12,100\n",
+            encoding='utf-8'
+        )
+
+        main(["--batch", str(source), "--out", str(tmp_path / "out.jsonl"), "--stats",
+              "--workers", workers, "--chunk-size", "1"])
+
+        out = capsys.readouterr().out
+        assert "Procesados: 2, rechazados: 0" in out
+        assert "Notas no finitas excluidas de las estadísticas: 1" in out
+        assert "Mediana: 12.0" in out
@@ -0,0 +1,200 @@
+"""
+Tests unitarios para el modo batch (lectura en streaming y calificación masiva).
+"""
+
+import json
+
+import pytest
+from src.batch.readers import build_student, detect_format, parse_bool
+from src.batch.runner import default_rejects_path, run_batch
+from src.calculator.grade_calculator import GradeCalculator
+from src.policies.attendance_policy import AttendancePolicy
+from src.policies.extra_points_policy import ExtraPointsPolicy
+from src.main import main
+from tests.helpers import read_jsonl
+
+
+class TestReaders:
+    """Tests para la lectura de registros."""
+
+    def test_shouldDetectFormat_fromExtension(self):
+        """Test: Detección de formato por extensión."""
+        assert detect_format("notas.CSV") == 'csv'
+        assert detect_format("notas.jsonl") == 'jsonl'
+        with pytest.raises(ValueError, match="no soportado"):
+            detect_format("notas.xlsx")
+
+    def test_shouldParseAttendanceValues(self):
+        """Test: Interpretación de valores de asistencia."""
+        assert parse_bool("Sí") is True
+        assert parse_bool("0") is False
+        with pytest.raises(ValueError, match="asistencia inválido"):
+            parse_bool("quizás")
+
+    def test_shouldBuildStudent_fromRecord(self):
+        """Test: Construcción de estudiante desde un registro JSONL."""
+        student, academic_year = build_student({
+            'student_id': 'ST001',
+            'has_reached_minimum_classes': True,
+            'academic_year': 1,
+            'evaluations': [{'grade': 15, 'weight': 50}, [18, 50]],
+        })
+        assert student.student_id == 'ST001'
+        assert len(student.evaluations) == 2
+        assert student.has_reached_minimum_classes is True
+        assert academic_year == 1
+
+    def test_shouldRaiseError_whenEvaluationIsMalformed(self):
+        """Test: Error con evaluación mal formada."""
+        with pytest.raises(ValueError, match="Evaluación inválida"):
+            build_student({'student_id': 'ST001', 'evaluations': [{'grade': 15}]})
+
+    @pytest.mark.parametrize("year", [[1], {}, True, 1.5, float('inf'), "uno", -1, "-3"])
+    def test_shouldRaiseValueError_whenAcademicYearIsNotInteger(self, year):
+        """Test: Años académicos no enteros o negativos se rechazan con ValueError."""
+        with pytest.raises(ValueError, match="Año académico inválido"):
+            build_student({'student_id': 'ST001', 'academic_year': year,
+                           'evaluations': [[15, 100]]})
+        assert build_student({'student_id': 'ST001', 'academic_year': 2.0,
+                              'evaluations': [[15, 100]]})[1] == 2
+
+
+class TestRunBatch:
+    """Tests para la calificación masiva."""
+
+    def setup_method(self):
+        self.calculator = GradeCalculator(AttendancePolicy(), ExtraPointsPolicy([True]))
+
+    def test_shouldGradeCsv_andRejectMalformedRows(self, tmp_path):
+        """Test: CSV calificado con filas inválidas enviadas a rechazos."""
+        source = tmp_path / "notas.csv"
+        source.write_text(
+            "student_id,has_reached_minimum_classes,academic_year,"
+            "grade_1,weight_1,grade_2,weight_2\n"
+            "ST001,s,0,15,50,18,50\n"
+            "ST002,n,0,-1,100,,\n"
+            "ST003,s,1,14,100,,\n"
+            "ST004,s,0,15,0,,\n",
+            encoding='utf-8'
+        )
+        output = tmp_path / "resultados.jsonl"
+
+        summary = run_batch(str(source), str(output), self.calculator)
+
+        assert summary == {'processed': 2, 'rejected': 2}
+        results = read_jsonl(output)
+        assert [result['student_id'] for result in results] == ['ST001', 'ST003']
+        assert results[0]['final_grade'] == 17.5
+        assert results[1]['final_grade'] == 14.0
+        rejects = read_jsonl(default_rejects_path(str(output)))
+        assert [reject['line'] for reject in rejects] == [3, 5]
+        assert "no puede ser negativa" in rejects[0]['error']
+        assert "peso total" in rejects[1]['error']
+
+    def test_shouldGradeJsonl_andRejectInvalidJson(self, tmp_path):
+        """Test: JSONL calificado con líneas inválidas enviadas a rechazos."""
+        source = tmp_path / "notas.jsonl"
+        rows = [json.dumps({'student_id': 'ST001', 'has_reached_minimum_classes': True,
+                            'evaluations': [{'grade': 16, 'weight': 100}]}),
+                '{no es json',
+                json.dumps({'student_id': 'ST002',
+                            'evaluations': [[10, 10]] * 11})]
+        source.write_text("\n".join(rows) + "\n", encoding='utf-8')
+        output = tmp_path / "resultados.jsonl"
+        rejects_path = tmp_path / "malos.jsonl"
+
+        summary = run_batch(str(source), str(output), self.calculator,
+                            rejects_path=str(rejects_path))
+
+        assert summary == {'processed': 1, 'rejected': 2}
+        assert read_jsonl(output)[0]['final_grade'] == 17.0
+        rejects = read_jsonl(rejects_path)
+        assert rejects[0]['row'] == '{no es json'
+        assert "No se pueden agregar más de" in rejects[1]['error']
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_shouldRejectRow_whenAcademicYearHasWrongType(self, tmp_path, workers):
+        """Test: Un año académico que no es entero se rechaza sin abortar el batch."""
+        source = tmp_path / "notas.jsonl"
+        rows = [json.dumps({'student_id': 'ST001', 'academic_year': [1],
+                            'evaluations': [[16, 100]]}),
+                json.dumps({'student_id': 'ST002', 'evaluations': [[16, 100]]})]
+        source.write_text("\n".join(rows) + "\n", encoding='utf-8')
+        output = tmp_path / "resultados.jsonl"
+
+        summary = run_batch(str(source), str(output), self.calculator, workers=workers)
+
+        assert summary == {'processed': 1, 'rejected': 1}
+        assert "Año académico inválido" in read_jsonl(default_rejects_path(str(output)))[0][
+            'error']
+
+
+    @pytest.mark.parametrize("extension,header", [
+        ("csv", b"student_id,has_reached_minimum_classes,grade_1,weight_1\n"),
+        ("jsonl", b""),
+    ])
+    def test_shouldRejectRow_whenItIsNotUtf8(self, tmp_path, extension, header):
+        """Test: Una fila con bytes que no son UTF-8 va a rechazos sin abortar el batch."""
+        source = tmp_path / f"notas.{extension}"
+        if extension == "csv":
+            rows = b"ST\xd1001,s,16,100\nST002,s,16,100\n"
+        else:
+            rows = (b'{"student_id": "ST\xd1001", "evaluations": [[16, 100]]}\n'
+                    b'{"student_id": "ST002", "evaluations": [[16, 100]]}\n')
+        source.write_bytes(header + rows)
+        output = tmp_path / "resultados.jsonl"
+
+        summary = run_batch(str(source), str(output), self.calculator)
+
+        assert summary == {'processed': 1, 'rejected': 1}
+        assert read_jsonl(output)[0]['student_id'] == 'ST002'
+        reject = read_jsonl(default_rejects_path(str(output)))[0]
+        assert "UTF-8" in reject['error']
+        assert "ST\ufffd001" in json.dumps(reject['row'], ensure_ascii=False)
+
+
+class TestMainBatchMode:
+    """Tests para la entrada no interactiva de src.main."""
+
+    def test_shouldRunBatchMode_fromCommandLine(self, tmp_path, capsys):
+        """Test: python -m src.main --batch escribe resultados."""
+        source = tmp_path / "notas.jsonl"
+        source.write_text(json.dumps({'student_id': 'ST001', 'academic_year': 1,
+                                      'has_reached_minimum_classes': 's',
+                                      'evaluations': [[14, 100]]}) + "\n",
+                          encoding='utf-8')
+        output = tmp_path / "resultados.jsonl"
+
+        main(["--batch", str(source), "--out", str(output), "--extra-points", "n,s"])
+
+        assert read_jsonl(output)[0]['final_grade'] == 15.0
+        assert "Procesados: 1, rechazados: 0" in capsys.readouterr().out
+
+    def test_shouldApplySelectionRules_fromCommandLine(self, tmp_path):
+        """Test: --best-of y --max-evaluations en modo batch."""
+        source = tmp_path / "notas.jsonl"
+        evaluations = [[grade, 5] for grade in range(1, 21)]
+        source.write_text(json.dumps({'student_id': 'ST001', 'has_reached_minimum_classes': 1,
+                                      'evaluations': evaluations}) + "\n", encoding='utf-8')
+        output = tmp_path / "resultados.jsonl"
+
+        main(["--batch", str(source), "--out", str(output), "--best-of", "4",
+              "--max-evaluations", "20"])
+
+        assert read_jsonl(output)[0]['final_grade'] == 18.5
+
+    def test_shouldGradeInFixedPoint_fromCommandLine(self, tmp_path):
+        """Test: --fixed-point redondea hacia arriba la mitad exacta."""
+        source = tmp_path / "notas.csv"
+        source.write_text("student_id,has_reached_minimum_classes,grade_1,weight_1,"
+                          "grade_2,weight_2\nST001,s,10.25,50,10.26,50\n", encoding='utf-8')
+        output = tmp_path / "resultados.jsonl"
+
+        main(["--batch", str(source), "--out", str(output), "--fixed-point"])
+
+        assert read_jsonl(output)[0]['final_grade'] == 10.26
+
+    def test_shouldFail_whenOutputIsMissing(self, tmp_path):
+        """Test: --batch requiere --out."""
+        with pytest.raises(SystemExit):
+            main(["--batch", str(tmp_path / "notas.csv")])
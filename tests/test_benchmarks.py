@@ -0,0 +1,83 @@
+"""
+Tests unitarios para la suite de benchmarks.
+"""
+
+import json
+
+from benchmarks import bench_grading
+from benchmarks.bench_grading import compare_with_baseline, generate_cohort, run_benchmarks
+from tests.helpers import requires_numpy
+
+
+class TestBenchmarks:
+    """Tests para la generación de datos y la comparación con la línea base."""
+
+    def test_shouldGenerateSameCohort_withSameSeed(self):
+        """Test: Datos sintéticos reproducibles."""
+        first = generate_cohort(20, seed=1)
+        second = generate_cohort(20, seed=1)
+        assert [[(e.grade, e.weight) for e in s.evaluations] for s in first] == \
+            [[(e.grade, e.weight) for e in s.evaluations] for s in second]
+
+    @requires_numpy
+    def test_shouldReportEveryBenchmark_forEverySize(self, monkeypatch):
+        """Test: Un resultado por benchmark y tamaño."""
+        monkeypatch.setattr(bench_grading, 'MIN_OPERATIONS', 10)
+        report = run_benchmarks(sizes=(1, 5), repeats=1)
+        assert len(report['results']) == 14
+        assert all(result['ns_per_op'] > 0 for result in report['results'])
+
+    def test_shouldDetectRegression_aboveThreshold(self):
+        """Test: Regresión detectada solo sobre el umbral."""
+        baseline = {'results': [{'benchmark': 'a', 'size': 1, 'ns_per_op': 100.0},
+                                {'benchmark': 'b', 'size': 1, 'ns_per_op': 100.0}]}
+        current = {'results': [{'benchmark': 'a', 'size': 1, 'ns_per_op': 115.0},
+                               {'benchmark': 'b', 'size': 1, 'ns_per_op': 130.0},
+                               {'benchmark': 'c', 'size': 1, 'ns_per_op': 999.0}]}
+
+        regressions = compare_with_baseline(current, baseline, threshold=0.2)
+
+        assert [regression['benchmark'] for regression in regressions] == ['b']
+
+    @requires_numpy
+    def test_shouldFailRun_whenBaselineIsFaster(self, tmp_path, monkeypatch):
+        """Test: Código de salida 1 ante una regresión."""
+        monkeypatch.setattr(bench_grading, 'MIN_OPERATIONS', 10)
+        baseline = tmp_path / "base.json"
+        output = tmp_path / "actual.json"
+        baseline.write_text(json.dumps({'results': [
+            {'benchmark': 'calculator.calculate_final_grade', 'size': 1, 'ns_per_op': 1e-6}
+        ]}))
+
+        exit_code = bench_grading.main(["--sizes", "1", "--repeats", "1",
+                                        "--out", str(output), "--baseline", str(baseline)])
+
+        assert exit_code == 1
+        assert json.loads(output.read_text())['meta']['seed'] == bench_grading.DEFAULT_SEED
+
+
+class TestSelectionBenchmark:
+    """Tests para el benchmark de reglas de selección."""
+
+    @requires_numpy
+    def test_shouldReportEveryCase_forEveryMaximum(self, monkeypatch):
+        """Test: Un resultado por caso y máximo de evaluaciones."""
+        from benchmarks.bench_selection import run_selection_benchmarks
+
+        report = run_selection_benchmarks(max_evaluations=(3, 30), size=20, repeats=1)
+
+        assert len(report['results']) == 16
+        assert report['results'][-1]['benchmark'] == 'selection.argsort[m=30]'
+
+
+class TestStartupBenchmark:
+    """Tests para el benchmark de arranque del modo rápido."""
+
+    def test_shouldNotImportHeavyModules_inGradeMode(self):
+        """Test: El modo rápido no importa typing, re, argparse, json ni NumPy."""
+        from benchmarks.bench_startup import run_startup_benchmark
+
+        result = run_startup_benchmark(repeats=1)
+
+        assert result['forbidden_modules'] == []
+        assert result['grade_ms'] > 0
@@ -0,0 +1,107 @@
+"""
+Tests unitarios para el formato binario de gradebook con carga mediante mmap.
+"""
+
+import pytest
+from src.models.student_table import StudentTable
+from src.policies.attendance_policy import AttendancePolicy
+from src.policies.extra_points_policy import ExtraPointsPolicy
+from src.calculator.grade_calculator import GradeCalculator
+from src.storage.binary_gradebook import load_gradebook, write_gradebook
+from tests.helpers import requires_numpy
+
+
+def build_table():
+    table = StudentTable()
+    table.add_student("ST001", [(15.0, 30.0), (18.0, 70.0)], True, 0)
+    table.add_student("ÉST-002", [(10.0, 100.0)], False, 1)
+    table.add_student("ST003", [(12.5, 40.0), (19.0, 30.0), (7.0, 30.0)], True, 1)
+    return table
+
+
+class TestBinaryGradebook:
+    """Tests para la escritura y carga sin copia del gradebook."""
+
+    def test_shouldRoundTripColumns_whenLoadedWithMmap(self, tmp_path):
+        """Test: Las columnas cargadas coinciden con las escritas."""
+        path = str(tmp_path / "libreta.csgb")
+        table = build_table()
+        write_gradebook(path, table)
+
+        with load_gradebook(path) as gradebook:
+            loaded = gradebook.table
+            assert list(loaded.student_ids) == ["ST001", "ÉST-002", "ST003"]
+            assert list(loaded.offsets) == list(table.offsets)
+            assert list(loaded.block.grades) == list(table.block.grades)
+            assert list(loaded.block.weights) == list(table.block.weights)
+            assert list(loaded.academic_years) == [0, 1, 1]
+            assert [student.has_reached_minimum_classes for student in loaded] == [True, False, True]
+            assert isinstance(loaded.block.grades, memoryview)
+            assert loaded.block.grades.readonly
+
+    @requires_numpy
+    def test_shouldGradeViews_likeOriginalTable(self, tmp_path):
+        """Test: Las vistas mapeadas son compatibles con GradeCalculator."""
+        path = str(tmp_path / "libreta.csgb")
+        table = build_table()
+        write_gradebook(path, table)
+        calculator = GradeCalculator(AttendancePolicy(), ExtraPointsPolicy([True, False]))
+
+        with load_gradebook(path) as gradebook:
+            loaded = [calculator.get_calculation_details(student, student.academic_year)
+                      for student in gradebook.table]
+            cohort = calculator.calculate_cohort(**gradebook.table.columns())
+
+        expected = [calculator.get_calculation_details(student, student.academic_year)
+                    for student in table]
+        assert loaded == expected
+        assert list(cohort['final_grade']) == [detail['final_grade'] for detail in expected]
+
+    def test_shouldRaiseError_whenClosingWithExportedColumns(self, tmp_path):
+        """Test: close() falla con ValueError mientras un arreglo usa las columnas."""
+        np = pytest.importorskip("numpy")
+        path = str(tmp_path / "libreta.csgb")
+        write_gradebook(path, build_table())
+
+        gradebook = load_gradebook(path)
+        grades = np.frombuffer(gradebook.table.block.grades)
+        copied = np.array(gradebook.table.block.weights)
+        with pytest.raises(ValueError, match="arreglos"):
+            gradebook.close()
+        assert list(grades) == [15.0, 18.0, 10.0, 12.5, 19.0, 7.0]
+
+        del grades
+        gradebook.close()
+        assert list(copied) == [30.0, 70.0, 100.0, 40.0, 30.0, 30.0]
+        assert gradebook._mmap.closed
+
+    @requires_numpy
+    def test_shouldCountEvaluations_fromOffsets(self, tmp_path):
+        """Test: evaluation_counts sale de las diferencias de offsets."""
+        path = str(tmp_path / "libreta.csgb")
+        write_gradebook(path, build_table())
+
+        with load_gradebook(path) as gradebook:
+            assert list(gradebook.table.evaluation_counts()) == [2, 1, 3]
+
+    def test_shouldHandleEmptyTable(self, tmp_path):
+        """Test: Un gradebook vacío se puede escribir y cargar."""
+        path = str(tmp_path / "vacia.csgb")
+        write_gradebook(path, StudentTable())
+
+        with load_gradebook(path) as gradebook:
+            assert len(gradebook.table) == 0
+
+    def test_shouldRaiseError_whenFileIsInvalid(self, tmp_path):
+        """Test: Archivos ajenos o truncados se rechazan."""
+        foreign = tmp_path / "otro.bin"
+        foreign.write_bytes(b"no es un gradebook" * 4)
+        with pytest.raises(ValueError, match="inválido"):
+            load_gradebook(str(foreign))
+
+        path = tmp_path / "libreta.csgb"
+        write_gradebook(str(path), build_table())
+        truncated = tmp_path / "truncado.csgb"
+        truncated.write_bytes(path.read_bytes()[:60])
+        with pytest.raises(ValueError, match="truncado"):
+            load_gradebook(str(truncated))
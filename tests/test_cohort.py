@@ -0,0 +1,90 @@
+"""
+Tests unitarios para el cálculo vectorizado de cohortes.
+"""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src.models.student import Student
+from src.models.evaluation import Evaluation
+from src.policies.attendance_policy import AttendancePolicy
+from src.policies.extra_points_policy import ExtraPointsPolicy
+from src.calculator.grade_calculator import GradeCalculator
+from src.calculator.cohort import round_2
+from tests.helpers import build_random_cohort
+
+
+class TestCalculateCohort:
+    """Tests para GradeCalculator.calculate_cohort."""
+
+    def test_shouldMatchScalarPath_bitForBit(self):
+        """Test: Resultados idénticos a calculate_final_grade (RNF03)."""
+        grades, weights, counts, attendance, years = build_random_cohort(2024, 2000)
+        calculator = GradeCalculator(AttendancePolicy(),
+                                     ExtraPointsPolicy([True, False, True]))
+
+        cohort = calculator.calculate_cohort(grades, weights, counts, attendance, years)
+
+        position = 0
+        for index, count in enumerate(counts):
+            student = Student(f"ST{index}")
+            for offset in range(count):
+                student.add_evaluation(
+                    Evaluation(grades[position + offset], weights[position + offset])
+                )
+            position += count
+            student.has_reached_minimum_classes = attendance[index]
+            expected = calculator.calculate_final_grade(student, years[index])
+            for field, value in expected.items():
+                assert cohort[field][index].item() == value
+
+    def test_shouldBroadcastCommonAcademicYear(self):
+        """Test: Un único año académico se aplica a todos los estudiantes."""
+        calculator = GradeCalculator(AttendancePolicy(), ExtraPointsPolicy([True]))
+
+        cohort = calculator.calculate_cohort(
+            [14.0, 15.0, 18.0], [100.0, 50.0, 50.0], [1, 2], [True, False]
+        )
+
+        assert cohort['extra_points'].tolist() == [1.0, 1.0]
+        assert cohort['final_grade'].tolist() == [15.0, 15.5]
+
+    def test_shouldClampNegativeFinalGrade(self):
+        """Test: La nota final vectorizada nunca es negativa."""
+        calculator = GradeCalculator(AttendancePolicy(), ExtraPointsPolicy([False]))
+
+        cohort = calculator.calculate_cohort([1.0], [100.0], [1], [False])
+
+        assert cohort['final_grade'].tolist() == [0.0]
+
+    def test_shouldRaiseError_whenStudentHasNoEvaluations(self):
+        """Test: Error cuando un estudiante no tiene evaluaciones."""
+        calculator = GradeCalculator(AttendancePolicy(), ExtraPointsPolicy([False]))
+
+        with pytest.raises(ValueError, match="al menos una evaluación"):
+            calculator.calculate_cohort([15.0], [100.0], [1, 0], [True, True])
+
+    def test_shouldRaiseError_whenTotalWeightIsZero(self):
+        """Test: Error cuando el peso total de un estudiante es cero."""
+        calculator = GradeCalculator(AttendancePolicy(), ExtraPointsPolicy([False]))
+
+        with pytest.raises(ValueError, match="peso total.*no puede ser cero"):
+            calculator.calculate_cohort([15.0, 12.0], [100.0, 0.0], [1, 1], [True, True])
+
+    def test_shouldRaiseError_whenColumnsAreInconsistent(self):
+        """Test: Error cuando las cantidades no coinciden con las columnas."""
+        calculator = GradeCalculator(AttendancePolicy(), ExtraPointsPolicy([False]))
+
+        with pytest.raises(ValueError, match="evaluation_counts"):
+            calculator.calculate_cohort([15.0, 12.0], [50.0, 50.0], [3], [True])
+
+
+class TestRound2:
+    """Tests para el redondeo vectorizado."""
+
+    def test_shouldMatchPythonRound_onTies(self):
+        """Test: Coincide con round(x, 2) en valores cercanos a .5."""
+        values = [2.675, 1.005, 0.125, 0.375, 16.665, 10.0049999, 7.345, 1e-9]
+        rounded = round_2(np.array(values))
+        assert rounded.tolist() == [round(value, 2) for value in values]
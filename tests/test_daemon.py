@@ -0,0 +1,124 @@
+"""
+Tests unitarios para el daemon de calificación y su cliente.
+"""
+
+import asyncio
+import io
+import json
+import socket
+import threading
+
+import pytest
+from src.service import daemon_client
+from src.service.daemon import GradingDaemon, main
+from src.service.protocol import LENGTH, decode_body, encode_frame
+
+
+class RunningDaemon:
+    """Ejecuta un GradingDaemon en un hilo con su propio event loop."""
+
+    def __init__(self, socket_path):
+        self.daemon = GradingDaemon(socket_path)
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self.loop.run_forever, daemon=True)
+
+    def __enter__(self):
+        self.thread.start()
+        asyncio.run_coroutine_threadsafe(self.daemon.start(), self.loop).result(5)
+        return self.daemon
+
+    def __exit__(self, *exc_info):
+        asyncio.run_coroutine_threadsafe(self.daemon.close(), self.loop).result(5)
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join(5)
+        self.loop.close()
+
+
+class TestProtocol:
+    """Tests para el protocolo con prefijo de longitud."""
+
+    def test_shouldRoundTripFields(self):
+        """Test: Los campos se codifican y decodifican sin pérdida."""
+        frame = encode_frame(['', '--grade', 'ñ:á', '15:100'])
+
+        assert LENGTH.unpack(frame[:4])[0] == len(frame) - 4
+        assert decode_body(frame[4:]) == ['', '--grade', 'ñ:á', '15:100']
+
+    def test_shouldRaiseError_whenBodyIsMalformed(self):
+        """Test: Cuerpos truncados o con bytes sobrantes se rechazan."""
+        body = encode_frame(['abc'])[4:]
+        with pytest.raises(ValueError, match="mal formado"):
+            decode_body(body[:-1])
+        with pytest.raises(ValueError, match="mal formado"):
+            decode_body(body + b'x')
+
+
+class TestGradingDaemon:
+    """Tests para el daemon y el cliente."""
+
+    def test_shouldGradeThroughSocket_likeDirectInvocation(self, tmp_path, capsys):
+        """Test: El cliente obtiene la misma salida que src.main --grade."""
+        socket_path = str(tmp_path / "notas.sock")
+        with RunningDaemon(socket_path):
+            code = daemon_client.main(["--socket", socket_path, "--grade", "15:30", "18:70",
+                                       "--attendance", "s", "--year", "1",
+                                       "--extra-points", "n,s"])
+            output = capsys.readouterr().out
+            failure = daemon_client.request(socket_path, ["--grade", "15:0"])
+
+        assert code == 0
+        assert output == "18.1\n"
+        assert failure[0] == 1
+        assert "peso total" in failure[2]
+
+    def test_shouldReadStdinRecord_andReuseCalculators(self, tmp_path):
+        """Test: --grade - envía el registro y las calculadoras se reutilizan."""
+        socket_path = str(tmp_path / "notas.sock")
+        record = json.dumps({'student_id': 'ST001', 'has_reached_minimum_classes': True,
+                             'evaluations': [[14, 100]]})
+        with RunningDaemon(socket_path) as daemon:
+            first = daemon_client.request(socket_path, ["--grade", "-", "--extra-points", "s",
+                                                        "--details"], record)
+            daemon_client.request(socket_path, ["--grade", "10:100", "--extra-points", "s"])
+            calculators = list(daemon._calculators)
+
+        assert json.loads(first[1])['final_grade'] == 15.0
+        assert calculators == [(True,)]
+
+    def test_shouldGradeLocally_whenDaemonIsNotRunning(self, tmp_path, capsys, monkeypatch):
+        """Test: Sin daemon, el cliente calcula en su propio proceso."""
+        monkeypatch.setattr('sys.stdin', io.StringIO(''))
+
+        code = daemon_client.main(["--socket", str(tmp_path / "no.sock"),
+                                   "--grade", "12:100", "--attendance", "s"])
+
+        assert code == 0
+        assert capsys.readouterr().out == "12.0\n"
+
+    def test_shouldRefuseToStart_whenSocketIsInUse(self, tmp_path):
+        """Test: Un segundo daemon no reemplaza a uno activo."""
+        socket_path = str(tmp_path / "notas.sock")
+        with RunningDaemon(socket_path):
+            with pytest.raises(ValueError, match="Ya hay un daemon"):
+                asyncio.run(GradingDaemon(socket_path).start())
+
+    def test_shouldNotDeletePath_whenItIsNotASocket(self, tmp_path):
+        """Test: Una ruta existente que no es socket no se borra ni se reemplaza."""
+        path = tmp_path / "notas.txt"
+        path.write_text("no borrar", encoding='utf-8')
+
+        with pytest.raises(ValueError, match="no es un socket"):
+            asyncio.run(GradingDaemon(str(path)).start())
+        with pytest.raises(SystemExit):
+            main(["--socket", str(path)])
+        assert path.read_text(encoding='utf-8') == "no borrar"
+
+    def test_shouldReplaceAbandonedSocket(self, tmp_path):
+        """Test: Un socket abandonado (sin daemon) se elimina y se reemplaza."""
+        socket_path = str(tmp_path / "notas.sock")
+        abandoned = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        abandoned.bind(socket_path)
+        abandoned.close()
+
+        with RunningDaemon(socket_path):
+            assert daemon_client.request(socket_path, ["--grade", "12:100"])[:2] == (0, "10.0\n")
@@ -0,0 +1,108 @@
+"""
+Tests unitarios para CalculationDetails (detalle del cálculo diferido).
+"""
+
+import copy
+import json
+import pickle
+
+import pytest
+from src.calculator.details import CalculationDetails
+from src.calculator.grade_calculator import GradeCalculator
+from src.models.evaluation import Evaluation
+from src.models.student import Student
+from src.policies.attendance_policy import AttendancePolicy
+from src.policies.extra_points_policy import ExtraPointsPolicy
+from tests.helpers import build_student
+
+
+def expected_details(calculator, student, academic_year=0):
+    """Arma el detalle completo de una vez, como un dict normal."""
+    return {
+        'student_id': student.student_id,
+        'number_of_evaluations': len(student.evaluations),
+        'evaluations': [
+            {'grade': evaluation.grade, 'weight': evaluation.weight,
+             'weighted_grade': calculator.weighted_grade(evaluation)}
+            for evaluation in student.evaluations
+        ],
+        'total_weight': round(student.get_total_weight(), 2),
+        'has_reached_minimum_classes': student.has_reached_minimum_classes,
+        'extra_points_policy_active':
+            calculator.extra_points_policy.is_extra_points_active(academic_year),
+        **calculator.calculate_final_grade(student, academic_year)
+    }
+
+
+class TestCalculationDetails:
+    """Tests para CalculationDetails."""
+
+    def setup_method(self):
+        self.calculator = GradeCalculator(AttendancePolicy(), ExtraPointsPolicy([True]))
+        self.student = build_student("ST001", [(15.0, 33.3), (10.25, 66.7)], False)
+
+    def test_shouldReadTotals_withoutBuildingEvaluations(self):
+        """Test: Los totales, len e 'in' no arman la lista de evaluaciones."""
+        details = self.calculator.get_calculation_details(self.student, 0)
+
+        assert isinstance(details, dict)
+        assert details['final_grade'] == expected_details(self.calculator, self.student)[
+            'final_grade']
+        assert len(details) == 10
+        assert 'evaluations' in details and 'tenant' not in details
+        assert details.get('tenant') is None
+        assert not details.is_materialized
+
+        assert details['evaluations'][1]['weighted_grade'] == 6.84
+        assert details.is_materialized
+
+    def test_shouldBehaveLikeEagerDict_onceBuilt(self):
+        """Test: Mismo contenido y orden de claves que el dict armado de una vez."""
+        expected = expected_details(self.calculator, self.student)
+
+        assert list(self.calculator.get_calculation_details(self.student, 0)) == list(expected)
+        assert self.calculator.get_calculation_details(self.student, 0) == expected
+        assert json.dumps(self.calculator.get_calculation_details(self.student, 0)) == \
+            json.dumps(expected)
+        assert {**self.calculator.get_calculation_details(self.student, 0)} == expected
+        assert dict(self.calculator.get_calculation_details(self.student, 0)) == expected
+        assert repr(self.calculator.get_calculation_details(self.student, 0)) == repr(expected)
+        restored = pickle.loads(pickle.dumps(self.calculator.get_calculation_details(
+            self.student, 0)))
+        assert type(restored) is dict and restored == expected
+        assert copy.deepcopy(self.calculator.get_calculation_details(self.student, 0)) == \
+            expected
+
+    def test_shouldBuildEvaluations_beforeMutating(self):
+        """Test: Modificar el detalle conserva las evaluaciones y el orden."""
+        details = self.calculator.get_calculation_details(self.student, 0)
+        details['tenant'] = 'ingenieria'
+        del details['student_id']
+
+        assert list(details)[:2] == ['number_of_evaluations', 'evaluations']
+        assert list(details)[-1] == 'tenant'
+        assert details.pop('evaluations')[0]['grade'] == 15.0
+        assert 'evaluations' not in details
+
+    def test_shouldKeepSnapshot_whenStudentChangesAfterwards(self):
+        """Test: Las evaluaciones agregadas después no aparecen en el detalle."""
+        expected = expected_details(self.calculator, self.student)
+        details = self.calculator.get_calculation_details(self.student, 0)
+        self.student.add_evaluation(Evaluation(20.0, 10.0))
+
+        assert details == expected
+
+    def test_shouldUseCalculatorWeightedGrade_inFixedPointMode(self):
+        """Test: En punto fijo la nota ponderada usa el redondeo exacto."""
+        calculator = GradeCalculator(AttendancePolicy(), ExtraPointsPolicy([]),
+                                     fixed_point=True)
+        student = Student("ST002")
+        student.add_evaluation(Evaluation(0.5, 1.0))
+
+        details = calculator.get_calculation_details(student)
+
+        assert details['evaluations'][0]['weighted_grade'] == 0.01
+        assert details == expected_details(calculator, student)
+        with pytest.raises(TypeError):
+            hash(details)
+        assert isinstance(details, CalculationDetails)
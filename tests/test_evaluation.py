@@ -2,6 +2,9 @@
 Tests unitarios para la clase Evaluation.
 """
 
+import copy
+import pickle
+
 import pytest
 from src.models.evaluation import Evaluation
 
@@ -46,4 +49,21 @@ class TestEvaluation:
         evaluation = Evaluation(15.0, 0.0)
         assert evaluation.weight == 0.0
         assert evaluation.get_weighted_grade() == 0.0
-
+    
+    def test_shouldRejectChanges_afterCreation(self):
+        """Test: La nota y el peso no se modifican una vez creada."""
+        evaluation = Evaluation(15.0, 30.0)
+        
+        with pytest.raises(AttributeError, match="inmutable"):
+            evaluation.grade = 5.0
+        with pytest.raises(AttributeError, match="inmutable"):
+            del evaluation.weight
+        assert evaluation.grade == 15.0 and evaluation.weight == 30.0
+    
+    def test_shouldKeepValues_whenCopiedOrPickled(self):
+        """Test: copy y pickle recrean la evaluación con sus valores."""
+        evaluation = Evaluation(15.0, 30.0)
+        
+        for clone in (copy.copy(evaluation), copy.deepcopy(evaluation),
+                      pickle.loads(pickle.dumps(evaluation))):
+            assert (clone.grade, clone.weight) == (15.0, 30.0)
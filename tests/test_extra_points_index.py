@@ -0,0 +1,88 @@
+"""
+Tests unitarios para ExtraPointsIndex.
+"""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src.policies.extra_points_policy import ExtraPointsPolicy
+from src.policies.extra_points_index import ExtraPointsIndex
+
+
+class TestExtraPointsIndex:
+    """Tests para el índice precompilado de puntos extra."""
+
+    def setup_method(self):
+        self.policies = {
+            'CS': [True, False, True],
+            'DS': ExtraPointsPolicy([False, True]),
+            'BIO': [],
+        }
+        self.index = ExtraPointsIndex(self.policies)
+
+    def test_shouldMatchExtraPointsPolicy_forSingleLookups(self):
+        """Test: Mismo resultado que ExtraPointsPolicy para cada programa y año."""
+        for program, years in (('CS', [True, False, True]), ('DS', [False, True]),
+                               ('BIO', [])):
+            policy = ExtraPointsPolicy(years)
+            for year in range(-1, 5):
+                assert self.index.get_extra_points(program, year) == \
+                    policy.get_extra_points_for_year(year)
+                assert self.index.is_extra_points_active(program, year) == \
+                    policy.is_extra_points_active(year)
+
+    def test_shouldRaiseError_whenProgramIsUnknown(self):
+        """Test: Error con programa desconocido."""
+        with pytest.raises(ValueError, match="Programa desconocido"):
+            self.index.get_extra_points('MATH', 0)
+
+    def test_shouldLookupManyYears_inOneCall(self):
+        """Test: Consulta vectorizada de arreglos de programas y años."""
+        codes = self.index.program_codes(['CS', 'CS', 'DS', 'DS', 'BIO', 'CS'])
+        years = np.array([0, 1, 1, 7, 0, -1])
+
+        extra_points = self.index.lookup_many(codes, years)
+
+        assert extra_points.tolist() == [1.0, 0.0, 1.0, 0.0, 0.0, 0.0]
+        assert self.index.lookup_many(codes[0], [0, 1, 2]).tolist() == [1.0, 0.0, 1.0]
+
+    def test_shouldBuildPolicy_forGradeCalculator(self):
+        """Test: Política equivalente para un programa."""
+        policy = self.index.policy_for('DS')
+        assert policy.all_years_teachers == [False, True, False]
+
+    def test_shouldRoundTrip_throughDisk(self, tmp_path):
+        """Test: Guardar y cargar conserva la tabla completa."""
+        path = tmp_path / "puntos_extra.bin"
+        many = {f"P{code}": [(code + year) % 3 == 0 for year in range(40)]
+                for code in range(50)}
+        index = ExtraPointsIndex(many, extra_points_amount=0.5)
+
+        index.save(str(path))
+        loaded = ExtraPointsIndex.load(str(path))
+
+        assert loaded.programs == index.programs
+        assert loaded.n_years == 40
+        assert loaded.extra_points_amount == 0.5
+        assert loaded.get_extra_points('P7', 2) == 0.5
+        assert path.stat().st_size < 50 * 40
+
+    def test_shouldRaiseError_whenFileIsInvalid(self, tmp_path):
+        """Test: Error al cargar un archivo con otro formato."""
+        path = tmp_path / "otro.bin"
+        path.write_bytes(b"no es un indice de puntos extra")
+        with pytest.raises(ValueError, match="inválido"):
+            ExtraPointsIndex.load(str(path))
+
+    def test_shouldRaiseError_whenFileIsTruncated(self, tmp_path):
+        """Test: Error al cargar un archivo cortado en cualquier sección."""
+        path = tmp_path / "puntos_extra.bin"
+        self.index.save(str(path))
+        data = path.read_bytes()
+
+        truncated = tmp_path / "truncado.bin"
+        for size in (25, 27, 31, len(data) - 1):
+            truncated.write_bytes(data[:size])
+            with pytest.raises(ValueError, match="truncado"):
+                ExtraPointsIndex.load(str(truncated))
@@ -0,0 +1,134 @@
+"""
+Tests unitarios para el cálculo en punto fijo (centésimas).
+"""
+
+import random
+from decimal import ROUND_HALF_UP, Decimal
+
+import pytest
+from src.batch.runner import run_batch
+from src.models.student import Student
+from src.models.evaluation import Evaluation
+from src.policies.attendance_policy import AttendancePolicy
+from src.policies.extra_points_policy import ExtraPointsPolicy
+from src.calculator.grade_calculator import GradeCalculator
+from src.calculator.fixed_point import to_hundredths
+from src.calculator.pipeline import PolicyPipeline
+from tests.helpers import requires_numpy
+
+
+def build_hundredths_cohort(seed, n_students):
+    """Genera una cohorte columnar con notas y pesos de 2 decimales."""
+    rng = random.Random(seed)
+    grades, weights, counts, attendance, years = [], [], [], [], []
+    for _ in range(n_students):
+        count = rng.randint(1, Student.MAX_EVALUATIONS)
+        counts.append(count)
+        grades += [rng.randint(0, 2000) / 100 for _ in range(count)]
+        weights += [rng.randint(1, 10000) / 100 for _ in range(count)]
+        attendance.append(rng.random() < 0.8)
+        years.append(rng.randint(-1, 3))
+    return grades, weights, counts, attendance, years
+
+
+def expected_final_grade(evaluations, has_reached_minimum_classes, extra_points):
+    """Referencia con decimal.Decimal y ROUND_HALF_UP."""
+    weighted_sum = sum(Decimal(str(grade)) * Decimal(str(weight))
+                       for grade, weight in evaluations)
+    total_weight = sum(Decimal(str(weight)) for _, weight in evaluations)
+    average = (weighted_sum / total_weight).quantize(Decimal('0.01'), ROUND_HALF_UP)
+    penalty = Decimal('0') if has_reached_minimum_classes else Decimal('2')
+    return float(max(Decimal('0'), average - penalty + Decimal(str(extra_points))))
+
+
+class TestFixedPoint:
+    """Tests para GradeCalculator con fixed_point=True."""
+
+    def test_shouldRoundHalfUp_whereFloatPathRoundsDown(self):
+        """Test: 10.255 exacto se redondea a 10.26 (la ruta float da 10.25)."""
+        student = Student("ST001")
+        student.add_evaluation(Evaluation(10.25, 50))
+        student.add_evaluation(Evaluation(10.26, 50))
+        student.has_reached_minimum_classes = True
+        policies = (AttendancePolicy(), ExtraPointsPolicy([False]))
+
+        exact = GradeCalculator(*policies, fixed_point=True).get_calculation_details(student)
+        binary = GradeCalculator(*policies).get_calculation_details(student)
+
+        assert exact['final_grade'] == 10.26
+        assert binary['final_grade'] == 10.25
+        assert [item['weighted_grade'] for item in exact['evaluations']] == [5.13, 5.13]
+
+    @requires_numpy
+    def test_shouldMatchDecimalReference_inScalarAndCohortPaths(self):
+        """Test: Resultados exactos e idénticos en ambas rutas."""
+        grades, weights, counts, attendance, years = build_hundredths_cohort(19, 1000)
+        calculator = GradeCalculator(AttendancePolicy(), ExtraPointsPolicy([True, False]),
+                                     fixed_point=True)
+
+        cohort = calculator.calculate_cohort(grades, weights, counts, attendance, years)
+
+        position = 0
+        for index, count in enumerate(counts):
+            pairs = list(zip(grades[position:position + count],
+                             weights[position:position + count]))
+            position += count
+            student = Student(f"ST{index}")
+            for grade, weight in pairs:
+                student.add_evaluation(Evaluation(grade, weight))
+            student.has_reached_minimum_classes = attendance[index]
+            result = calculator.calculate_final_grade(student, years[index])
+            extra_points = 1.0 if years[index] == 0 else 0.0
+
+            assert result['final_grade'] == expected_final_grade(pairs, attendance[index],
+                                                                 extra_points)
+            for field, value in result.items():
+                assert cohort[field][index].item() == value
+
+    @requires_numpy
+    def test_shouldRaiseError_whenValueIsNotInHundredths(self):
+        """Test: Valores con más de 2 decimales se rechazan en ambas rutas."""
+        calculator = GradeCalculator(AttendancePolicy(), ExtraPointsPolicy([]), fixed_point=True)
+        student = Student("ST001")
+        student.add_evaluation(Evaluation(15.125, 100))
+
+        assert to_hundredths(15.07) == 1507
+        with pytest.raises(ValueError, match="centésimas"):
+            calculator.calculate_final_grade(student, 0)
+        with pytest.raises(ValueError, match="centésimas"):
+            calculator.calculate_cohort([15.0, 12.0], [50.0, 49.995], [2], [True])
+
+    @requires_numpy
+    @pytest.mark.parametrize("grade", [float('inf'), float('nan')])
+    def test_shouldRaiseValueError_whenGradeIsNotFinite(self, grade):
+        """Test: NaN e infinitos se rechazan con ValueError en ambas rutas."""
+        calculator = GradeCalculator(AttendancePolicy(), ExtraPointsPolicy([]), fixed_point=True)
+        student = Student("ST001")
+        student.add_evaluation(Evaluation(grade, 100))
+
+        with pytest.raises(ValueError, match="centésimas"):
+            to_hundredths(grade)
+        with pytest.raises(ValueError, match="centésimas"):
+            calculator.calculate_final_grade(student, 0)
+        with pytest.raises(ValueError, match="centésimas"):
+            calculator.calculate_cohort([15.0, grade], [50.0, 50.0], [2], [True])
+
+    def test_shouldRejectInfiniteGrade_inFixedPointBatch(self, tmp_path):
+        """Test: Con --fixed-point una nota 'inf' va a rechazos sin abortar el batch."""
+        source = tmp_path / "notas.csv"
+        source.write_text("student_id,has_reached_minimum_classes,grade_1,weight_1\n"
+                          "ST001,s,inf,100\nST002,s,12,100\n", encoding='utf-8')
+        output = tmp_path / "out.jsonl"
+
+        summary = run_batch(str(source), str(output), GradeCalculator(
+            AttendancePolicy(), ExtraPointsPolicy([]), fixed_point=True))
+
+        assert summary == {'processed': 1, 'rejected': 1}
+
+    def test_shouldRaiseError_whenCombinedWithPipeline(self):
+        """Test: El modo de punto fijo no se combina con un pipeline."""
+        policies = (AttendancePolicy(), ExtraPointsPolicy([]))
+
+        with pytest.raises(ValueError, match="punto fijo"):
+            GradeCalculator(*policies, pipeline=PolicyPipeline.default(*policies),
+                            fixed_point=True)
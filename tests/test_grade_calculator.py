@@ -255,3 +255,120 @@ class TestGradeCalculatorDetails:
         assert details['has_reached_minimum_classes'] is True
         assert details['extra_points_policy_active'] is True
 
+
+
+class TestGradeCalculatorCache:
+    """Tests para la caché de resultados de get_calculation_details."""
+    
+    def _build_student(self):
+        student = Student("ST015")
+        student.add_evaluation(Evaluation(15.0, 50.0))
+        student.add_evaluation(Evaluation(18.0, 50.0))
+        student.has_reached_minimum_classes = True
+        return student
+    
+    def test_shouldReturnCachedDetails_whenStudentUnchanged(self):
+        """Test: Segunda consulta del mismo estudiante es un acierto."""
+        student = self._build_student()
+        calculator = GradeCalculator(AttendancePolicy(), ExtraPointsPolicy([True]),
+                                     cache_size=8)
+        
+        first = calculator.get_calculation_details(student, 0)
+        second = calculator.get_calculation_details(student, 0)
+        
+        assert second is first
+        info = calculator.cache_info()
+        assert (info.hits, info.misses, info.maxsize, info.currsize) == (1, 1, 8, 1)
+    
+    def test_shouldRecalculate_whenStudentIsMutated(self):
+        """Test: add_evaluation y la asistencia invalidan la entrada."""
+        student = self._build_student()
+        calculator = GradeCalculator(AttendancePolicy(), ExtraPointsPolicy([False]),
+                                     cache_size=8)
+        
+        before = calculator.get_calculation_details(student, 0)
+        student.add_evaluation(Evaluation(0.0, 50.0))
+        after_evaluation = calculator.get_calculation_details(student, 0)
+        student.has_reached_minimum_classes = False
+        after_attendance = calculator.get_calculation_details(student, 0)
+        
+        assert before['final_grade'] == 16.5
+        assert after_evaluation['final_grade'] == 11.0
+        assert after_attendance['final_grade'] == 9.0
+        assert calculator.cache_info().hits == 0
+    
+    def test_shouldRecalculate_whenPolicyListChanges(self):
+        """Test: Cambiar la lista de años de la política invalida la entrada."""
+        student = self._build_student()
+        extra_points_policy = ExtraPointsPolicy([False])
+        calculator = GradeCalculator(AttendancePolicy(), extra_points_policy, cache_size=8)
+        
+        before = calculator.get_calculation_details(student, 0)
+        extra_points_policy.all_years_teachers[0] = True
+        after = calculator.get_calculation_details(student, 0)
+        
+        assert before['final_grade'] == 16.5
+        assert after['final_grade'] == 17.5
+        assert after['extra_points_policy_active'] is True
+    
+    def test_shouldRecalculate_whenPolicyConstantChanges(self, monkeypatch):
+        """Test: Cambiar una constante de las políticas vacía la caché."""
+        student = self._build_student()
+        student.has_reached_minimum_classes = False
+        calculator = GradeCalculator(AttendancePolicy(), ExtraPointsPolicy([False]),
+                                     cache_size=8)
+        
+        before = calculator.get_calculation_details(student, 0)
+        monkeypatch.setattr(AttendancePolicy, 'PENALTY_NO_ATTENDANCE', 3.0)
+        after = calculator.get_calculation_details(student, 0)
+        
+        assert (before['final_grade'], after['final_grade']) == (14.5, 13.5)
+        assert calculator.cache_info().currsize == 1
+    
+    def test_shouldIgnoreAttendanceRate_whenPoliciesDoNotUseIt(self):
+        """Test: attendance_rate no forma parte de la clave sin tramos de asistencia."""
+        student = self._build_student()
+        calculator = GradeCalculator(AttendancePolicy(), ExtraPointsPolicy([False]),
+                                     cache_size=8)
+        
+        first = calculator.get_calculation_details(student, 0)
+        student.attendance_rate = 55.0
+        
+        assert calculator.get_calculation_details(student, 0) is first
+    
+    def test_shouldEvictLeastRecentlyUsed_whenCacheIsFull(self):
+        """Test: Desalojo LRU al superar el tamaño máximo."""
+        calculator = GradeCalculator(AttendancePolicy(), ExtraPointsPolicy([False]),
+                                     cache_size=2)
+        students = []
+        for index in range(3):
+            student = Student(f"ST02{index}")
+            student.add_evaluation(Evaluation(float(index + 10), 100.0))
+            students.append(student)
+        
+        calculator.get_calculation_details(students[0], 0)
+        calculator.get_calculation_details(students[1], 0)
+        calculator.get_calculation_details(students[0], 0)
+        calculator.get_calculation_details(students[2], 0)
+        calculator.get_calculation_details(students[0], 0)
+        calculator.get_calculation_details(students[1], 0)
+        
+        info = calculator.cache_info()
+        assert (info.hits, info.misses, info.currsize) == (2, 4, 2)
+        calculator.cache_clear()
+        assert calculator.cache_info() == (0, 0, 2, 0)
+    
+    def test_shouldNotCache_byDefault(self):
+        """Test: Sin caché cuando no se configura su tamaño."""
+        student = self._build_student()
+        calculator = GradeCalculator(AttendancePolicy(), ExtraPointsPolicy([False]))
+        
+        first = calculator.get_calculation_details(student, 0)
+        
+        assert calculator.get_calculation_details(student, 0) is not first
+        assert calculator.cache_info() == (0, 0, 0, 0)
+    
+    def test_shouldRaiseError_whenCacheSizeIsNegative(self):
+        """Test: Error con tamaño de caché negativo."""
+        with pytest.raises(ValueError, match="caché no puede ser negativo"):
+            GradeCalculator(AttendancePolicy(), ExtraPointsPolicy([False]), cache_size=-1)
@@ -0,0 +1,139 @@
+"""
+Tests unitarios para el servicio HTTP asíncrono y su generador de carga.
+"""
+
+import asyncio
+import json
+
+from src.policies.attendance_policy import AttendancePolicy
+from src.policies.extra_points_policy import ExtraPointsPolicy
+from src.service.http_server import GradingService
+from src.service.loadgen import build_request, percentile, read_response, run_load
+
+
+def run_with_service(scenario):
+    """Ejecuta scenario(port) con un servicio levantado en un puerto libre."""
+    async def runner():
+        service = GradingService(AttendancePolicy(), ExtraPointsPolicy([True]), workers=2)
+        port = await service.start('127.0.0.1', 0)
+        try:
+            return await scenario(service, port)
+        finally:
+            await service.close()
+    return asyncio.run(runner())
+
+
+async def request(port, method, path, payload=None, raw_body=None):
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    body = raw_body if raw_body is not None else (
+        json.dumps(payload).encode() if payload is not None else b'')
+    writer.write(f"{method} {path} HTTP/1.1\r\nContent-Length: {len(body)}\r\n"
+                 f"Connection: close\r\n\r\n".encode() + body)
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    head, _, body = response.partition(b'\r\n\r\n')
+    return int(head.split()[1]), body
+
+
+class TestGradingService:
+    """Tests para los endpoints del servicio."""
+
+    def test_shouldGradeSingleStudent(self):
+        """Test: POST /grade devuelve el detalle del cálculo."""
+        async def scenario(service, port):
+            return await request(port, 'POST', '/grade', {
+                'student_id': 'ST001', 'has_reached_minimum_classes': True,
+                'evaluations': [{'grade': 14, 'weight': 100}]})
+
+        status, body = run_with_service(scenario)
+
+        assert status == 200
+        assert json.loads(body)['final_grade'] == 15.0
+
+    def test_shouldReturnBadRequest_whenStudentIsInvalid(self):
+        """Test: Errores de validación responden 400."""
+        async def scenario(service, port):
+            invalid = await request(port, 'POST', '/grade', {'student_id': 'ST002',
+                                                             'evaluations': []})
+            malformed = await request(port, 'POST', '/grade', raw_body=b'{no json')
+            return invalid, malformed
+
+        invalid, malformed = run_with_service(scenario)
+
+        assert invalid[0] == 400
+        assert "al menos una evaluación" in json.loads(invalid[1])['error']
+        assert malformed[0] == 400
+
+    def test_shouldGradeBatch_inWorkerPool_preservingOrder(self):
+        """Test: POST /grade/batch califica en orden e informa errores por índice."""
+        students = [{'student_id': f"ST{index}", 'has_reached_minimum_classes': True,
+                     'evaluations': [[index % 20, 100]] if index != 3 else []}
+                    for index in range(1200)]
+
+        async def scenario(service, port):
+            return await request(port, 'POST', '/grade/batch', {'students': students})
+
+        status, body = run_with_service(scenario)
+
+        results = json.loads(body)['results']
+        assert status == 200
+        assert len(results) == 1200
+        assert results[3] == {'index': 3, 'error': "El estudiante debe tener al menos una evaluación"}
+        assert [result['student_id'] for result in results[:3]] == ['ST0', 'ST1', 'ST2']
+        assert results[1199]['final_grade'] == 1199 % 20 + 1.0
+
+    def test_shouldRespondNotFoundAndMethodNotAllowed(self):
+        """Test: Rutas y métodos desconocidos."""
+        async def scenario(service, port):
+            return (await request(port, 'GET', '/nada'),
+                    await request(port, 'GET', '/grade'))
+
+        not_found, not_allowed = run_with_service(scenario)
+
+        assert not_found[0] == 404
+        assert not_allowed[0] == 405
+
+    def test_shouldAnswerPipelinedRequests_inOrder(self):
+        """Test: Varias solicitudes en una sola escritura se responden en orden."""
+        async def scenario(service, port):
+            reader, writer = await asyncio.open_connection('127.0.0.1', port)
+            bodies = [json.dumps({'student_id': f"ST{grade}",
+                                  'evaluations': [[grade, 100]]}).encode()
+                      for grade in (10, 11, 12)]
+            writer.write(b''.join(build_request('localhost', '/grade', body)
+                                  for body in bodies))
+            await writer.drain()
+            statuses = [await read_response(reader) for _ in bodies]
+            writer.close()
+            metrics = await request(port, 'GET', '/metrics')
+            return statuses, metrics
+
+        statuses, metrics = run_with_service(scenario)
+
+        assert statuses == [200, 200, 200]
+        assert metrics[0] == 200
+        assert b'gradecalculator_calls_total{method="get_calculation_details"} 3' in metrics[1]
+
+    def test_shouldReportLatencyPercentiles_underLoad(self):
+        """Test: El generador de carga reporta p50 y p99."""
+        async def scenario(service, port):
+            return await run_load('127.0.0.1', port, requests=200, concurrency=4, pipeline=5)
+
+        summary = run_with_service(scenario)
+
+        assert summary['requests'] == 200
+        assert summary['statuses'] == {200: 200}
+        assert 0 < summary['p50_ms'] <= summary['p99_ms']
+
+
+class TestPercentile:
+    """Tests para el cálculo de percentiles del generador de carga."""
+
+    def test_shouldUseNearestRank(self):
+        """Test: Percentil por rango más cercano."""
+        values = list(range(1, 101))
+        assert percentile(values, 0.50) == 50
+        assert percentile(values, 0.99) == 99
+        assert percentile(values, 1.0) == 100
+        assert percentile([], 0.5) == 0.0
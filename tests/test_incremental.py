@@ -0,0 +1,175 @@
+"""
+Tests unitarios para la recalificación incremental.
+"""
+
+import pytest
+from src.policies.attendance_policy import AttendancePolicy
+from src.policies.extra_points_policy import ExtraPointsPolicy
+from src.policies.policy_config import PolicyConfig
+from src.calculator.grade_calculator import GradeCalculator
+from src.calculator.pipeline import PolicyPipeline
+from src.calculator.incremental import (AttendanceChanged, EvaluationAdded,
+                                        ExtraPointsYearToggled, GradeDelta, GradeEdited,
+                                        IncrementalGrader)
+from tests.helpers import build_student, requires_numpy
+
+
+class CountingCalculator(GradeCalculator):
+    """Calculadora que registra a qué estudiantes califica."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.graded = []
+
+    def calculate_final_grade(self, student, academic_year):
+        self.graded.append(student.student_id)
+        return super().calculate_final_grade(student, academic_year)
+
+
+def build_grader():
+    calculator = CountingCalculator(AttendancePolicy(), ExtraPointsPolicy([False, True]))
+    students = [
+        (build_student("ST001", [(14.0, 50.0), (16.0, 50.0)]), 0),
+        (build_student("ST002", [(12.0, 100.0)]), 1),
+        (build_student("ST003", [(10.0, 100.0)], has_reached_minimum_classes=False), 1),
+        (build_student("ST004", [(18.0, 100.0)]), 2),
+    ]
+    grader = IncrementalGrader(calculator, students)
+    calculator.graded.clear()
+    return grader, calculator
+
+
+class TestIncrementalGrader:
+    """Tests para IncrementalGrader."""
+
+    def test_shouldGradeWholeSection_onCreation(self):
+        """Test: Al crearse califica a todos los estudiantes."""
+        grader, _ = build_grader()
+
+        assert grader.final_grade("ST001") == 15.0
+        assert grader.final_grade("ST002") == 13.0
+        assert grader.final_grade("ST003") == 9.0
+
+    def test_shouldRegradeOnlyAffectedStudent_whenGradeIsEdited(self):
+        """Test: Editar una nota recalifica solo a ese estudiante."""
+        grader, calculator = build_grader()
+
+        deltas = grader.apply([GradeEdited("ST001", 1, 18.0)])
+
+        assert deltas == [GradeDelta("ST001", 15.0, 16.0, None)]
+        assert calculator.graded == ["ST001"]
+
+    def test_shouldRegradeOnce_whenStudentHasSeveralEvents(self):
+        """Test: Varios eventos del mismo estudiante producen un solo delta."""
+        grader, calculator = build_grader()
+
+        deltas = grader.apply([
+            EvaluationAdded("ST004", 10.0, 0.0),
+            AttendanceChanged("ST004", False),
+            AttendanceChanged("ST003", True),
+        ])
+
+        assert deltas == [GradeDelta("ST003", 9.0, 11.0, None),
+                          GradeDelta("ST004", 18.0, 16.0, None)]
+        assert sorted(calculator.graded) == ["ST003", "ST004"]
+
+    def test_shouldRegradeOnlyYearStudents_whenYearIsToggled(self):
+        """Test: Cambiar un año de la política recalifica solo a ese año."""
+        grader, calculator = build_grader()
+
+        deltas = grader.apply([ExtraPointsYearToggled(1, False)])
+
+        assert deltas == [GradeDelta("ST002", 13.0, 12.0, None),
+                          GradeDelta("ST003", 9.0, 8.0, None)]
+        assert sorted(calculator.graded) == ["ST002", "ST003"]
+        assert grader.students_in_year(1) == {"ST002", "ST003"}
+
+    def test_shouldExtendPolicy_whenToggledYearIsNew(self):
+        """Test: Activar un año fuera de la lista la extiende."""
+        grader, calculator = build_grader()
+
+        deltas = grader.apply([ExtraPointsYearToggled(2, True),
+                               ExtraPointsYearToggled(0, False)])
+
+        assert calculator.extra_points_policy.all_years_teachers == [False, True, True]
+        assert deltas == [GradeDelta("ST004", 18.0, 19.0, None)]
+        assert calculator.graded == ["ST004"]
+
+    @requires_numpy
+    @pytest.mark.parametrize("cache_size", [0, 8])
+    def test_shouldRecompilePipeline_whenYearIsToggled(self, cache_size):
+        """Test: Un pipeline compilado ve el cambio de la política de puntos extra."""
+        attendance_policy, extra_points_policy = AttendancePolicy(), ExtraPointsPolicy([False])
+        calculator = GradeCalculator(attendance_policy, extra_points_policy,
+                                     cache_size=cache_size,
+                                     pipeline=PolicyPipeline.default(attendance_policy,
+                                                                     extra_points_policy))
+        grader = IncrementalGrader(calculator, [(build_student("ST001", [(13.0, 100.0)]), 0)])
+
+        assert grader.apply([ExtraPointsYearToggled(0, True)]) == [
+            GradeDelta("ST001", 13.0, 14.0, None)]
+        assert calculator.calculate_cohort([13.0], [100.0], [1], [True])[
+            'final_grade'].tolist() == [14.0]
+        assert extra_points_policy.all_years_teachers == [False]
+        assert calculator.extra_points_policy is not extra_points_policy
+
+    def test_shouldReplacePolicyConfig_whenYearIsToggled(self):
+        """Test: Con PolicyConfig el año se cambia creando una configuración nueva."""
+        config = PolicyConfig([False], penalty_no_attendance=1.5, extra_points_amount=0.5)
+        calculator = GradeCalculator(config, config)
+        grader = IncrementalGrader(calculator, [
+            (build_student("ST001", [(13.0, 100.0)]), 0),
+            (build_student("ST002", [(13.0, 100.0)], has_reached_minimum_classes=False), 2)])
+
+        deltas = grader.apply([ExtraPointsYearToggled(0, True), ExtraPointsYearToggled(2, True)])
+
+        assert deltas == [GradeDelta("ST001", 13.0, 13.5, None),
+                          GradeDelta("ST002", 11.5, 12.0, None)]
+        assert calculator.extra_points_policy == PolicyConfig([True, False, True], 1.5, 0.5)
+        assert calculator.attendance_policy is calculator.extra_points_policy
+        assert config.all_years_teachers == (False,)
+
+    def test_shouldRejectPipeline_withPolicyConfig(self):
+        """Test: Un pipeline con PolicyConfig se rechaza al crear el motor."""
+        config = PolicyConfig([False])
+        calculator = GradeCalculator(config, config,
+                                     pipeline=PolicyPipeline.default(config, config))
+
+        with pytest.raises(ValueError, match="pipeline con PolicyConfig"):
+            IncrementalGrader(calculator)
+
+    def test_shouldNotEmitDelta_whenGradeStaysNaN(self):
+        """Test: Una nota NaN que no cambia no produce delta."""
+        class NaNCalculator(GradeCalculator):
+            def calculate_final_grade(self, student, academic_year):
+                return {'final_grade': float('nan')}
+
+        calculator = NaNCalculator(AttendancePolicy(), ExtraPointsPolicy([]))
+        grader = IncrementalGrader(calculator, [(build_student("ST001", [(13.0, 100.0)]), 0)])
+
+        assert grader.apply([AttendanceChanged("ST001", False)]) == []
+
+    def test_shouldEmitErrorDelta_whenStudentBecomesUngradable(self):
+        """Test: Un peso total cero deja la nota en None con su motivo."""
+        grader, _ = build_grader()
+
+        deltas = grader.apply([GradeEdited("ST002", 0, weight=0.0)])
+
+        assert deltas == [GradeDelta("ST002", 13.0, None,
+                                     "El peso total de las evaluaciones no puede ser cero")]
+        assert grader.apply([GradeEdited("ST002", 0, weight=100.0)]) == [
+            GradeDelta("ST002", None, 13.0, None)]
+
+    def test_shouldRaiseError_whenEventIsInvalid(self):
+        """Test: Eventos inválidos se rechazan con ValueError."""
+        grader, _ = build_grader()
+
+        with pytest.raises(ValueError, match="desconocido"):
+            grader.apply([EvaluationAdded("ST999", 10.0, 10.0)])
+        with pytest.raises(ValueError, match="no tiene la evaluación 5"):
+            grader.apply([GradeEdited("ST001", 5, 10.0)])
+        with pytest.raises(ValueError, match="no puede ser negativa"):
+            grader.apply([AttendanceChanged("ST001", False),
+                          EvaluationAdded("ST001", -1.0, 10.0)])
+
+        assert grader.apply([]) == [GradeDelta("ST001", 15.0, 13.0, None)]
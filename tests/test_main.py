@@ -0,0 +1,50 @@
+"""
+Tests unitarios para el modo rápido (--grade) de la línea de comandos.
+"""
+
+import io
+import json
+
+import pytest
+from src.main import main, parse_grade_args
+
+
+class TestGradeMode:
+    """Tests para python -m src.main --grade."""
+
+    def test_shouldPrintFinalGrade_fromArguments(self, capsys):
+        """Test: Las evaluaciones y políticas se reciben como argumentos."""
+        code = main(["--grade", "15:30", "18:70", "--attendance", "s",
+                     "--year", "1", "--extra-points", "n,s"])
+
+        assert code == 0
+        assert capsys.readouterr().out == "18.1\n"
+
+    def test_shouldPrintDetails_fromStdinJson(self, capsys, monkeypatch):
+        """Test: Con '-' el registro JSON se lee de stdin (formato batch)."""
+        monkeypatch.setattr('sys.stdin', io.StringIO(json.dumps({
+            'student_id': 'ST001', 'has_reached_minimum_classes': False,
+            'evaluations': [{'grade': 14, 'weight': 100}]})))
+
+        code = main(["--grade", "-", "--extra-points", "s", "--details"])
+
+        details = json.loads(capsys.readouterr().out)
+        assert code == 0
+        assert details['student_id'] == 'ST001'
+        assert details['final_grade'] == 13.0
+
+    def test_shouldReturnErrorCode_whenDataIsInvalid(self, capsys):
+        """Test: Datos inválidos terminan con código 1 y mensaje en stderr."""
+        assert main(["--grade", "15:0"]) == 1
+        assert "peso total" in capsys.readouterr().err
+        assert main(["--grade", "15"]) == 1
+        assert "NOTA:PESO" in capsys.readouterr().err
+        assert main(["--grade", "15:100", "--year", "-3"]) == 1
+        assert "Año académico inválido: '-3'" in capsys.readouterr().err
+
+    def test_shouldReturnUsageCode_whenArgumentsAreInvalid(self, capsys):
+        """Test: Argumentos desconocidos terminan con código 2."""
+        assert main(["--grade", "15:100", "--desconocido"]) == 2
+        assert "uso:" in capsys.readouterr().err
+        with pytest.raises(ValueError, match="requiere al menos una evaluación"):
+            parse_grade_args(["--grade", "--details"])
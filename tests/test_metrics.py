@@ -0,0 +1,82 @@
+"""
+Tests unitarios para las métricas de GradeCalculator.
+"""
+
+import pytest
+from src.models.evaluation import Evaluation
+from src.policies.attendance_policy import AttendancePolicy
+from src.policies.extra_points_policy import ExtraPointsPolicy
+from src.calculator.grade_calculator import GradeCalculator
+from src.calculator.metrics import (
+    Histogram, MetricsRegistry, classify_validation_error, parse_prometheus_text
+)
+from tests.helpers import build_student
+
+
+class TestMetricsRegistry:
+    """Tests para el registro de métricas."""
+
+    def test_shouldClassifyValidationErrors_byReason(self):
+        """Test: Motivo obtenido del mensaje de cada ValueError."""
+        with pytest.raises(ValueError) as error:
+            Evaluation(-1.0, 10.0)
+        assert classify_validation_error(error.value) == "negative_grade"
+        assert classify_validation_error(ValueError("otro")) == "other"
+
+    def test_shouldAccumulateHistogramBuckets(self):
+        """Test: Buckets acumulativos con límite superior inclusivo."""
+        histogram = Histogram((0.1, 1.0))
+        for value in (0.05, 0.1, 0.5, 3.0):
+            histogram.observe(value)
+        assert list(histogram.cumulative()) == [("0.1", 2), ("1.0", 3), ("+Inf", 4)]
+        assert histogram.count == 4
+
+
+class TestGradeCalculatorMetrics:
+    """Tests para la instrumentación de GradeCalculator."""
+
+    def test_shouldRecordCallsLatencyAndFailures(self):
+        """Test: Llamadas, latencia y errores de validación registrados."""
+        metrics = MetricsRegistry()
+        calculator = GradeCalculator(AttendancePolicy(), ExtraPointsPolicy([True]),
+                                     metrics=metrics)
+
+        calculator.calculate_final_grade(build_student("ST001", [(15.0, 100.0)]), 0)
+        calculator.get_calculation_details(build_student("ST002", [(12.0, 100.0)]), 0)
+        with pytest.raises(ValueError):
+            calculator.calculate_final_grade(build_student("ST003", [(12.0, 0.0)]), 0)
+        with pytest.raises(ValueError):
+            calculator.get_calculation_details(build_student("ST004"), 0)
+
+        assert metrics.calls == {'calculate_final_grade': 2, 'get_calculation_details': 2}
+        assert metrics.latency['calculate_final_grade'].count == 2
+        assert metrics.validation_failures == {'zero_total_weight': 1, 'no_evaluations': 1}
+
+    def test_shouldExportPrometheusText_readableByScraper(self):
+        """Test: El texto exportado se puede leer como Prometheus."""
+        metrics = MetricsRegistry()
+        calculator = GradeCalculator(AttendancePolicy(), ExtraPointsPolicy([False]),
+                                     metrics=metrics)
+        for index in range(3):
+            calculator.calculate_final_grade(build_student(f"ST{index}", [(15.0, 100.0)]), 0)
+
+        samples = parse_prometheus_text(metrics.render_prometheus())
+
+        method = (('method', 'calculate_final_grade'),)
+        assert samples[('gradecalculator_calls_total', method)] == 3
+        assert samples[('gradecalculator_call_duration_seconds_count', method)] == 3
+        assert samples[('gradecalculator_call_duration_seconds_bucket',
+                        (('le', '+Inf'), ('method', 'calculate_final_grade')))] == 3
+        assert samples[('gradecalculator_call_duration_seconds_sum', method)] > 0
+
+    def test_shouldNotRecordAnything_whenMetricsDisabled(self):
+        """Test: Sin registro de métricas no hay instrumentación."""
+        calculator = GradeCalculator(AttendancePolicy(), ExtraPointsPolicy([False]))
+        assert calculator.metrics is None
+        result = calculator.calculate_final_grade(build_student("ST005", [(15.0, 100.0)]), 0)
+        assert result['final_grade'] == 15.0
+
+    def test_shouldRaiseError_whenPrometheusLineIsInvalid(self):
+        """Test: Error ante una línea que no es una muestra."""
+        with pytest.raises(ValueError, match="inválida"):
+            parse_prometheus_text("esto no es una metrica valida\n")
@@ -0,0 +1,97 @@
+"""
+Tests unitarios para la calificación paralela en varios procesos.
+"""
+
+import json
+import random
+
+import pytest
+from src.batch.parallel import ParallelGrader, iter_chunks
+from src.batch.runner import run_batch
+from src.models.student import Student
+from src.models.evaluation import Evaluation
+from src.calculator.grade_calculator import GradeCalculator
+from src.policies.attendance_policy import AttendancePolicy
+from src.policies.extra_points_policy import ExtraPointsPolicy
+
+
+def write_random_jsonl(path, n_students, seed=7):
+    rng = random.Random(seed)
+    with open(path, 'w', encoding='utf-8') as stream:
+        for index in range(n_students):
+            evaluations = [[round(rng.uniform(0, 20), 2), round(rng.uniform(0, 40), 1)]
+                           for _ in range(rng.randint(0, 4))]
+            stream.write(json.dumps({
+                'student_id': f"ST{index:05d}",
+                'has_reached_minimum_classes': rng.random() < 0.7,
+                'academic_year': rng.randint(0, 2),
+                'evaluations': evaluations,
+            }) + "\n")
+
+
+class TestParallelGrader:
+    """Tests para ParallelGrader."""
+
+    def test_shouldSplitItemsInChunks(self):
+        """Test: División en bloques preservando el orden."""
+        assert list(iter_chunks(range(5), 2)) == [[0, 1], [2, 3], [4]]
+
+    def test_shouldReturnResultsInInputOrder(self):
+        """Test: Resultados en el orden de entrada, con errores en su posición."""
+        students = []
+        for index in range(25):
+            student = Student(f"ST{index}")
+            if index % 5:
+                student.add_evaluation(Evaluation(float(index % 20), 100.0))
+            students.append((student, 0))
+
+        with ParallelGrader(AttendancePolicy(), ExtraPointsPolicy([True]),
+                            workers=2, chunk_size=3) as grader:
+            results = list(grader.grade_students(students))
+
+        assert len(results) == 25
+        for index, result in enumerate(results):
+            if index % 5:
+                assert result['student_id'] == f"ST{index}"
+            else:
+                assert isinstance(result, ValueError)
+
+    def test_shouldRaiseError_whenChunkSizeIsInvalid(self):
+        """Test: Error con tamaño de bloque inválido."""
+        with pytest.raises(ValueError, match="tamaño de bloque"):
+            ParallelGrader(AttendancePolicy(), ExtraPointsPolicy([]), workers=1, chunk_size=0)
+
+    def test_shouldProduceSameFiles_asSequentialBatch(self, tmp_path):
+        """Test: La salida paralela es idéntica byte a byte a la secuencial."""
+        source = tmp_path / "notas.jsonl"
+        write_random_jsonl(source, 500)
+        calculator = GradeCalculator(AttendancePolicy(), ExtraPointsPolicy([True, False]))
+
+        sequential = run_batch(str(source), str(tmp_path / "seq.jsonl"), calculator)
+        parallel = run_batch(str(source), str(tmp_path / "par.jsonl"), calculator,
+                             workers=3, chunk_size=17)
+
+        assert sequential == parallel
+        assert parallel['rejected'] > 0
+        for name in ("seq.jsonl", "seq.rejects.jsonl"):
+            parallel_name = name.replace("seq", "par")
+            assert (tmp_path / name).read_bytes() == (tmp_path / parallel_name).read_bytes()
+
+    def test_shouldMergeWorkerAggregates_likeSequentialBatch(self, tmp_path):
+        """Test: Los agregados parciales de cada proceso se combinan en uno."""
+        from src.calculator.aggregates import SectionAggregate
+
+        source = tmp_path / "notas.jsonl"
+        write_random_jsonl(source, 400)
+        calculator = GradeCalculator(AttendancePolicy(), ExtraPointsPolicy([True, False]))
+        sequential, parallel = SectionAggregate(), SectionAggregate()
+
+        run_batch(str(source), str(tmp_path / "seq.jsonl"), calculator, aggregate=sequential)
+        run_batch(str(source), str(tmp_path / "par.jsonl"), calculator,
+                  workers=3, chunk_size=23, aggregate=parallel)
+
+        expected, actual = sequential.result(), parallel.result()
+        assert actual['mean'] == pytest.approx(expected['mean'])
+        assert actual['std_dev'] == pytest.approx(expected['std_dev'])
+        for key in ('count', 'rejected', 'median', 'percentiles', 'pass_rate', 'histogram'):
+            assert actual[key] == expected[key]
@@ -0,0 +1,212 @@
+"""
+Tests unitarios para el pipeline de políticas compilado.
+"""
+
+import random
+
+import pytest
+from src.models.student import Student
+from src.models.evaluation import Evaluation
+from src.policies.attendance_policy import AttendancePolicy
+from src.policies.extra_points_policy import ExtraPointsPolicy
+from src.calculator.grade_calculator import GradeCalculator
+from src.calculator.pipeline import (AttendancePenalty, AttendanceTiers, BestOf, Cap,
+                                     DropLowest, ExtraPoints, PolicyPipeline, drop_lowest)
+from tests.helpers import build_random_cohort, build_student, build_students, requires_numpy
+
+
+class TestPolicyPipeline:
+    """Tests para PolicyPipeline."""
+
+    @requires_numpy
+    def test_shouldMatchGradeCalculator_whenUsingDefaultRules(self):
+        """Test: El pipeline por defecto es idéntico bit a bit a RF04 (RNF03)."""
+        grades, weights, counts, attendance, years = build_random_cohort(17, 1500)
+        attendance_policy = AttendancePolicy()
+        extra_points_policy = ExtraPointsPolicy([True, False, True])
+        calculator = GradeCalculator(attendance_policy, extra_points_policy)
+        pipeline = PolicyPipeline.default(attendance_policy, extra_points_policy)
+        fused = pipeline.compile()
+
+        cohort = pipeline.compile_vectorized()(grades, weights, counts, attendance, years)
+
+        for index, student in enumerate(build_students(grades, weights, counts, attendance)):
+            expected = calculator.calculate_final_grade(student, years[index])
+            assert fused(student, years[index]) == expected
+            for field, value in expected.items():
+                assert cohort[field][index].item() == value
+
+    @requires_numpy
+    def test_shouldMatchScalarPath_whenDroppingLowest(self):
+        """Test: Descartar evaluaciones da el mismo resultado escalar y vectorizado."""
+        grades, weights, counts, attendance, years = build_random_cohort(5, 800)
+        pipeline = PolicyPipeline([DropLowest(2), AttendancePenalty(),
+                                   ExtraPoints(ExtraPointsPolicy([False, True]))])
+        fused = pipeline.compile()
+
+        cohort = pipeline.compile_vectorized()(grades, weights, counts, attendance, years)
+
+        for index, student in enumerate(build_students(grades, weights, counts, attendance)):
+            for field, value in fused(student, years[index]).items():
+                assert cohort[field][index].item() == value
+
+    def test_shouldDropLowestGrade_andKeepAtLeastOne(self):
+        """Test: Se descarta la menor nota y el promedio usa los pesos restantes."""
+        fused = PolicyPipeline([DropLowest()]).compile()
+
+        student = build_student("ST001", [(8, 20), (16, 40), (12, 40)])
+        assert fused(student, 0)['final_grade'] == 14.0
+        assert fused(build_student("ST001", [(8, 100)]), 0)['final_grade'] == 8.0
+
+    @requires_numpy
+    def test_shouldMatchScalarPath_whenCountingBestOfManyEvaluations(self):
+        """Test: BestOf con empates y muchas evaluaciones coincide en ambas rutas."""
+        rng = random.Random(18)
+        grades, weights, counts = [], [], []
+        for _ in range(300):
+            count = rng.randint(1, 60)
+            counts.append(count)
+            grades += [float(rng.randint(0, 20)) for _ in range(count)]
+            weights += [round(rng.uniform(0.5, 10), 1) for _ in range(count)]
+        attendance = [True] * len(counts)
+        pipeline = PolicyPipeline([BestOf(8), DropLowest(1)])
+        fused = pipeline.compile()
+
+        cohort = pipeline.compile_vectorized()(grades, weights, counts, attendance)
+
+        position = 0
+        for index, count in enumerate(counts):
+            student = Student(f"ST{index}", max_evaluations=60)
+            for offset in range(count):
+                student.add_evaluation(Evaluation(grades[position + offset],
+                                                  weights[position + offset]))
+            position += count
+            student.has_reached_minimum_classes = True
+            for field, value in fused(student, 0).items():
+                assert cohort[field][index].item() == value
+
+    def test_shouldSelectSameEvaluations_asFullSort(self):
+        """Test: La selección parcial descarta las mismas evaluaciones que ordenar."""
+        rng = random.Random(7)
+        for _ in range(200):
+            evaluations = [Evaluation(float(rng.randint(0, 20)), 1.0)
+                           for _ in range(rng.randint(1, 300))]
+            count = rng.randint(1, len(evaluations))
+            kept = min(count, len(evaluations) - 1)
+            dropped = set(sorted(range(len(evaluations)),
+                                 key=lambda index: evaluations[index].grade)[:kept])
+            expected = [evaluation for index, evaluation in enumerate(evaluations)
+                        if index not in dropped]
+
+            assert drop_lowest(evaluations, count) == expected
+
+    def test_shouldRenormalizeWeights_whenCountingBestOf(self):
+        """Test: Solo cuentan las N mejores y su peso se renormaliza."""
+        fused = PolicyPipeline([BestOf(2)]).compile()
+
+        result = fused(build_student("ST001", [(10, 25), (18, 25), (6, 25), (14, 25)]), 0)
+
+        assert result['weighted_average'] == 16.0
+
+    def test_shouldApplyAttendanceTiers(self):
+        """Test: Se aplica el primer tramo cuyo porcentaje mínimo se alcanza."""
+        fused = PolicyPipeline([AttendanceTiers([(70, 1.0), (90, 0.0), (0, 3.0)])]).compile()
+
+        results = [fused(build_student("ST001", [(15, 100)], attendance_rate=rate),
+                         0)['final_grade'] for rate in (95, 90, 75, 40)]
+
+        assert results == [15.0, 15.0, 14.0, 12.0]
+
+    @requires_numpy
+    def test_shouldRaiseError_whenTiersLackAttendanceRate(self):
+        """Test: Error cuando la regla de tramos no tiene porcentaje de asistencia."""
+        pipeline = PolicyPipeline([AttendanceTiers([(80, 0.0), (0, 2.0)])])
+
+        with pytest.raises(ValueError, match="attendance_rate"):
+            pipeline.compile()(build_student("ST001", [(15, 100)]), 0)
+        with pytest.raises(ValueError, match="attendance_rate"):
+            pipeline.compile_vectorized()([15.0], [100.0], [1], [True])
+
+    @requires_numpy
+    def test_shouldApplyCap_afterBonuses(self):
+        """Test: El tope limita la nota final después de los puntos extra."""
+        pipeline = PolicyPipeline([Cap(20.0), ExtraPoints(ExtraPointsPolicy([True]))])
+
+        assert pipeline.compile()(build_student("ST001", [(19.8, 100)]), 0)['final_grade'] == 20.0
+        assert pipeline.compile_vectorized()([19.8], [100.0], [1], [True])[
+            'final_grade'].tolist() == [20.0]
+
+    def test_shouldRaiseError_whenRuleIsNotSupported(self):
+        """Test: Error cuando una regla no es soportada."""
+        with pytest.raises(ValueError, match="Regla no soportada"):
+            PolicyPipeline([AttendancePolicy()])
+        with pytest.raises(ValueError, match="positiva"):
+            BestOf(0)
+
+
+class TestGradeCalculatorPipeline:
+    """Tests para GradeCalculator con un pipeline."""
+
+    @requires_numpy
+    def test_shouldUsePipeline_inScalarAndCohortPaths(self):
+        """Test: La calculadora usa el pipeline compilado en ambas rutas."""
+        extra_points_policy = ExtraPointsPolicy([True])
+        calculator = GradeCalculator(AttendancePolicy(), extra_points_policy, cache_size=4,
+                                     pipeline=PolicyPipeline([
+                                         DropLowest(), AttendancePenalty(),
+                                         ExtraPoints(extra_points_policy)]))
+        student = build_student("ST001", [(4, 50), (16, 50)], has_reached_minimum_classes=False)
+
+        details = calculator.get_calculation_details(student, 0)
+        cohort = calculator.calculate_cohort([4.0, 16.0], [50.0, 50.0], [2], [False])
+
+        assert details['weighted_average'] == 16.0
+        assert details['final_grade'] == 15.0
+        assert cohort['final_grade'].tolist() == [15.0]
+
+    @requires_numpy
+    def test_shouldRecompile_whenPolicyChangesInPlace(self):
+        """Test: Cambiar la política en el lugar no deja resultados del pipeline anterior."""
+        attendance_policy, extra_points_policy = AttendancePolicy(), ExtraPointsPolicy([False])
+        calculator = GradeCalculator(attendance_policy, extra_points_policy, cache_size=4,
+                                     pipeline=PolicyPipeline.default(attendance_policy,
+                                                                     extra_points_policy))
+        student = build_student("ST001", [(15, 100)])
+        assert calculator.get_calculation_details(student, 0)['final_grade'] == 15.0
+
+        extra_points_policy.all_years_teachers[0] = True
+        details = calculator.get_calculation_details(student, 0)
+
+        assert details['extra_points_policy_active'] is True
+        assert (details['extra_points'], details['final_grade']) == (1.0, 16.0)
+        assert calculator.calculate_final_grade(student, 0)['final_grade'] == 16.0
+        assert calculator.calculate_cohort([15.0], [100.0], [1], [True])[
+            'final_grade'].tolist() == [16.0]
+        assert calculator.get_calculation_details(student, 0) is details
+
+    def test_shouldKeyCacheOnAttendanceRate_whenPipelineUsesTiers(self):
+        """Test: Con tramos de asistencia la caché distingue attendance_rate."""
+        calculator = GradeCalculator(AttendancePolicy(), ExtraPointsPolicy([]), cache_size=4,
+                                     pipeline=PolicyPipeline([
+                                         AttendanceTiers([(80, 0.0), (0, 2.0)])]))
+        student = build_student("ST001", [(15, 100)], attendance_rate=90.0)
+
+        assert calculator.get_calculation_details(student, 0)['final_grade'] == 15.0
+        student.attendance_rate = 50.0
+        assert calculator.get_calculation_details(student, 0)['final_grade'] == 13.0
+
+    def test_shouldReportKeptEvaluations_inDetails(self):
+        """Test: El detalle marca las evaluaciones descartadas y cuenta solo las conservadas."""
+        attendance_policy, extra_points_policy = AttendancePolicy(), ExtraPointsPolicy([])
+        calculator = GradeCalculator(attendance_policy, extra_points_policy,
+                                     pipeline=PolicyPipeline.default(attendance_policy,
+                                                                     extra_points_policy, 1))
+
+        details = calculator.get_calculation_details(build_student("ST001", [(5, 50), (15, 50)]))
+        without_selection = GradeCalculator(attendance_policy, extra_points_policy)
+
+        assert details['weighted_average'] == 15.0
+        assert (details['number_of_evaluations'], details['total_weight']) == (1, 50.0)
+        assert [evaluation['dropped'] for evaluation in details['evaluations']] == [True, False]
+        assert 'dropped' not in without_selection.get_calculation_details(
+            build_student("ST001", [(5, 50)]))['evaluations'][0]
@@ -0,0 +1,96 @@
+"""
+Tests unitarios para PolicyConfig y la calculadora con políticas congeladas.
+"""
+
+import pickle
+
+import pytest
+from src.calculator.grade_calculator import GradeCalculator
+from src.calculator.pipeline import PolicyPipeline
+from src.policies.attendance_policy import AttendancePolicy
+from src.policies.extra_points_policy import ExtraPointsPolicy
+from src.policies.policy_config import PolicyConfig
+from tests.helpers import build_random_cohort, build_students
+
+
+class TestPolicyConfig:
+    """Tests para PolicyConfig."""
+
+    def test_shouldUseInstanceValues_insteadOfClassConstants(self):
+        """Test: Cada instancia aplica sus propios valores."""
+        config = PolicyConfig([True, False], penalty_no_attendance=1.5,
+                              extra_points_amount=0.5)
+
+        assert config.calculate_penalty(False) == 1.5
+        assert config.calculate_penalty(True) == 0.0
+        assert config.get_extra_points_for_year(0) == 0.5
+        assert config.get_extra_points_for_year(1) == 0.0
+        assert config.get_extra_points_for_year(7) == 0.0
+        assert config.frozen_penalties() == (1.5, 0.0)
+        assert config.frozen_extra_points() == (0.5, 0.0)
+        assert AttendancePolicy.PENALTY_NO_ATTENDANCE == 2.0
+
+    def test_shouldBeImmutable_andCopyTheYears(self):
+        """Test: La configuración no se puede modificar después de crearse."""
+        years = [True]
+        config = PolicyConfig(years)
+        years.append(True)
+
+        with pytest.raises(AttributeError, match="inmutable"):
+            config.penalty_no_attendance = 0.0
+        assert config.all_years_teachers == (True,)
+        assert pickle.loads(pickle.dumps(config)) == config
+        assert hash(PolicyConfig([True])) == hash(config)
+
+    def test_shouldFreezeCurrentPolicies(self):
+        """Test: from_policies copia los valores actuales de las políticas."""
+        config = PolicyConfig.from_policies(AttendancePolicy(), ExtraPointsPolicy([False, True]))
+
+        assert config == PolicyConfig([False, True], 2.0, 1.0)
+
+    def test_shouldRaiseError_whenValuesAreInvalid(self):
+        """Test: Error con años que no son lista de booleanos o valores negativos."""
+        with pytest.raises(ValueError, match="lista"):
+            PolicyConfig("sn")
+        for active in ("n", "false", 1, None):
+            with pytest.raises(ValueError, match="solo admite booleanos"):
+                PolicyConfig([True, active])
+        with pytest.raises(ValueError, match="negativa"):
+            PolicyConfig([], penalty_no_attendance=-1)
+        with pytest.raises(ValueError, match="negativos"):
+            PolicyConfig([], extra_points_amount=-0.5)
+
+
+class TestFrozenGradeCalculator:
+    """Tests para GradeCalculator con PolicyConfig."""
+
+    def test_shouldMatchClassPolicies_bitForBit(self):
+        """Test: Con los valores por defecto coincide con las políticas de clase (RNF03)."""
+        grades, weights, counts, attendance, years = build_random_cohort(23, 1000)
+        calculator = GradeCalculator(AttendancePolicy(), ExtraPointsPolicy([True, False, True]))
+        config = PolicyConfig([True, False, True])
+        frozen = GradeCalculator(config, config)
+
+        for index, student in enumerate(build_students(grades, weights, counts, attendance)):
+            assert frozen.calculate_final_grade(student, years[index]) == \
+                calculator.calculate_final_grade(student, years[index])
+        assert frozen.get_calculation_details(student, 0)['extra_points_policy_active'] is True
+
+    def test_shouldApplyPerInstanceValues_withoutTouchingOtherCalculators(self):
+        """Test: Dos calculadoras con configuraciones distintas conviven."""
+        strict = PolicyConfig([True], penalty_no_attendance=3.0, extra_points_amount=0.5)
+        lenient = PolicyConfig([True], penalty_no_attendance=0.0)
+        student = build_students([12.0], [100.0], [1], [False])[0]
+
+        assert GradeCalculator(strict, strict).calculate_final_grade(student)['final_grade'] == 9.5
+        assert GradeCalculator(lenient, lenient).calculate_final_grade(student)[
+            'final_grade'] == 13.0
+
+    def test_shouldKeepPipelinePath_whenPipelineIsGiven(self):
+        """Test: Con un pipeline se usa la función compilada, no la congelada."""
+        config = PolicyConfig([], penalty_no_attendance=5.0)
+        calculator = GradeCalculator(config, config,
+                                     pipeline=PolicyPipeline.default(config, config))
+        student = build_students([12.0], [100.0], [1], [False])[0]
+
+        assert calculator.calculate_final_grade(student)['final_grade'] == 7.0
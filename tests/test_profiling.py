@@ -0,0 +1,149 @@
+"""
+Tests unitarios para el perfilado de las ejecuciones de calificación.
+"""
+
+import os
+import pstats
+import sys
+import time
+
+import pytest
+from src.calculator.grade_calculator import GradeCalculator
+from src.main import main
+from src.models.evaluation import Evaluation
+from src.models.student import Student
+from src.policies.attendance_policy import AttendancePolicy
+from src.policies.extra_points_policy import ExtraPointsPolicy
+from src.profiling import (SamplingProfiler, TracingProfiler, categorize, create_profiler,
+                           profile_run)
+
+
+def grade_students(seconds=0.2):
+    """Califica estudiantes durante al menos los segundos dados."""
+    calculator = GradeCalculator(AttendancePolicy(), ExtraPointsPolicy([True]))
+    deadline = time.perf_counter() + seconds
+    graded = 0
+    while time.perf_counter() < deadline:
+        student = Student(f"ST{graded}")
+        for grade in (12.0, 15.5, 18.0):
+            student.add_evaluation(Evaluation(grade, 100 / 3))
+        calculator.calculate_final_grade(student, 0)
+        graded += 1
+    return graded
+
+
+class TestCategorize:
+    """Tests para categorize."""
+
+    def test_shouldAttributeFunctions_byModule(self):
+        """Test: Calculadora, modelos, I/O y resto."""
+        import codecs
+        import csv
+        import heapq
+        import json
+        from src.batch import readers, runner
+        from src.calculator import grade_calculator
+        from src.models import student
+
+        assert categorize(grade_calculator.__file__) == 'calculator'
+        assert categorize(student.__file__) == 'models'
+        assert categorize(readers.__file__) == 'io'
+        assert categorize(json.__file__) == 'io'
+        assert categorize(csv.__file__) == 'io'
+        assert categorize(codecs.__file__) == 'io'
+        assert categorize(heapq.__file__) is None
+        assert categorize(runner.__file__) is None
+        assert categorize('~', "<method 'write' of '_io.TextIOWrapper' objects>") == 'io'
+        assert categorize('~', "<built-in method builtins.len>") is None
+
+
+class TestSamplingProfiler:
+    """Tests para SamplingProfiler."""
+
+    def test_shouldSampleStacks_andAttributeThemToCategories(self):
+        """Test: Las muestras forman pilas colapsadas y se reparten por categoría."""
+        profiler = SamplingProfiler(interval=0.0005)
+        profiler.start()
+        grade_students()
+        profiler.stop()
+
+        report = profiler.report()
+        assert report.total > 0
+        assert sum(report.categories.values()) == report.total
+        assert report.categories.get('calculator', 0) + report.categories.get('models', 0) > 0
+        lines = report.collapsed()
+        assert sum(int(line.rsplit(' ', 1)[1]) for line in lines) == report.total
+        assert any('tests/test_profiling.py:grade_students;' in line for line in lines)
+        label, own, cumulative = report.top(1)[0]
+        assert own <= cumulative <= report.total
+
+    def test_shouldRestoreSwitchInterval_afterStopping(self):
+        """Test: El intervalo de cambio de hilo vuelve a su valor original."""
+        original = sys.getswitchinterval()
+        profiler = SamplingProfiler(interval=original / 10)
+        profiler.start()
+        assert sys.getswitchinterval() == original / 10
+        profiler.stop()
+
+        assert sys.getswitchinterval() == original
+
+    def test_shouldRaiseError_whenModeOrIntervalIsInvalid(self):
+        """Test: Error con intervalos no positivos o modos desconocidos."""
+        with pytest.raises(ValueError, match="positivo"):
+            SamplingProfiler(interval=0)
+        with pytest.raises(ValueError, match="no soportado"):
+            create_profiler('perf')
+        profiler = TracingProfiler()
+        profiler.start()
+        profiler.stop()
+        with pytest.raises(ValueError, match="modo 'sample'"):
+            profiler.report().collapsed()
+
+
+class TestProfileRun:
+    """Tests para profile_run y la opción --profile."""
+
+    def test_shouldWriteCollapsedStacksAndSummary_inSampleMode(self, tmp_path, capsys):
+        """Test: Modo 'sample' escribe pilas colapsadas y el resumen."""
+        base = str(tmp_path / "perfil")
+
+        graded = profile_run(grade_students, 'sample', base, interval=0.0005, top=5)
+
+        assert graded > 0
+        assert os.path.getsize(base + ".collapsed") > 0
+        summary = open(base + ".summary.txt", encoding='utf-8').read()
+        assert "calculator" in summary and "models" in summary
+        assert summary in capsys.readouterr().out
+
+    def test_shouldWritePstatsDump_inCProfileMode(self, tmp_path):
+        """Test: Modo 'cprofile' escribe el volcado de pstats con tiempos por función."""
+        base = str(tmp_path / "perfil")
+
+        profile_run(lambda: grade_students(0.05), 'cprofile', base, top=10)
+
+        stats = pstats.Stats(base + ".prof")
+        assert any(name == 'calculate_final_grade' for _, _, name in stats.stats)
+        assert not os.path.exists(base + ".collapsed")
+        summary = open(base + ".summary.txt", encoding='utf-8').read()
+        assert "src/calculator/grade_calculator.py:_calculate_final_grade" in summary
+
+    def test_shouldProfileBatchRun_fromCommandLine(self, tmp_path, capsys):
+        """Test: --profile perfila el modo batch desde la línea de comandos."""
+        source = tmp_path / "notas.csv"
+        source.write_text(
+            "student_id,has_reached_minimum_classes,academic_year,grade_1,weight_1\n"
+            + "".join(f"ST{index},s,0,15,100\n" for index in range(200)),
+            encoding='utf-8'
+        )
+        base = tmp_path / "perfil"
+
+        main(["--batch", str(source), "--out", str(tmp_path / "r.jsonl"),
+              "--profile", "cprofile", "--profile-out", str(base), "--profile-top", "3"])
+
+        output = capsys.readouterr().out
+        assert "Procesados: 200, rechazados: 0" in output
+        assert "Perfil (cprofile)" in output
+        assert (tmp_path / "perfil.prof").exists()
+        with pytest.raises(SystemExit):
+            main(["--batch", str(source), "--out", str(tmp_path / "r.jsonl"),
+                  "--profile", "sample", "--profile-interval", "0"])
@@ -0,0 +1,92 @@
+"""
+Tests unitarios para el motor de escenarios de política (what-if).
+"""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src.calculator.aggregates import SectionAggregate
+from src.calculator.grade_calculator import GradeCalculator
+from src.calculator.scenarios import Scenario, ScenarioEngine
+from src.models.student_table import StudentTable
+from src.policies.attendance_policy import AttendancePolicy
+from src.policies.extra_points_policy import ExtraPointsPolicy
+from tests.helpers import build_random_cohort
+
+
+class TestScenarioEngine:
+    """Tests para ScenarioEngine."""
+
+    def setup_method(self):
+        self.extra_points_policy = ExtraPointsPolicy([True, False, True])
+        self.cohort = build_random_cohort(22, 1200)
+        self.engine = ScenarioEngine(self.extra_points_policy, *self.cohort)
+
+    def test_shouldReproduceCurrentPolicies_bitForBit(self):
+        """Test: El escenario actual coincide con calculate_cohort (RNF03)."""
+        calculator = GradeCalculator(AttendancePolicy(), self.extra_points_policy)
+        expected = calculator.calculate_cohort(*self.cohort)['final_grade']
+        aggregate = SectionAggregate()
+        for final_grade in expected.tolist():
+            aggregate.add(final_grade)
+        summary = aggregate.result()
+
+        result = self.engine.run([Scenario("actual")])
+
+        assert np.array_equal(self.engine.final_grades(Scenario("actual")), expected)
+        assert result['pass_rate'][0] == summary['pass_rate']
+        assert result['mean'][0] == pytest.approx(summary['mean'])
+        assert result['histogram'][0].tolist() == [bar['count'] for bar in summary['histogram']]
+
+    def test_shouldMatchRecalculation_whenPolicyValuesChange(self, monkeypatch):
+        """Test: Cada escenario equivale a recalcular con las constantes cambiadas."""
+        scenarios = Scenario.grid([0.0, 1.5, 3.25], [0.0, 0.5])
+        final_grades = {scenario.name: self.engine.final_grades(scenario)
+                        for scenario in scenarios}
+
+        for scenario in scenarios:
+            monkeypatch.setattr(AttendancePolicy, 'PENALTY_NO_ATTENDANCE',
+                                scenario.penalty_no_attendance)
+            monkeypatch.setattr(ExtraPointsPolicy, 'EXTRA_POINTS_AMOUNT',
+                                scenario.extra_points_amount)
+            calculator = GradeCalculator(AttendancePolicy(), self.extra_points_policy)
+
+            expected = calculator.calculate_cohort(*self.cohort)['final_grade']
+
+            assert np.array_equal(final_grades[scenario.name], expected), scenario.name
+
+    def test_shouldReturnSameMatrix_forAnyBlockSize(self):
+        """Test: El tamaño de bloque no cambia los resultados."""
+        scenarios = Scenario.grid(np.arange(0, 4, 0.5), [0.0, 0.5, 1.0])
+
+        whole = self.engine.run(scenarios)
+        blocked = self.engine.run(scenarios, block_elements=1)
+
+        assert whole['scenarios'][:2] == ["penalty=0,extra=0", "penalty=0,extra=0.5"]
+        assert whole['histogram'].shape == (24, 21)
+        assert np.array_equal(whole['pass_rate'], blocked['pass_rate'])
+        assert np.array_equal(whole['histogram'], blocked['histogram'])
+        assert whole['histogram'].sum(axis=1).tolist() == [len(self.engine)] * 24
+        assert np.all(np.diff(whole['pass_rate'][::3]) <= 0)
+
+    def test_shouldAcceptStudentTableColumns(self):
+        """Test: La cohorte se puede tomar de un StudentTable."""
+        table = StudentTable()
+        table.add_student("ST001", [(12.0, 100.0)], False, 0)
+        table.add_student("ST002", [(10.0, 100.0)], True, 1)
+        engine = ScenarioEngine(ExtraPointsPolicy([True, True]), **table.columns())
+
+        result = engine.run([Scenario("actual"), Scenario("sin penalización", 0.0, 0.0),
+                             Scenario("más penalización", 3.0, 1.0)])
+
+        assert result['pass_rate'].tolist() == [1.0, 0.5, 0.5]
+
+    def test_shouldRaiseError_whenScenariosAreInvalid(self):
+        """Test: Error con escenarios inválidos o cohorte vacía."""
+        with pytest.raises(ValueError, match="al menos un escenario"):
+            self.engine.run([])
+        with pytest.raises(ValueError, match="negativa"):
+            Scenario("inválido", penalty_no_attendance=-1)
+        with pytest.raises(ValueError, match="al menos un estudiante"):
+            ScenarioEngine(self.extra_points_policy, [], [], [], [])
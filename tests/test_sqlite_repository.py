@@ -0,0 +1,180 @@
+"""
+Tests unitarios para el repositorio de estudiantes en SQLite.
+"""
+
+import pytest
+from src.calculator.aggregates import SectionAggregate
+from src.calculator.grade_calculator import GradeCalculator
+from src.calculator.pipeline import PolicyPipeline
+from src.models.student import Student
+from src.models.student_table import StudentTable
+from src.policies.attendance_policy import AttendancePolicy
+from src.policies.extra_points_policy import ExtraPointsPolicy
+from src.storage.sqlite_repository import StudentRepository
+from tests.helpers import build_random_cohort, build_student, build_students
+
+
+class TestStudentRepository:
+    """Tests para StudentRepository."""
+
+    def setup_method(self):
+        self.calculator = GradeCalculator(AttendancePolicy(), ExtraPointsPolicy([True, False]))
+
+    def test_shouldRoundTripStudents_fromDatabaseFile(self, tmp_path):
+        """Test: Los estudiantes guardados se cargan con los mismos datos."""
+        path = str(tmp_path / "notas.db")
+        student = build_student("ST001", [(15, 30), (18.5, 70)], False)
+        student.attendance_rate = 72.5
+
+        with StudentRepository(path) as repository:
+            assert repository.save([student, build_student("ST002", [(10, 100)])], 1) == 2
+            journal_mode = repository.connection.execute("PRAGMA journal_mode").fetchone()[0]
+
+        with StudentRepository(path) as repository:
+            loaded, academic_year = repository.get("ST001")
+            assert repository.get("ST999") is None
+            assert repository.count() == 2
+
+        assert journal_mode == 'wal'
+        assert academic_year == 1
+        assert [(e.grade, e.weight) for e in loaded.evaluations] == [(15, 30), (18.5, 70)]
+        assert loaded.has_reached_minimum_classes is False
+        assert loaded.attendance_rate == 72.5
+        assert loaded.get_weighted_sum() == student.get_weighted_sum()
+
+    def test_shouldUpsertStudents_andDropRemovedEvaluations(self):
+        """Test: Guardar de nuevo un estudiante reemplaza sus evaluaciones."""
+        with StudentRepository() as repository:
+            repository.save([build_student("ST001", [(10, 40), (12, 30), (14, 30)])])
+            repository.save([build_student("ST001", [(20, 100)])], academic_year=1)
+
+            loaded, academic_year = repository.get("ST001")
+            assert [(e.grade, e.weight) for e in loaded.evaluations] == [(20, 100)]
+            assert academic_year == 1
+            assert repository.count() == 1
+            assert repository.delete(["ST001"]) == 1
+            assert repository.connection.execute(
+                "SELECT COUNT(*) FROM evaluations").fetchone()[0] == 0
+
+    def test_shouldRaiseError_whenGradeIsNotFinite(self):
+        """Test: Una nota NaN o infinita produce ValueError y no guarda nada."""
+        with StudentRepository() as repository:
+            repository.save([build_student("ST001", [(10, 100)])])
+
+            for grade in (float('nan'), float('inf')):
+                with pytest.raises(ValueError, match="finitos.*ST003"):
+                    repository.save([build_student("ST002", [(12, 100)]),
+                                     build_student("ST003", [(grade, 100)])])
+            assert repository.count() == 1
+
+    def test_shouldUseIndexes_forStudentAndYearQueries(self):
+        """Test: Las consultas por student_id y por año usan índices."""
+        with StudentRepository() as repository:
+            by_id = repository.connection.execute(
+                "EXPLAIN QUERY PLAN SELECT * FROM evaluations WHERE student_id = ?",
+                ("ST001",)).fetchall()
+            by_year = repository.connection.execute(
+                "EXPLAIN QUERY PLAN SELECT student_id FROM students WHERE academic_year = 1"
+            ).fetchall()
+
+        assert "PRIMARY KEY" in by_id[0][-1]
+        assert "students_academic_year" in by_year[0][-1]
+
+    def test_shouldIterateStudents_bySection(self):
+        """Test: Se recorren los estudiantes de un año en orden de student_id."""
+        table = StudentTable()
+        table.add_student("ST002", [(12.0, 100.0)], True, 1)
+        table.add_student("ST001", [(15.0, 50.0), (9.0, 50.0)], False, 1)
+        table.add_student("ST003", [(18.0, 100.0)], True, 0)
+
+        with StudentRepository() as repository:
+            repository.save(table)
+            section = [(student.student_id, year) for student, year
+                       in repository.iter_students(academic_year=1)]
+
+        assert section == [("ST001", 1), ("ST002", 1)]
+
+    def test_shouldGradeSectionInSql_likeGradeCalculator(self):
+        """Test: La calificación en SQL es idéntica bit a bit a RF04 (RNF03)."""
+        grades, weights, counts, attendance, years = build_random_cohort(21, 1500)
+        students = build_students(grades, weights, counts, attendance)
+        for index, student in enumerate(students):
+            student.student_id = f"ST{index:05d}"
+
+        with StudentRepository() as repository:
+            for student, year in zip(students, years):
+                repository.save([student], int(year))
+            graded = dict(repository.grade_section(self.calculator))
+            section = list(repository.grade_section(self.calculator, academic_year=1))
+            statistics = repository.section_statistics(self.calculator)
+
+        expected = {student.student_id: self.calculator.calculate_final_grade(student, year)
+                    for student, year in zip(students, years)}
+        aggregate = SectionAggregate()
+        for result in expected.values():
+            aggregate.add(result['final_grade'])
+        summary = aggregate.result()
+        assert graded == expected
+        assert len(section) == sum(1 for year in years if year == 1)
+        assert statistics['count'] == summary['count']
+        assert statistics['mean'] == pytest.approx(summary['mean'])
+        assert statistics['min'] == summary['min']
+        assert statistics['max'] == summary['max']
+        assert statistics['pass_rate'] == summary['pass_rate']
+
+    def test_shouldRoundStatistics_likeRound_whenGradesAreNearHalf(self):
+        """Test: Las estadísticas redondean como round() en los casos de mitad."""
+        grades = [14.125, 2.675, 10.005, 12.345, 14.125, 16.0]
+        students = [build_student(f"ST{index:03d}", [(grade, 100)])
+                    for index, grade in enumerate(grades)]
+
+        with StudentRepository() as repository:
+            repository.save(students, academic_year=1)
+            statistics = repository.section_statistics(self.calculator, passing_grade=14.13)
+
+        aggregate = SectionAggregate(passing_grade=14.13)
+        for student in students:
+            aggregate.add(self.calculator.calculate_final_grade(student, 1)['final_grade'])
+        summary = aggregate.result()
+        assert statistics['min'] == summary['min'] == 2.67
+        assert statistics['max'] == summary['max']
+        assert statistics['pass_rate'] == summary['pass_rate'] == 1 / 6
+        assert statistics['mean'] == pytest.approx(summary['mean'])
+
+    def test_shouldKeepStudentTotals_whenEvaluationsChangeOutsideRepository(self):
+        """Test: Los triggers mantienen las sumas de students al editar evaluaciones."""
+        with StudentRepository() as repository:
+            repository.save([build_student("ST001", [(10, 40), (12, 30), (14, 30)])])
+            with repository.connection:
+                repository.connection.execute(
+                    "UPDATE evaluations SET grade = 20 WHERE position = 0")
+                repository.connection.execute(
+                    "DELETE FROM evaluations WHERE position = 2")
+            totals = repository.connection.execute(
+                "SELECT number_of_evaluations, total_weight, weighted_sum FROM students"
+            ).fetchone()
+            graded = dict(repository.grade_section(self.calculator))
+            loaded, academic_year = repository.get("ST001")
+
+        assert totals == (2, 70.0, pytest.approx(11.6))
+        assert graded["ST001"] == self.calculator.calculate_final_grade(loaded, academic_year)
+
+    def test_shouldReturnEmptyStatistics_whenSectionIsEmpty(self):
+        """Test: Estadísticas de una sección sin estudiantes."""
+        with StudentRepository() as repository:
+            statistics = repository.section_statistics(self.calculator, academic_year=3)
+
+        assert statistics == {'count': 0, 'mean': None, 'min': None, 'max': None,
+                              'pass_rate': None}
+
+    def test_shouldRaiseError_whenSectionCannotBeGraded(self):
+        """Test: Error con estudiantes sin evaluaciones o calculadora no estándar."""
+        with StudentRepository() as repository:
+            repository.save([build_student("ST001", [(10, 100)]), Student("ST002")])
+
+            with pytest.raises(ValueError, match="al menos una evaluación.*ST002"):
+                repository.section_statistics(self.calculator)
+            with pytest.raises(ValueError, match="cálculo estándar"):
+                list(repository.grade_section(GradeCalculator(
+                    AttendancePolicy(), ExtraPointsPolicy([]),
+                    pipeline=PolicyPipeline([]))))
@@ -38,6 +38,19 @@ class TestStudent:
         with pytest.raises(ValueError, match="No se pueden agregar más de"):
             student.add_evaluation(Evaluation(15.0, 10.0))
     
+    def test_shouldAllowMoreEvaluations_whenMaxIsConfigured(self):
+        """Test: El máximo de evaluaciones se configura por estudiante."""
+        student = Student("ST004", max_evaluations=40)
+        
+        for i in range(40):
+            student.add_evaluation(Evaluation(15.0, 2.5))
+        
+        assert student.get_total_weight() == 100.0
+        with pytest.raises(ValueError, match="más de 40"):
+            student.add_evaluation(Evaluation(15.0, 2.5))
+        with pytest.raises(ValueError, match="positivo"):
+            Student("ST005", max_evaluations=0)
+    
     def test_shouldCalculateTotalWeight_correctly(self):
         """Test: Cálculo correcto del peso total."""
         student = Student("ST004")
@@ -57,3 +70,91 @@ class TestStudent:
         student.has_reached_minimum_classes = False
         assert student.has_reached_minimum_classes is False
 
+    
+    def test_shouldKeepRunningTotals_whenAddingEvaluations(self):
+        """Test: Totales incrementales idénticos a sumar desde cero."""
+        student = Student("ST006")
+        evaluations = [Evaluation(15.3, 30.1), Evaluation(18.7, 40.2), Evaluation(16.1, 29.7)]
+        for evaluation in evaluations:
+            student.add_evaluation(evaluation)
+        
+        assert student.get_total_weight() == sum(e.weight for e in evaluations)
+        assert student.get_weighted_sum() == sum(e.get_weighted_grade() for e in evaluations)
+    
+    def test_shouldUpdateTotals_whenEvaluationIsUpdated(self):
+        """Test: Actualizar una evaluación ajusta los totales en O(1)."""
+        student = Student("ST007")
+        student.add_evaluation(Evaluation(15.0, 30.0))
+        student.add_evaluation(Evaluation(18.0, 70.0))
+        
+        updated = student.update_evaluation(0, grade=10.0)
+        
+        assert updated.grade == 10.0 and updated.weight == 30.0
+        assert student.evaluations[0] is updated
+        assert student.get_total_weight() == 100.0
+        assert student.get_weighted_sum() == pytest.approx(10.0 * 0.3 + 18.0 * 0.7)
+    
+    def test_shouldRaiseError_whenUpdatedEvaluationIsInvalid(self):
+        """Test: Error al actualizar con datos inválidos sin alterar totales."""
+        student = Student("ST008")
+        student.add_evaluation(Evaluation(15.0, 30.0))
+        
+        with pytest.raises(ValueError, match="peso debe estar entre 0 y 100"):
+            student.update_evaluation(0, weight=120.0)
+        assert student.get_total_weight() == 30.0
+    
+    def test_shouldUpdateTotals_whenEvaluationIsRemoved(self):
+        """Test: Eliminar una evaluación ajusta los totales en O(1)."""
+        student = Student("ST009")
+        student.add_evaluation(Evaluation(15.0, 30.0))
+        student.add_evaluation(Evaluation(18.0, 70.0))
+        
+        removed = student.remove_evaluation(0)
+        
+        assert removed.grade == 15.0
+        assert len(student.evaluations) == 1
+        assert student.get_total_weight() == 70.0
+        assert student.get_weighted_sum() == pytest.approx(18.0 * 0.7)
+    
+    def test_shouldRejectDirectChanges_toEvaluations(self):
+        """Test: Las evaluaciones no se modifican sin pasar por los métodos."""
+        student = Student("ST010")
+        student.add_evaluation(Evaluation(15.0, 30.0))
+        
+        with pytest.raises(AttributeError):
+            student.evaluations.append(Evaluation(18.0, 70.0))
+        with pytest.raises(TypeError):
+            student.evaluations[0] = Evaluation(18.0, 70.0)
+        with pytest.raises(AttributeError):
+            student.evaluations = []
+        assert student.evaluations == (student.evaluations[0],)
+        assert student.get_total_weight() == 30.0
+    
+    def test_shouldReuseEvaluationsTuple_untilStudentChanges(self):
+        """Test: La tupla de evaluaciones se arma una vez por cambio."""
+        student = Student("ST011", max_evaluations=1000)
+        for index in range(1000):
+            student.add_evaluation(Evaluation(15.0, 0.1))
+        evaluations = student.evaluations
+        
+        assert len(evaluations) == 1000
+        assert student.evaluations is evaluations
+        student.remove_evaluation(0)
+        assert student.evaluations is not evaluations
+        assert len(student.evaluations) == 999
+    
+    def test_shouldSumAgain_whenSubtractingIsNotEnough(self):
+        """Test: Sin peso restante o con contribuciones no finitas se vuelve a sumar."""
+        student = Student("ST012")
+        for grade, weight in ((15.3, 10.1), (12.7, 20.2), (18.0, 0.0)):
+            student.add_evaluation(Evaluation(grade, weight))
+        
+        student.remove_evaluation(0)
+        student.update_evaluation(0, weight=0.0)
+        assert student.get_total_weight() == 0
+        assert student.get_weighted_sum() == 0
+        
+        student.update_evaluation(1, grade=float('nan'), weight=50.0)
+        student.update_evaluation(1, grade=14.0)
+        assert student.get_total_weight() == 50.0
+        assert student.get_weighted_sum() == 7.0
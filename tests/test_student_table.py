@@ -0,0 +1,93 @@
+"""
+Tests unitarios para StudentTable, EvaluationBlock y sus vistas.
+"""
+
+import pytest
+from src.models.student import Student
+from src.models.evaluation import Evaluation
+from src.models.student_table import EvaluationBlock, StudentTable
+from src.policies.attendance_policy import AttendancePolicy
+from src.policies.extra_points_policy import ExtraPointsPolicy
+from src.calculator.grade_calculator import GradeCalculator
+from tests.helpers import requires_numpy
+
+
+class TestCompactModels:
+    """Tests para la representación compacta de los modelos."""
+
+    def test_shouldNotHaveInstanceDict_onModels(self):
+        """Test: Student y Evaluation usan __slots__."""
+        assert not hasattr(Evaluation(15.0, 30.0), '__dict__')
+        assert not hasattr(Student("ST001"), '__dict__')
+
+    def test_shouldValidateEvaluations_inBlock(self):
+        """Test: El bloque aplica las validaciones de Evaluation."""
+        block = EvaluationBlock()
+        block.append(15.0, 30.0)
+        with pytest.raises(ValueError, match="no puede ser negativa"):
+            block.append(-1.0, 30.0)
+        with pytest.raises(ValueError, match="peso debe estar entre 0 y 100"):
+            block.append(15.0, 101.0)
+        assert len(block) == 1
+        assert block.view(0).get_weighted_grade() == Evaluation(15.0, 30.0).get_weighted_grade()
+
+
+class TestStudentTable:
+    """Tests para la tabla columnar de estudiantes."""
+
+    def test_shouldExposeStudentViews_withStudentInterface(self):
+        """Test: Las vistas se comportan como Student."""
+        table = StudentTable()
+        table.add_student("ST001", [(15.0, 30.0), (18.0, 70.0)], True, 1)
+        table.add_student("ST002", [(12.0, 100.0)])
+
+        view = table[0]
+        assert len(table) == 2
+        assert view.student_id == "ST001"
+        assert view.academic_year == 1
+        assert view.has_reached_minimum_classes is True
+        assert [evaluation.grade for evaluation in view.evaluations] == [15.0, 18.0]
+        assert view.get_total_weight() == 100.0
+        assert table[-1].student_id == "ST002"
+        with pytest.raises(IndexError):
+            table[2]
+
+    def test_shouldKeepTableUnchanged_whenRowIsInvalid(self):
+        """Test: Una fila inválida no deja la tabla en estado parcial."""
+        table = StudentTable()
+        with pytest.raises(ValueError, match="no puede ser negativa"):
+            table.add_student("ST001", [(15.0, 50.0), (-2.0, 50.0)])
+        with pytest.raises(ValueError, match="No se pueden agregar más de"):
+            table.add_student("ST002", [(15.0, 5.0)] * (Student.MAX_EVALUATIONS + 1))
+        assert len(table) == 0
+        assert len(table.block) == 0
+
+    def test_shouldGradeViews_withUnchangedGradeCalculator(self):
+        """Test: GradeCalculator califica vistas igual que objetos Student."""
+        student = Student("ST003")
+        student.add_evaluation(Evaluation(15.0, 30.0))
+        student.add_evaluation(Evaluation(18.0, 40.0))
+        student.add_evaluation(Evaluation(16.0, 30.0))
+        table = StudentTable.from_students([student])
+        calculator = GradeCalculator(AttendancePolicy(), ExtraPointsPolicy([True]))
+
+        details = calculator.get_calculation_details(table[0], 0)
+
+        assert details == calculator.get_calculation_details(student, 0)
+
+    @requires_numpy
+    def test_shouldProvideCohortColumns(self):
+        """Test: Las columnas alimentan directamente calculate_cohort."""
+        table = StudentTable()
+        table.add_student("ST001", [(15.0, 50.0), (18.0, 50.0)], True, 0)
+        table.add_student("ST002", [(14.0, 100.0)], False, 0)
+        calculator = GradeCalculator(AttendancePolicy(), ExtraPointsPolicy([False]))
+
+        cohort = calculator.calculate_cohort(**table.columns())
+
+        assert cohort['final_grade'].tolist() == [16.5, 12.0]
+
+    def test_shouldRaiseError_whenColumnsAreInconsistent(self):
+        """Test: Error al construir una tabla con columnas inconsistentes."""
+        with pytest.raises(ValueError, match="longitudes consistentes"):
+            StudentTable(student_ids=["ST001"])
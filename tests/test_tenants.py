@@ -0,0 +1,122 @@
+"""
+Tests unitarios para la calificación multi-tenant.
+"""
+
+import json
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src.batch.runner import run_batch
+from src.calculator.grade_calculator import GradeCalculator
+from src.calculator.tenants import TenantPolicies, load_tenant_policies
+from src.main import main
+from src.policies.attendance_policy import AttendancePolicy
+from src.policies.extra_points_policy import ExtraPointsPolicy
+from src.policies.policy_config import PolicyConfig
+from tests.helpers import build_random_cohort, build_students, read_jsonl
+
+
+TENANTS = {
+    'ingenieria': {'all_years_teachers': [True, False], 'penalty_no_attendance': 1.5,
+                   'extra_points_amount': 0.5},
+    'medicina': {'all_years_teachers': [False, True, True], 'penalty_no_attendance': 3.0},
+}
+
+
+class TestTenantPolicies:
+    """Tests para TenantPolicies."""
+
+    def setup_method(self):
+        self.tenants = TenantPolicies.from_dict(TENANTS)
+
+    def test_shouldFreezePolicies_intoIndexedVectors(self):
+        """Test: Penalización y puntos extra precalculados por tenant."""
+        assert self.tenants.tenants == ['ingenieria', 'medicina']
+        assert self.tenants.penalties.tolist() == [[1.5, 0.0], [3.0, 0.0]]
+        assert self.tenants.extra_points.tolist() == [[0.5, 0.0, 0.0], [0.0, 1.0, 1.0]]
+        assert self.tenants.tenant_codes(['medicina', 'ingenieria']).tolist() == [1, 0]
+
+    def test_shouldMatchPerTenantCalculators_bitForBit(self):
+        """Test: La cohorte multi-tenant coincide con la calculadora de cada tenant (RNF03)."""
+        grades, weights, counts, attendance, years = build_random_cohort(24, 1500)
+        codes = np.arange(len(counts)) % 2
+
+        cohort = self.tenants.calculate_cohort(codes, grades, weights, counts, attendance,
+                                               years)
+
+        students = build_students(grades, weights, counts, attendance)
+        for index, student in enumerate(students):
+            calculator = self.tenants.calculator(self.tenants.tenants[codes[index]])
+            expected = calculator.calculate_final_grade(student, years[index])
+            for field, value in expected.items():
+                assert cohort[field][index].item() == value
+
+    def test_shouldRaiseError_whenTenantIsUnknown(self):
+        """Test: Error con tenants desconocidos o configuración inválida."""
+        with pytest.raises(ValueError, match="Tenant desconocido"):
+            self.tenants.calculator('derecho')
+        with pytest.raises(ValueError, match="Código de tenant"):
+            self.tenants.calculate_cohort([5], [10.0], [100.0], [1], [True])
+        with pytest.raises(ValueError, match="inválida del tenant x"):
+            TenantPolicies.from_dict({'x': {'penalty': 1.0}})
+        with pytest.raises(ValueError, match="solo admite booleanos"):
+            TenantPolicies.from_dict({'x': {'all_years_teachers': ["s", "n"]}})
+        with pytest.raises(ValueError, match="al menos un tenant"):
+            TenantPolicies({})
+
+
+class TestMultiTenantBatch:
+    """Tests para la calificación masiva de varios tenants en una pasada."""
+
+    def write_source(self, tmp_path):
+        source = tmp_path / "notas.csv"
+        source.write_text(
+            "student_id,tenant,has_reached_minimum_classes,academic_year,grade_1,weight_1\n"
+            "ST001,ingenieria,n,0,12,100\n"
+            "ST002,medicina,n,1,12,100\n"
+            "ST003,derecho,s,0,12,100\n"
+            "ST004,medicina,s,0,12,100\n",
+            encoding='utf-8'
+        )
+        return source
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_shouldGradeEachRow_withItsTenantPolicies(self, tmp_path, workers):
+        """Test: Cada fila usa los parámetros de su tenant; los desconocidos se rechazan."""
+        output = tmp_path / "resultados.jsonl"
+        calculator = GradeCalculator(AttendancePolicy(), ExtraPointsPolicy([]))
+
+        summary = run_batch(str(self.write_source(tmp_path)), str(output), calculator,
+                            workers=workers, chunk_size=1,
+                            tenants=TenantPolicies.from_dict(TENANTS))
+
+        results = read_jsonl(output)
+        assert summary == {'processed': 3, 'rejected': 1}
+        assert [(result['tenant'], result['final_grade']) for result in results] == [
+            ('ingenieria', 11.0), ('medicina', 10.0), ('medicina', 12.0)]
+        rejects = read_jsonl(tmp_path / "resultados.rejects.jsonl")
+        assert "Tenant desconocido: derecho" in rejects[0]['error']
+
+    def test_shouldLoadTenants_fromCommandLine(self, tmp_path):
+        """Test: --tenants carga la configuración desde un archivo JSON."""
+        config = tmp_path / "tenants.json"
+        config.write_text(json.dumps(TENANTS), encoding='utf-8')
+        output = tmp_path / "resultados.jsonl"
+
+        main(["--batch", str(self.write_source(tmp_path)), "--out", str(output),
+              "--tenants", str(config)])
+
+        assert [result['final_grade'] for result in read_jsonl(output)] == [11.0, 10.0, 12.0]
+        assert load_tenant_policies(str(config)).configs[1] == PolicyConfig(
+            [False, True, True], 3.0)
+
+    def test_shouldFail_whenTenantsUseColumnarOutput(self, tmp_path):
+        """Test: La calificación por tenant solo admite salida JSONL."""
+        config = tmp_path / "tenants.json"
+        config.write_text(json.dumps(TENANTS), encoding='utf-8')
+
+        with pytest.raises(SystemExit):
+            main(["--batch", str(self.write_source(tmp_path)), "--out", str(tmp_path / "r"),
+                  "--tenants", str(config), "--out-format", "csv"])
@@ -0,0 +1,131 @@
+"""
+Tests unitarios para la validación masiva de cohortes.
+"""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src.models.evaluation import Evaluation
+from src.models.student import Student
+from src.policies.attendance_policy import AttendancePolicy
+from src.policies.extra_points_policy import ExtraPointsPolicy
+from src.calculator.grade_calculator import GradeCalculator
+from src.calculator.metrics import MetricsRegistry, classify_validation_error
+from src.calculator.validation import ValidationIssue, validate_columns
+
+
+def scalar_errors(grades, weights, counts):
+    """Mensaje del primer ValueError de la ruta por objetos, por estudiante."""
+    calculator = GradeCalculator(AttendancePolicy(), ExtraPointsPolicy([]))
+    errors = []
+    position = 0
+    for count in counts:
+        try:
+            student = Student("ST")
+            for offset in range(count):
+                student.add_evaluation(Evaluation(grades[position + offset],
+                                                  weights[position + offset]))
+            calculator.calculate_final_grade(student, 0)
+            errors.append(None)
+        except ValueError as error:
+            errors.append(classify_validation_error(error))
+        position += count
+    return errors
+
+
+class TestValidateColumns:
+    """Tests para validate_columns."""
+
+    def test_shouldReturnEmptyReport_whenCohortIsValid(self):
+        """Test: Una cohorte válida no produce errores."""
+        report = validate_columns([15.0, 18.0, 10.0], [30.0, 70.0, 100.0], [2, 1])
+
+        assert report.is_valid
+        assert len(report) == 0
+        assert report.valid_mask().tolist() == [True, True]
+
+    def test_shouldReportEveryIssue_withRowAndEvaluation(self):
+        """Test: Se reportan todos los errores, no solo el primero."""
+        grades = [15.0, -1.0, 12.0, 10.0, -2.0, 14.0]
+        weights = [30.0, 70.0, 0.0, 150.0, 50.0, 0.0]
+        report = validate_columns(grades, weights, [2, 0, 1, 2, 1])
+
+        assert report.issues == [
+            ValidationIssue(0, 1, 'negative_grade', "La nota no puede ser negativa"),
+            ValidationIssue(1, None, 'no_evaluations',
+                            "El estudiante debe tener al menos una evaluación"),
+            ValidationIssue(2, None, 'zero_total_weight',
+                            "El peso total de las evaluaciones no puede ser cero"),
+            ValidationIssue(3, 0, 'weight_out_of_range', "El peso debe estar entre 0 y 100"),
+            ValidationIssue(3, 1, 'negative_grade', "La nota no puede ser negativa"),
+            ValidationIssue(4, None, 'zero_total_weight',
+                            "El peso total de las evaluaciones no puede ser cero"),
+        ]
+        assert report.invalid_rows == [0, 1, 2, 3, 4]
+        assert report.counts_by_reason() == {'negative_grade': 2, 'no_evaluations': 1,
+                                             'zero_total_weight': 2,
+                                             'weight_out_of_range': 1}
+
+    def test_shouldReportTooManyEvaluations(self):
+        """Test: Se aplica el límite de evaluaciones por estudiante (RNF01)."""
+        count = Student.MAX_EVALUATIONS + 1
+        report = validate_columns([10.0] * count, [5.0] * count, [count])
+
+        assert [issue.reason for issue in report] == ['too_many_evaluations']
+        assert report.issues[0].row == 0
+
+    def test_shouldAgreeWithScalarValidation_onRandomDirtyData(self):
+        """Test: Los estudiantes rechazados coinciden con la ruta por objetos."""
+        rng = np.random.default_rng(12)
+        counts = rng.integers(0, Student.MAX_EVALUATIONS + 3, size=300)
+        total = int(counts.sum())
+        grades = rng.choice([-1.0, 0.0, 12.5, 20.0], size=total)
+        weights = rng.choice([-5.0, 0.0, 0.0, 25.0, 100.0, 120.0], size=total)
+
+        report = validate_columns(grades, weights, counts)
+        expected = scalar_errors(grades.tolist(), weights.tolist(), counts.tolist())
+
+        assert report.valid_mask().tolist() == [error is None for error in expected]
+        reasons_by_row = {}
+        for issue in report:
+            reasons_by_row.setdefault(issue.row, []).append(issue.reason)
+        for row, error in enumerate(expected):
+            if error is not None:
+                assert error in reasons_by_row[row]
+
+    def test_shouldFilterColumns_withEvaluationMask(self):
+        """Test: Las máscaras permiten calificar solo a los estudiantes válidos."""
+        grades = np.array([15.0, 18.0, -1.0, 10.0])
+        weights = np.array([30.0, 70.0, 100.0, 100.0])
+        counts = np.array([2, 1, 1])
+        report = validate_columns(grades, weights, counts)
+
+        keep = report.valid_mask()
+        evaluations = report.evaluation_mask()
+        calculator = GradeCalculator(AttendancePolicy(), ExtraPointsPolicy([]))
+        result = calculator.calculate_cohort(grades[evaluations], weights[evaluations],
+                                             counts[keep], True)
+
+        assert result['final_grade'].tolist() == [17.1, 10.0]
+
+    def test_shouldRaiseError_whenColumnsAreInconsistent(self):
+        """Test: Columnas de distinta longitud no se pueden validar por fila."""
+        with pytest.raises(ValueError, match="misma longitud"):
+            validate_columns([10.0, 12.0], [50.0], [2])
+
+
+class TestValidateCohort:
+    """Tests para GradeCalculator.validate_cohort."""
+
+    def test_shouldRecordIssues_inMetrics(self):
+        """Test: Los errores del reporte se suman a las métricas por motivo."""
+        metrics = MetricsRegistry()
+        calculator = GradeCalculator(AttendancePolicy(), ExtraPointsPolicy([]),
+                                     metrics=metrics)
+
+        report = calculator.validate_cohort([-1.0, 10.0], [50.0, 0.0], [1, 1, 0])
+
+        assert report.to_dict()['n_invalid_students'] == 3
+        assert metrics.validation_failures == {'negative_grade': 1, 'zero_total_weight': 1,
+                                               'no_evaluations': 1}
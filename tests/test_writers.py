@@ -0,0 +1,230 @@
+"""
+Tests unitarios para los escritores de resultados por bloques.
+"""
+
+import csv
+import io
+import json
+
+import pytest
+from src.batch.readers import iter_records
+from src.batch.writers import (EVALUATION_COLUMNS, STUDENT_COLUMNS, ArrowResultWriter,
+                               ColumnarResultWriter, CsvResultWriter, JsonlResultWriter,
+                               ResultWriter, arrow_available, export_records,
+                               open_result_writer)
+from src.calculator.grade_calculator import GradeCalculator
+from src.calculator.pipeline import PolicyPipeline
+from src.policies.attendance_policy import AttendancePolicy
+from src.policies.extra_points_policy import ExtraPointsPolicy
+from src.main import main
+from tests.helpers import build_student
+
+
+STUDENTS = [
+    build_student("ST001", [(15, 50), (18, 50)]),
+    build_student("Ñandú \"B\"", [(10.25, 33.3), (7, 66.7)], False),
+    build_student("ST003", [(20, 100)]),
+]
+
+
+def read_csv(path):
+    with open(path, encoding='utf-8', newline='') as stream:
+        return list(csv.DictReader(stream))
+
+
+class TestJsonlResultWriter:
+    """Tests para JsonlResultWriter."""
+
+    @pytest.mark.parametrize("fixed_point", [False, True])
+    def test_shouldMatchCalculationDetails_byteForByte(self, fixed_point):
+        """Test: Cada línea es idéntica a json.dumps(get_calculation_details)."""
+        calculator = GradeCalculator(AttendancePolicy(), ExtraPointsPolicy([True, False]),
+                                     fixed_point=fixed_point)
+        stream = io.StringIO()
+
+        with JsonlResultWriter(calculator, stream) as writer:
+            for year, student in enumerate(STUDENTS):
+                writer.write(student, year)
+
+        expected = "".join(
+            json.dumps(calculator.get_calculation_details(student, year),
+                       ensure_ascii=False) + "\n"
+            for year, student in enumerate(STUDENTS))
+        assert stream.getvalue() == expected
+
+    def test_shouldMatchCalculationDetails_whenPipelineDropsEvaluations(self):
+        """Test: Con DropLowest las líneas incluyen la marca 'dropped' del detalle."""
+        attendance_policy, extra_points_policy = AttendancePolicy(), ExtraPointsPolicy([True])
+        calculator = GradeCalculator(attendance_policy, extra_points_policy,
+                                     pipeline=PolicyPipeline.default(attendance_policy,
+                                                                     extra_points_policy, 1))
+        stream = io.StringIO()
+
+        with JsonlResultWriter(calculator, stream) as writer:
+            for student in STUDENTS:
+                writer.write(student, 0)
+
+        lines = stream.getvalue().splitlines()
+        assert lines == [json.dumps(calculator.get_calculation_details(student, 0),
+                                    ensure_ascii=False) for student in STUDENTS]
+        assert json.loads(lines[0])['evaluations'][0]['dropped'] is True
+
+    def test_shouldWriteByChunks(self):
+        """Test: Las líneas se escriben al completar cada bloque."""
+        calculator = GradeCalculator(AttendancePolicy(), ExtraPointsPolicy([]))
+        stream = io.StringIO()
+        writer = JsonlResultWriter(calculator, stream, chunk_size=2)
+
+        writer.write(STUDENTS[0])
+        assert stream.getvalue() == ""
+        writer.write(STUDENTS[1])
+        assert stream.getvalue().count("\n") == 2
+        writer.write(STUDENTS[2])
+        writer.close()
+
+        assert stream.getvalue().count("\n") == 3
+        assert writer.rows == 3
+
+    def test_shouldRaiseError_whenChunkSizeIsNotPositive(self):
+        """Test: Error con tamaño de bloque no positivo."""
+        calculator = GradeCalculator(AttendancePolicy(), ExtraPointsPolicy([]))
+
+        with pytest.raises(ValueError, match="positivo"):
+            JsonlResultWriter(calculator, io.StringIO(), chunk_size=0)
+
+    def test_shouldFailAtConstruction_whenSubclassIsIncomplete(self):
+        """Test: Un escritor sin _write_chunk no se puede crear."""
+        class IncompleteWriter(ResultWriter):
+            def _append(self, student, academic_year, calculation):
+                pass
+
+        calculator = GradeCalculator(AttendancePolicy(), ExtraPointsPolicy([]))
+        with pytest.raises(TypeError, match="_write_chunk"):
+            IncompleteWriter(calculator)
+        with pytest.raises(TypeError):
+            ColumnarResultWriter(calculator, "resultados")
+
+
+class TestColumnarResultWriters:
+    """Tests para los escritores columnares."""
+
+    def setup_method(self):
+        self.calculator = GradeCalculator(AttendancePolicy(), ExtraPointsPolicy([True]))
+
+    def test_shouldWriteStudentAndEvaluationTables_asCsv(self, tmp_path):
+        """Test: Tablas CSV de estudiantes y evaluaciones unidas por student_id."""
+        base = str(tmp_path / "resultados")
+
+        with CsvResultWriter(self.calculator, base, chunk_size=2) as writer:
+            for student in STUDENTS:
+                writer.write(student, 0)
+
+        students = read_csv(writer.students_path)
+        evaluations = read_csv(writer.evaluations_path)
+        assert tuple(students[0]) == STUDENT_COLUMNS
+        assert tuple(evaluations[0]) == EVALUATION_COLUMNS
+        assert [row['student_id'] for row in students] == ["ST001", "Ñandú \"B\"", "ST003"]
+        assert [row['has_reached_minimum_classes'] for row in students] == [
+            'true', 'false', 'true']
+        assert float(students[0]['final_grade']) == 17.5
+        assert len(evaluations) == 5
+        assert evaluations[1] == {'student_id': 'ST001', 'position': '1', 'grade': '18.0',
+                                  'weight': '50.0', 'weighted_grade': '9.0',
+                                  'dropped': 'false'}
+
+    def test_shouldMarkDroppedEvaluations_andCountOnlyKeptOnes(self, tmp_path):
+        """Test: Con DropLowest las tablas coinciden con el detalle del cálculo."""
+        attendance_policy, extra_points_policy = AttendancePolicy(), ExtraPointsPolicy([True])
+        calculator = GradeCalculator(attendance_policy, extra_points_policy,
+                                     pipeline=PolicyPipeline.default(attendance_policy,
+                                                                     extra_points_policy, 1))
+        base = str(tmp_path / "resultados")
+
+        with CsvResultWriter(calculator, base) as writer:
+            for student in STUDENTS:
+                writer.write(student, 0)
+
+        students = read_csv(writer.students_path)
+        evaluations = read_csv(writer.evaluations_path)
+        for row, student in zip(students, STUDENTS):
+            details = calculator.get_calculation_details(student, 0)
+            assert int(row['number_of_evaluations']) == details['number_of_evaluations']
+            assert float(row['total_weight']) == details['total_weight']
+        assert [row['dropped'] for row in evaluations] == [
+            'true', 'false', 'false', 'true', 'false']
+
+    def test_shouldRequirePyarrow_forArrowOutput(self, tmp_path):
+        """Test: Error claro cuando falta la dependencia opcional pyarrow."""
+        if arrow_available():
+            pytest.skip("pyarrow está instalado")
+
+        with pytest.raises(ValueError, match="pyarrow"):
+            ArrowResultWriter(self.calculator, str(tmp_path / "resultados"))
+
+    def test_shouldWriteArrowTables_whenPyarrowIsInstalled(self, tmp_path):
+        """Test: Las tablas Arrow tienen un record batch por bloque."""
+        pyarrow = pytest.importorskip("pyarrow")
+        import pyarrow.ipc
+
+        with ArrowResultWriter(self.calculator, str(tmp_path / "resultados"),
+                               chunk_size=2) as writer:
+            for student in STUDENTS:
+                writer.write(student, 0)
+
+        with pyarrow.ipc.open_file(writer.students_path) as reader:
+            assert reader.num_record_batches == 2
+            table = reader.read_all()
+        assert table.column('final_grade').to_pylist()[0] == 17.5
+        assert table.num_rows == 3
+
+    def test_shouldRaiseError_whenFormatIsNotSupported(self, tmp_path):
+        """Test: Error con formato de salida no soportado."""
+        with pytest.raises(ValueError, match="no soportado"):
+            open_result_writer(self.calculator, str(tmp_path / "r"), 'parquet')
+
+
+class TestExportRecords:
+    """Tests para export_records."""
+
+    def test_shouldWriteRejects_andUpdateSummary(self, tmp_path):
+        """Test: Las filas inválidas van a rechazos y no se escriben resultados."""
+        calculator = GradeCalculator(AttendancePolicy(), ExtraPointsPolicy([]))
+        source = io.StringIO(
+            json.dumps({'student_id': 'ST001', 'evaluations': [[12, 100]]}) + "\n"
+            "{no es json\n"
+            + json.dumps({'student_id': 'ST002', 'evaluations': [[12, 0]]}) + "\n")
+        rejects = io.StringIO()
+
+        with CsvResultWriter(calculator, str(tmp_path / "r")) as writer:
+            summary = export_records(writer, iter_records(source, 'jsonl'), rejects)
+
+        assert summary == {'processed': 1, 'rejected': 2}
+        assert [json.loads(line)['line'] for line in rejects.getvalue().splitlines()] == [2, 3]
+        assert len(read_csv(writer.students_path)) == 1
+        assert len(read_csv(writer.evaluations_path)) == 1
+
+
+class TestMainOutputFormat:
+    """Tests para --out-format en modo batch."""
+
+    def test_shouldWriteCsvTables_fromCommandLine(self, tmp_path, capsys):
+        """Test: --out-format csv escribe las tablas en la ruta base de --out."""
+        source = tmp_path / "notas.csv"
+        source.write_text("student_id,has_reached_minimum_classes,grade_1,weight_1\n"
+                          "ST001,s,14,100\nST002,s,-1,100\n", encoding='utf-8')
+        base = tmp_path / "resultados"
+
+        main(["--batch", str(source), "--out", str(base), "--out-format", "csv"])
+
+        students = read_csv(f"{base}.students.csv")
+        assert [row['final_grade'] for row in students] == ['14.0']
+        assert "Procesados: 1, rechazados: 1" in capsys.readouterr().out
+
+    def test_shouldFail_whenColumnarOutputUsesWorkers(self, tmp_path):
+        """Test: La salida columnar no admite varios procesos."""
+        source = tmp_path / "notas.csv"
+        source.write_text("student_id,grade_1,weight_1\nST001,14,100\n", encoding='utf-8')
+
+        with pytest.raises(SystemExit):
+            main(["--batch", str(source), "--out", str(tmp_path / "r"),
+                  "--out-format", "csv", "--workers", "2"])